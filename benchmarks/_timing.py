@@ -0,0 +1,41 @@
+# ==========================================================
+# benchmarks/_timing.py
+# ----------------------------------------------------------
+# 벤치마크 스크립트들이 같이 쓰는 작은 타이밍 도우미입니다.
+#   - src/ 경로를 sys.path 에 추가 (demos/ 와 같은 방식)
+#   - timeit 기반 측정 결과를 dict 로 정리
+# ==========================================================
+
+import os
+import sys
+import timeit
+
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(CURRENT_DIR)
+SRC_PATH = os.path.join(PROJECT_ROOT, "src")
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
+
+
+def measure(fn, number: int = 1000, repeat: int = 5) -> dict:
+    """
+    fn() 을 number 번씩 repeat 회 실행해서 1회당 시간을 정리합니다.
+
+    Returns
+    -------
+    dict
+        {"best_us": ..., "median_us": ..., "number": ..., "repeat": ...}
+        best_us/median_us 는 "호출 1회당" 마이크로초입니다.
+    """
+    timer = timeit.Timer(fn)
+    runs = sorted(t / number * 1e6 for t in timer.repeat(repeat=repeat, number=number))
+    return {
+        "best_us": runs[0],
+        "median_us": runs[len(runs) // 2],
+        "number": number,
+        "repeat": repeat,
+    }
+
+
+def format_row(name: str, stats: dict) -> str:
+    return f"{name:<40s} best={stats['best_us']:>10.2f}us  median={stats['median_us']:>10.2f}us"
@@ -0,0 +1,142 @@
+# ==========================================================
+# benchmarks/bench_backends.py
+# ----------------------------------------------------------
+# OCR 백엔드(paddle / onnx) 별 처리량과 메모리 비교.
+#
+#   - 로드 시간     : 엔진 생성 + 워밍업 1회
+#   - 메모리(RSS)   : 엔진 생성 전후 상주 메모리, 측정 종료 시 최대 RSS
+#   - 처리량        : ocr() 1장씩 / ocr_batch() 묶음 처리의 images/s, 1장당 지연 p50/p90
+#
+# 메모리를 공정하게 재기 위해 백엔드마다 새 프로세스(spawn)에서 측정합니다.
+# 설치되지 않은 백엔드(paddleocr / onnxruntime 미설치, 모델 파일 없음)는 건너뜁니다.
+# 백엔드 옵션은 ocr_config.yaml 의 paddle_backend / onnx_backend 섹션을 사용합니다.
+#
+# 실행:
+#   python benchmarks/bench_backends.py
+#   python benchmarks/bench_backends.py --images assets/pictures_origin --batch 8
+# ==========================================================
+
+import _timing  # noqa: F401  (src 경로 등록)
+
+import argparse
+import multiprocessing as mp
+import os
+import resource
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from label_text_recognition.config.loader import load_ocr_config
+from label_text_recognition.ocr.backends import SUPPORTED_BACKENDS, backend_options, create_backend
+from label_text_recognition.metrics.stage_metrics import percentile
+from label_text_recognition.ocr.batch_runner import collect_image_paths
+
+from stub_engine import make_label_frame, synthetic_ocr_result
+
+
+def _rss_mb() -> float:
+    """현재 상주 메모리(MB). /proc 가 없으면 최대 RSS 로 대신합니다."""
+    try:
+        with open("/proc/self/status", "r") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024.0
+    except OSError:
+        pass
+    return _peak_rss_mb()
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux 는 KB, macOS 는 byte 단위
+    return peak / (1024.0 * 1024.0) if os.uname().sysname == "Darwin" else peak / 1024.0
+
+
+def _load_images(image_paths: list[str], count: int):
+    import cv2
+
+    if image_paths:
+        images = [img for img in (cv2.imread(p) for p in image_paths[:count]) if img is not None]
+        if images:
+            return images
+    return [make_label_frame(synthetic_ocr_result(n_words=60, seed=i), seed=i) for i in range(count)]
+
+
+def measure_backend(name: str, lang: str, options: dict, image_paths: list[str],
+                    count: int, batch: int, cls_enable: bool) -> dict:
+    """(별도 프로세스에서 실행) 백엔드 1개를 생성하고 처리량/메모리를 잽니다."""
+    images = _load_images(image_paths, count)
+    rss_before = _rss_mb()
+
+    t0 = time.perf_counter()
+    try:
+        engine = create_backend(name, lang, **options)
+    except (ImportError, FileNotFoundError, ValueError) as e:
+        return {"backend": name, "skipped": f"{type(e).__name__}: {e}"}
+    engine.ocr(images[0], cls=cls_enable)  # 워밍업
+    load_sec = time.perf_counter() - t0
+    rss_loaded = _rss_mb()
+
+    latencies = []
+    started = time.perf_counter()
+    for img in images:
+        t = time.perf_counter()
+        engine.ocr(img, cls=cls_enable)
+        latencies.append((time.perf_counter() - t) * 1000.0)
+    single_sec = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for i in range(0, len(images), batch):
+        engine.ocr_batch(images[i:i + batch], cls=cls_enable)
+    batch_sec = time.perf_counter() - started
+
+    return {
+        "backend": name,
+        "images": len(images),
+        "load_sec": load_sec,
+        "rss_base_mb": rss_before,
+        "rss_engine_mb": rss_loaded - rss_before,
+        "rss_peak_mb": _peak_rss_mb(),
+        "single_ips": len(images) / max(single_sec, 1e-9),
+        "batch_ips": len(images) / max(batch_sec, 1e-9),
+        "p50_ms": percentile(latencies, 50),
+        "p90_ms": percentile(latencies, 90),
+    }
+
+
+def run(backends=SUPPORTED_BACKENDS, images_dir: str | None = None, count: int = 20, batch: int = 8) -> dict:
+    cfg = load_ocr_config()
+    lang = (cfg.get("ocr_langs") or ["en"])[0]
+    cls_enable = cfg.get("ocr_cls_enable", True)
+    image_paths = collect_image_paths([images_dir]) if images_dir else []
+
+    results = {}
+    ctx = mp.get_context("spawn")
+    for name in backends:
+        with ProcessPoolExecutor(max_workers=1, mp_context=ctx) as pool:
+            fut = pool.submit(measure_backend, name, lang, backend_options(cfg, name),
+                              image_paths, count, batch, cls_enable)
+            results[name] = fut.result()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare OCR backends (throughput / memory).")
+    parser.add_argument("--backends", nargs="+", default=list(SUPPORTED_BACKENDS), choices=SUPPORTED_BACKENDS)
+    parser.add_argument("--images", default=None, help="directory of sample images (default: synthetic frames)")
+    parser.add_argument("--count", type=int, default=20, help="number of images to run")
+    parser.add_argument("--batch", type=int, default=8, help="images per ocr_batch() call")
+    args = parser.parse_args()
+
+    results = run(args.backends, args.images, args.count, args.batch)
+    print("🧠 OCR backend comparison")
+    for name, r in results.items():
+        if "skipped" in r:
+            print(f"  {name:<7s} skipped ({r['skipped']})")
+            continue
+        print(f"  {name:<7s} load={r['load_sec']:6.2f}s  engine RSS=+{r['rss_engine_mb']:7.1f}MB  "
+              f"peak={r['rss_peak_mb']:7.1f}MB  single={r['single_ips']:6.2f} img/s  "
+              f"batch={r['batch_ips']:6.2f} img/s  p50={r['p50_ms']:7.1f}ms  p90={r['p90_ms']:7.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
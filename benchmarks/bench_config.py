@@ -0,0 +1,60 @@
+# ==========================================================
+# benchmarks/bench_config.py
+# ----------------------------------------------------------
+# "프레임당 설정 조회 비용" 마이크로벤치마크.
+#
+#   1) load_ocr_config()          : 예전 방식 (매번 YAML open + safe_load)
+#   2) get_ocr_config()           : mtime 캐시 (check_interval 안에서는 dict 조회만)
+#   3) get_ocr_config(check_interval=0) : 매 호출 os.stat 까지 수행하는 최악의 경우
+#   4) mode suffix                : run_ocr_on_image 가 프레임마다 만들던 문자열
+#
+# 실행:
+#   python benchmarks/bench_config.py
+# ==========================================================
+
+import _timing  # noqa: F401  (src 경로 등록)
+from _timing import format_row, measure
+
+from label_text_recognition.config.loader import load_ocr_config
+from label_text_recognition.config.settings import get_ocr_config
+
+
+def _legacy_mode_suffix(cfg: dict) -> str:
+    # ocr_runner._build_mode_suffix 와 같은 로직 (paddleocr 없이 측정하려고 복사)
+    parts = [
+        "SAVE_ON" if cfg.get("enable_save_output", True) else "SAVE_OFF",
+        "CONSOLE_ON" if cfg.get("enable_console_log", True) else "CONSOLE_OFF",
+        "REDRAW_ON" if cfg.get("enable_redraw_from_json", True) else "REDRAW_OFF",
+    ]
+    return "MODE: " + ", ".join(parts)
+
+
+def run() -> dict:
+    get_ocr_config()  # 캐시 예열
+
+    results = {
+        "load_ocr_config (legacy, per frame)": measure(load_ocr_config, number=50),
+        "legacy load + mode suffix": measure(
+            lambda: _legacy_mode_suffix(load_ocr_config()), number=50
+        ),
+        "get_ocr_config (cached)": measure(get_ocr_config, number=100_000),
+        "get_ocr_config (stat every call)": measure(
+            lambda: get_ocr_config(check_interval=0), number=20_000
+        ),
+    }
+    return results
+
+
+def main():
+    results = run()
+    print("📏 per-frame config overhead")
+    for name, stats in results.items():
+        print(format_row(name, stats))
+
+    legacy = results["legacy load + mode suffix"]["median_us"]
+    cached = results["get_ocr_config (cached)"]["median_us"]
+    print(f"\n⚡ speed-up (legacy → cached): x{legacy / max(cached, 1e-9):,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+# ==========================================================
+# benchmarks/bench_merge_words.py
+# ----------------------------------------------------------
+# ocr_utils 의 줄 그룹화/단어 병합 후처리 벤치마크.
+#
+#   - legacy     : 예전 파이썬 루프 구현 (단어마다 dict + np.mean, 파이썬 정렬/루프)
+#   - vectorized : ocr_utils._group_lines ((N, 4, 2) NumPy 배열 연산)
+#
+# 10 ~ 5000 개의 단어 박스를 가진 합성 레이아웃에서
+# 두 구현의 결과가 완전히 같은지 확인하고, 처리 시간을 비교합니다.
+# (렌더링 비용은 제외하고 그룹화/병합만 측정)
+#
+# 실행:
+#   python benchmarks/bench_merge_words.py
+# ==========================================================
+
+import random
+
+import _timing  # noqa: F401  (src 경로 등록)
+from _timing import measure
+
+import numpy as np
+
+from label_text_recognition.ocr.ocr_utils import _group_lines
+
+SIZES = (10, 50, 200, 1000, 5000)
+
+
+def legacy_group(ocr_result, y_thresh=20, x_gap_thresh=30):
+    """예전 merge_words_with_boxes 의 1~4단계(렌더링 제외)를 그대로 옮긴 것."""
+    lines = []
+    for box_info in ocr_result:
+        box, (text, conf) = box_info
+        x_coords = [p[0] for p in box]
+        y_coords = [p[1] for p in box]
+        cx, cy = np.mean(x_coords), np.mean(y_coords)
+        lines.append({
+            "text": text.strip(),
+            "conf": float(conf),
+            "cx": cx,
+            "cy": cy,
+            "x_min": min(x_coords),
+            "x_max": max(x_coords),
+            "box": np.array(box).astype(int).tolist()
+        })
+    if not lines:
+        return []
+
+    lines.sort(key=lambda t: (t["cy"], t["cx"]))
+    grouped_lines = []
+    current_line = [lines[0]]
+    for i in range(1, len(lines)):
+        if abs(lines[i]["cy"] - current_line[-1]["cy"]) <= y_thresh:
+            current_line.append(lines[i])
+        else:
+            grouped_lines.append(current_line)
+            current_line = [lines[i]]
+    grouped_lines.append(current_line)
+
+    merged_results = []
+    for line_idx, line in enumerate(grouped_lines, start=1):
+        line.sort(key=lambda t: t["x_min"])
+        merged_line_words = []
+        current_word = line[0]["text"]
+        for j in range(1, len(line)):
+            gap = line[j]["x_min"] - line[j - 1]["x_max"]
+            if gap < x_gap_thresh:
+                current_word += " " + line[j]["text"]
+            else:
+                merged_line_words.append(current_word)
+                current_word = line[j]["text"]
+        merged_line_words.append(current_word)
+        merged_results.append({
+            "line_index": line_idx,
+            "text": " ".join(merged_line_words),
+            "avg_conf": float(np.mean([w["conf"] for w in line])),
+            "pos": (int(line[0]["cy"]) - 25, int(line[0]["x_min"])),
+        })
+    return merged_results
+
+
+def vectorized_group(ocr_result, y_thresh=20, x_gap_thresh=30):
+    lines, _ = _group_lines(ocr_result, y_thresh, x_gap_thresh)
+    return [
+        {
+            "line_index": i,
+            "text": line["text"],
+            "avg_conf": line["avg_conf"],
+            "pos": (int(line["cy"]) - 25, int(line["x_min"])),
+        }
+        for i, line in enumerate(lines, start=1)
+    ]
+
+
+def make_layout(n_boxes: int, seed: int = 0):
+    """
+    줄/열로 배치된 단어 박스를 만듭니다. 약간의 기울기와 흔들림을 넣어서
+    같은 줄 판정 / 간격 병합 분기가 골고루 나오게 합니다.
+    """
+    rng = random.Random(seed)
+    per_line = max(1, min(12, n_boxes // 4 or 1))
+    result = []
+    for i in range(n_boxes):
+        row, col = divmod(i, per_line)
+        x = 20 + col * rng.choice((70, 90, 130)) + rng.uniform(-3, 3)
+        y = 30 + row * 28 + rng.uniform(-6, 6)
+        w, h = rng.uniform(30, 80), rng.uniform(14, 22)
+        skew = rng.uniform(-2, 2)
+        box = [[x, y], [x + w, y + skew], [x + w, y + h + skew], [x, y + h]]
+        if rng.random() < 0.5:
+            box = [[int(px), int(py)] for px, py in box]
+        text = f" W{i} " if rng.random() < 0.2 else f"W{i}"
+        result.append((box, (text, rng.uniform(0.5, 1.0))))
+    rng.shuffle(result)
+    return result
+
+
+def run() -> dict:
+    results = {}
+    for n in SIZES:
+        layout = make_layout(n, seed=n)
+        assert legacy_group(layout) == vectorized_group(layout), f"mismatch at n={n}"
+        number = max(1, 2000 // n)
+        legacy = measure(lambda: legacy_group(layout), number=number, repeat=5)
+        fast = measure(lambda: vectorized_group(layout), number=number, repeat=5)
+        results[n] = {
+            "legacy_us": legacy["median_us"],
+            "vectorized_us": fast["median_us"],
+            "speedup": legacy["median_us"] / max(fast["median_us"], 1e-9),
+        }
+    return results
+
+
+def main():
+    results = run()
+    print("📏 merge_words_with_boxes grouping (outputs verified identical)")
+    print(f"{'boxes':>6s} {'legacy':>12s} {'vectorized':>12s} {'speed-up':>9s}")
+    for n, r in results.items():
+        print(f"{n:>6d} {r['legacy_us']:>10.1f}us {r['vectorized_us']:>10.1f}us {r['speedup']:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
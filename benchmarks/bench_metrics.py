@@ -0,0 +1,55 @@
+# ==========================================================
+# benchmarks/bench_metrics.py
+# ----------------------------------------------------------
+# 단계 계측(metrics.stage_metrics.timed) 오버헤드 측정.
+#
+#   - bare     : 계측 없이 빈 함수 호출
+#   - disabled : metrics.enabled=false 일 때 with timed(...) (기본 설정)
+#   - enabled  : 수집 중일 때 with timed(...) (perf_counter 2회 + 히스토그램 기록)
+#
+# 실제 단계(수 ms ~ 수 초)에 비해 무시할 수 있는 수준인지 확인하는 용도입니다.
+#
+# 실행:
+#   python benchmarks/bench_metrics.py
+# ==========================================================
+
+import _timing  # noqa: F401  (src 경로 등록)
+from _timing import format_row, measure
+
+from label_text_recognition.metrics.stage_metrics import disable_metrics, enable_metrics, timed
+
+
+def _work():
+    pass
+
+
+def _with_timer():
+    with timed("bench"):
+        _work()
+
+
+def run() -> dict:
+    results = {"bare call": measure(_work, number=200_000)}
+
+    disable_metrics()
+    results["timed() disabled"] = measure(_with_timer, number=200_000)
+
+    registry = enable_metrics()
+    results["timed() enabled"] = measure(_with_timer, number=200_000)
+    disable_metrics()
+
+    results["_observed"] = registry.histogram("bench").snapshot()["count"]
+    return results
+
+
+def main():
+    results = run()
+    observed = results.pop("_observed")
+    print("⏱ stage timer overhead (per block)")
+    for name, stats in results.items():
+        print(format_row(name, stats))
+    print(f"   (enabled run recorded {observed} observations)")
+
+
+if __name__ == "__main__":
+    main()
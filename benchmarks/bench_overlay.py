@@ -0,0 +1,105 @@
+# ==========================================================
+# benchmarks/bench_overlay.py
+# ----------------------------------------------------------
+# 캡처 결과 렌더링: 줄마다 draw_korean_text (기존) vs OverlayCompositor (일괄 합성)
+#
+#   - legacy    : 줄마다 cv2.rectangle + 전체 프레임 BGR→RGB→PIL→BGR 변환 후 텍스트 1줄
+#                 (폰트 로딩 비용은 빼고 비교하기 위해 폰트는 레지스트리에서 가져옴)
+#   - composite : 박스는 OpenCV, 텍스트는 텍스트 영역 PIL 레이어 1장에 모아서 1회 합성
+#
+# 두 결과 이미지의 평균 픽셀 차이도 함께 출력합니다. (같은 그림이면 0 에 가까움)
+#
+# 실행:
+#   python benchmarks/bench_overlay.py
+# ==========================================================
+
+import _timing  # noqa: F401  (src 경로 등록)
+from _timing import measure
+
+import cv2
+import numpy as np
+from PIL import Image, ImageDraw
+
+from label_text_recognition.render.fonts import get_font
+from label_text_recognition.render.overlay import OverlayCompositor
+
+FRAME_SIZE = (1280, 720)
+LINE_COUNTS = [5, 20, 40]
+
+
+def make_results(n_lines: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    w, h = FRAME_SIZE
+    results = []
+    step = max(1, (h - 60) // max(1, n_lines))
+    for i in range(n_lines):
+        x1 = int(rng.integers(10, w // 2))
+        y1 = 40 + i * step
+        x2 = x1 + int(rng.integers(120, w // 2 - 10))
+        y2 = y1 + 14
+        results.append({
+            "text": f"시험일 2025.11.{i:02d} LOT-{i:04d}",
+            "avg_conf": float(rng.uniform(0.5, 1.0)),
+            "box": [[x1, y1], [x2, y1], [x2, y2], [x1, y2]],
+        })
+    return results
+
+
+def legacy_render(frame, results):
+    """예전 process_capture 3) 단계 (줄마다 전체 프레임 색 변환)."""
+    vis_img = frame.copy()
+    font = get_font(20)
+    for r in results:
+        box = r["box"]
+        x1, y1 = int(box[0][0]), int(box[0][1])
+        x2, y2 = int(box[2][0]), int(box[2][1])
+        cv2.rectangle(vis_img, (x1, y1), (x2, y2), (0, 255, 255), 2)
+        pil_img = Image.fromarray(cv2.cvtColor(vis_img, cv2.COLOR_BGR2RGB))
+        ImageDraw.Draw(pil_img).text((x1, y1 - 22), f"{r['text']} ({r['avg_conf']:.2f})",
+                                     font=font, fill=(255, 0, 0))
+        vis_img = cv2.cvtColor(np.array(pil_img), cv2.COLOR_RGB2BGR)
+    return vis_img
+
+
+def composite_render(frame, results):
+    overlay = OverlayCompositor(frame)
+    for r in results:
+        box = r["box"]
+        x1, y1 = int(box[0][0]), int(box[0][1])
+        x2, y2 = int(box[2][0]), int(box[2][1])
+        overlay.add_rect((x1, y1), (x2, y2), (0, 255, 255), 2)
+        overlay.add_text(f"{r['text']} ({r['avg_conf']:.2f})", x1, y1 - 22, color=(255, 0, 0))
+    return overlay.compose()
+
+
+def run() -> dict:
+    rng = np.random.default_rng(0)
+    frame = rng.integers(0, 256, (FRAME_SIZE[1], FRAME_SIZE[0], 3), dtype=np.uint8)
+    get_font(20)  # 폰트 로딩은 측정에서 제외
+
+    results = {}
+    for n in LINE_COUNTS:
+        lines = make_results(n, seed=n)
+        diff = float(np.mean(cv2.absdiff(legacy_render(frame, lines), composite_render(frame, lines))))
+        legacy = measure(lambda: legacy_render(frame, lines), number=5, repeat=5)
+        fast = measure(lambda: composite_render(frame, lines), number=5, repeat=5)
+        results[n] = {
+            "legacy_ms": legacy["median_us"] / 1000.0,
+            "composite_ms": fast["median_us"] / 1000.0,
+            "speedup": legacy["median_us"] / max(fast["median_us"], 1e-9),
+            "mean_abs_diff": diff,
+        }
+    return results
+
+
+def main():
+    results = run()
+    print(f"🖼️ capture overlay rendering ({FRAME_SIZE[0]}x{FRAME_SIZE[1]})")
+    print(f"{'lines':>6s} {'legacy':>11s} {'composite':>11s} {'speed-up':>9s} {'pixel diff':>11s}")
+    for n, r in results.items():
+        print(f"{n:>6d} {r['legacy_ms']:>9.2f}ms {r['composite_ms']:>9.2f}ms "
+              f"{r['speedup']:>8.1f}x {r['mean_abs_diff']:>11.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+# ==========================================================
+# benchmarks/bench_serializers.py
+# ----------------------------------------------------------
+# 결과 JSON "직렬화 + 파일 쓰기" 시간과 디스크 용량 비교
+#
+#   - json-pretty   : 기존 방식 (표준 json, indent=4)
+#   - json-compact  : 표준 json, 들여쓰기 없음 + 좌표/신뢰도 반올림
+#   - orjson-pretty : orjson, 2칸 들여쓰기          (orjson 설치 시)
+#   - orjson-compact: orjson, 들여쓰기 없음 + 반올림 (orjson 설치 시)
+#
+# 결과 크기는 group_words() 출력과 같은 형태(box + word_boxes 포함)로
+# 줄 수 20 / 100 / 500 인 캡처를 만들어 사용합니다.
+#
+# 실행:
+#   python benchmarks/bench_serializers.py
+# ==========================================================
+
+import _timing  # noqa: F401  (src 경로 등록)
+from _timing import measure
+
+import os
+import tempfile
+
+import numpy as np
+
+from label_text_recognition.exporters.serializers import (
+    OrjsonSerializer,
+    OutputProfile,
+    StdlibJsonSerializer,
+)
+
+LINE_COUNTS = [20, 100, 500]
+
+
+def make_results(n_lines: int, seed: int = 0) -> list[dict]:
+    rng = np.random.default_rng(seed)
+    results = []
+    for i in range(n_lines):
+        n_words = int(rng.integers(1, 6))
+        x, y = float(rng.uniform(0, 1000)), float(rng.uniform(0, 700))
+        word_boxes = []
+        for _ in range(n_words):
+            w, h = float(rng.uniform(20, 120)), float(rng.uniform(12, 30))
+            word_boxes.append([[x, y], [x + w, y], [x + w, y + h], [x, y + h]])
+            x += w + float(rng.uniform(5, 25))
+        xs = [p[0] for wb in word_boxes for p in wb]
+        ys = [p[1] for wb in word_boxes for p in wb]
+        results.append({
+            "line_index": i + 1,
+            "text": " ".join(f"성명{i}-{k}" for k in range(n_words)),
+            "avg_conf": float(rng.uniform(0.5, 1.0)),
+            "box": [[min(xs), min(ys)], [max(xs), min(ys)], [max(xs), max(ys)], [min(xs), max(ys)]],
+            "word_boxes": word_boxes,
+        })
+    return results
+
+
+def _variants():
+    variants = [("json-pretty", StdlibJsonSerializer(), "pretty", 4),
+                ("json-compact", StdlibJsonSerializer(), "compact", None)]
+    try:
+        orjson_ser = OrjsonSerializer()
+        variants += [("orjson-pretty", orjson_ser, "pretty", 2),
+                     ("orjson-compact", orjson_ser, "compact", None)]
+    except ImportError:
+        print("ℹ️ orjson 미설치 → orjson 항목은 건너뜁니다.")
+    return variants
+
+
+def run() -> dict:
+    out_dir = tempfile.mkdtemp(prefix="bench_serializers_")
+    results = {}
+    for n in LINE_COUNTS:
+        data = make_results(n, seed=n)
+        row = {}
+        for name, serializer, profile, indent in _variants():
+            path = os.path.join(out_dir, f"{name}_{n}.json")
+            prof = OutputProfile(profile)
+
+            def write_once():
+                payload = serializer.dumps(prof.prepare(data), indent=indent)
+                with open(path, "wb") as f:
+                    f.write(payload)
+
+            stats = measure(write_once, number=max(1, 2000 // n), repeat=5)
+            row[name] = {"ms": stats["median_us"] / 1000.0, "bytes": os.path.getsize(path)}
+        results[n] = row
+    return results
+
+
+def main():
+    results = run()
+    print("🧾 result JSON serialize + write (median per capture)")
+    for n, row in results.items():
+        base = row["json-pretty"]
+        print(f"\n  lines={n}")
+        for name, r in row.items():
+            print(f"    {name:<15s} {r['ms']:>8.3f}ms  {r['bytes']:>9d} B  "
+                  f"(x{base['ms'] / max(r['ms'], 1e-9):.1f} faster, "
+                  f"{r['bytes'] / base['bytes'] * 100:.0f}% size)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+# ==========================================================
+# benchmarks/bench_sharpness.py
+# ----------------------------------------------------------
+# 선명도 지표별 "비용"과 "기준 점수와의 일치도" 비교.
+#
+#   - 기준(reference): camera_loop.get_definition_score 와 같은
+#                     전체 해상도 CV_64F 라플라시안 분산
+#   - 비교 대상      : metric x downscale x center_roi 조합
+#
+# 합성 라벨 프레임(1280x720)에 블러 강도를 바꿔가며 점수를 매기고,
+#   1) 프레임당 계산 시간
+#   2) 기준 점수와의 순위 상관(Spearman)
+#   3) 기준 점수 ≈ 후보 점수 × ratio 가 되는 환산 비율(중앙값)
+# 을 출력합니다. ratio 는 definition_threshold 재보정에 사용하세요.
+#
+# 실행:
+#   python benchmarks/bench_sharpness.py
+# ==========================================================
+
+import _timing  # noqa: F401  (src 경로 등록)
+from _timing import format_row, measure
+
+import cv2
+import numpy as np
+
+from label_text_recognition.camera.sharpness import SharpnessScorer, laplacian_variance
+
+CANDIDATES = [
+    ("laplacian", 1.0, 1.0),
+    ("laplacian32", 1.0, 1.0),
+    ("laplacian32", 0.5, 1.0),
+    ("laplacian32", 0.5, 0.6),
+    ("tenengrad", 1.0, 1.0),
+    ("tenengrad", 0.5, 1.0),
+    ("laplacian", 0.5, 1.0),
+    ("laplacian", 0.25, 1.0),
+]
+
+
+def make_label_frame(seed: int, width: int = 1280, height: int = 720):
+    """글자 줄이 여러 개 있는 합성 라벨 프레임."""
+    rng = np.random.default_rng(seed)
+    img = np.full((height, width, 3), 200, dtype=np.uint8)
+    img += rng.integers(0, 20, size=img.shape, dtype=np.uint8)
+    for row in range(8):
+        y = 80 + row * 75
+        text = "".join(rng.choice(list("ABCDEFGHJKLMNPQRSTUVWXYZ0123456789-"), size=18))
+        cv2.putText(img, text, (60, y), cv2.FONT_HERSHEY_SIMPLEX, 1.4, (20, 20, 20), 3, cv2.LINE_AA)
+    return img
+
+
+def make_frames():
+    frames = []
+    for seed in range(4):
+        base = make_label_frame(seed)
+        for sigma in (0, 0.8, 1.5, 2.5, 4.0):
+            frames.append(base if sigma == 0 else cv2.GaussianBlur(base, (0, 0), sigma))
+    return frames
+
+
+def spearman(a, b) -> float:
+    ra = np.argsort(np.argsort(a))
+    rb = np.argsort(np.argsort(b))
+    return float(np.corrcoef(ra, rb)[0, 1])
+
+
+def run() -> dict:
+    frames = make_frames()
+    reference = np.array([laplacian_variance(cv2.cvtColor(f, cv2.COLOR_BGR2GRAY)) for f in frames])
+    frame = frames[0]
+
+    results = {}
+    for metric, downscale, roi in CANDIDATES:
+        scorer = SharpnessScorer(metric=metric, downscale=downscale, center_roi=roi)
+        scores = np.array([scorer.compute(f) for f in frames])
+        stats = measure(lambda: scorer.compute(frame), number=20, repeat=5)
+        stats["spearman"] = spearman(reference, scores)
+        stats["ratio"] = float(np.median(reference / np.maximum(scores, 1e-9)))
+        results[f"{metric} ds={downscale} roi={roi}"] = stats
+    return results
+
+
+def main():
+    results = run()
+    print("📏 sharpness score cost / agreement vs reference (1280x720)")
+    for name, stats in results.items():
+        print(f"{format_row(name, stats)}  spearman={stats['spearman']:.3f}  ratio={stats['ratio']:.3f}")
+    print("\nℹ️ definition_threshold(새 지표) ≈ definition_threshold(기준) / ratio")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,280 @@
+# ==========================================================
+# benchmarks/run_benchmarks.py
+# ----------------------------------------------------------
+# 릴리스 간 성능 회귀를 잡기 위한 벤치마크 스위트 실행기입니다.
+#
+# 측정 항목 (기본: 스텁 엔진 → PaddleOCR 없이 실행 가능, 결과가 결정적)
+# ----------------------------------------------------------
+#   - merge_words_with_boxes : 줄 병합 + 시각화 (단어 50 / 500개)
+#   - group_words            : 줄 병합만 (렌더링 제외)
+#   - get_definition_score   : 1280x720 프레임 선명도 점수
+#   - draw_korean_text       : 프레임 위 한글 텍스트 1줄
+#   - export_all_json        : 결과 JSON 저장 (임시 폴더, files 모드)
+#   - run_ocr_on_image       : 스텁 엔진으로 전체 흐름 (render on / off)
+#
+# (선택) 실제 엔진 단계: --real-engine
+#   - ocr_backend 설정의 엔진(paddle / onnx)을 만들 수 있을 때만 실행, 없으면 건너뜀
+#   - --record 경로를 주면 실제 ocr() 출력을 저장 → 이후 --recording 으로 스텁에서 재생
+#
+# 결과 파일 (JSON)
+# ----------------------------------------------------------
+#   benchmarks/results/bench_YYYYmmdd_HHMMSS.json
+#   {"schema": 1, "created_at": ..., "git_commit": ..., "env": {...},
+#    "cases": {"<name>": {"best_us": ..., "median_us": ..., "number": ..., "repeat": ...}}}
+#
+# 실행 예시
+# ----------------------------------------------------------
+#   python benchmarks/run_benchmarks.py
+#   python benchmarks/run_benchmarks.py --baseline benchmarks/results/bench_v1.json
+#   python benchmarks/run_benchmarks.py --real-engine --image assets/pictures/sample.jpg
+#
+# --baseline 을 주면 case 별 median 을 비교하고, --max-regression(기본 25%) 보다
+# 느려진 항목이 있으면 종료 코드 1 로 끝납니다. (CI 에서 그대로 사용 가능)
+# ==========================================================
+
+import _timing  # noqa: F401  (src 경로 등록)
+from _timing import format_row, measure
+
+import argparse
+import contextlib
+import copy
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+from datetime import datetime
+
+import cv2
+import numpy as np
+
+from label_text_recognition.camera.camera_loop import draw_korean_text, get_definition_score
+from label_text_recognition.config.loader import load_ocr_config
+from label_text_recognition.config.settings import OcrConfig
+from label_text_recognition.exporters.json_exporter import export_all_json
+from label_text_recognition.ocr.ocr_runner import run_ocr_on_image
+from label_text_recognition.ocr.ocr_utils import group_words, merge_words_with_boxes
+from label_text_recognition.render.fonts import get_font
+
+from stub_engine import StubOcrEngine, make_label_frame, save_recording, synthetic_ocr_result
+
+RESULTS_DIR = os.path.join(_timing.CURRENT_DIR, "results")
+SCHEMA_VERSION = 1
+
+
+# ----------------------------------------------------------
+# 설정 / 환경 정보
+# ----------------------------------------------------------
+def bench_config(out_dir: str) -> OcrConfig:
+    """
+    실제 ocr_config.yaml 을 기반으로, 저장 경로만 임시 폴더로 바꾼 설정.
+    (SQLite 인덱스 / jsonl 처럼 프로세스 상태가 남는 저장은 끔)
+    """
+    raw = copy.deepcopy(load_ocr_config())
+    raw["enable_save_output"] = True
+    export_cfg = raw.setdefault("export_options", {})
+    export_cfg["mode"] = "files"
+    export_cfg.setdefault("text_json", {})["path"] = os.path.join(out_dir, "json")
+    export_cfg.setdefault("bbox_json", {})["path"] = os.path.join(out_dir, "json_bbox")
+    export_cfg.setdefault("sqlite_index", {})["enabled"] = False
+    return OcrConfig.from_mapping(raw)
+
+
+def _git_commit() -> str:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=_timing.PROJECT_ROOT, capture_output=True, text=True, timeout=5,
+        )
+        return out.stdout.strip() if out.returncode == 0 else ""
+    except (OSError, subprocess.SubprocessError):
+        return ""
+
+
+def environment() -> dict:
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "numpy": np.__version__,
+        "opencv": cv2.__version__,
+    }
+
+
+# ----------------------------------------------------------
+# 측정 항목
+# ----------------------------------------------------------
+def stub_cases(cfg: OcrConfig, engine: StubOcrEngine) -> dict:
+    """스텁 엔진 기반 항목들. {name: (fn, number)}"""
+    small = synthetic_ocr_result(n_words=50, seed=1)[0]
+    large = synthetic_ocr_result(n_words=500, seed=2)[0]
+    frame = make_label_frame(engine.result)
+    merged = group_words(engine.result[0] if engine.result else [])
+
+    return {
+        "merge_words_with_boxes[words=50]": (lambda: merge_words_with_boxes(frame, small), 20),
+        "merge_words_with_boxes[words=500]": (lambda: merge_words_with_boxes(frame, large), 5),
+        "group_words[words=500]": (lambda: group_words(large), 50),
+        "get_definition_score[1280x720]": (lambda: get_definition_score(frame), 50),
+        "draw_korean_text[1280x720]": (lambda: draw_korean_text(frame, "선명도: 123.4", 10, 10), 50),
+        f"export_all_json[lines={len(merged)}]": (lambda: export_all_json(merged, cfg), 20),
+        "run_ocr_on_image[stub, render]": (
+            lambda: run_ocr_on_image(frame, engine, cfg.conf_threshold, cfg.ocr_cls_enable, cfg=cfg), 10),
+        "run_ocr_on_image[stub, no render]": (
+            lambda: run_ocr_on_image(frame, engine, cfg.conf_threshold, cfg.ocr_cls_enable,
+                                     cfg=cfg, render=False), 50),
+    }
+
+
+def real_engine_cases(cfg: OcrConfig, image_path: str | None, record_path: str | None) -> dict:
+    """
+    실제 엔진 단계 (ocr_backend 설정의 백엔드). 엔진을 만들 수 없으면 빈 dict 를 돌려줍니다.
+    """
+    from label_text_recognition.ocr.backends import backend_options
+    from label_text_recognition.ocr.ocr_engine import build_ocr_engines
+
+    lang = cfg.ocr_langs[0]
+    backend = cfg.get("ocr_backend", "paddle") or "paddle"
+    try:
+        engine = build_ocr_engines([lang], backend, **backend_options(cfg, backend))[lang]
+    except (ImportError, FileNotFoundError, ValueError) as e:
+        print(f"ℹ️ 실제 엔진 단계를 건너뜁니다. ({backend} 엔진 생성 실패: {e})")
+        return {}
+
+    if image_path:
+        frame = cv2.imread(image_path)
+        if frame is None:
+            print(f"⚠️ 이미지를 읽을 수 없습니다: {image_path} → 합성 프레임 사용")
+    else:
+        frame = None
+    if frame is None:
+        frame = make_label_frame(synthetic_ocr_result())
+
+    # 첫 호출(콜드 스타트)은 측정에서 제외하고, 필요하면 출력을 녹화
+    first = engine.ocr(frame, cls=cfg.ocr_cls_enable)
+    if record_path:
+        save_recording(first, record_path)
+        print(f"📼 실제 엔진 출력 저장: {record_path}")
+
+    return {
+        f"run_ocr_on_image[{backend}:{lang}, no render]": (
+            lambda: run_ocr_on_image(frame, engine, cfg.conf_threshold, cfg.ocr_cls_enable,
+                                     cfg=cfg, render=False), 1),
+    }
+
+
+def run(
+    real_engine: bool = False,
+    image_path: str | None = None,
+    record_path: str | None = None,
+    recording: str | None = None,
+    repeat: int = 5,
+) -> dict:
+    out_dir = tempfile.mkdtemp(prefix="bench_suite_")
+    cfg = bench_config(out_dir)
+    get_font(20)  # 폰트 로딩은 측정에서 제외
+
+    if recording:
+        engine = StubOcrEngine.from_recording(recording)
+        print(f"📼 녹화된 엔진 출력 사용: {recording}")
+    else:
+        engine = StubOcrEngine.synthetic(n_words=120, seed=0)
+
+    cases = stub_cases(cfg, engine)
+    if real_engine:
+        cases.update(real_engine_cases(cfg, image_path, record_path))
+
+    measured = {}
+    for name, (fn, number) in cases.items():
+        # 저장/경고 메시지가 측정 결과 출력에 섞이지 않도록 stdout 을 잠시 돌려둠
+        with contextlib.redirect_stdout(io.StringIO()):
+            fn()  # 예열 (지연 import / 캐시 / 폴더 생성)
+            measured[name] = measure(fn, number=number, repeat=repeat)
+        print(format_row(name, measured[name]))
+
+    return {
+        "schema": SCHEMA_VERSION,
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "git_commit": _git_commit(),
+        "env": environment(),
+        "engine": "recording" if recording else "synthetic",
+        "cases": measured,
+    }
+
+
+# ----------------------------------------------------------
+# 저장 / 비교
+# ----------------------------------------------------------
+def save_report(report: dict, path: str | None = None) -> str:
+    if path is None:
+        ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+        path = os.path.join(RESULTS_DIR, f"bench_{ts}.json")
+    out_dir = os.path.dirname(path)
+    if out_dir:
+        os.makedirs(out_dir, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    return path
+
+
+def compare(report: dict, baseline: dict, max_regression: float) -> list[str]:
+    """
+    baseline 대비 median 이 max_regression 비율 이상 느려진 항목 이름을 돌려줍니다.
+    (한쪽에만 있는 항목은 비교하지 않음)
+    """
+    regressions = []
+    print(f"\n📊 baseline 비교 (commit {baseline.get('git_commit') or '?'}, "
+          f"허용 {max_regression * 100:.0f}%)")
+    for name, cur in report["cases"].items():
+        base = baseline.get("cases", {}).get(name)
+        if not base:
+            continue
+        ratio = cur["median_us"] / max(base["median_us"], 1e-9)
+        mark = "✅"
+        if ratio > 1.0 + max_regression:
+            mark = "❌"
+            regressions.append(name)
+        print(f"  {mark} {name:<40s} {base['median_us']:>10.2f}us → {cur['median_us']:>10.2f}us  (x{ratio:.2f})")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the benchmark suite and write a JSON report.")
+    parser.add_argument("--output", "-o", default=None,
+                        help="report path (default: benchmarks/results/bench_<ts>.json)")
+    parser.add_argument("--baseline", default=None, help="previous report to compare against")
+    parser.add_argument("--max-regression", type=float, default=0.25,
+                        help="allowed slowdown vs baseline median (0.25 = 25%%)")
+    parser.add_argument("--repeat", type=int, default=5, help="timeit repeat count per case")
+    parser.add_argument("--recording", default=None, help="replay a recorded ocr() output in the stub engine")
+    parser.add_argument("--real-engine", action="store_true", help="also time the real PaddleOCR engine")
+    parser.add_argument("--image", default=None, help="image for the real-engine tier")
+    parser.add_argument("--record", default=None, help="save the real engine's ocr() output to this file")
+    args = parser.parse_args()
+
+    print("⏱️ benchmark suite")
+    report = run(
+        real_engine=args.real_engine,
+        image_path=args.image,
+        record_path=args.record,
+        recording=args.recording,
+        repeat=args.repeat,
+    )
+    path = save_report(report, args.output)
+    print(f"\n💾 결과 저장: {path}")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.max_regression)
+        if regressions:
+            print(f"\n❌ 성능 회귀 {len(regressions)}건: {', '.join(regressions)}")
+            sys.exit(1)
+        print("\n✅ 성능 회귀 없음")
+
+
+if __name__ == "__main__":
+    main()
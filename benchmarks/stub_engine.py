@@ -0,0 +1,146 @@
+# ==========================================================
+# benchmarks/stub_engine.py
+# ----------------------------------------------------------
+# PaddleOCR 대신 쓰는 "결정적(deterministic)" 스텁 엔진입니다.
+#
+#   - 실제 추론 없이 미리 정해진 ocr() 출력을 그대로 돌려줍니다.
+#     → run_ocr_on_image 전체 흐름(필터링 → 줄 병합 → 시각화)을
+#       엔진 지연 편차 없이 측정할 수 있습니다.
+#   - 출력은 두 가지 중 하나
+#       1) 합성 출력 : synthetic_ocr_result(n_words, seed) (seed 가 같으면 항상 같은 결과)
+#       2) 녹화 출력 : 실제 엔진의 ocr() 결과를 JSON 으로 저장해 둔 파일
+#                      (run_benchmarks.py --real-engine --record 로 생성)
+#
+# 사용 예시
+# ----------------------------------------------------------
+# engine = StubOcrEngine.synthetic(n_words=120, seed=0)
+# engine = StubOcrEngine.from_recording("benchmarks/recordings/label.json")
+# results, vis, msg = run_ocr_on_image(frame, engine, cfg=cfg)
+# ==========================================================
+
+import json
+import os
+import time
+
+import numpy as np
+
+FRAME_SIZE = (1280, 720)  # (width, height)
+
+_WORDS = ["시험일", "2025.11.19", "LOT-0412", "성명", "홍길동", "제조번호", "A-1029",
+          "유효기간", "2026.05.31", "중량", "250g", "보관", "냉장", "검사자", "OK"]
+
+
+def synthetic_ocr_result(
+    n_words: int = 120,
+    seed: int = 0,
+    frame_size: tuple[int, int] = FRAME_SIZE,
+) -> list:
+    """
+    라벨처럼 여러 줄에 단어가 늘어선 PaddleOCR 형식의 결과를 만듭니다.
+
+    Returns
+    -------
+    list
+        [[ [box, (text, conf)], ... ]]  (ocr() 와 같은 "페이지 1장" 구조)
+        box 는 4점 [[x, y], ...] (float)
+    """
+    rng = np.random.default_rng(seed)
+    width, height = frame_size
+    words = []
+    x, y = 40.0, 30.0
+    while len(words) < n_words:
+        w = float(rng.uniform(40, 160))
+        h = float(rng.uniform(18, 30))
+        if x + w > width - 40:
+            # 다음 줄로 (줄 간격은 y_thresh 보다 크게)
+            x, y = 40.0, y + float(rng.uniform(36, 48))
+            if y + h > height - 20:
+                y = 30.0 + float(rng.uniform(0, 10))
+        dy = float(rng.uniform(-3, 3))  # 같은 줄 안에서도 살짝 기울어짐
+        box = [[x, y + dy], [x + w, y + dy], [x + w, y + h + dy], [x, y + h + dy]]
+        text = str(rng.choice(_WORDS))
+        conf = float(rng.uniform(0.35, 0.99))
+        words.append([box, (text, conf)])
+        # 대부분은 x_gap_thresh 안쪽 간격, 가끔 멀리 떨어진 단어
+        x += w + float(rng.choice([8.0, 15.0, 22.0, 60.0]))
+    return [words]
+
+
+def make_label_frame(result: list, frame_size: tuple[int, int] = FRAME_SIZE, seed: int = 0):
+    """
+    스텁 결과의 박스 위치에 글자 블록을 그린 합성 프레임 (BGR).
+    선명도/시각화 측정이 실제 라벨과 비슷한 픽셀 분포에서 이뤄지도록 사용합니다.
+    """
+    import cv2
+
+    rng = np.random.default_rng(seed)
+    width, height = frame_size
+    img = np.full((height, width, 3), 210, dtype=np.uint8)
+    img += rng.integers(0, 20, size=img.shape, dtype=np.uint8)
+    for box, (_text, _conf) in (result[0] if result else []):
+        x1, y1 = int(box[0][0]), int(box[0][1])
+        x2, y2 = int(box[2][0]), int(box[2][1])
+        cv2.putText(img, "ABC123", (x1, y2 - 4), cv2.FONT_HERSHEY_SIMPLEX,
+                    max(0.4, (y2 - y1) / 30.0), (30, 30, 30), 2, cv2.LINE_AA)
+    return img
+
+
+def _to_jsonable(value):
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (list, tuple)):
+        return [_to_jsonable(v) for v in value]
+    return value
+
+
+def save_recording(result: list, path: str) -> None:
+    """실제 엔진의 ocr() 결과를 JSON 으로 저장합니다. (numpy 값은 리스트로 변환)"""
+    out_dir = os.path.dirname(path)
+    if out_dir:
+        os.makedirs(out_dir, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(_to_jsonable(result), f, ensure_ascii=False)
+
+
+def load_recording(path: str) -> list:
+    """save_recording() 으로 저장한 결과를 ocr() 형식([[box, (text, conf)], ...])으로 읽습니다."""
+    with open(path, "r", encoding="utf-8") as f:
+        pages = json.load(f)
+    return [
+        [[box, (text, conf)] for box, (text, conf) in (page or [])]
+        for page in (pages or [])
+    ]
+
+
+class StubOcrEngine:
+    """
+    PaddleOCR.ocr(image, cls=...) 와 같은 인터페이스의 스텁 엔진.
+
+    Parameters
+    ----------
+    result : list
+        매 호출마다 돌려줄 ocr() 결과 (입력 이미지와 무관하게 항상 같음)
+    latency_ms : float
+        호출마다 추가로 기다릴 시간 (엔진 지연을 흉내 낼 때만 사용, 기본 0)
+    """
+
+    def __init__(self, result: list, latency_ms: float = 0.0):
+        self.result = result
+        self.latency_ms = float(latency_ms)
+        self.calls = 0
+
+    @classmethod
+    def synthetic(cls, n_words: int = 120, seed: int = 0, latency_ms: float = 0.0) -> "StubOcrEngine":
+        return cls(synthetic_ocr_result(n_words, seed), latency_ms=latency_ms)
+
+    @classmethod
+    def from_recording(cls, path: str, latency_ms: float = 0.0) -> "StubOcrEngine":
+        return cls(load_recording(path), latency_ms=latency_ms)
+
+    def ocr(self, image, cls: bool = True):
+        self.calls += 1
+        if self.latency_ms > 0:
+            time.sleep(self.latency_ms / 1000.0)
+        return self.result
@@ -0,0 +1,122 @@
+# ==========================================================
+# batch_ocr.py
+# ----------------------------------------------------------
+# 디렉터리 / glob 으로 지정한 이미지 전체를 병렬로 OCR 하는 배치 CLI 입니다.
+# 워커 프로세스마다 엔진을 한 번만 만들어서 상주시키고,
+# 결과는 입력 순서대로 스트리밍 출력합니다.
+#
+# 실행 예시
+# ----------------------------------------------------------
+#   python demos/batch_ocr.py assets/pictures_origin
+#   python demos/batch_ocr.py "archive/2025-*/**/*.jpg" --workers 4 --jsonl out.jsonl
+#
+# 종료 시 처리량(images/s)과 지연시간 백분위(p50/p90/p99)를 출력합니다.
+# ==========================================================
+
+import os
+import sys
+import argparse
+import json
+import time
+
+# src 경로 추가
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(CURRENT_DIR)
+SRC_PATH = os.path.join(PROJECT_ROOT, "src")
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
+
+from label_text_recognition.config.loader import load_ocr_config
+from label_text_recognition.ocr.backends import backend_options
+from label_text_recognition.ocr.batch_runner import (
+    BatchSummary,
+    collect_image_paths,
+    iter_batch_ocr,
+)
+
+
+def main():
+    cfg = load_ocr_config()
+    batch_cfg = cfg.get("batch", {}) or {}
+    ocr_langs = cfg.get("ocr_langs", ["en"])
+
+    parser = argparse.ArgumentParser(description="Run OCR over directories / globs in parallel.")
+    parser.add_argument("inputs", nargs="+", help="image files, directories or glob patterns")
+    parser.add_argument("--workers", "-w", type=int,
+                        default=batch_cfg.get("workers", max(1, (os.cpu_count() or 2) // 2)),
+                        help="number of worker processes (each keeps one engine resident)")
+    parser.add_argument("--lang", default=ocr_langs[0], help="OCR language (default: ocr_langs[0])")
+    parser.add_argument("--chunksize", type=int, default=batch_cfg.get("chunksize", 1),
+                        help="images handed to a worker at once")
+    parser.add_argument("--no-recursive", action="store_true", help="do not descend into sub directories")
+    parser.add_argument("--jsonl", default=None, help="write one JSON record per image to this file")
+    parser.add_argument("--quiet", "-q", action="store_true", help="only print the final summary")
+    args = parser.parse_args()
+
+    extensions = batch_cfg.get("extensions") or None
+    if extensions:
+        paths = collect_image_paths(args.inputs, extensions, recursive=not args.no_recursive)
+    else:
+        paths = collect_image_paths(args.inputs, recursive=not args.no_recursive)
+
+    if not paths:
+        print("❌ 처리할 이미지가 없습니다. 경로/패턴을 확인하세요.")
+        return
+
+    backend = cfg.get("ocr_backend", "paddle") or "paddle"
+    print(f"🚀 배치 OCR 시작: {len(paths)}장, workers={args.workers}, lang={args.lang}, backend={backend}")
+
+    jsonl_file = None
+    if args.jsonl:
+        out_dir = os.path.dirname(args.jsonl)
+        if out_dir:
+            os.makedirs(out_dir, exist_ok=True)
+        jsonl_file = open(args.jsonl, "w", encoding="utf-8")
+
+    summary = BatchSummary()
+    started = time.perf_counter()
+    try:
+        items = iter_batch_ocr(
+            paths,
+            lang=args.lang,
+            workers=args.workers,
+            conf_threshold=cfg.get("conf_threshold", 0.5),
+            cls_enable=cfg.get("ocr_cls_enable", True),
+            chunksize=args.chunksize,
+            warmup=(cfg.get("engine", {}) or {}).get("warmup", True),
+            backend=backend,
+            backend_options=backend_options(cfg, backend),
+            preprocess_cfg={
+                "downscale": dict(cfg.get("downscale", {}) or {}),
+                "tiling": dict(cfg.get("tiling", {}) or {}),
+            },
+        )
+        for idx, item in enumerate(items, start=1):
+            summary.add(item)
+
+            if not args.quiet:
+                print(f"[{idx}/{len(paths)}] {item.path} | {len(item.results)} lines | "
+                      f"{item.latency_ms:.1f}ms | {item.message}")
+
+            if jsonl_file is not None:
+                record = {
+                    "image": item.path,
+                    "message": item.message,
+                    "latency_ms": round(item.latency_ms, 2),
+                    "results": item.results,
+                }
+                jsonl_file.write(json.dumps(record, ensure_ascii=False) + "\n")
+    except KeyboardInterrupt:
+        print("\n⏹ 중단 요청 → 지금까지의 결과로 요약합니다.")
+    finally:
+        summary.elapsed_sec = time.perf_counter() - started
+        if jsonl_file is not None:
+            jsonl_file.close()
+
+    print(summary.format_report())
+    if args.jsonl:
+        print(f"✅ 결과 JSONL: {args.jsonl}")
+
+
+if __name__ == "__main__":
+    main()
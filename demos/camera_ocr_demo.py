@@ -2,10 +2,15 @@
 # 카메라를 켜서 실시간으로 OCR을 돌려보는 데모 스크립트입니다.
 # 실제 로직은 src/label_text_recognition/camera/camera_loop.py 안에 있고
 # 여기서는 그 함수를 불러와서 실행만 합니다.
+#
+# 카메라 대신 녹화 파일 / 이미지 폴더를 같은 루프로 돌릴 수도 있습니다.
+#   python demos/camera_ocr_demo.py --video line3.mp4 --fast --ocr-every 15
+#   python demos/camera_ocr_demo.py --dir assets/pictures-origin --ocr-every 1
 # ==========================================================
 
 import os
 import sys
+import argparse
 
 # src/ 경로를 파이썬 경로에 추가 (로컬 실행 편의용)
 CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -15,7 +20,31 @@ if SRC_PATH not in sys.path:
     sys.path.insert(0, SRC_PATH)
 
 from label_text_recognition.camera.camera_loop import start_camera_ocr
+from label_text_recognition.camera.frame_source import ImageDirSource, VideoFileSource
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Live camera OCR (or replay a video / image folder).")
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--video", help="카메라 대신 사용할 동영상 파일")
+    group.add_argument("--dir", help="카메라 대신 사용할 이미지 폴더 (파일 이름 순)")
+    parser.add_argument("--stride", type=int, default=1, help="N 프레임마다 1장만 사용")
+    parser.add_argument("--fast", action="store_true", help="실시간 속도 대신 최대 속도로 재생")
+    parser.add_argument("--fps", type=float, default=10.0, help="--dir 를 실시간으로 재생할 때 fps")
+    parser.add_argument("--ocr-every", type=int, default=None,
+                        help="N 프레임마다 자동 OCR (기본: frame_source.ocr_every)")
+    args = parser.parse_args()
+
+    source = None
+    if args.video:
+        source = VideoFileSource(args.video, stride=args.stride, realtime=not args.fast)
+    elif args.dir:
+        source = ImageDirSource(args.dir, stride=args.stride, realtime=not args.fast, fps=args.fps)
+    if source is not None and source.exhausted:
+        return
+
+    start_camera_ocr(source=source, ocr_every=args.ocr_every)
 
 
 if __name__ == "__main__":
-    start_camera_ocr()
+    main()
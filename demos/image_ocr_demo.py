@@ -17,8 +17,12 @@ if SRC_PATH not in sys.path:
     sys.path.insert(0, SRC_PATH)
 
 from label_text_recognition.config.loader import load_ocr_config
-from label_text_recognition.ocr.ocr_engine import build_ocr_engines
+from label_text_recognition.ocr.cascade import CascadeRecognizer
+from label_text_recognition.ocr.downscale import AdaptiveDownscaler
+from label_text_recognition.ocr.engine_registry import build_engine_registry
 from label_text_recognition.ocr.ocr_runner import run_ocr_on_image
+from label_text_recognition.ocr.roi import RoiSet
+from label_text_recognition.ocr.tiling import TiledOcr
 from label_text_recognition.exporters.json_exporter import export_to_json
 
 
@@ -28,14 +32,21 @@ def main():
     args = parser.parse_args()
 
     cfg = load_ocr_config()
-    ocr_langs = cfg.get("ocr_langs", ["en"])
     conf_threshold = cfg.get("conf_threshold", 0.5)
     output_json_dir = cfg.get("output_dir_json", "assets/json")
     os.makedirs(output_json_dir, exist_ok=True)
 
-    # 엔진 생성
-    engines = build_ocr_engines(ocr_langs)
-    main_engine = engines[ocr_langs[0]]
+    # 엔진 생성 (메인 언어 엔진만 생성 — 나머지 언어는 쓰지 않으므로 로딩하지 않음)
+    registry = build_engine_registry(cfg)
+    main_engine = registry.get()
+    # cascade.enabled 이면 신뢰도가 낮은 영역만 보조 언어 엔진으로 재인식
+    cascade = CascadeRecognizer.from_config(cfg, registry)
+    # roi.enabled 이면 관심 영역만 잘라서 OCR (박스는 원본 이미지 좌표)
+    roi = RoiSet.from_config(cfg)
+    # downscale.enabled 이면 축소 이미지에서 검출, 원본 해상도에서 인식
+    downscale = AdaptiveDownscaler.from_config(cfg)
+    # tiling.enabled 이면 아주 큰 스캔은 겹치는 타일로 나눠서 OCR
+    tiling = TiledOcr.from_config(cfg, engine_factory=registry.create_engine)
 
     # 이미지 읽기
     img = cv2.imread(args.image)
@@ -44,12 +55,17 @@ def main():
         return
 
     # OCR 실행
-    results, vis_img = run_ocr_on_image(img, main_engine, conf_threshold)
+    results, vis_img, msg = run_ocr_on_image(
+        img, main_engine, conf_threshold, cascade=cascade, roi=roi, downscale=downscale, tiling=tiling
+    )
+    print(f"ℹ️ {msg}")
+    if cascade is not None:
+        print(cascade.format_stats())
 
     # JSON 저장
     ts = time.strftime("%Y%m%d_%H%M%S")
     out_json = os.path.join(output_json_dir, f"image_{ts}.json")
-    export_to_json(results, out_json)
+    export_to_json(results, out_json, ts=ts)
 
     print(f"✅ OCR 완료, 결과 JSON: {out_json}")
     for r in results:
@@ -0,0 +1,82 @@
+# ==========================================================
+# query_results.py
+# ----------------------------------------------------------
+# SQLite 결과 인덱스(export_options.sqlite_index)에서
+# 인식된 텍스트로 캡처를 찾는 조회 CLI 입니다.
+#
+# 실행 예시
+# ----------------------------------------------------------
+#   python demos/query_results.py "LOT-2025"
+#   python demos/query_results.py 시험일 --since 20251101 --until 20251130_235959
+#   python demos/query_results.py --stats
+#
+# 결과는 최신 캡처부터 출력하며, 조회에 걸린 시간(ms)을 함께 표시합니다.
+# ==========================================================
+
+import os
+import sys
+import argparse
+import json
+import time
+
+# src 경로 추가
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(CURRENT_DIR)
+SRC_PATH = os.path.join(PROJECT_ROOT, "src")
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
+
+from label_text_recognition.config.loader import load_ocr_config
+from label_text_recognition.exporters.sqlite_index import SqliteResultIndex
+
+
+def main():
+    cfg = load_ocr_config()
+    index_cfg = (cfg.get("export_options", {}) or {}).get("sqlite_index", {}) or {}
+
+    parser = argparse.ArgumentParser(description="Search captured OCR results by recognized text.")
+    parser.add_argument("query", nargs="?", default=None, help="text to search for")
+    parser.add_argument("--db", default=index_cfg.get("path", "assets/ocr_index.sqlite3"),
+                        help="index database (default: export_options.sqlite_index.path)")
+    parser.add_argument("--limit", "-n", type=int, default=50, help="maximum number of lines to print")
+    parser.add_argument("--since", default=None, help="only captures with ts >= SINCE (e.g. 20251101)")
+    parser.add_argument("--until", default=None, help="only captures with ts <= UNTIL (e.g. 20251130_235959)")
+    parser.add_argument("--like", action="store_true", help="use LIKE '%%query%%' instead of the FTS index")
+    parser.add_argument("--stats", action="store_true", help="print index statistics")
+    parser.add_argument("--json", action="store_true", help="print matches as JSON lines")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.db):
+        print(f"❌ 인덱스 DB 가 없습니다: {args.db}")
+        print("   ocr_config.yaml 의 export_options.sqlite_index.enabled 를 true 로 설정하세요.")
+        return
+
+    index = SqliteResultIndex(args.db, fts_tokenizer=index_cfg.get("fts_tokenizer", "trigram"))
+    try:
+        if args.stats or not args.query:
+            stats = index.stats()
+            print(f"📚 {stats['db_path']}  ({stats['db_bytes'] / 1024 / 1024:.1f} MB, fts={stats['fts_mode']})")
+            print(f"   captures={stats['captures']}  lines={stats['lines']}  "
+                  f"range={stats['first_ts']} ~ {stats['last_ts']}")
+            if not args.query:
+                return
+
+        started = time.perf_counter()
+        rows = index.search(args.query, limit=args.limit,
+                            since=args.since, until=args.until, use_like=args.like)
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+
+        for row in rows:
+            if args.json:
+                print(json.dumps(row, ensure_ascii=False))
+            else:
+                conf = row["avg_conf"] if row["avg_conf"] is not None else 0.0
+                print(f"[{row['ts']}] {row['line_index']}. {row['text']} ({conf:.2f})  {row['image'] or ''}")
+
+        print(f"🔎 '{args.query}' → {len(rows)}건 ({elapsed_ms:.1f}ms)")
+    finally:
+        index.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -8,12 +8,12 @@
 import os
 import json
 import cv2
-import numpy as np
-from PIL import Image, ImageDraw, ImageFont
 from datetime import datetime
 import argparse
 
 from label_text_recognition.config.loader import load_ocr_config
+from label_text_recognition.render.fonts import configure_fonts
+from label_text_recognition.render.overlay import OverlayCompositor
 
 
 # ----------------------------------------------------------
@@ -22,8 +22,7 @@ from label_text_recognition.config.loader import load_ocr_config
 def redraw_from_json(img_path: str, json_path: str, cfg) -> str:
     """OCR JSON 결과를 기반으로 이미지 위에 한글 텍스트를 다시 그림"""
 
-    # 1. YAML에서 폰트 설정 및 출력 여부 확인
-    font_path = "/usr/share/fonts/truetype/noto/NotoSansCJK-Regular.ttc"
+    # 1. YAML에서 출력 여부 확인
     enable_redraw = cfg.get("enable_redraw_from_json", True)
     if not enable_redraw:
         print("🔕 redraw_from_json 기능이 비활성화되어 있습니다. (YAML 설정 확인)")
@@ -34,16 +33,8 @@ def redraw_from_json(img_path: str, json_path: str, cfg) -> str:
     if bgr is None:
         raise FileNotFoundError(f"이미지를 찾을 수 없습니다: {img_path}")
 
-    rgb = cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB)
-    pil_img = Image.fromarray(rgb)
-    draw = ImageDraw.Draw(pil_img)
-
-    # 3. 폰트 로드
-    try:
-        font = ImageFont.truetype(font_path, 20)
-    except OSError:
-        print("⚠️ NotoSansCJK 폰트를 찾을 수 없습니다. 기본 폰트로 대체합니다.")
-        font = ImageFont.load_default()
+    # 3. 박스/텍스트를 모아서 한 번에 합성 (폰트는 fonts.candidates 에서 결정된 한글 폰트)
+    overlay = OverlayCompositor(bgr, copy=False)
 
     # 4. JSON 불러오기
     with open(json_path, "r", encoding="utf-8") as f:
@@ -60,12 +51,12 @@ def redraw_from_json(img_path: str, json_path: str, cfg) -> str:
         x1, y1 = int(box[0][0]), int(box[0][1])
         x2, y2 = int(box[2][0]), int(box[2][1])
 
-        # 사각형 박스
-        draw.rectangle((x1, y1, x2, y2), outline=(255, 255, 0), width=2)
+        # 사각형 박스 (BGR 기준 노란색)
+        overlay.add_rect((x1, y1), (x2, y2), (0, 255, 255), 2)
 
-        # 텍스트 (박스 위쪽에 표시)
+        # 텍스트 (박스 위쪽에 표시, RGB 기준 빨간색)
         text_y = y1 - 22 if y1 - 22 > 0 else y1 + 2
-        draw.text((x1, text_y), text, font=font, fill=(255, 0, 0))
+        overlay.add_text(text, x1, text_y, color=(255, 0, 0), font_size=20)
 
     # 6. 결과 저장
     today = datetime.now().strftime("%Y%m%d")
@@ -75,7 +66,7 @@ def redraw_from_json(img_path: str, json_path: str, cfg) -> str:
     os.makedirs(out_dir, exist_ok=True)
     out_path = os.path.join(out_dir, file_name)
 
-    out_bgr = cv2.cvtColor(np.array(pil_img), cv2.COLOR_RGB2BGR)
+    out_bgr = overlay.compose()
     cv2.imwrite(out_path, out_bgr)
     print(f"✅ 재시각화 완료 → {out_path}")
 
@@ -92,4 +83,5 @@ if __name__ == "__main__":
     args = parser.parse_args()
 
     cfg = load_ocr_config()
+    configure_fonts(cfg)
     redraw_from_json(args.img, args.json, cfg)
\ No newline at end of file
@@ -0,0 +1,156 @@
+# ==========================================================
+# auto_trigger.py
+# ----------------------------------------------------------
+# 작업자가 SPACE 를 누르지 않아도, 프레임이 "충분히 선명하고 + 일정 프레임
+# 동안 움직임이 없을 때" 자동으로 OCR 을 요청하는 트리거 모듈입니다.
+# (컨베이어 라인처럼 라벨이 들어왔다 멈췄다 빠지는 환경용)
+#
+# 판단 기준
+# ----------------------------------------------------------
+# 1) 선명도   : get_definition_score(frame) >= definition_threshold
+# 2) 안정성   : 축소한 흑백 프레임끼리의 평균 차이(frame differencing)가
+#               motion_threshold 이하인 상태가 stable_frames 프레임 연속
+# 3) 쿨다운   : 마지막 트리거 이후 cooldown_sec 초가 지났을 것
+# 4) 장면 변화: (require_scene_change=true 일 때) 마지막 트리거 때의 장면과
+#               충분히 달라졌을 것 → 같은 라벨을 수십 번 OCR 하지 않음
+#
+# 결과적으로 추론 횟수는 "프레임 수"가 아니라 "라벨 수"에 비례합니다.
+# ==========================================================
+
+import time
+
+import cv2
+import numpy as np
+
+
+class AutoTrigger:
+    """
+    프레임마다 update() 를 호출하면, OCR 을 실행해야 하는 시점에만 True 를 돌려줍니다.
+    """
+
+    def __init__(
+        self,
+        definition_threshold: float,
+        stable_frames: int = 8,
+        motion_threshold: float = 3.0,
+        cooldown_sec: float = 2.0,
+        require_scene_change: bool = True,
+        scene_change_threshold: float = 15.0,
+        diff_width: int = 160,
+    ):
+        self.definition_threshold = definition_threshold
+        self.stable_frames = max(1, int(stable_frames))
+        self.motion_threshold = float(motion_threshold)
+        self.cooldown_sec = float(cooldown_sec)
+        self.require_scene_change = require_scene_change
+        self.scene_change_threshold = float(scene_change_threshold)
+        self.diff_width = max(16, int(diff_width))
+
+        self.stable_count = 0
+        self.last_motion = 0.0
+        self.armed = True
+        self.fire_count = 0
+        self._prev_small = None
+        self._trigger_small = None
+        self._last_fire_at = float("-inf")
+
+    @classmethod
+    def from_config(cls, cfg) -> "AutoTrigger":
+        trigger_cfg = cfg.get("auto_trigger", {}) or {}
+        return cls(
+            definition_threshold=cfg.get("definition_threshold", 200),
+            stable_frames=trigger_cfg.get("stable_frames", 8),
+            motion_threshold=trigger_cfg.get("motion_threshold", 3.0),
+            cooldown_sec=trigger_cfg.get("cooldown_sec", 2.0),
+            require_scene_change=trigger_cfg.get("require_scene_change", True),
+            scene_change_threshold=trigger_cfg.get("scene_change_threshold", 15.0),
+            diff_width=trigger_cfg.get("diff_width", 160),
+        )
+
+    # ------------------------------------------------------
+    # 내부 도우미
+    # ------------------------------------------------------
+    def _small_gray(self, frame):
+        """
+        차분 계산용 축소 흑백 이미지. (160px 폭이면 1280x720 대비 약 1/64 픽셀)
+        """
+        h, w = frame.shape[:2]
+        scale = self.diff_width / float(w)
+        size = (self.diff_width, max(1, int(round(h * scale))))
+        small = cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+        if small.ndim == 3:
+            small = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+        return small
+
+    @staticmethod
+    def _mean_absdiff(a, b) -> float:
+        return float(np.mean(cv2.absdiff(a, b)))
+
+    # ------------------------------------------------------
+    # 메인 API
+    # ------------------------------------------------------
+    def update(self, frame, def_score: float, can_fire: bool = True, now: float | None = None) -> bool:
+        """
+        새 프레임으로 상태를 갱신하고, 지금 OCR 을 실행해야 하면 True 를 돌려줍니다.
+
+        Parameters
+        ----------
+        frame : np.ndarray
+            현재 프레임 (BGR)
+        def_score : float
+            이미 계산된 현재 프레임 선명도 (get_definition_score 결과)
+        can_fire : bool
+            False 면 조건이 맞아도 발사하지 않고 기다립니다.
+            (예: OCR 워커가 아직 이전 작업을 처리 중일 때)
+        now : float | None
+            테스트용 시각 주입. None 이면 time.monotonic().
+        """
+        now = time.monotonic() if now is None else now
+        small = self._small_gray(frame)
+
+        # 1) 직전 프레임과의 차이 → 안정 프레임 카운트
+        if self._prev_small is not None and self._prev_small.shape == small.shape:
+            self.last_motion = self._mean_absdiff(small, self._prev_small)
+            if self.last_motion <= self.motion_threshold:
+                self.stable_count += 1
+            else:
+                self.stable_count = 0
+        self._prev_small = small
+
+        # 2) 마지막 트리거 장면과 충분히 달라지면 다시 무장(armed)
+        if not self.armed and self._trigger_small is not None:
+            if self._mean_absdiff(small, self._trigger_small) >= self.scene_change_threshold:
+                self.armed = True
+
+        # 3) 발사 조건 확인
+        if not can_fire or not self.armed:
+            return False
+        if self.stable_count < self.stable_frames:
+            return False
+        if def_score < self.definition_threshold:
+            return False
+        if now - self._last_fire_at < self.cooldown_sec:
+            return False
+
+        self._last_fire_at = now
+        self.fire_count += 1
+        self.stable_count = 0
+        if self.require_scene_change:
+            self.armed = False
+            self._trigger_small = small
+        return True
+
+    def status_text(self, now: float | None = None) -> str:
+        """
+        미리보기 오버레이용 짧은 상태 문자열.
+        """
+        now = time.monotonic() if now is None else now
+        if not self.armed:
+            return f"AUTO: waiting for new label (fired {self.fire_count})"
+        remain = self.cooldown_sec - (now - self._last_fire_at)
+        if remain > 0:
+            return f"AUTO: cooldown {remain:.1f}s"
+        return (
+            f"AUTO: stable {min(self.stable_count, self.stable_frames)}/{self.stable_frames}"
+            f" motion={self.last_motion:.1f}"
+        )
@@ -14,6 +14,17 @@
 # 2) 수동 고정 모드: camera_index에 숫자를 넣은 경우
 #    → 그 숫자를 그대로 카메라 인덱스로 사용
 #
+# 빠른 자동 탐색
+# ----------------------------------------------------------
+# - 예전에는 init_camera 가 0~9번을 차례로 열어보고(scan), resolve_camera_index 가
+#   같은 장치들을 한 번 더 열어봤습니다. 리눅스(V4L2)에서는 없는 장치를 여는 데
+#   몇 초씩 걸리기도 해서 시작이 한참 멈췄습니다.
+# ✅ 리눅스에서는 /dev/videoN 이 없는 번호는 열어보지 않음
+# ✅ 남은 번호는 스레드로 동시에 열어보고, probe_timeout 초가 지나면 기다리지 않음
+# ✅ 마지막으로 성공한 카메라 번호 / 해상도를 작은 JSON 캐시 파일에 저장
+#    → 다음 실행 때는 그 카메라를 먼저 열어보고, 열리면 탐색을 건너뜀
+# ✅ init_camera 는 탐색을 한 번만 하고 결과(available)를 resolve_camera_index 에 넘김
+#
 # 추가 기능
 # ----------------------------------------------------------
 # - cv2.VideoCapture() 접근 시 OS 오류나 장치 문제로 예외가 발생하더라도
@@ -28,6 +39,9 @@
 # camera_id = resolve_camera_index(cfg.get("camera_index", "auto"))
 # cap = cv2.VideoCapture(camera_id)
 #
+# available = scan_cameras(max_index=10, timeout=3.0)   # 동시 탐색 결과를 재사용할 때
+# camera_id = resolve_camera_index("auto", available=available)
+#
 # YAML에서의 설정 예시
 # ----------------------------------------------------------
 # camera_index: auto        # → 자동으로 사용 가능한 카메라 찾기
@@ -36,16 +50,92 @@
 #
 # 주의
 # ----------------------------------------------------------
-# - 자동 탐색은 0부터 순서대로 찾으므로, 여러 개 연결된 환경에서는
-#   "가장 먼저 열리는" 장치를 선택합니다.
+# - 자동 탐색은 여러 장치를 동시에 열어보지만, 결과는 번호 순으로 정렬하므로
+#   여러 개 연결된 환경에서는 "번호가 가장 작은 열리는" 장치를 선택합니다.
+# - timeout 안에 열리지 않은 장치는 "없음"으로 취급합니다. (그 스레드는 데몬이라 종료를 막지 않음)
 # - 아무 장치도 열리지 않으면 None을 반환하므로, 호출부에서 예외처리를
 #   한 번 더 해주는 게 안전합니다.
 # ==========================================================
 
+import json
+import os
+import sys
+import threading
+import time
+
 import cv2
 
+DEFAULT_CACHE_PATH = "assets/.camera_cache.json"
+
+
+# ==========================================================
+# 1️⃣ 장치 확인 / 동시 탐색
+# ==========================================================
+def _has_dev_nodes() -> bool:
+    """/dev/videoN 으로 장치 존재 여부를 알 수 있는 OS 인지 (리눅스)"""
+    return sys.platform.startswith("linux") and os.path.isdir("/dev")
+
+
+def device_exists(index: int) -> bool:
+    """
+    카메라 장치가 있을 수 있는 번호인지 확인합니다.
+    리눅스에서는 /dev/video{index} 가 없으면 False, 그 외 OS 는 알 수 없으므로 항상 True.
+    """
+    if not _has_dev_nodes():
+        return True
+    return os.path.exists(f"/dev/video{index}")
+
+
+def _probe(index: int, found: dict) -> None:
+    try:
+        cap = cv2.VideoCapture(index)
+        try:
+            found[index] = cap.isOpened()
+        finally:
+            cap.release()
+    except Exception as e:
+        print(f"⚠️ Camera index {index} check failed: {e}")
+        found[index] = False
+
+
+def scan_cameras(max_index: int = 10, timeout: float = 3.0) -> list[int]:
+    """
+    0 ~ max_index-1 중 열리는 카메라 번호를 동시에 탐색해서 번호 순으로 돌려줍니다.
+
+    Parameters
+    ----------
+    max_index : int
+        탐색할 번호 개수 (0 ~ max_index-1)
+    timeout : float
+        전체 탐색 제한 시간(초). 이 안에 응답하지 않은 장치는 목록에서 빠집니다.
+
+    Returns
+    -------
+    list[int]
+        열리는 카메라 번호 목록 (없으면 빈 리스트)
+    """
+    candidates = [i for i in range(max_index) if device_exists(i)]
+    if not candidates:
+        return []
+
+    found: dict[int, bool] = {}
+    threads = []
+    for i in candidates:
+        # 데몬 스레드: 드라이버가 멈춰도 프로그램 종료를 막지 않음
+        thread = threading.Thread(target=_probe, args=(i, found), name=f"camera-probe-{i}", daemon=True)
+        thread.start()
+        threads.append((i, thread))
+
+    deadline = time.monotonic() + max(0.0, timeout)
+    for i, thread in threads:
+        thread.join(max(0.0, deadline - time.monotonic()))
+        if thread.is_alive():
+            print(f"⏱ Camera index {i} did not respond within {timeout:.1f}s → 건너뜀")
 
-def find_available_camera(max_index: int = 10) -> int | None:
+    return sorted(i for i, ok in list(found.items()) if ok)
+
+
+def find_available_camera(max_index: int = 10, timeout: float = 3.0) -> int | None:
     """
     0 ~ max_index 범위 내에서 '열리는' 첫 번째 카메라 인덱스를 탐색합니다.
 
@@ -53,6 +143,8 @@ def find_available_camera(max_index: int = 10) -> int | None:
     ----------
     max_index : int
         탐색할 최대 인덱스 번호. 기본값은 10으로, 0~10번까지 확인합니다.
+    timeout : float
+        장치 탐색 제한 시간(초). 장치들은 동시에 열어봅니다.
 
     Returns
     -------
@@ -60,23 +152,63 @@ def find_available_camera(max_index: int = 10) -> int | None:
         사용 가능한 카메라 인덱스를 찾으면 그 인덱스를 반환하고,
         찾지 못하면 None을 반환합니다.
     """
-    for i in range(max_index + 1):
-        try:
-            cap = cv2.VideoCapture(i)
-            if cap.isOpened():
-                cap.release()
-                print(f"✅ Available camera found at index {i}")
-                return i
-            cap.release()
-        except Exception as e:
-            print(f"⚠️ Camera index {i} check failed: {e}")
-            continue
+    available = scan_cameras(max_index + 1, timeout=timeout)
+    if available:
+        print(f"✅ Available camera found at index {available[0]}")
+        return available[0]
 
     print("❌ No available camera detected.")
     return None
 
 
-def resolve_camera_index(cfg_value) -> int | None:
+# ==========================================================
+# 2️⃣ 마지막으로 성공한 카메라 캐시
+# ==========================================================
+def load_camera_cache(path: str = DEFAULT_CACHE_PATH) -> dict | None:
+    """
+    마지막으로 성공한 카메라 정보 {"index", "width", "height", "saved_at"} 를 읽습니다.
+    파일이 없거나 깨져 있으면 None.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return {
+            "index": int(data["index"]),
+            "width": int(data.get("width", 0)),
+            "height": int(data.get("height", 0)),
+            "saved_at": data.get("saved_at", ""),
+        }
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        print(f"⚠️ 카메라 캐시 파일을 읽을 수 없어 무시합니다: {path} ({e})")
+        return None
+
+
+def save_camera_cache(index: int, width: int, height: int, path: str = DEFAULT_CACHE_PATH) -> None:
+    """열기에 성공한 카메라 번호와 실제 해상도를 저장합니다. (실패해도 실행에는 영향 없음)"""
+    data = {
+        "index": int(index),
+        "width": int(width),
+        "height": int(height),
+        "saved_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+    }
+    try:
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"⚠️ 카메라 캐시 파일을 저장할 수 없습니다: {path} ({e})")
+
+
+# ==========================================================
+# 3️⃣ 설정값 해석
+# ==========================================================
+def resolve_camera_index(cfg_value, available: list[int] | None = None) -> int | None:
     """
     YAML 설정값을 해석해서 실제로 사용할 카메라 인덱스를 결정합니다.
 
@@ -84,6 +216,7 @@ def resolve_camera_index(cfg_value) -> int | None:
     ----------
     1) cfg_value가 문자열이고, 그 값이 'auto' 이면
        → 자동 탐색 모드로 전환하여 사용 가능한 첫 번째 카메라를 찾습니다.
+         (available 이 주어지면 다시 탐색하지 않고 그 목록의 첫 번째를 사용)
     2) cfg_value가 숫자거나 숫자로 변환 가능한 문자열이면
        → 그 값을 그대로 인덱스로 사용합니다.
     3) 그 외의 값이 들어오면
@@ -93,15 +226,19 @@ def resolve_camera_index(cfg_value) -> int | None:
     ----------
     cfg_value :
         YAML에서 읽어온 camera_index 값. 'auto' 또는 정수/정수형 문자열을 예상합니다.
+    available : list[int] | None
+        이미 탐색한 카메라 번호 목록 (scan_cameras 결과). None 이면 여기서 탐색합니다.
 
     Returns
     -------
     int | None
         실제로 사용할 카메라 인덱스. 잘못된 값이면 None.
     """
-    # 1) 'auto'로 설정된 경우 → 자동 탐색
+    # 1) 'auto'로 설정된 경우 → 자동 탐색 (이미 탐색했으면 결과 재사용)
     if isinstance(cfg_value, str) and cfg_value.lower() == "auto":
         print("🔍 Auto camera detection enabled.")
+        if available is not None:
+            return available[0] if available else None
         return find_available_camera()
 
     # 2) 숫자 또는 숫자형 문자열인 경우 → 그대로 사용
@@ -6,76 +6,129 @@
 # ==========================================================
 
 import cv2
-from label_text_recognition.camera.camera_auto_finder import resolve_camera_index
+from label_text_recognition.camera.camera_auto_finder import (
+    DEFAULT_CACHE_PATH,
+    device_exists,
+    load_camera_cache,
+    resolve_camera_index,
+    save_camera_cache,
+    scan_cameras,
+)
 
 
-def scan_available_cameras(max_index: int = 10):
+def scan_available_cameras(max_index: int = 10, timeout: float = 3.0):
     """
     0 ~ max_index-1 범위에서 열리는 카메라만 수집해서 리스트로 반환.
     auto 모드일 때 콘솔에 보여주려고 쓰는 보조 함수.
+    (장치들을 동시에 열어보고, timeout 초 안에 응답하지 않은 장치는 제외)
     """
-    available = []
-    for i in range(max_index):
-        cap = cv2.VideoCapture(i)
-        if cap.isOpened():
-            available.append(i)
-            cap.release()
-    return available
+    return scan_cameras(max_index, timeout=timeout)
 
 
 def init_camera(cfg):
     """
     설정 파일(cfg)을 기반으로 카메라를 초기화합니다.
+    실제로 연 카메라 번호까지 필요하면 init_camera_with_index 를 사용합니다.
 
-    1. camera_index: "auto" → 연결 가능한 첫 카메라 자동 탐색
+    1. camera_index: "auto" → 마지막으로 성공한 카메라(캐시)를 먼저 열어보고,
+       안 되면 연결 가능한 첫 카메라 자동 탐색 (탐색은 한 번만)
     2. camera_index: int → 해당 번호 사용
     3. 실패 시 None 반환
+
+    camera_discovery:
+      max_index: 10           # auto 탐색 범위 (0 ~ max_index-1)
+      probe_timeout: 3.0      # 동시 탐색 제한 시간(초)
+      cache_enabled: true     # 마지막으로 성공한 카메라 번호/해상도 저장
+      cache_path: "assets/.camera_cache.json"
+    """
+    cap, _ = init_camera_with_index(cfg)
+    return cap
+
+
+def init_camera_with_index(cfg):
+    """
+    init_camera 와 같지만 (VideoCapture, 실제로 연 카메라 번호) 를 돌려줍니다.
+    camera_index: "auto" 일 때 캐시 / 탐색으로 정해진 번호를 알 수 있어서
+    카메라별 설정(roi.per_camera 등)을 찾을 때 사용합니다. 실패 시 (None, None).
     """
+    discovery_cfg = cfg.get("camera_discovery", {}) or {}
+    max_index = int(discovery_cfg.get("max_index", 10))
+    probe_timeout = float(discovery_cfg.get("probe_timeout", 3.0))
+    cache_path = discovery_cfg.get("cache_path", DEFAULT_CACHE_PATH)
+    cache_enabled = bool(discovery_cfg.get("cache_enabled", True)) and bool(cache_path)
+    frame_w = cfg.get("frame_width", 960)
+    frame_h = cfg.get("frame_height", 540)
 
     # ----------------------------------------------------------
     # 1️⃣ 카메라 인덱스 해석
     # ----------------------------------------------------------
     raw_index = cfg.get("camera_index", "auto")
+    is_auto = isinstance(raw_index, str) and raw_index.lower() == "auto"
+
+    # auto: 마지막으로 성공한 카메라를 먼저 열어봄 → 열리면 탐색 생략
+    if is_auto and cache_enabled:
+        cached = load_camera_cache(cache_path)
+        if cached is not None and device_exists(cached["index"]):
+            print(f"⚡ 마지막으로 사용한 카메라 {cached['index']} ({cached['width']}x{cached['height']}) 를 먼저 시도합니다.")
+            cap = open_camera(cached["index"], frame_w, frame_h)
+            if cap is not None:
+                _remember_camera(cap, cached["index"], cache_path)
+                return cap, cached["index"]
+            print("   → 열리지 않아 전체 탐색으로 넘어갑니다.")
 
     # auto로 설정된 경우, 어떤 카메라들이 잡히는지 먼저 보여줌
     available = None
-    if isinstance(raw_index, str) and raw_index.lower() == "auto":
-        available = scan_available_cameras(max_index=10)
+    if is_auto:
+        available = scan_available_cameras(max_index=max_index, timeout=probe_timeout)
         if not available:
             print("❌ 연결 가능한 카메라가 없습니다.")
             print("⚙️ 카메라 케이블/노트북 웹캠을 확인하거나 YAML에서 숫자로 지정해보세요.")
-            return None
+            return None, None
         print(f"🔍 감지된 카메라 인덱스: {available}")
 
-    # 실제로 사용할 인덱스 결정 (auto든 숫자든 여기서 최종 결정)
-    camera_id = resolve_camera_index(raw_index)
+    # 실제로 사용할 인덱스 결정 (auto든 숫자든 여기서 최종 결정, auto 는 위 탐색 결과 재사용)
+    camera_id = resolve_camera_index(raw_index, available=available)
 
     if camera_id is None:
         print(f"❌ 카메라 인덱스를 결정할 수 없습니다. (입력값: {raw_index})")
         print("⚙️ ocr_config.yaml에서 camera_index를 숫자로 직접 지정해보세요. (예: 0)")
-        return None
+        return None, None
 
     # ----------------------------------------------------------
-    # 2️⃣ VideoCapture 생성 및 해상도 설정
+    # 2️⃣ VideoCapture 생성 및 해상도 설정 + 정상 오픈 여부 확인
     # ----------------------------------------------------------
-    frame_w = cfg.get("frame_width", 960)
-    frame_h = cfg.get("frame_height", 540)
+    cap = open_camera(camera_id, frame_w, frame_h)
+    if cap is None:
+        # 만약 auto 스캔 결과가 있으면 힌트도 같이 출력
+        if available:
+            print(f"💡 참고: 방금 감지된 카메라 인덱스는 {available} 였습니다.")
+            print("   그 중 하나를 ocr_config.yaml에 숫자로 넣어서 다시 시도해보세요.")
+        else:
+            print("⚙️ 장치 연결 상태 또는 YAML 설정(camera_index)을 확인하세요.")
+    elif cache_enabled:
+        _remember_camera(cap, camera_id, cache_path)
+    return cap, (camera_id if cap is not None else None)
+
+
+def _remember_camera(cap, camera_id: int, cache_path: str) -> None:
+    """실제로 적용된 해상도와 함께 카메라 번호를 캐시에 저장"""
+    width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH) or 0)
+    height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT) or 0)
+    save_camera_cache(camera_id, width, height, cache_path)
 
+
+def open_camera(camera_id: int, frame_w: int, frame_h: int):
+    """
+    지정한 번호의 카메라를 열고 해상도를 설정합니다. 열리지 않으면 None.
+    (멀티 카메라 모드에서는 카메라마다 이 함수를 직접 호출)
+    """
     cap = cv2.VideoCapture(camera_id)
     cap.set(cv2.CAP_PROP_FRAME_WIDTH, frame_w)
     cap.set(cv2.CAP_PROP_FRAME_HEIGHT, frame_h)
 
-    # ----------------------------------------------------------
-    # 3️⃣ 정상 오픈 여부 확인
-    # ----------------------------------------------------------
     if not cap.isOpened():
         print(f"❌ 카메라 {camera_id} 를 열 수 없습니다.")
-        # 만약 auto 스캔 결과가 있으면 힌트도 같이 출력
-        if available:
-            print(f"💡 참고: 방금 감지된 카메라 인덱스는 {available} 였습니다.")
-            print("   그 중 하나를 ocr_config.yaml에 숫자로 넣어서 다시 시도해보세요.")
-        else:
-            print("⚙️ 장치 연결 상태 또는 YAML 설정(camera_index)을 확인하세요.")
+        cap.release()
         return None
 
     print(f"✅ Camera {camera_id} opened successfully ({frame_w}x{frame_h})")
@@ -10,6 +10,14 @@
 #   ✅ 한글 깨짐(????) 문제 완전 해결 (Pillow 기반 draw_korean_text 적용)
 #   ✅ 선명도(Definition) 계산 및 시각 표시
 #   ✅ 카메라 자동 감지(auto) 지원
+#   ✅ 캡처 / 미리보기 / OCR 을 서로 다른 스레드로 분리
+#      → OCR 이 도는 동안에도 미리보기는 카메라 프레임레이트 유지
+#   ✅ auto_trigger.enabled: true → 선명 + 정지 상태가 되면 SPACE 없이 자동 OCR
+#   ✅ roi.enabled: true → 설정된 관심 영역만 OCR (미리보기에 영역 표시)
+#   ✅ downscale.enabled: true → 축소 이미지에서 검출, 원본 해상도에서 인식
+#   ✅ frame_source 로 카메라 대신 동영상 파일 / 이미지 폴더를 같은 루프로 재처리
+#      (stride, 실시간/최대 속도, ocr_every 로 N 프레임마다 자동 OCR)
+#   ✅ camera_index: [0, 2] → 멀티 카메라 모드 (multi_camera.py, 엔진은 공유)
 #   ✅ YAML의 enable_* / visualize / export_options.* 옵션으로
 #      - 저장 여부
 #      - 실시간 B박스 표시
@@ -27,7 +35,7 @@
 #   2. 터미널에서 실행:
 #        python demos/camera_ocr_demo.py
 #   3. 실행 중:
-#        [SPACE] → 캡처 및 OCR 실행
+#        [SPACE] → 캡처 및 OCR 실행 (OCR 은 백그라운드에서 진행)
 #        [q]     → 종료
 #
 # 작성 목적:
@@ -37,15 +45,30 @@
 
 import os
 import time
+from dataclasses import dataclass
+
 import cv2
 import numpy as np
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw
 
-from label_text_recognition.config.loader import load_ocr_config
-from label_text_recognition.ocr.ocr_engine import build_ocr_engines
+from label_text_recognition.config.settings import get_ocr_config
+from label_text_recognition.ocr.cascade import CascadeRecognizer
+from label_text_recognition.ocr.downscale import AdaptiveDownscaler
+from label_text_recognition.ocr.engine_registry import build_engine_registry
 from label_text_recognition.ocr.ocr_runner import run_ocr_on_image
+from label_text_recognition.ocr.result_cache import OcrResultCache
+from label_text_recognition.ocr.roi import RoiSet
+from label_text_recognition.render.fonts import configure_fonts, get_font
+from label_text_recognition.render.overlay import OverlayCompositor
 from label_text_recognition.exporters.json_exporter import export_to_json
-from label_text_recognition.camera.camera_initializer import init_camera
+from label_text_recognition.exporters.async_writer import AsyncResultWriter
+from label_text_recognition.camera.auto_trigger import AutoTrigger
+from label_text_recognition.camera.frame_grabber import FrameGrabber
+from label_text_recognition.camera.frame_source import FrameSource, open_frame_source
+from label_text_recognition.camera.sharpness import SharpnessScorer
+from label_text_recognition.camera.ocr_worker import OcrJob, OcrWorker
+from label_text_recognition.metrics.endpoint import start_metrics, stop_metrics
+from label_text_recognition.metrics.stage_metrics import get_registry, timed
 
 
 # ==========================================================
@@ -53,28 +76,28 @@ from label_text_recognition.camera.camera_initializer import init_camera
 # ----------------------------------------------------------
 # OpenCV(cv2.putText)는 기본 폰트만 지원하기 때문에 한글이 깨집니다.
 # Pillow(PIL)을 이용하여 한글 폰트를 로드하고, 텍스트를 이미지에 그립니다.
+# 폰트는 render.fonts 레지스트리에서 (경로, 크기)별로 한 번만 로드됩니다.
 # ==========================================================
 def draw_korean_text(
     img_bgr,
     text,
     x,
     y,
-    font_path="/usr/share/fonts/truetype/noto/NotoSansCJK-Regular.ttc",
+    font_path=None,
     font_size=20,
     color=(0, 255, 0),
 ):
     """
     OpenCV가 한글을 지원하지 않아 PIL로 텍스트를 표시하는 함수.
+    호출마다 전체 프레임을 색 변환하므로, 여러 줄을 그릴 때는
+    render.overlay.OverlayCompositor 로 모아서 한 번에 그리는 것을 권장합니다.
+    font_path 가 None 이면 설정(fonts.candidates)에서 결정된 기본 한글 폰트를 사용합니다.
     """
     img_rgb = cv2.cvtColor(img_bgr, cv2.COLOR_BGR2RGB)
     pil_img = Image.fromarray(img_rgb)
     draw = ImageDraw.Draw(pil_img)
 
-    try:
-        font = ImageFont.truetype(font_path, font_size)
-    except OSError:
-        print("⚠️ NotoSans 폰트를 찾지 못했습니다. 기본 폰트를 사용합니다.")
-        font = ImageFont.load_default()
+    font = get_font(font_size, font_path)
 
     draw.text((x, y), text, font=font, fill=color)
     return cv2.cvtColor(np.array(pil_img), cv2.COLOR_RGB2BGR)
@@ -86,6 +109,10 @@ def draw_korean_text(
 # 이미지의 라플라시안 분산(Laplacian Variance)을 이용해 초점 흐림을 측정합니다.
 # 값이 높을수록 선명하고, 낮을수록 흐립니다.
 # 화면 상단의 Definition 표시와 품질 경고 기준으로 사용됩니다.
+#
+# 메인 루프에서는 sharpness.SharpnessScorer 를 사용합니다.
+# (축소 / 중앙 ROI / N 프레임마다 계산 / 다른 지표를 YAML 로 선택 가능)
+# 이 함수는 기준 점수(reference)이자 하위 호환용으로 남겨둡니다.
 # ==========================================================
 def get_definition_score(frame):
     gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
@@ -94,11 +121,247 @@ def get_definition_score(frame):
 
 
 # ==========================================================
-# 🚀 3️⃣ 메인 함수: start_camera_ocr()
+# 🗂 3️⃣ 캡처 처리 설정
+# ----------------------------------------------------------
+# YAML 에서 읽은 enable_* / export_options.* 값을 한 곳에 모아둡니다.
+# 캡처 처리(process_capture)는 OCR 워커 스레드에서 실행되므로,
+# 필요한 값을 미리 이 객체에 담아서 넘깁니다.
+# ==========================================================
+@dataclass(frozen=True)
+class CaptureSettings:
+    conf_threshold: float = 0.5
+    definition_threshold: float = 200
+    cls_enable: bool = True
+    enable_console_log: bool = True
+    enable_save_output: bool = True
+    enable_retry_on_error: bool = False
+    debug_image_enabled: bool = False
+    debug_image_dir: str = "assets/debug_images"
+    debug_image_pattern: str = "debug_{ts}.png"
+    out_img_dir: str = "assets/pictures"
+    out_img_origin_dir: str = "assets/pictures-origin"
+    out_json_dir: str = "assets/json"
+
+    @classmethod
+    def from_config(cls, cfg) -> "CaptureSettings":
+        # 디버그용 B박스 이미지 저장 옵션 (export_options.debug_image)
+        export_options = cfg.get("export_options", {})
+        debug_image_cfg = export_options.get("debug_image", {})
+
+        return cls(
+            conf_threshold=cfg.get("conf_threshold", 0.5),
+            definition_threshold=cfg.get("definition_threshold", 200),
+            cls_enable=cfg.get("ocr_cls_enable", True),
+            enable_console_log=cfg.get("enable_console_log", True),
+            enable_save_output=cfg.get("enable_save_output", True),
+            enable_retry_on_error=cfg.get("enable_retry_on_error", False),
+            debug_image_enabled=debug_image_cfg.get("enabled", False),
+            debug_image_dir=debug_image_cfg.get("path", "assets/debug_images"),
+            debug_image_pattern=debug_image_cfg.get("filename_pattern", "debug_{ts}.png"),
+            # 출력 경로 설정 (기존 기본 경로)
+            out_img_dir=cfg.get("output_dir_images", "assets/pictures"),
+            out_img_origin_dir=cfg.get("output_dir_images_origin", "assets/pictures-origin"),
+            out_json_dir=cfg.get("output_dir_json", "assets/json"),
+        )
+
+
+# ==========================================================
+# 🧾 4️⃣ 캡처 1건 처리: OCR → 시각화 → 저장 → 콘솔 로그
+# ----------------------------------------------------------
+# 예전에는 [SPACE] 분기 안에서 미리보기와 같은 스레드로 실행되던 부분입니다.
+# 이제는 OcrWorker 스레드에서 실행되므로, 이 함수가 도는 동안에도
+# 미리보기 화면은 멈추지 않습니다. (cv2.imshow 는 메인 스레드 전용)
+# ==========================================================
+def process_capture(
+    job: OcrJob,
+    engine,
+    settings: CaptureSettings,
+    cfg,
+    result_cache: OcrResultCache | None = None,
+    writer: AsyncResultWriter | None = None,
+    cascade: CascadeRecognizer | None = None,
+    roi: RoiSet | None = None,
+    downscale: AdaptiveDownscaler | None = None,
+) -> list[dict]:
+    """
+    캡처 1건을 처리하고 OCR 결과(list[dict])를 돌려줍니다.
+    result_cache 가 있으면 거의 같은 화면은 OCR 엔진 호출 없이 캐시 결과를 사용합니다.
+    writer 가 있으면 이미지/JSON 저장은 백그라운드 쓰기 스레드에 맡기고 바로 돌아옵니다.
+    cascade 가 있으면 신뢰도가 낮은 영역만 보조 언어 엔진으로 다시 인식합니다.
+    roi 가 있으면 관심 영역만 OCR 합니다. (결과 box 는 프레임 전체 좌표)
+    downscale 이 있으면 축소 이미지에서 검출하고 원본 해상도에서 인식합니다.
+    """
+    ts = job.ts
+    frame = job.frame
+    def_score = job.def_score
+    font = cv2.FONT_HERSHEY_SIMPLEX
+
+    # 시각화 이미지는 저장할 때만 필요 → 저장 OFF 면 렌더링 자체를 생략
+    #  (캡처 결과 그림은 아래 3) 에서 한 번만 그리므로 OCR 단계에서는 렌더링하지 않음)
+    render = settings.enable_save_output
+
+    # 1) OCR 수행 (결과 캐시 HIT 이면 엔진 호출 생략)
+    results, vis_img, msg = run_ocr_on_image(
+        frame, engine, settings.conf_threshold, settings.cls_enable,
+        cfg=cfg, result_cache=result_cache, render=False, cascade=cascade, roi=roi,
+        downscale=downscale,
+    )
+    if "CACHE HIT" in msg and settings.enable_console_log:
+        print("♻️ 직전과 거의 같은 화면 → 캐시된 OCR 결과 사용")
+
+    # 2) 오류 시 재시도 (토글)
+    if msg.startswith("ERROR") and settings.enable_retry_on_error:
+        print("⚠️ OCR 오류 발생 → 1회 재시도")
+        results, vis_img, msg = run_ocr_on_image(
+            frame, engine, settings.conf_threshold, settings.cls_enable,
+            cfg=cfg, result_cache=result_cache, render=False, cascade=cascade, roi=roi,
+            downscale=downscale,
+        )
+
+    # 3) 결과 시각화 (박스 + 텍스트)
+    #    - frame 복사본 위에 B박스를 그리고, 한글 텍스트 + 신뢰도를 함께 표시
+    #    - 모든 줄을 OverlayCompositor 에 모아서 한 번에 합성
+    #      (줄마다 draw_korean_text 로 전체 프레임을 색 변환하지 않음)
+    #    - render=False 면 vis_img 는 원본 frame 그대로이므로 그리지 않음
+    if render:
+        with timed("render"):
+            overlay = OverlayCompositor(frame)
+            for r in results:
+                box = r.get("box", [])
+                text = r.get("text", "")
+                avg_conf = r.get("avg_conf", 0.0)
+
+                if box:
+                    x1, y1 = int(box[0][0]), int(box[0][1])
+                    x2, y2 = int(box[2][0]), int(box[2][1])
+                    overlay.add_rect((x1, y1), (x2, y2), (0, 255, 255), 2)
+                    overlay.add_text(f"{text} ({avg_conf:.2f})", x1, y1 - 22,
+                                     color=(255, 0, 0), font_size=20)
+            vis_img = overlay.compose()
+
+    # 4) 저장 경로 지정 (기존 + JSON 경로)
+    img_path_origin = os.path.join(settings.out_img_origin_dir, f"capture_{ts}.jpg")
+    img_path = os.path.join(settings.out_img_dir, f"capture_{ts}.jpg")
+    json_path = os.path.join(settings.out_json_dir, f"capture_{ts}.json")
+
+    # 5) 저장 (enable_save_output 기반)
+    #    - writer 가 있으면 인코딩/쓰기는 백그라운드에서 (여기서는 요청만 넣음)
+    #    - frame / vis_img / results 는 이 뒤로 수정하지 않으므로 복사 없이 넘김
+    if settings.enable_save_output:
+        # JSONL 세션 모드(export_options.mode: jsonl)에서 레코드에 함께 남는 정보
+        meta = {"image": img_path, "image_origin": img_path_origin, "definition": round(def_score, 2)}
+        if writer is not None:
+            writer.write_image(img_path_origin, frame, label="origin")
+            writer.write_image(img_path, vis_img, label="vis")
+            writer.submit(export_to_json, results, json_path, cfg=cfg, ts=ts, meta=meta, label="json")
+        else:
+            # 원본 이미지 저장
+            with timed("write_origin"):
+                cv2.imwrite(img_path_origin, frame)
+            # vis_img (B박스 + 텍스트 그려진 결과) 저장
+            with timed("write_vis"):
+                cv2.imwrite(img_path, vis_img)
+            # JSON 저장 (export_to_json 은 내부에서 config 기반 export_all_json 호출)
+            with timed("write_json"):
+                export_to_json(results, json_path, cfg=cfg, ts=ts, meta=meta)
+
+        # 디버그용 B박스 이미지 저장 (선택 사항)
+        if settings.debug_image_enabled:
+            # vis_img 위에 좌표/인덱스를 추가로 그려서 저장해도 되고,
+            # frame 기준으로 다시 그려도 됨. 여기서는 vis_img 기준으로 저장.
+            debug_frame = vis_img.copy()
+            for idx, r in enumerate(results):
+                box = r.get("box", [])
+                if not box or len(box) < 4:
+                    continue
+                cx = int(sum(p[0] for p in box) / len(box))
+                cy = int(sum(p[1] for p in box) / len(box))
+                label = f"#{idx} ({cx},{cy})"
+                cv2.putText(
+                    debug_frame,
+                    label,
+                    (cx, cy - 5),
+                    font,
+                    0.4,
+                    (0, 255, 0),
+                    1,
+                    cv2.LINE_AA,
+                )
+
+            debug_filename = settings.debug_image_pattern.replace("{ts}", ts)
+            debug_path = os.path.join(settings.debug_image_dir, debug_filename)
+            if writer is not None:
+                writer.write_image(debug_path, debug_frame, label="debug")
+            else:
+                with timed("write_debug"):
+                    cv2.imwrite(debug_path, debug_frame)
+            print(f"🟩 디버그 B박스 이미지: {debug_path}")
+
+        title = "📝 결과 저장 요청 (백그라운드)" if writer is not None else "✅ 결과 저장 완료"
+        print(
+            f"{title}:\n"
+            f"   - {img_path_origin}\n"
+            f"   - {img_path}\n"
+            f"   - {json_path}"
+        )
+    else:
+        print("💾 저장 비활성화 상태이므로 파일은 생성되지 않습니다.")
+
+    # 6) 콘솔 로그 (enable_console_log)
+    if not results:
+        if settings.enable_console_log:
+            print(f"⚠️ OCR 결과 없음. Definition={def_score:.2f}")
+        return results
+
+    confs = [r.get("avg_conf", 0.0) for r in results]
+    overall_conf = sum(confs) / len(confs)
+
+    if settings.enable_console_log:
+        for r in results:
+            print(f"- {r.get('text', '')} ({r.get('avg_conf', 0.0):.2f})")
+        print(f"📈 평균 신뢰도: {overall_conf:.2f}")
+
+        if def_score < settings.definition_threshold:
+            print("⚠️ 이미지가 다소 흐립니다.")
+        elif overall_conf < settings.conf_threshold:
+            print("⚠️ 인식은 되었으나 신뢰도가 낮습니다.")
+        else:
+            print("✅ 선명도와 인식률 모두 양호합니다.")
+
+    return results
+
+
+def _capture_ts(source: FrameSource, seq: int) -> str:
+    """
+    캡처 1건의 저장 파일 이름에 쓰는 타임스탬프.
+    초 단위 시각 뒤에 프레임 번호(seq)를 붙여서 덮어쓰기를 막습니다.
+      - 파일 소스 : 1초에 여러 장을 처리함 → <시각>_<소스 이름>_<seq>
+      - 카메라    : OCR 워커 대기열(ocr_queue_size)에 1초 안에 캡처가 여러 건 들어갈 수 있음
+                    → <시각>_<seq>
+    메인 루프는 매 반복마다 새 프레임(seq 증가)을 받으므로, 서로 다른 프레임의 캡처는 이름이 겹치지 않습니다.
+
+    이미지(capture_<ts>.jpg)뿐 아니라 JSON 도 이 값으로 이름을 정합니다.
+    process_capture 가 export_to_json(..., ts=ts) 로 넘기면 export_all_json 이
+    text_json / bbox_json 의 filename_pattern 에 있는 {ts} 를 이 값으로 채웁니다.
+    """
+    ts = time.strftime("%Y%m%d_%H%M%S")
+    if source.is_live:
+        return f"{ts}_{seq:06d}"
+    return f"{ts}_{source.name}_{seq:06d}"
+
+
+# ==========================================================
+# 🚀 5️⃣ 메인 함수: start_camera_ocr()
 # ----------------------------------------------------------
 # 프로그램 진입점.
-#   [SPACE] → OCR 수행 및 결과 저장
-#   [q]     → 종료
+#   [SPACE] → OCR 작업을 큐에 넣음 (처리는 OCR 워커 스레드에서)
+#   [q]     → 종료 (대기 중인 캡처는 모두 처리/저장한 뒤 종료)
+#
+# 스레드 구성:
+#   - 캡처 스레드 (FrameGrabber) : source.read() 를 쉬지 않고 호출, 최신 프레임만 유지
+#                                  (동영상/폴더 소스는 프레임을 버리지 않음)
+#   - 메인 스레드               : 미리보기(cv2.imshow) + 키 입력 + 결과 오버레이
+#   - OCR 워커 스레드 (OcrWorker): OCR → 시각화 → 저장 (bounded queue)
 #
 # YAML 설정값을 불러와 enable_* / visualize / export_options.* 토글을
 # 기반으로 기능을 제어합니다.
@@ -108,23 +371,45 @@ def get_definition_score(frame):
 #   - enable_console_log: false → 터미널 로그 최소화
 #   - visualize.draw_bbox_on_live: true → 실시간 B박스 모드 (테스트용)
 #   - visualize.show_bbox_coords_on_live: true → 실시간 좌표 표시 모드 (테스트용)
+#   - camera_pipeline.ocr_queue_size: 2 → OCR 대기열 길이
+#   - auto_trigger.enabled: true → 핸즈프리 모드 (선명도 + 안정 프레임 + 쿨다운)
+#   - frame_source.type: video / dir → 녹화 파일 / 이미지 폴더 재처리
 # ==========================================================
-def start_camera_ocr() -> None:
-    """실시간 카메라 OCR 데모 실행"""
+def start_camera_ocr(source: FrameSource | None = None, ocr_every: int | None = None) -> None:
+    """
+    실시간 카메라 OCR 데모 실행
+
+    Parameters
+    ----------
+    source : FrameSource | None
+        프레임 소스 (frame_source.VideoFileSource / ImageDirSource / GeneratorSource ...)
+        None 이면 frame_source 설정으로 엽니다. (기본: 카메라)
+    ocr_every : int | None
+        N 프레임마다 SPACE 없이 OCR 요청 (0 → 끔). None 이면 frame_source.ocr_every 사용.
+        "프레임"은 메인 루프가 실제로 받은 프레임입니다. 카메라는 캡처 스레드가 밀린 프레임을
+        버리므로(최신 프레임만 유지) 카메라 프레임 번호가 아니라 받은 프레임 수로 셉니다.
+        카메라가 아닌 소스에서는 대기열이 비기를 기다렸다가 넣으므로 캡처가 버려지지 않습니다.
+    """
 
     # ------------------------------------------------------
     # 1️⃣ 설정 로드 및 기본 파라미터
+    #    - 여기서 받은 불변 설정 객체를 OCR/JSON 저장 경로에 그대로 넘겨서
+    #      캡처마다 YAML 을 다시 파싱하지 않도록 합니다.
     # ------------------------------------------------------
-    cfg = load_ocr_config()
-    conf_threshold = cfg.get("conf_threshold", 0.5)
-    definition_threshold = cfg.get("definition_threshold", 200)
-    cls_enable = cfg.get("ocr_cls_enable", True)
+    cfg = get_ocr_config()
+
+    # camera_index: [0, 2] → 카메라별 캡처 스레드 + 공유 엔진 풀 (multi_camera.py)
+    if source is None and isinstance(cfg.get("camera_index"), (list, tuple)):
+        from label_text_recognition.camera.multi_camera import start_multi_camera_ocr
+
+        start_multi_camera_ocr(cfg)
+        return
+
+    settings = CaptureSettings.from_config(cfg)
+    definition_threshold = settings.definition_threshold
 
     # YAML 기반 기능 토글 (기존)
     enable_definition_overlay = cfg.get("enable_definition_overlay", True)
-    enable_console_log = cfg.get("enable_console_log", True)
-    enable_save_output = cfg.get("enable_save_output", True)
-    enable_retry_on_error = cfg.get("enable_retry_on_error", False)
 
     # 시각화 옵션(visualize 섹션) - 없으면 기본값 사용
     visualize_cfg = cfg.get("visualize", {})
@@ -136,45 +421,98 @@ def start_camera_ocr() -> None:
         "show_definition_on_live", enable_definition_overlay
     )
 
-    # 디버그용 B박스 이미지 저장 옵션 (export_options.debug_image)
-    export_options = cfg.get("export_options", {})
-    debug_image_cfg = export_options.get("debug_image", {})
-    debug_image_enabled = debug_image_cfg.get("enabled", False)
-    debug_image_dir = debug_image_cfg.get("path", "assets/debug_images")
-    debug_image_pattern = debug_image_cfg.get("filename_pattern", "debug_{ts}.png")
+    # 캡처/미리보기/OCR 분리 파이프라인 옵션
+    pipeline_cfg = cfg.get("camera_pipeline", {}) or {}
+    ocr_queue_size = pipeline_cfg.get("ocr_queue_size", 2)
+    if ocr_every is None:
+        ocr_every = (cfg.get("frame_source", {}) or {}).get("ocr_every", 0)
+    ocr_every = max(0, int(ocr_every or 0))
 
-    # 출력 경로 설정 (기존 기본 경로)
-    out_img_dir = cfg.get("output_dir_images", "assets/pictures")
-    out_img_origin_dir = cfg.get("output_dir_images_origin", "assets/pictures-origin")
-    out_json_dir = cfg.get("output_dir_json", "assets/json")
+    # 단계별 소요 시간 계측 (metrics.enabled → /metrics HTTP 또는 텍스트 파일)
+    metrics_exporters = start_metrics(cfg)
+
+    # 선명도 채점기 (sharpness 섹션: metric / downscale / center_roi / every_n)
+    sharpness_scorer = SharpnessScorer.from_config(cfg)
+
+    # 한글 폰트 경로는 시작 시 한 번만 결정하고, 결과 표시용 20px 폰트를 미리 로드
+    configure_fonts(cfg)
+    get_font(20)
+
+    # 자동 트리거 (핸즈프리 모드)
+    auto_trigger = None
+    if (cfg.get("auto_trigger", {}) or {}).get("enabled", False):
+        auto_trigger = AutoTrigger.from_config(cfg)
 
     # 저장 기능이 켜져 있을 때만 폴더 생성
-    if enable_save_output:
-        os.makedirs(out_img_dir, exist_ok=True)
-        os.makedirs(out_img_origin_dir, exist_ok=True)
-        os.makedirs(out_json_dir, exist_ok=True)
-        if debug_image_enabled:
-            os.makedirs(debug_image_dir, exist_ok=True)
+    if settings.enable_save_output:
+        os.makedirs(settings.out_img_dir, exist_ok=True)
+        os.makedirs(settings.out_img_origin_dir, exist_ok=True)
+        os.makedirs(settings.out_json_dir, exist_ok=True)
+        if settings.debug_image_enabled:
+            os.makedirs(settings.debug_image_dir, exist_ok=True)
     else:
         print("💾 [비활성화] enable_save_output: false → 폴더 생성/저장 비활성화")
 
     # ------------------------------------------------------
     # 2️⃣ OCR 엔진 초기화
+    #    - 실제로 쓰는 메인 언어(ocr_langs[0]) 엔진만 백그라운드에서 로딩하고,
+    #      그동안 카메라를 엽니다. (나머지 언어는 필요할 때 registry.get(lang))
     # ------------------------------------------------------
-    ocr_langs = cfg.get("ocr_langs", ["en"])
-    ocr_engines = build_ocr_engines(ocr_langs)
-    main_engine = ocr_engines[ocr_langs[0]]
+    registry = build_engine_registry(cfg)
+    registry.preload([registry.main_lang], background=True)
 
     # ------------------------------------------------------
-    # 3️⃣ 카메라 열기
+    # 3️⃣ 카메라(프레임 소스) 열기
     # ------------------------------------------------------
-    cap = init_camera(cfg)
-    if cap is None:
+    if source is None:
+        source = open_frame_source(cfg)
+    if source is None:
         print("❌ 카메라를 열 수 없습니다.")
+        registry.shutdown()
+        stop_metrics(metrics_exporters)
         return
 
+    main_engine = registry.get()
+
+    # 다국어 캐스케이드 (cascade.enabled): 보조 언어 엔진은 백그라운드에서 이어서 로딩
+    cascade = CascadeRecognizer.from_config(cfg, registry)
+    if cascade is None:
+        registry.shutdown()
+
+    # ------------------------------------------------------
+    # 4️⃣ 캡처 스레드 + OCR 워커 시작
+    # ------------------------------------------------------
+    # 관심 영역 크롭 (roi.enabled, 장치 번호별 per_camera 지정 가능)
+    #  - camera_index: "auto" 여도 실제로 연 장치 번호로 찾음 (동영상/폴더 소스는 regions)
+    roi = RoiSet.from_config(cfg, camera_index=getattr(source, "camera_index", None))
+    roi_rects = None
+    draw_roi_on_live = roi is not None and (cfg.get("roi", {}) or {}).get("draw_on_live", True)
+
+    # 적응형 축소 (downscale.enabled): 검출은 축소 이미지, 인식은 원본 해상도
+    downscale = AdaptiveDownscaler.from_config(cfg)
+
+    # 거의 같은 화면에 대한 OCR 결과 캐시 (result_cache.enabled)
+    result_cache = OcrResultCache.from_config(cfg)
+
+    # 결과 파일(이미지/JSON) 백그라운드 저장기 (async_writer.enabled, 저장 ON 일 때만)
+    writer = None
+    if settings.enable_save_output and (cfg.get("async_writer", {}) or {}).get("enabled", True):
+        writer = AsyncResultWriter.from_config(cfg).start()
+
+    # 카메라는 최신 프레임만, 동영상/폴더는 모든 프레임을 순서대로 (stride 는 소스에서 처리)
+    grabber = FrameGrabber(source, drop_frames=source.is_live).start()
+    def run_capture(job: OcrJob) -> list[dict]:
+        with timed("process_capture"):
+            return process_capture(
+                job, main_engine, settings, cfg, result_cache, writer, cascade, roi, downscale
+            )
+
+    worker = OcrWorker(run_capture, max_queue=ocr_queue_size).start()
+
     print("✅ Camera OCR ready")
     print("   [SPACE] → OCR 실행 / [q] → 종료")
+    if auto_trigger is not None:
+        print("   🤖 자동 트리거 ON: 선명하고 멈춘 라벨은 자동으로 OCR 합니다.")
 
     font = cv2.FONT_HERSHEY_SIMPLEX
 
@@ -182,33 +520,78 @@ def start_camera_ocr() -> None:
     # → 실시간 화면에서 B박스/좌표를 다시 그릴 때 사용
     last_results = []
     last_def_score = 0.0
+    last_seq = 0
+    frames_seen = 0   # 메인 루프가 받은 프레임 수 (ocr_every 기준, 카메라는 seq 가 건너뛰므로 따로 셈)
 
     # ------------------------------------------------------
-    # 4️⃣ 메인 루프: 실시간 영상 처리
+    # 5️⃣ 메인 루프: 실시간 영상 처리 (미리보기 + 키 입력)
     # ------------------------------------------------------
     while True:
-        ret, frame = cap.read()
+        ret, frame, seq = grabber.read(last_seq, timeout=1.0)
         if not ret:
-            print("⚠️ 프레임을 읽을 수 없습니다. 카메라 연결을 확인하세요.")
-            break
+            if grabber.stopped:
+                if source.is_live:
+                    print("⚠️ 프레임을 읽을 수 없습니다. 카메라 연결을 확인하세요.")
+                else:
+                    print(f"🎞 프레임 소스를 끝까지 읽었습니다. ({source.frames_read} 프레임)")
+                break
+            # 새 프레임이 아직 없으면 창 이벤트만 처리하고 다시 대기
+            if (cv2.waitKey(1) & 0xFF) == ord("q"):
+                break
+            continue
+        last_seq = seq
+        frames_seen += 1
+
+        # OCR 워커에서 끝난 결과를 받아서 오버레이에 반영
+        for done in worker.poll_results():
+            last_results = done.results
+            last_def_score = done.job.def_score
+            if settings.enable_console_log:
+                print(f"⏱ OCR 완료 ({done.job.ts}): {done.elapsed_sec * 1000:.0f}ms")
 
         # 현재 프레임 선명도 계산
-        live_def = get_definition_score(frame)
+        with timed("sharpness"):
+            live_def = sharpness_scorer.score(frame)
         display = frame.copy()
 
-        # 4-1) 화면 안내 문구
+        # 5-1) 화면 안내 문구
         cv2.putText(display, "Press [SPACE] to OCR, [q] to quit",
                     (10, 30), font, 0.6, (255, 255, 255), 2)
 
-        # 4-2) Definition 표시 (시각화 옵션 기반)
+        # 5-2) Definition 표시 (시각화 옵션 기반)
         if show_definition_on_live:
             color = (0, 255, 0) if live_def >= definition_threshold else (0, 0, 255)
             cv2.putText(display,
                         f"Definition: {live_def:.1f} (th={definition_threshold})",
                         (10, 60), font, 0.55, color, 2)
 
-        # 4-3) 실시간 B박스 + 좌표 표시 (테스트/디버깅용)
-        #  - last_results 는 마지막으로 SPACE 눌렀을 때의 OCR 결과입니다.
+        # 5-3) OCR 진행 상태 표시 (워커가 작업 중이면 대기열 길이와 함께 표시)
+        if worker.busy:
+            cv2.putText(display, f"OCR running... (queued: {worker.pending})",
+                        (10, 90), font, 0.55, (0, 255, 255), 2)
+
+        # 5-4) 자동 트리거: 선명 + 정지 + 쿨다운 조건이 맞으면 OCR 요청
+        #      (워커가 바쁠 때는 발사하지 않고 조건을 유지한 채 기다림)
+        if auto_trigger is not None:
+            if auto_trigger.update(frame, live_def, can_fire=not worker.busy):
+                ts = _capture_ts(source, seq)
+                job = OcrJob(ts=ts, frame=frame, def_score=live_def, meta={"trigger": "auto"})
+                if worker.submit(job):
+                    print(f"\n🤖 {ts} - 자동 트리거 OCR 요청 (Definition={live_def:.1f})")
+            cv2.putText(display, auto_trigger.status_text(),
+                        (10, 120), font, 0.5, (255, 200, 0), 1, cv2.LINE_AA)
+
+        # 5-5) 관심 영역(ROI) 표시: OCR 에 실제로 넘기는 영역 (패딩 제외)
+        if draw_roi_on_live:
+            if roi_rects is None:
+                frame_h, frame_w = frame.shape[:2]
+                roi_rects = roi.pixel_rects(frame_w, frame_h, padding=False)
+                print(f"✂️ ROI {len(roi_rects)}개, 프레임 대비 {roi.coverage(frame_w, frame_h) * 100:.0f}% 만 OCR")
+            for x1, y1, x2, y2 in roi_rects:
+                cv2.rectangle(display, (x1, y1), (x2 - 1, y2 - 1), (255, 128, 0), 1)
+
+        # 5-6) 실시간 B박스 + 좌표 표시 (테스트/디버깅용)
+        #  - last_results 는 마지막으로 완료된 OCR 결과입니다.
         #  - draw_bbox_on_live: B박스 폴리라인 표시 여부
         #  - show_bbox_coords_on_live: 각 박스의 중심 좌표를 텍스트로 표시 여부
         if draw_bbox_on_live and last_results:
@@ -253,124 +636,49 @@ def start_camera_ocr() -> None:
             break
 
         # --------------------------------------------------
-        # 🟢 [SPACE] 누르면 OCR 실행
+        # 🟢 [SPACE] 누르면 OCR 작업을 큐에 넣음 (처리는 워커 스레드에서)
         # --------------------------------------------------
         if key == 32:  # space
-            ts = time.strftime("%Y%m%d_%H%M%S")
-            print(f"\n📸 {ts} - OCR 실행 중...")
-            def_score = live_def
-
-            # 1) OCR 수행
-            results, vis_img, msg = run_ocr_on_image(
-                frame.copy(), main_engine, conf_threshold, cls_enable
-            )
-
-            # 2) 오류 시 재시도 (토글)
-            if msg.startswith("ERROR") and enable_retry_on_error:
-                print("⚠️ OCR 오류 발생 → 1회 재시도")
-                results, vis_img, msg = run_ocr_on_image(
-                    frame.copy(), main_engine, conf_threshold, cls_enable
-                )
-
-            # 3) 결과 시각화 (박스 + 텍스트)
-            #    - vis_img 위에 B박스를 그리고, 한글 텍스트 + 신뢰도를 함께 표시
-            for r in results:
-                box = r.get("box", [])
-                text = r.get("text", "")
-                avg_conf = r.get("avg_conf", 0.0)
-
-                if box:
-                    x1, y1 = int(box[0][0]), int(box[0][1])
-                    x2, y2 = int(box[2][0]), int(box[2][1])
-                    cv2.rectangle(vis_img, (x1, y1), (x2, y2),
-                                  (0, 255, 255), 2)
-                    vis_img = draw_korean_text(
-                        vis_img,
-                        f"{text} ({avg_conf:.2f})",
-                        x1, y1 - 22,
-                        font_size=20, color=(255, 0, 0)
-                    )
-
-            # 마지막 결과를 저장해 두었다가
-            # 실시간 화면에서 B박스/좌표를 다시 그릴 때 사용
-            last_results = results
-            last_def_score = def_score
-
-            # 4) 저장 경로 지정 (기존 + JSON 경로)
-            img_path_origin = os.path.join(out_img_origin_dir, f"capture_{ts}.jpg")
-            img_path = os.path.join(out_img_dir, f"capture_{ts}.jpg")
-            json_path = os.path.join(out_json_dir, f"capture_{ts}.json")
-
-            # 5) 저장 (enable_save_output 기반)
-            if enable_save_output:
-                # 원본 이미지 저장
-                cv2.imwrite(img_path_origin, frame)
-                # vis_img (B박스 + 텍스트 그려진 결과) 저장
-                cv2.imwrite(img_path, vis_img)
-                # JSON 저장 (export_to_json 은 내부에서 config 기반 export_all_json 호출)
-                export_to_json(results, json_path)
-
-                # 디버그용 B박스 이미지 저장 (선택 사항)
-                if debug_image_enabled:
-                    # vis_img 위에 좌표/인덱스를 추가로 그려서 저장해도 되고,
-                    # frame 기준으로 다시 그려도 됨. 여기서는 vis_img 기준으로 저장.
-                    debug_frame = vis_img.copy()
-                    for idx, r in enumerate(results):
-                        box = r.get("box", [])
-                        if not box or len(box) < 4:
-                            continue
-                        cx = int(sum(p[0] for p in box) / len(box))
-                        cy = int(sum(p[1] for p in box) / len(box))
-                        label = f"#{idx} ({cx},{cy})"
-                        cv2.putText(
-                            debug_frame,
-                            label,
-                            (cx, cy - 5),
-                            font,
-                            0.4,
-                            (0, 255, 0),
-                            1,
-                            cv2.LINE_AA,
-                        )
-
-                    debug_filename = debug_image_pattern.replace("{ts}", ts)
-                    debug_path = os.path.join(debug_image_dir, debug_filename)
-                    cv2.imwrite(debug_path, debug_frame)
-                    print(f"🟩 디버그 B박스 이미지 저장: {debug_path}")
-
-                print(
-                    "✅ 결과 저장 완료:\n"
-                    f"   - {img_path_origin}\n"
-                    f"   - {img_path}\n"
-                    f"   - {json_path}"
-                )
+            ts = _capture_ts(source, seq)
+            if worker.submit(OcrJob(ts=ts, frame=frame, def_score=live_def)):
+                print(f"\n📸 {ts} - OCR 요청 (대기열: {worker.pending})")
             else:
-                print("💾 저장 비활성화 상태이므로 파일은 생성되지 않습니다.")
-
-            # 6) 콘솔 로그 (enable_console_log)
-            if not results:
-                if enable_console_log:
-                    print(f"⚠️ OCR 결과 없음. Definition={def_score:.2f}")
-                continue
-
-            confs = [r.get("avg_conf", 0.0) for r in results]
-            overall_conf = sum(confs) / len(confs)
-
-            if enable_console_log:
-                for r in results:
-                    print(f"- {r.get('text', '')} ({r.get('avg_conf', 0.0):.2f})")
-                print(f"📈 평균 신뢰도: {overall_conf:.2f}")
-
-                if def_score < definition_threshold:
-                    print("⚠️ 이미지가 다소 흐립니다.")
-                elif overall_conf < conf_threshold:
-                    print("⚠️ 인식은 되었으나 신뢰도가 낮습니다.")
-                else:
-                    print("✅ 선명도와 인식률 모두 양호합니다.")
+                print(f"\n⏳ {ts} - OCR 대기열이 가득 차서 이번 캡처는 건너뜁니다.")
+
+        # --------------------------------------------------
+        # 🔁 ocr_every: N 프레임마다 자동으로 OCR 요청 (재처리 / 부하 테스트)
+        #    - 받은 프레임 수로 셈 (카메라는 버린 프레임만큼 seq 가 건너뛰어 seq 로는 간격이 불규칙)
+        #    - 파일 소스는 자리가 날 때까지 기다림 → 모든 요청이 처리됨
+        #    - 카메라는 기다리지 않음 → 미리보기가 멈추지 않음
+        # --------------------------------------------------
+        if ocr_every and frames_seen % ocr_every == 0:
+            ts = _capture_ts(source, seq)
+            job = OcrJob(ts=ts, frame=frame, def_score=live_def, meta={"trigger": "every"})
+            if not worker.submit(job, block=not source.is_live) and settings.enable_console_log:
+                print(f"\n⏳ {ts} - OCR 대기열이 가득 차서 이번 캡처는 건너뜁니다.")
 
     # ------------------------------------------------------
-    # 5️⃣ 종료 처리
+    # 6️⃣ 종료 처리
+    #    - 이미 요청된 캡처는 모두 처리/저장한 뒤 종료합니다.
     # ------------------------------------------------------
-    cap.release()
+    if worker.busy:
+        print("⏳ 남은 OCR 작업을 마무리하는 중...")
+    worker.stop(drain=True)
+    if writer is not None:
+        # OCR 워커가 넣은 저장 요청까지 모두 디스크에 쓴 뒤 종료
+        writer.close()
+        if settings.enable_console_log:
+            print(writer.format_stats())
+    grabber.stop()
+    if result_cache is not None and settings.enable_console_log:
+        print(result_cache.format_stats())
+    if cascade is not None:
+        registry.shutdown()
+        if settings.enable_console_log:
+            print(cascade.format_stats())
+    stop_metrics(metrics_exporters)
+    if get_registry() is not None and settings.enable_console_log:
+        print(get_registry().format_summary())
+    source.release()
     cv2.destroyAllWindows()
-    print("🟢 OCR 세션을 정상 종료했습니다.")
\ No newline at end of file
+    print("🟢 OCR 세션을 정상 종료했습니다.")
@@ -0,0 +1,117 @@
+# ==========================================================
+# frame_grabber.py
+# ----------------------------------------------------------
+# 카메라에서 프레임을 "전용 스레드"로 계속 읽어두는 캡처 모듈입니다.
+#
+# 배경
+# ----------------------------------------------------------
+# - 메인 루프가 OCR 등으로 잠깐이라도 멈추면 cap.read() 가 호출되지 않아
+#   드라이버 버퍼에 오래된 프레임이 쌓이고, 다시 읽을 때 과거 화면이 나옵니다.
+# - FrameGrabber 는 별도 스레드에서 cap.read() 를 쉬지 않고 호출하면서
+#   "가장 최신 프레임 1장"만 보관합니다.
+# - 동영상/이미지 폴더(frame_source.py)를 재처리할 때는 프레임을 버리면 안 되므로
+#   drop_frames=False 로 만들면 소비자가 읽어 갈 때까지 다음 프레임을 읽지 않습니다.
+#
+# 사용 예시
+# ----------------------------------------------------------
+# grabber = FrameGrabber(cap).start()                        # 카메라: 최신 프레임만
+# grabber = FrameGrabber(source, drop_frames=False).start()  # 파일: 모든 프레임
+# ok, frame, seq = grabber.read(last_seq, timeout=1.0)
+# ...
+# grabber.stop()
+# ==========================================================
+
+import threading
+import time
+
+from label_text_recognition.metrics.stage_metrics import timed
+
+
+class FrameGrabber:
+    """
+    cap.read() 를 백그라운드 스레드에서 반복 호출하고 최신 프레임만 유지합니다.
+
+    - read(last_seq) 는 last_seq 보다 새로운 프레임이 들어올 때까지 기다리므로
+      호출하는 쪽 루프는 자연스럽게 카메라 프레임레이트에 맞춰 돌게 됩니다.
+    - 카메라가 프레임을 더 이상 주지 못하면 stopped 가 True 가 됩니다.
+      (frame_source 의 파일 소스는 끝에 도달하면(exhausted) 재시도 없이 바로 종료)
+    - drop_frames=False 면 직전 프레임을 read() 로 가져가기 전까지 다음 프레임을 읽지 않습니다.
+    """
+
+    def __init__(self, cap, name: str = "frame-grabber", drop_frames: bool = True):
+        self._cap = cap
+        self._name = name
+        self._drop_frames = drop_frames
+        self._consumed_seq = 0
+        self._cond = threading.Condition()
+        self._frame = None
+        self._seq = 0
+        self._running = False
+        self._thread: threading.Thread | None = None
+        self.stopped = False
+        self.read_fail_count = 0
+
+    def start(self) -> "FrameGrabber":
+        self._running = True
+        self._thread = threading.Thread(target=self._loop, name=self._name, daemon=True)
+        self._thread.start()
+        return self
+
+    def _loop(self) -> None:
+        while self._running:
+            if not self._drop_frames:
+                # 소비자가 직전 프레임을 가져갈 때까지 대기 (프레임 누락 없음)
+                with self._cond:
+                    self._cond.wait_for(lambda: self._consumed_seq >= self._seq or not self._running)
+                if not self._running:
+                    break
+
+            with timed("capture"):
+                ret, frame = self._cap.read()
+            if not ret:
+                if getattr(self._cap, "exhausted", False):
+                    # 동영상/폴더 끝 → 더 읽을 프레임이 없음
+                    break
+                self.read_fail_count += 1
+                # 일시적인 실패는 몇 번 더 시도하고, 계속 실패하면 종료로 판단
+                if self.read_fail_count >= 30:
+                    break
+                time.sleep(0.01)
+                continue
+
+            self.read_fail_count = 0
+            with self._cond:
+                self._frame = frame
+                self._seq += 1
+                self._cond.notify_all()
+
+        with self._cond:
+            self.stopped = True
+            self._running = False
+            self._cond.notify_all()
+
+    def read(self, last_seq: int = 0, timeout: float | None = 1.0):
+        """
+        last_seq 보다 새로운 프레임을 돌려줍니다.
+
+        Returns
+        -------
+        (ok, frame, seq)
+            ok=False 면 timeout 안에 새 프레임이 없었거나 캡처가 종료된 상태입니다.
+        """
+        with self._cond:
+            if self._seq <= last_seq and not self.stopped:
+                self._cond.wait_for(lambda: self._seq > last_seq or self.stopped, timeout)
+            if self._seq <= last_seq or self._frame is None:
+                return False, None, self._seq
+            if self._consumed_seq < self._seq:
+                self._consumed_seq = self._seq
+                self._cond.notify_all()
+            return True, self._frame, self._seq
+
+    def stop(self) -> None:
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
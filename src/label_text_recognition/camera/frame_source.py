@@ -0,0 +1,298 @@
+# ==========================================================
+# frame_source.py
+# ----------------------------------------------------------
+# 카메라 / 동영상 파일 / 이미지 폴더 / 메모리 제너레이터를
+# 같은 방식(read() → (ok, frame))으로 읽을 수 있게 해주는 프레임 소스 모듈입니다.
+#
+# 배경
+# ----------------------------------------------------------
+# - init_camera / start_camera_ocr 는 실시간 cv2.VideoCapture(index) 만 받습니다.
+# - 녹화해 둔 MP4 나 이미지 폴더로 같은 파이프라인을 다시 돌리거나(오프라인 재처리),
+#   부하 테스트를 하려면 카메라 없이 프레임을 공급할 방법이 필요합니다.
+#
+# 동작 방식
+# ----------------------------------------------------------
+# ✅ 모든 소스는 cv2.VideoCapture 와 같은 read() / isOpened() / release() 를 제공
+#     → FrameGrabber / camera_loop 는 소스 종류를 몰라도 됨
+# ✅ 프레임은 read() 할 때 한 장씩 읽음 (폴더 전체/동영상 전체를 미리 올리지 않음)
+# ✅ stride=N → N 프레임마다 1장만 사용 (동영상은 grab() 으로 디코딩 없이 건너뜀)
+# ✅ realtime=True  → 원본 fps 에 맞춰 천천히 공급 (카메라와 같은 조건)
+#    realtime=False → 기다리지 않고 최대 속도로 공급 (재처리 / 부하 테스트)
+# ✅ 끝까지 읽으면 exhausted=True → FrameGrabber 가 재시도 없이 바로 종료
+#
+# 사용 예시
+# ----------------------------------------------------------
+# source = open_frame_source(cfg)                        # frame_source 섹션 기준
+# source = VideoFileSource("line3.mp4", stride=2, realtime=False)
+# source = GeneratorSource(frames, fps=30)               # 테스트용
+# grabber = FrameGrabber(source, drop_frames=not source.is_live).start()
+# ==========================================================
+
+import glob
+import os
+import time
+from typing import Iterable, Iterator
+
+import cv2
+import numpy as np
+
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp", ".tif", ".tiff")
+
+
+class FrameSource:
+    """
+    프레임 소스 공통 베이스.
+    하위 클래스는 _next_frame() 만 구현하면 stride / 속도 조절은 여기서 처리합니다.
+
+    Parameters
+    ----------
+    stride : int
+        stride 프레임마다 1장만 돌려줌 (1 → 모두 사용)
+    realtime : bool
+        True 면 fps 에 맞춰 read() 간격을 맞춤, False 면 최대 속도
+    fps : float
+        realtime 일 때 기준 프레임레이트 (stride 로 건너뛴 프레임도 시간에 포함)
+    """
+
+    name = "source"
+    is_live = False
+
+    def __init__(self, stride: int = 1, realtime: bool = False, fps: float = 30.0):
+        self.stride = max(1, int(stride))
+        self.realtime = bool(realtime)
+        self.fps = float(fps) if fps and fps > 0 else 30.0
+        self.exhausted = False
+        self.frames_read = 0      # 실제로 돌려준 프레임 수
+        self.position = -1        # 마지막으로 돌려준 프레임의 원본 번호 (0부터)
+        self._next_due: float | None = None
+
+    # ------------------------------------------------------
+    # 하위 클래스 구현
+    # ------------------------------------------------------
+    def _next_frame(self) -> np.ndarray | None:
+        """다음 프레임 (없으면 None)"""
+        raise NotImplementedError
+
+    def _skip_frame(self) -> bool:
+        """디코딩 없이 한 프레임 건너뛰기. 기본은 읽고 버림"""
+        return self._next_frame() is not None
+
+    # ------------------------------------------------------
+    # cv2.VideoCapture 호환 API
+    # ------------------------------------------------------
+    def isOpened(self) -> bool:
+        return not self.exhausted
+
+    def read(self):
+        if self.exhausted:
+            return False, None
+
+        # stride: 앞의 stride-1 프레임은 건너뜀 (첫 프레임은 그대로 사용)
+        if self.position >= 0:
+            for _ in range(self.stride - 1):
+                if not self._skip_frame():
+                    self.exhausted = True
+                    return False, None
+                self.position += 1
+
+        frame = self._next_frame()
+        if frame is None:
+            self.exhausted = True
+            return False, None
+        self.position += 1
+        self.frames_read += 1
+
+        if self.realtime:
+            self._pace()
+        return True, frame
+
+    def _pace(self) -> None:
+        interval = self.stride / self.fps
+        now = time.monotonic()
+        if self._next_due is None:
+            self._next_due = now
+        wait = self._next_due - now
+        if wait > 0:
+            time.sleep(wait)
+        # 처리가 밀렸으면 따라잡으려고 몰아서 보내지 않고 지금부터 다시 맞춤
+        self._next_due = max(self._next_due, now) + interval
+
+    def release(self) -> None:
+        self.exhausted = True
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self.name} stride={self.stride} realtime={self.realtime}>"
+
+
+class CameraSource(FrameSource):
+    """
+    이미 열린 cv2.VideoCapture(카메라)를 감싸는 소스. 속도는 카메라가 정함
+    camera_index 는 실제로 연 장치 번호 (auto 탐색 결과 포함, 모르면 None)
+    """
+
+    is_live = True
+
+    def __init__(self, cap, name: str = "camera", stride: int = 1, camera_index: int | None = None):
+        super().__init__(stride=stride, realtime=False)
+        self.cap = cap
+        self.name = name
+        self.camera_index = camera_index
+
+    def _next_frame(self):
+        ret, frame = self.cap.read()
+        # 카메라의 일시적인 읽기 실패는 종료가 아님 → FrameGrabber 가 재시도
+        if not ret:
+            return None
+        return frame
+
+    def _skip_frame(self) -> bool:
+        return bool(self.cap.grab())
+
+    def read(self):
+        ret, frame = super().read()
+        if not ret:
+            self.exhausted = False
+        return ret, frame
+
+    def isOpened(self) -> bool:
+        return self.cap.isOpened()
+
+    def release(self) -> None:
+        super().release()
+        self.cap.release()
+
+
+class VideoFileSource(FrameSource):
+    """동영상 파일 (mp4 / avi ...). fps 는 파일 정보에서 읽음"""
+
+    def __init__(self, path: str, stride: int = 1, realtime: bool = False, fps: float | None = None):
+        self.path = path
+        self.name = os.path.splitext(os.path.basename(path))[0]
+        self.cap = cv2.VideoCapture(path)
+        file_fps = self.cap.get(cv2.CAP_PROP_FPS) if self.cap.isOpened() else 0.0
+        super().__init__(stride=stride, realtime=realtime, fps=fps or file_fps or 30.0)
+        if not self.cap.isOpened():
+            print(f"❌ 동영상 파일을 열 수 없습니다: {path}")
+            self.exhausted = True
+
+    @property
+    def frame_count(self) -> int:
+        return int(self.cap.get(cv2.CAP_PROP_FRAME_COUNT) or 0)
+
+    def _next_frame(self):
+        ret, frame = self.cap.read()
+        return frame if ret else None
+
+    def _skip_frame(self) -> bool:
+        # grab() 은 디코딩 없이 다음 프레임으로 이동 → stride 가 클수록 빨라짐
+        return bool(self.cap.grab())
+
+    def release(self) -> None:
+        super().release()
+        self.cap.release()
+
+
+class ImageDirSource(FrameSource):
+    """
+    폴더 안의 이미지를 파일 이름 순서대로 한 장씩 읽는 소스.
+    (목록만 먼저 만들고, 이미지는 read() 할 때 읽음)
+    """
+
+    def __init__(
+        self,
+        path: str,
+        stride: int = 1,
+        realtime: bool = False,
+        fps: float = 10.0,
+        extensions: Iterable[str] = IMAGE_EXTENSIONS,
+    ):
+        super().__init__(stride=stride, realtime=realtime, fps=fps)
+        self.path = path
+        self.name = os.path.basename(os.path.normpath(path))
+        exts = tuple(e.lower() for e in extensions)
+        self.files = sorted(
+            f for f in glob.glob(os.path.join(path, "*")) if f.lower().endswith(exts)
+        )
+        self._index = 0
+        self.current_file: str | None = None
+        if not self.files:
+            print(f"❌ 폴더에 이미지가 없습니다: {path}")
+            self.exhausted = True
+
+    def _next_frame(self):
+        while self._index < len(self.files):
+            path = self.files[self._index]
+            self._index += 1
+            frame = cv2.imread(path)
+            if frame is not None:
+                self.current_file = path
+                return frame
+            print(f"⚠️ 이미지를 읽을 수 없어 건너뜁니다: {path}")
+        return None
+
+    def _skip_frame(self) -> bool:
+        # 건너뛸 파일은 읽지 않음
+        if self._index >= len(self.files):
+            return False
+        self._index += 1
+        return True
+
+
+class GeneratorSource(FrameSource):
+    """이터러블/제너레이터에서 프레임을 꺼내는 소스 (테스트, 합성 프레임 부하 테스트용)"""
+
+    def __init__(self, frames: Iterable[np.ndarray], stride: int = 1, realtime: bool = False,
+                 fps: float = 30.0, name: str = "generator"):
+        super().__init__(stride=stride, realtime=realtime, fps=fps)
+        self.name = name
+        self._it: Iterator[np.ndarray] = iter(frames)
+
+    def _next_frame(self):
+        return next(self._it, None)
+
+
+# ----------------------------------------------------------
+# 설정 기반 생성
+# ----------------------------------------------------------
+def open_frame_source(cfg, source_type: str | None = None, path: str | None = None) -> FrameSource | None:
+    """
+    frame_source 섹션(또는 인자)으로 소스를 엽니다. 실패하면 None.
+
+    frame_source:
+      type: "camera"       # camera | video | dir
+      path: null           # video → 파일 경로, dir → 폴더 경로
+      stride: 1
+      realtime: true       # false → 최대 속도 (video / dir 만 해당)
+      fps: 10              # dir 에서 realtime 일 때 기준 fps (video 는 파일 fps)
+    """
+    src_cfg = cfg.get("frame_source", {}) or {}
+    source_type = (source_type or src_cfg.get("type") or "camera").lower()
+    path = path or src_cfg.get("path")
+    stride = src_cfg.get("stride", 1)
+    realtime = src_cfg.get("realtime", True)
+
+    if source_type == "camera":
+        from label_text_recognition.camera.camera_initializer import init_camera_with_index
+
+        cap, camera_index = init_camera_with_index(cfg)
+        if cap is None:
+            return None
+        return CameraSource(cap, stride=stride, camera_index=camera_index)
+
+    if not path:
+        print(f"❌ frame_source.type={source_type} 에는 path 가 필요합니다.")
+        return None
+
+    if source_type == "video":
+        source = VideoFileSource(path, stride=stride, realtime=realtime)
+    elif source_type == "dir":
+        source = ImageDirSource(path, stride=stride, realtime=realtime, fps=src_cfg.get("fps", 10))
+    else:
+        print(f"❌ 지원하지 않는 frame_source.type: {source_type} (camera / video / dir)")
+        return None
+
+    if source.exhausted:
+        return None
+    pace = "실시간" if source.realtime else "최대 속도"
+    print(f"🎞 프레임 소스: {source_type} '{path}' (stride={source.stride}, {pace})")
+    return source
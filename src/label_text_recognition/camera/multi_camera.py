@@ -0,0 +1,496 @@
+# ==========================================================
+# multi_camera.py
+# ----------------------------------------------------------
+# 한 프로세스에서 USB 카메라 여러 대를 동시에 캡처하고,
+# 모든 카메라가 "하나의 OCR 엔진 풀"을 나눠 쓰는 멀티 카메라 모드입니다.
+#
+# 배경
+# ----------------------------------------------------------
+# - 스테이션마다 USB 카메라가 2~3대인데, init_camera 는 장치 하나만 열고
+#   start_camera_ocr 는 루프 하나만 돌립니다.
+# - 카메라마다 프로세스를 띄우면 PaddleOCR 모델이 카메라 수만큼 메모리에 올라갑니다.
+#
+# 동작 방식
+# ----------------------------------------------------------
+# ✅ camera_index: [0, 2] 처럼 리스트로 적으면 멀티 카메라 모드
+# ✅ 카메라마다 캡처 스레드(FrameGrabber) + 선명도/자동 트리거/ROI/결과 캐시를 따로 가짐
+# ✅ cameras.<번호> 섹션으로 카메라별 설정 덮어쓰기 (해상도, ROI, 임계값 ...)
+# ✅ OCR 은 SharedEnginePool 하나가 처리
+#    - 엔진 수 = multi_camera.engine_workers (기본 1 → 모델은 메모리에 한 벌만)
+#    - 카메라별 대기열(max_queue_per_camera)을 따로 두고 라운드 로빈으로 꺼냄
+#      → 자동 트리거가 자주 걸리는 카메라가 다른 카메라를 굶기지 않음
+# ✅ 카메라별 통계: 요청 / 대기열 가득 참 / 처리 / 오류 / 평균 대기·처리 시간
+# ✅ 저장 파일 이름의 ts 는 <시각>_cam<번호>_<프레임 번호> → 카메라끼리, 같은 카메라의 캡처끼리 덮어쓰지 않음
+#
+# 조작
+# ----------------------------------------------------------
+#   [SPACE] → 모든 카메라 캡처   [1]~[9] → 해당 순번 카메라만 캡처   [q] → 종료
+# ==========================================================
+
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+import cv2
+import numpy as np
+
+from label_text_recognition.camera.auto_trigger import AutoTrigger
+from label_text_recognition.camera.camera_initializer import open_camera
+from label_text_recognition.camera.frame_grabber import FrameGrabber
+from label_text_recognition.camera.frame_source import CameraSource
+from label_text_recognition.camera.ocr_worker import OcrJob, OcrJobResult
+from label_text_recognition.camera.sharpness import SharpnessScorer
+from label_text_recognition.metrics.stage_metrics import timed
+
+
+# ==========================================================
+# 1️⃣ 카메라별 설정
+# ==========================================================
+def camera_indices(cfg) -> list[int] | None:
+    """camera_index 가 리스트면 정수 목록, 아니면 None (단일 카메라 모드)"""
+    raw = cfg.get("camera_index", "auto")
+    if not isinstance(raw, (list, tuple)):
+        return None
+    indices = []
+    for value in raw:
+        try:
+            indices.append(int(value))
+        except (TypeError, ValueError):
+            print(f"⚠️ camera_index 목록의 잘못된 값은 건너뜁니다: {value}")
+    return indices
+
+
+def camera_config(cfg, index: int):
+    """
+    cameras.<index> 섹션을 덮어쓴 카메라 전용 설정을 돌려줍니다.
+
+    cameras:
+      0: {frame_width: 1280, frame_height: 720}
+      2: {conf_threshold: 0.6, roi: {enabled: true, regions: [...]}}
+    """
+    cameras_cfg = cfg.get("cameras", {}) or {}
+    overrides = dict(cameras_cfg.get(index) or cameras_cfg.get(str(index)) or {})
+    overrides["camera_index"] = index
+    return cfg.with_overrides(overrides)
+
+
+# ==========================================================
+# 2️⃣ 공유 엔진 풀 (카메라별 대기열 + 라운드 로빈)
+# ==========================================================
+@dataclass
+class CameraStats:
+    submitted: int = 0
+    rejected: int = 0        # 대기열이 가득 차서 버린 요청
+    processed: int = 0
+    errors: int = 0
+    wait_sec: float = 0.0    # 대기열에서 기다린 시간 합
+    busy_sec: float = 0.0    # OCR 처리 시간 합
+
+    def format(self, name: str) -> str:
+        n = max(1, self.processed)
+        return (
+            f"   - {name}: 요청 {self.submitted}, 처리 {self.processed}, "
+            f"대기열 초과 {self.rejected}, 오류 {self.errors}, "
+            f"평균 대기 {self.wait_sec / n * 1000:.0f}ms, 평균 처리 {self.busy_sec / n * 1000:.0f}ms"
+        )
+
+
+@dataclass
+class _QueuedJob:
+    job: OcrJob
+    queued_at: float = field(default_factory=time.perf_counter)
+
+
+class SharedEnginePool:
+    """
+    여러 카메라의 OCR 요청을 제한된 수의 엔진으로 처리합니다.
+
+    Parameters
+    ----------
+    engines : list
+        워커 스레드마다 하나씩 쓸 엔진 (같은 엔진을 여러 번 넣어도 됨 — 스레드 안전한 백엔드)
+    process_fn : Callable[[Any, OcrJob, Any], list]
+        process_fn(camera_key, job, engine) → OCR 결과
+    max_queue_per_camera : int
+        카메라 하나가 쌓아 둘 수 있는 대기 요청 수 (가득 차면 submit 이 False)
+    """
+
+    def __init__(self, engines: list, process_fn: Callable[[Any, OcrJob, Any], list],
+                 max_queue_per_camera: int = 2):
+        if not engines:
+            raise ValueError("SharedEnginePool 에는 최소 한 개의 엔진이 필요합니다.")
+        self._engines = list(engines)
+        self._process_fn = process_fn
+        self._max_queue = max(1, int(max_queue_per_camera))
+
+        self._cond = threading.Condition()
+        self._queues: dict[Any, deque] = {}
+        self._order: list[Any] = []       # 라운드 로빈 순서
+        self._next = 0
+        self._active = 0
+        self._stopping = False
+        self._threads: list[threading.Thread] = []
+        self._done: deque = deque()
+        self.stats: dict[Any, CameraStats] = {}
+
+    def add_camera(self, key: Any) -> None:
+        with self._cond:
+            if key not in self._queues:
+                self._queues[key] = deque()
+                self._order.append(key)
+                self.stats[key] = CameraStats()
+
+    def start(self) -> "SharedEnginePool":
+        for i, engine in enumerate(self._engines):
+            thread = threading.Thread(target=self._loop, args=(engine,), name=f"ocr-pool-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    # ------------------------------------------------------
+    # 요청 / 결과
+    # ------------------------------------------------------
+    def submit(self, key: Any, job: OcrJob) -> bool:
+        with self._cond:
+            stats = self.stats[key]
+            queue_ = self._queues[key]
+            if self._stopping or len(queue_) >= self._max_queue:
+                stats.rejected += 1
+                return False
+            queue_.append(_QueuedJob(job))
+            stats.submitted += 1
+            self._cond.notify()
+            return True
+
+    def poll_results(self) -> list[tuple[Any, OcrJobResult]]:
+        done = []
+        while True:
+            try:
+                done.append(self._done.popleft())
+            except IndexError:
+                return done
+
+    def pending(self, key: Any) -> int:
+        with self._cond:
+            return len(self._queues[key])
+
+    @property
+    def busy(self) -> bool:
+        with self._cond:
+            return self._active > 0 or any(self._queues.values())
+
+    # ------------------------------------------------------
+    # 워커
+    # ------------------------------------------------------
+    def _take(self):
+        """라운드 로빈으로 다음 카메라의 요청 1건 (cond 잡은 상태에서 호출)"""
+        n = len(self._order)
+        for step in range(n):
+            key = self._order[(self._next + step) % n]
+            if self._queues[key]:
+                self._next = (self._next + step + 1) % n
+                return key, self._queues[key].popleft()
+        return None
+
+    def _loop(self, engine) -> None:
+        while True:
+            with self._cond:
+                item = self._take()
+                while item is None:
+                    if self._stopping:
+                        return
+                    self._cond.wait()
+                    item = self._take()
+                self._active += 1
+
+            key, queued = item
+            t0 = time.perf_counter()
+            error, results = "", []
+            try:
+                results = self._process_fn(key, queued.job, engine) or []
+            except Exception as e:
+                print(f"⚠️ OCR 풀 처리 중 예외 발생 ({key}): {e}")
+                error = str(e)
+            elapsed = time.perf_counter() - t0
+
+            with self._cond:
+                self._active -= 1
+                stats = self.stats[key]
+                stats.processed += 1
+                stats.errors += 1 if error else 0
+                stats.wait_sec += t0 - queued.queued_at
+                stats.busy_sec += elapsed
+                self._cond.notify_all()
+            self._done.append((key, OcrJobResult(queued.job, results, error, elapsed)))
+
+    def stop(self, drain: bool = True) -> None:
+        """drain=True 면 대기 중인 요청을 모두 처리한 뒤 종료"""
+        with self._cond:
+            self._stopping = True
+            if not drain:
+                for queue_ in self._queues.values():
+                    queue_.clear()
+            self._cond.notify_all()
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+    def format_stats(self, names: dict | None = None) -> str:
+        rows = [f"📷 카메라별 OCR 통계 (엔진 워커 {len(self._engines)}개)"]
+        with self._cond:
+            for key in self._order:
+                rows.append(self.stats[key].format(str((names or {}).get(key, key))))
+        return "\n".join(rows)
+
+
+# ==========================================================
+# 3️⃣ 카메라 채널 (카메라 1대분 상태)
+# ==========================================================
+@dataclass
+class CameraChannel:
+    index: int
+    cfg: Any
+    settings: Any
+    source: CameraSource
+    grabber: FrameGrabber
+    scorer: SharpnessScorer
+    auto_trigger: AutoTrigger | None = None
+    roi: Any = None
+    downscale: Any = None
+    result_cache: Any = None
+    last_seq: int = 0
+    last_results: list = field(default_factory=list)
+
+    @property
+    def name(self) -> str:
+        return f"cam{self.index}"
+
+    @property
+    def window(self) -> str:
+        return f"Label Text Recognition - Camera {self.index}"
+
+
+def _open_channels(cfg, indices: list[int]) -> list[CameraChannel]:
+    from label_text_recognition.camera.camera_loop import CaptureSettings
+    from label_text_recognition.ocr.downscale import AdaptiveDownscaler
+    from label_text_recognition.ocr.result_cache import OcrResultCache
+    from label_text_recognition.ocr.roi import RoiSet
+
+    channels = []
+    for index in indices:
+        cam_cfg = camera_config(cfg, index)
+        cap = open_camera(index, cam_cfg.get("frame_width", 960), cam_cfg.get("frame_height", 540))
+        if cap is None:
+            continue
+        source = CameraSource(cap, name=f"cam{index}", camera_index=index)
+        auto_trigger = None
+        if (cam_cfg.get("auto_trigger", {}) or {}).get("enabled", False):
+            auto_trigger = AutoTrigger.from_config(cam_cfg)
+        channels.append(CameraChannel(
+            index=index,
+            cfg=cam_cfg,
+            settings=CaptureSettings.from_config(cam_cfg),
+            source=source,
+            grabber=FrameGrabber(source, name=f"frame-grabber-{index}").start(),
+            scorer=SharpnessScorer.from_config(cam_cfg),
+            auto_trigger=auto_trigger,
+            roi=RoiSet.from_config(cam_cfg, camera_index=index),
+            downscale=AdaptiveDownscaler.from_config(cam_cfg),
+            result_cache=OcrResultCache.from_config(cam_cfg),
+        ))
+    return channels
+
+
+def _build_pool_engines(registry, workers: int) -> list:
+    """
+    엔진 워커 수만큼 엔진 목록을 만듭니다.
+    스레드 안전한 백엔드(onnx)는 엔진 하나를 공유하고, 아니면 워커마다 엔진을 하나씩 더 만듭니다.
+    """
+    main_engine = registry.get()
+    if getattr(main_engine, "thread_safe", False):
+        return [main_engine] * workers
+    return [main_engine] + [registry.create_engine() for _ in range(workers - 1)]
+
+
+# ==========================================================
+# 4️⃣ 메인 함수
+# ==========================================================
+def start_multi_camera_ocr(cfg=None) -> None:
+    """camera_index 가 리스트일 때의 멀티 카메라 OCR 실행 (start_camera_ocr 에서 호출)"""
+    from label_text_recognition.camera.camera_loop import process_capture
+    from label_text_recognition.config.settings import get_ocr_config
+    from label_text_recognition.exporters.async_writer import AsyncResultWriter
+    from label_text_recognition.metrics.endpoint import start_metrics, stop_metrics
+    from label_text_recognition.metrics.stage_metrics import get_registry
+    from label_text_recognition.ocr.cascade import CascadeRecognizer
+    from label_text_recognition.ocr.engine_registry import build_engine_registry
+    from label_text_recognition.render.fonts import configure_fonts, get_font
+
+    cfg = cfg or get_ocr_config()
+    indices = camera_indices(cfg) or []
+    multi_cfg = cfg.get("multi_camera", {}) or {}
+    engine_workers = max(1, int(multi_cfg.get("engine_workers", 1)))
+    max_queue = multi_cfg.get("max_queue_per_camera", 2)
+    enable_console_log = cfg.get("enable_console_log", True)
+    enable_save_output = cfg.get("enable_save_output", True)
+    show_live_preview = (cfg.get("visualize", {}) or {}).get("show_live_preview", True)
+    draw_bbox_on_live = (cfg.get("visualize", {}) or {}).get("draw_bbox_on_live", False)
+
+    metrics_exporters = start_metrics(cfg)
+    configure_fonts(cfg)
+    get_font(20)
+
+    registry = build_engine_registry(cfg)
+    registry.preload([registry.main_lang], background=True)
+
+    channels = _open_channels(cfg, indices)
+    if not channels:
+        print(f"❌ 열 수 있는 카메라가 없습니다. (camera_index: {list(indices)})")
+        registry.shutdown()
+        stop_metrics(metrics_exporters)
+        return
+
+    # 저장 폴더는 카메라별 설정에 따라 다를 수 있으므로 모두 생성
+    if enable_save_output:
+        for ch in channels:
+            for path in (ch.settings.out_img_dir, ch.settings.out_img_origin_dir, ch.settings.out_json_dir):
+                os.makedirs(path, exist_ok=True)
+            if ch.settings.debug_image_enabled:
+                os.makedirs(ch.settings.debug_image_dir, exist_ok=True)
+
+    engines = _build_pool_engines(registry, engine_workers)
+    # 캐스케이드는 모든 워커 스레드가 공유 (보조 엔진 호출은 CascadeRecognizer 안에서 언어별로 직렬화)
+    cascade = CascadeRecognizer.from_config(cfg, registry)
+    if cascade is None:
+        registry.shutdown()
+
+    writer = None
+    if enable_save_output and (cfg.get("async_writer", {}) or {}).get("enabled", True):
+        writer = AsyncResultWriter.from_config(cfg).start()
+
+    by_index = {ch.index: ch for ch in channels}
+
+    def run_capture(index: int, job: OcrJob, engine) -> list[dict]:
+        ch = by_index[index]
+        with timed("process_capture"):
+            return process_capture(
+                job, engine, ch.settings, ch.cfg, ch.result_cache, writer, cascade, ch.roi, ch.downscale
+            )
+
+    pool = SharedEnginePool(engines, run_capture, max_queue_per_camera=max_queue)
+    for ch in channels:
+        pool.add_camera(ch.index)
+    pool.start()
+
+    names = {ch.index: ch.name for ch in channels}
+    print(f"✅ Multi-camera OCR ready: {', '.join(names.values())} (엔진 워커 {engine_workers}개)")
+    print("   [SPACE] → 모든 카메라 OCR / [1]~[9] → 해당 카메라만 / [q] → 종료")
+
+    font = cv2.FONT_HERSHEY_SIMPLEX
+
+    def request(ch: CameraChannel, frame, seq: int, def_score: float, trigger: str) -> None:
+        # 카메라 이름 + 프레임 번호 → 한 카메라에서 1초에 여러 건을 요청해도(자동 + 수동, SPACE 뒤 숫자 키)
+        # 서로 다른 프레임이면 이미지 / JSON 이름이 겹치지 않음
+        ts = f"{time.strftime('%Y%m%d_%H%M%S')}_{ch.name}_{seq:06d}"
+        job = OcrJob(ts=ts, frame=frame, def_score=def_score, meta={"trigger": trigger, "camera": ch.index})
+        if pool.submit(ch.index, job):
+            print(f"\n📸 {ts} - OCR 요청 ({trigger}, 대기열: {pool.pending(ch.index)})")
+        elif enable_console_log:
+            print(f"\n⏳ {ts} - {ch.name} 대기열이 가득 차서 이번 캡처는 건너뜁니다.")
+
+    latest: dict[int, tuple[Any, int, float]] = {}
+    while True:
+        for index, done in pool.poll_results():
+            by_index[index].last_results = done.results
+            if enable_console_log:
+                print(f"⏱ {names[index]} OCR 완료 ({done.job.ts}): {done.elapsed_sec * 1000:.0f}ms")
+
+        alive = False
+        got_frame = False
+        for ch in channels:
+            # 카메라마다 새 프레임이 있을 때만 처리 (기다리지 않음)
+            ret, frame, seq = ch.grabber.read(ch.last_seq, timeout=0)
+            if not ch.grabber.stopped:
+                alive = True
+            if not ret:
+                continue
+            ch.last_seq = seq
+            got_frame = True
+
+            with timed("sharpness"):
+                live_def = ch.scorer.score(frame)
+            latest[ch.index] = (frame, seq, live_def)
+
+            if ch.auto_trigger is not None:
+                if ch.auto_trigger.update(frame, live_def, can_fire=pool.pending(ch.index) == 0):
+                    request(ch, frame, seq, live_def, "auto")
+
+            if show_live_preview:
+                display = frame.copy()
+                color = (0, 255, 0) if live_def >= ch.settings.definition_threshold else (0, 0, 255)
+                cv2.putText(display, f"{ch.name}  Definition: {live_def:.1f}",
+                            (10, 30), font, 0.6, color, 2)
+                queued = pool.pending(ch.index)
+                if queued:
+                    cv2.putText(display, f"OCR queued: {queued}", (10, 60), font, 0.55, (0, 255, 255), 2)
+                if ch.roi is not None:
+                    h, w = frame.shape[:2]
+                    for x1, y1, x2, y2 in ch.roi.pixel_rects(w, h, padding=False):
+                        cv2.rectangle(display, (x1, y1), (x2 - 1, y2 - 1), (255, 128, 0), 1)
+                if draw_bbox_on_live:
+                    for item in ch.last_results:
+                        box = item.get("box")
+                        if box and len(box) >= 4:
+                            pts = np.array(box, dtype=np.int32).reshape((-1, 1, 2))
+                            cv2.polylines(display, [pts], isClosed=True, color=(0, 255, 0), thickness=2)
+                cv2.imshow(ch.window, display)
+
+        if not alive:
+            print("⚠️ 모든 카메라에서 프레임을 읽을 수 없습니다. 카메라 연결을 확인하세요.")
+            break
+
+        key = cv2.waitKey(1) & 0xFF
+        if key == ord("q"):
+            break
+        if key == 32:  # space → 모든 카메라
+            for ch in channels:
+                if ch.index in latest:
+                    request(ch, *latest[ch.index], "manual")
+        elif ord("1") <= key <= ord("9"):
+            pos = key - ord("1")
+            if pos < len(channels) and channels[pos].index in latest:
+                request(channels[pos], *latest[channels[pos].index], "manual")
+        elif not got_frame:
+            # 어느 카메라에도 새 프레임이 없었으면 CPU 를 잠깐 놓아줌
+            time.sleep(0.002)
+
+    # ------------------------------------------------------
+    # 종료 처리 (요청된 캡처는 모두 처리/저장)
+    # ------------------------------------------------------
+    if pool.busy:
+        print("⏳ 남은 OCR 작업을 마무리하는 중...")
+    pool.stop(drain=True)
+    if writer is not None:
+        writer.close()
+        if enable_console_log:
+            print(writer.format_stats())
+    for ch in channels:
+        ch.grabber.stop()
+        ch.source.release()
+    if enable_console_log:
+        print(pool.format_stats(names))
+        for ch in channels:
+            if ch.result_cache is not None:
+                print(f"{ch.name}: {ch.result_cache.format_stats()}")
+    if cascade is not None:
+        registry.shutdown()
+        if enable_console_log:
+            print(cascade.format_stats())
+    stop_metrics(metrics_exporters)
+    if get_registry() is not None and enable_console_log:
+        print(get_registry().format_summary())
+    cv2.destroyAllWindows()
+    print("🟢 멀티 카메라 OCR 세션을 정상 종료했습니다.")
@@ -0,0 +1,163 @@
+# ==========================================================
+# ocr_worker.py
+# ----------------------------------------------------------
+# 캡처된 프레임을 "OCR 전용 스레드"에서 처리하는 작업 큐 모듈입니다.
+#
+# 배경
+# ----------------------------------------------------------
+# - 예전 camera_loop 는 SPACE 를 누르면 같은 스레드에서
+#   OCR → 시각화 → 파일 저장을 모두 끝낸 뒤에야 다음 프레임을 읽었습니다.
+#   그동안 미리보기 화면은 멈춰 있었습니다.
+# - OcrWorker 는 크기가 제한된 작업 큐(bounded queue)를 두고,
+#   메인 루프는 작업을 넣기만 하고 바로 미리보기로 돌아갑니다.
+# - 끝난 작업은 결과 큐로 돌아오고, 메인 루프가 poll_results() 로 받아서
+#   실시간 오버레이(B박스 등)에 반영합니다.
+#
+# 주의
+# ----------------------------------------------------------
+# - PaddleOCR 인스턴스는 동시 호출에 안전하지 않으므로
+#   엔진 하나당 워커 스레드는 하나만 둡니다.
+# ==========================================================
+
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+
+@dataclass
+class OcrJob:
+    """
+    OCR 워커에 넘기는 작업 1건.
+
+    ts        : 캡처 시각 문자열 (파일명에 사용)
+    frame     : 원본 프레임 (BGR)
+    def_score : 캡처 시점의 선명도 점수
+    meta      : 호출부에서 필요한 부가 정보 (예: 트리거 종류)
+    """
+
+    ts: str
+    frame: Any
+    def_score: float = 0.0
+    meta: dict = field(default_factory=dict)
+
+
+@dataclass
+class OcrJobResult:
+    """
+    OCR 워커가 돌려주는 작업 결과.
+    results 는 process_fn 의 반환값, error 는 처리 중 발생한 예외 메시지입니다.
+    """
+
+    job: OcrJob
+    results: list = field(default_factory=list)
+    error: str = ""
+    elapsed_sec: float = 0.0
+
+
+class OcrWorker:
+    """
+    bounded queue + 전용 스레드로 OCR 작업을 처리합니다.
+
+    Parameters
+    ----------
+    process_fn : Callable[[OcrJob], list]
+        작업 1건을 처리하는 함수. (OCR + 시각화 + 저장 등)
+    max_queue : int
+        대기열 최대 길이. 가득 차면 submit() 이 False 를 돌려줍니다.
+    """
+
+    def __init__(self, process_fn: Callable[[OcrJob], list], max_queue: int = 2,
+                 name: str = "ocr-worker"):
+        self._process_fn = process_fn
+        self._jobs: queue.Queue = queue.Queue(maxsize=max(1, int(max_queue)))
+        self._done: queue.Queue = queue.Queue()
+        self._name = name
+        self._thread: threading.Thread | None = None
+        self._busy = threading.Event()
+
+    # ------------------------------------------------------
+    # 상태
+    # ------------------------------------------------------
+    @property
+    def pending(self) -> int:
+        """대기 중인 작업 수 (처리 중인 작업 제외)"""
+        return self._jobs.qsize()
+
+    @property
+    def busy(self) -> bool:
+        """지금 작업을 처리 중이거나 대기 중인 작업이 있으면 True"""
+        return self._busy.is_set() or not self._jobs.empty()
+
+    # ------------------------------------------------------
+    # 시작 / 제출 / 결과 수집
+    # ------------------------------------------------------
+    def start(self) -> "OcrWorker":
+        self._thread = threading.Thread(target=self._loop, name=self._name, daemon=True)
+        self._thread.start()
+        return self
+
+    def submit(self, job: OcrJob, block: bool = False, timeout: float | None = None) -> bool:
+        """
+        작업을 대기열에 넣습니다. 대기열이 가득 차 있으면 기다리지 않고 False.
+        (미리보기 스레드가 절대 막히지 않도록 하기 위함)
+        block=True 면 자리가 날 때까지 기다립니다. (오프라인 재처리처럼 캡처를 버리면 안 될 때)
+        """
+        try:
+            self._jobs.put(job, block=block, timeout=timeout)
+            return True
+        except queue.Full:
+            return False
+
+    def poll_results(self) -> list[OcrJobResult]:
+        """
+        끝난 작업들을 기다리지 않고 모두 꺼내서 돌려줍니다.
+        """
+        done = []
+        while True:
+            try:
+                done.append(self._done.get_nowait())
+            except queue.Empty:
+                return done
+
+    def _loop(self) -> None:
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                self._jobs.task_done()
+                break
+
+            self._busy.set()
+            t0 = time.perf_counter()
+            try:
+                results = self._process_fn(job)
+                self._done.put(OcrJobResult(job, results or [], "", time.perf_counter() - t0))
+            except Exception as e:
+                print(f"⚠️ OCR 워커 처리 중 예외 발생: {e}")
+                self._done.put(OcrJobResult(job, [], str(e), time.perf_counter() - t0))
+            finally:
+                self._busy.clear()
+                self._jobs.task_done()
+
+    def stop(self, drain: bool = True, timeout: float | None = None) -> None:
+        """
+        워커를 종료합니다.
+
+        drain=True  → 이미 들어온 작업을 모두 처리한 뒤 종료 (캡처 결과 저장 보장)
+        drain=False → 대기 중인 작업은 버리고 현재 작업만 끝낸 뒤 종료
+        """
+        if self._thread is None:
+            return
+
+        if not drain:
+            while True:
+                try:
+                    self._jobs.get_nowait()
+                    self._jobs.task_done()
+                except queue.Empty:
+                    break
+
+        self._jobs.put(None)
+        self._thread.join(timeout=timeout)
+        self._thread = None
@@ -0,0 +1,138 @@
+# ==========================================================
+# sharpness.py
+# ----------------------------------------------------------
+# 프레임 선명도(Definition) 점수를 "싸게" 계산하기 위한 모듈입니다.
+#
+# 배경
+# ----------------------------------------------------------
+# - camera_loop.get_definition_score() 는 매 프레임 1280x720 전체를
+#   흑백 변환 → CV_64F 라플라시안 → .var() 로 계산합니다.
+# - 30fps 미리보기에서는 소형 산업용 PC CPU 의 적지 않은 몫을 차지합니다.
+#
+# 제공 기능
+# ----------------------------------------------------------
+# ✅ downscale   : 축소한 이미지에서 계산 (0.5 → 픽셀 수 1/4)
+# ✅ center_roi  : 화면 중앙 일부만 사용 (0.5 → 가로/세로 절반 영역)
+# ✅ every_n     : N 프레임마다 한 번만 계산하고 나머지는 직전 값 재사용
+# ✅ metric      :
+#     - "laplacian"   : 기존과 같은 CV_64F 라플라시안 분산 (기준값)
+#     - "laplacian32" : CV_32F 라플라시안 + cv2.meanStdDev (값은 거의 동일, 더 빠름)
+#     - "tenengrad"   : Sobel 기울기 제곱 평균 (노이즈에 덜 민감)
+#
+# 주의
+# ----------------------------------------------------------
+# - downscale / center_roi / metric 을 바꾸면 점수의 "크기"가 달라지므로
+#   definition_threshold 도 다시 맞춰야 합니다.
+#   benchmarks/bench_sharpness.py 가 기준 점수 대비 환산 비율을 알려줍니다.
+# ==========================================================
+
+import cv2
+
+SUPPORTED_METRICS = ("laplacian", "laplacian32", "tenengrad")
+
+
+# ----------------------------------------------------------
+# 1️⃣ 점수 함수들 (입력: 흑백 uint8 이미지)
+# ----------------------------------------------------------
+def laplacian_variance(gray) -> float:
+    """기존 get_definition_score 와 같은 계산 (CV_64F 라플라시안 분산)."""
+    return float(cv2.Laplacian(gray, cv2.CV_64F).var())
+
+
+def laplacian_variance_f32(gray) -> float:
+    """
+    CV_32F 라플라시안 + meanStdDev.
+    uint8 입력의 라플라시안 값은 float32 로 정확히 표현되고,
+    meanStdDev 는 내부적으로 double 로 누적하므로 기준값과 거의 같습니다.
+    """
+    lap = cv2.Laplacian(gray, cv2.CV_32F)
+    _, std = cv2.meanStdDev(lap)
+    return float(std[0][0]) ** 2
+
+
+def tenengrad(gray, ksize: int = 3) -> float:
+    """Sobel x/y 기울기 제곱합의 평균."""
+    gx = cv2.Sobel(gray, cv2.CV_32F, 1, 0, ksize=ksize)
+    gy = cv2.Sobel(gray, cv2.CV_32F, 0, 1, ksize=ksize)
+    return float(cv2.mean(gx * gx + gy * gy)[0])
+
+
+_METRIC_FUNCS = {
+    "laplacian": laplacian_variance,
+    "laplacian32": laplacian_variance_f32,
+    "tenengrad": tenengrad,
+}
+
+
+# ----------------------------------------------------------
+# 2️⃣ 전처리 (ROI 자르기 → 축소 → 흑백)
+# ----------------------------------------------------------
+def prepare_gray(frame, downscale: float = 1.0, center_roi: float = 1.0):
+    """
+    점수 계산용 흑백 이미지를 만듭니다.
+    자르기와 축소를 흑백 변환보다 먼저 해서 변환할 픽셀 수 자체를 줄입니다.
+    """
+    if center_roi < 1.0:
+        h, w = frame.shape[:2]
+        rw, rh = max(1, int(w * center_roi)), max(1, int(h * center_roi))
+        x0, y0 = (w - rw) // 2, (h - rh) // 2
+        frame = frame[y0:y0 + rh, x0:x0 + rw]
+
+    if downscale < 1.0:
+        h, w = frame.shape[:2]
+        size = (max(1, int(w * downscale)), max(1, int(h * downscale)))
+        frame = cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+
+    if frame.ndim == 3:
+        return cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+    return frame
+
+
+# ----------------------------------------------------------
+# 3️⃣ 프레임 루프용 채점기
+# ----------------------------------------------------------
+class SharpnessScorer:
+    """
+    설정에 따라 선명도 점수를 계산하는 객체.
+    every_n > 1 이면 N 프레임마다 한 번만 계산하고, 사이 프레임은 직전 점수를 돌려줍니다.
+    """
+
+    def __init__(
+        self,
+        metric: str = "laplacian",
+        downscale: float = 1.0,
+        center_roi: float = 1.0,
+        every_n: int = 1,
+    ):
+        if metric not in _METRIC_FUNCS:
+            print(f"⚠️ 지원하지 않는 sharpness.metric: {metric} → laplacian 사용")
+            metric = "laplacian"
+        self.metric = metric
+        self.downscale = min(1.0, max(0.05, float(downscale)))
+        self.center_roi = min(1.0, max(0.05, float(center_roi)))
+        self.every_n = max(1, int(every_n))
+
+        self._func = _METRIC_FUNCS[metric]
+        self._frame_count = 0
+        self._last_score = 0.0
+
+    @classmethod
+    def from_config(cls, cfg) -> "SharpnessScorer":
+        sharp_cfg = cfg.get("sharpness", {}) or {}
+        return cls(
+            metric=sharp_cfg.get("metric", "laplacian"),
+            downscale=sharp_cfg.get("downscale", 1.0),
+            center_roi=sharp_cfg.get("center_roi", 1.0),
+            every_n=sharp_cfg.get("every_n", 1),
+        )
+
+    def compute(self, frame) -> float:
+        """every_n 과 상관없이 지금 프레임의 점수를 계산합니다."""
+        return self._func(prepare_gray(frame, self.downscale, self.center_roi))
+
+    def score(self, frame) -> float:
+        """프레임 루프에서 매 프레임 호출하는 함수."""
+        if self._frame_count % self.every_n == 0:
+            self._last_score = self.compute(frame)
+        self._frame_count += 1
+        return self._last_score
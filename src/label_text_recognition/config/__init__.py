@@ -2,8 +2,12 @@
 # 설정 관련 모듈을 묶어주는 패키지 초기화 파일입니다.
 # 외부에서는 from label_text_recognition.config import load_ocr_config
 # 정도로만 사용하도록 설계합니다.
+#
+# 캡처마다 설정을 참조하는 hot path 에서는 파싱 결과를 캐시하는
+# get_ocr_config() (→ OcrConfig) 를 사용합니다.
 # ==========================================================
 
 from .loader import load_ocr_config
+from .settings import OcrConfig, clear_config_cache, get_ocr_config
 
-__all__ = ["load_ocr_config"]
+__all__ = ["load_ocr_config", "get_ocr_config", "clear_config_cache", "OcrConfig"]
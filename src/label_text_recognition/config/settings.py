@@ -0,0 +1,207 @@
+# ==========================================================
+# settings.py
+# ----------------------------------------------------------
+# ocr_config.yaml 을 "한 번만" 파싱해서 불변(immutable) 설정 객체로
+# 들고 있는 캐시 계층입니다.
+#
+# 배경
+# ----------------------------------------------------------
+# - load_ocr_config() 는 호출될 때마다 YAML 파일 전체를 열고 파싱합니다.
+# - run_ocr_on_image / export_all_json 처럼 캡처마다 불리는 경로에서
+#   이걸 매번 호출하면, 설정은 그대로인데 파싱 비용만 계속 나갑니다.
+#
+# 동작 방식
+# ----------------------------------------------------------
+# ✅ get_ocr_config() 는 파싱 결과(OcrConfig)를 경로별로 캐시합니다.
+# ✅ check_interval 초마다 한 번만 파일 mtime 을 확인하고,
+#    파일이 수정되었을 때만 다시 파싱합니다. (YAML 수정은 그대로 반영됨)
+# ✅ OcrConfig 는 frozen dataclass + 읽기 전용 매핑이라
+#    여러 스레드가 같은 객체를 안전하게 공유할 수 있습니다.
+# ✅ cfg.get("key", default), cfg["section"]["key"] 처럼
+#    기존 dict 사용 코드가 그대로 동작합니다.
+#
+# 사용 예시
+# ----------------------------------------------------------
+# from label_text_recognition.config import get_ocr_config
+# cfg = get_ocr_config()
+# cfg.conf_threshold          # 타입이 정해진 필드
+# cfg.get("visualize", {})    # 기존 dict 스타일 접근
+# ==========================================================
+
+import os
+import threading
+import time
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Mapping
+
+import yaml
+
+DEFAULT_CONFIG_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "ocr_config.yaml"
+)
+
+# 비어 있는 섹션을 돌려줄 때 공유해서 쓰는 읽기 전용 매핑
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+
+def _freeze(value: Any) -> Any:
+    """
+    YAML 파싱 결과를 읽기 전용 구조로 바꿉니다.
+    dict → MappingProxyType, list → tuple (재귀)
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+@dataclass(frozen=True, eq=False)
+class OcrConfig:
+    """
+    ocr_config.yaml 의 불변 스냅샷.
+
+    자주 쓰는 최상위 값은 타입이 정해진 필드로 꺼내두고,
+    나머지 섹션(visualize, export_options, ...)은 raw 매핑으로 접근합니다.
+    """
+
+    path: str
+    mtime_ns: int
+    raw: Mapping[str, Any]
+
+    camera_index: Any = "auto"
+    frame_width: int = 960
+    frame_height: int = 540
+    ocr_langs: tuple[str, ...] = ("en",)
+    conf_threshold: float = 0.5
+    definition_threshold: float = 200.0
+    ocr_cls_enable: bool = True
+
+    enable_redraw_from_json: bool = True
+    enable_definition_overlay: bool = True
+    enable_console_log: bool = True
+    enable_save_output: bool = True
+    enable_retry_on_error: bool = False
+
+    # ------------------------------------------------------
+    # dict 호환 인터페이스 (기존 cfg.get(...) 코드용)
+    # ------------------------------------------------------
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.raw.get(key, default)
+
+    def __getitem__(self, key: str) -> Any:
+        return self.raw[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.raw
+
+    def section(self, key: str) -> Mapping[str, Any]:
+        """
+        하위 섹션을 읽기 전용 매핑으로 돌려줍니다. 없거나 비어 있으면 빈 매핑.
+        """
+        value = self.raw.get(key)
+        return value if isinstance(value, Mapping) else _EMPTY
+
+    def with_overrides(self, overrides: Mapping[str, Any] | None) -> "OcrConfig":
+        """
+        일부 값만 바꾼 새 OcrConfig 를 돌려줍니다. (예: 카메라별 설정)
+        섹션(dict) 값은 한 단계 병합합니다. → {"roi": {"enabled": True}} 는 roi 의 나머지 키를 유지
+        """
+        if not overrides:
+            return self
+        merged = dict(self.raw)
+        for key, value in overrides.items():
+            base = merged.get(key)
+            if isinstance(base, Mapping) and isinstance(value, Mapping):
+                merged[key] = {**base, **value}
+            else:
+                merged[key] = value
+        return OcrConfig.from_mapping(merged, path=self.path, mtime_ns=self.mtime_ns)
+
+    @classmethod
+    def from_mapping(cls, data: Mapping[str, Any], path: str = "", mtime_ns: int = 0) -> "OcrConfig":
+        """
+        이미 파싱된 dict 로부터 OcrConfig 를 만듭니다. (테스트/벤치마크용으로도 사용)
+        """
+        raw = _freeze(dict(data or {}))
+        langs = raw.get("ocr_langs") or ("en",)
+        if isinstance(langs, str):
+            langs = (langs,)
+
+        return cls(
+            path=path,
+            mtime_ns=mtime_ns,
+            raw=raw,
+            camera_index=raw.get("camera_index", "auto"),
+            frame_width=int(raw.get("frame_width", 960)),
+            frame_height=int(raw.get("frame_height", 540)),
+            ocr_langs=tuple(langs),
+            conf_threshold=float(raw.get("conf_threshold", 0.5)),
+            definition_threshold=float(raw.get("definition_threshold", 200)),
+            ocr_cls_enable=bool(raw.get("ocr_cls_enable", True)),
+            enable_redraw_from_json=bool(raw.get("enable_redraw_from_json", True)),
+            enable_definition_overlay=bool(raw.get("enable_definition_overlay", True)),
+            enable_console_log=bool(raw.get("enable_console_log", True)),
+            enable_save_output=bool(raw.get("enable_save_output", True)),
+            enable_retry_on_error=bool(raw.get("enable_retry_on_error", False)),
+        )
+
+
+# ----------------------------------------------------------
+# 캐시 저장소
+# ----------------------------------------------------------
+# path → (OcrConfig, 마지막 mtime 확인 시각[monotonic])
+_CACHE: dict[str, tuple[OcrConfig, float]] = {}
+_LOCK = threading.Lock()
+
+
+def _parse(path: str, mtime_ns: int) -> OcrConfig:
+    with open(path, "r", encoding="utf-8") as f:
+        data = yaml.safe_load(f) or {}
+    return OcrConfig.from_mapping(data, path=path, mtime_ns=mtime_ns)
+
+
+def get_ocr_config(path: str | None = None, check_interval: float = 1.0) -> OcrConfig:
+    """
+    캐시된 OcrConfig 를 반환합니다.
+
+    Parameters
+    ----------
+    path : str | None
+        설정 파일 경로. None 이면 패키지 안의 ocr_config.yaml.
+    check_interval : float
+        파일 mtime 을 다시 확인하기까지의 최소 간격(초).
+        0 이면 매 호출마다 os.stat 으로 확인합니다.
+
+    Returns
+    -------
+    OcrConfig
+        파일이 바뀌지 않았다면 매번 "같은 객체"를 돌려줍니다.
+    """
+    path = path or DEFAULT_CONFIG_PATH
+    now = time.monotonic()
+
+    cached = _CACHE.get(path)
+    if cached is not None and now - cached[1] < check_interval:
+        # 가장 흔한 경로: 락도, 파일 접근도 없이 바로 반환
+        return cached[0]
+
+    with _LOCK:
+        cached = _CACHE.get(path)
+        mtime_ns = os.stat(path).st_mtime_ns
+        if cached is not None and cached[0].mtime_ns == mtime_ns:
+            _CACHE[path] = (cached[0], now)
+            return cached[0]
+
+        cfg = _parse(path, mtime_ns)
+        _CACHE[path] = (cfg, now)
+        return cfg
+
+
+def clear_config_cache() -> None:
+    """
+    캐시를 비웁니다. 다음 get_ocr_config() 호출은 무조건 파일을 다시 읽습니다.
+    """
+    with _LOCK:
+        _CACHE.clear()
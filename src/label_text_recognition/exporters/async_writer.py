@@ -0,0 +1,288 @@
+# ==========================================================
+# async_writer.py
+# ----------------------------------------------------------
+# 캡처 결과(원본 JPEG / 시각화 JPEG / 디버그 PNG / JSON)를
+# "백그라운드 쓰기 스레드"에서 인코딩·저장하는 모듈입니다.
+#
+# 배경
+# ----------------------------------------------------------
+# - process_capture 는 캡처 1건마다 이미지 2~3장 인코딩 + JSON 1~2개 저장을
+#   OCR 과 같은 스레드에서 동기적으로 처리했습니다.
+# - SD 카드 / 네트워크 공유 폴더에서는 이것만으로 캡처당 수백 ms 가 걸려
+#   다음 OCR 작업이 그만큼 늦어졌습니다.
+#
+# 동작 방식
+# ----------------------------------------------------------
+# ✅ 크기가 제한된 쓰기 큐 + 워커 스레드 N개 (cv2.imwrite 는 GIL 을 풀어서 병렬로 동작)
+# ✅ 큐가 가득 차면 backpressure: 호출부가 자리가 날 때까지 기다림
+#    (put_timeout_sec 을 넘기면 그 작업은 버리고 dropped 로 집계)
+# ✅ close() / flush() 는 이미 들어온 작업을 모두 쓴 뒤에 돌아옴
+#    + 프로세스 종료 시(atexit) 자동으로 close() → 종료 직전 캡처도 저장 보장
+# ✅ stats(): 큐 깊이 / 최대 깊이 / 처리 건수 / 실패·버림 건수 / 쓰기 지연시간
+#
+# 주의
+# ----------------------------------------------------------
+# - write_image() 에 넘긴 배열은 실제로 쓰일 때까지 수정하면 안 됩니다.
+#   (복사 비용을 없애기 위해 참조만 넘김)
+#
+# 사용 예시
+# ----------------------------------------------------------
+# writer = AsyncResultWriter.from_config(cfg).start()
+# writer.write_image("assets/pictures/capture_x.jpg", vis_img)
+# writer.submit(export_all_json, results, cfg, label="json")
+# ...
+# writer.close()
+# print(writer.format_stats())
+# ==========================================================
+
+import atexit
+import os
+import queue
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable
+
+import cv2
+
+from label_text_recognition.metrics.stage_metrics import observe, percentile
+
+
+@dataclass
+class WriteTask:
+    """
+    쓰기 작업 1건.
+
+    label : 통계/로그용 이름 (예: "origin", "vis", "json")
+    fn    : 실제로 파일을 쓰는 함수
+    args  : fn 에 넘길 위치 인자
+    kwargs: fn 에 넘길 키워드 인자
+    """
+
+    label: str
+    fn: Callable
+    args: tuple = ()
+    kwargs: dict = field(default_factory=dict)
+    enqueued_at: float = 0.0
+
+
+def _write_image(path: str, image, params=None) -> None:
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    if not cv2.imwrite(path, image, list(params or [])):
+        raise OSError(f"이미지 저장 실패: {path}")
+
+
+class AsyncResultWriter:
+    """
+    bounded queue + 쓰기 전용 스레드로 결과 파일을 저장합니다.
+
+    Parameters
+    ----------
+    workers : int
+        쓰기 스레드 수
+    max_queue : int
+        대기열 최대 길이. 가득 차면 호출부가 기다립니다. (backpressure)
+    put_timeout_sec : float | None
+        대기열이 가득 찼을 때 기다리는 최대 시간(초).
+        None 이면 자리가 날 때까지 무한히 기다림 (기본, 데이터 유실 없음)
+        0 이면 기다리지 않고 바로 버림
+    jpeg_quality : int | None
+        .jpg/.jpeg 저장 품질 (None 이면 OpenCV 기본값 95)
+    """
+
+    def __init__(
+        self,
+        workers: int = 2,
+        max_queue: int = 16,
+        put_timeout_sec: float | None = None,
+        jpeg_quality: int | None = None,
+        name: str = "result-writer",
+    ):
+        self.workers = max(1, int(workers))
+        self.max_queue = max(1, int(max_queue))
+        self.put_timeout_sec = put_timeout_sec
+        self.jpeg_quality = jpeg_quality
+        self._name = name
+
+        self._tasks: queue.Queue = queue.Queue(maxsize=self.max_queue)
+        self._threads: list[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._closed = False
+
+        self.submitted = 0
+        self.written = 0
+        self.failed = 0
+        self.dropped = 0
+        self.blocked = 0          # 대기열이 가득 차서 호출부가 기다린 횟수
+        self.max_depth = 0
+        self._latencies_ms: deque = deque(maxlen=1000)   # 큐 대기 + 쓰기 시간
+        self._write_ms: deque = deque(maxlen=1000)       # 쓰기 시간만
+
+    @classmethod
+    def from_config(cls, cfg) -> "AsyncResultWriter":
+        writer_cfg = cfg.get("async_writer", {}) or {}
+        return cls(
+            workers=writer_cfg.get("workers", 2),
+            max_queue=writer_cfg.get("max_queue", 16),
+            put_timeout_sec=writer_cfg.get("put_timeout_sec", None),
+            jpeg_quality=writer_cfg.get("jpeg_quality", None),
+        )
+
+    # ------------------------------------------------------
+    # 시작 / 종료
+    # ------------------------------------------------------
+    def start(self) -> "AsyncResultWriter":
+        for i in range(self.workers):
+            t = threading.Thread(target=self._loop, name=f"{self._name}-{i}", daemon=True)
+            t.start()
+            self._threads.append(t)
+        # 데몬 스레드라서 종료 시 남은 작업이 버려지지 않도록 atexit 에서 flush
+        atexit.register(self.close)
+        return self
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """
+        지금까지 들어온 작업이 모두 끝날 때까지 기다립니다.
+        timeout 안에 끝나면 True.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._tasks.all_tasks_done:
+            while self._tasks.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._tasks.all_tasks_done.wait(remaining)
+        return True
+
+    def close(self, timeout: float | None = None) -> None:
+        """
+        남은 작업을 모두 쓴 뒤 스레드를 종료합니다. 여러 번 호출해도 안전합니다.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+
+        self.flush(timeout)
+        for _ in self._threads:
+            self._tasks.put(None)
+        for t in self._threads:
+            t.join(timeout=timeout)
+        self._threads.clear()
+        atexit.unregister(self.close)
+
+    # ------------------------------------------------------
+    # 작업 제출
+    # ------------------------------------------------------
+    def submit(self, fn: Callable, *args, label: str = "task", **kwargs) -> bool:
+        """
+        임의의 쓰기 함수를 대기열에 넣습니다. (예: export_all_json)
+        버려진 경우(put_timeout_sec 초과 / 종료 후 호출) False 를 돌려줍니다.
+        """
+        if self._closed:
+            with self._stats_lock:
+                self.dropped += 1
+            print(f"⚠️ 결과 저장기가 이미 종료됨 → '{label}' 저장 생략")
+            return False
+
+        task = WriteTask(label, fn, args, kwargs, time.perf_counter())
+        try:
+            self._tasks.put_nowait(task)
+        except queue.Full:
+            with self._stats_lock:
+                self.blocked += 1
+            try:
+                if self.put_timeout_sec is not None and self.put_timeout_sec <= 0:
+                    raise queue.Full
+                self._tasks.put(task, timeout=self.put_timeout_sec)
+            except queue.Full:
+                with self._stats_lock:
+                    self.dropped += 1
+                print(f"⚠️ 저장 대기열이 가득 참 → '{label}' 저장 생략")
+                return False
+
+        # 여러 스레드(OCR 워커 / 멀티 카메라 풀)가 동시에 제출하므로 카운터는 잠금 안에서 갱신
+        with self._stats_lock:
+            self.submitted += 1
+            self.max_depth = max(self.max_depth, self._tasks.qsize())
+        return True
+
+    def write_image(self, path: str, image, params=None, label: str = "image") -> bool:
+        """
+        이미지를 비동기로 저장합니다. (인코딩도 쓰기 스레드에서 수행)
+        params 가 없고 jpeg_quality 가 설정되어 있으면 .jpg 에 품질을 적용합니다.
+        """
+        if params is None and self.jpeg_quality is not None and \
+                path.lower().endswith((".jpg", ".jpeg")):
+            params = [cv2.IMWRITE_JPEG_QUALITY, int(self.jpeg_quality)]
+        return self.submit(_write_image, path, image, params, label=label)
+
+    # ------------------------------------------------------
+    # 쓰기 스레드
+    # ------------------------------------------------------
+    def _loop(self) -> None:
+        while True:
+            task = self._tasks.get()
+            if task is None:
+                self._tasks.task_done()
+                break
+
+            t0 = time.perf_counter()
+            ok = False
+            try:
+                task.fn(*task.args, **task.kwargs)
+                ok = True
+            except Exception as e:
+                print(f"⚠️ 결과 저장 실패 ({task.label}): {e}")
+            finally:
+                t1 = time.perf_counter()
+                observe(f"write_{task.label}", t1 - t0)
+                with self._stats_lock:
+                    if ok:
+                        self.written += 1
+                    else:
+                        self.failed += 1
+                    self._write_ms.append((t1 - t0) * 1000.0)
+                    self._latencies_ms.append((t1 - task.enqueued_at) * 1000.0)
+                self._tasks.task_done()
+
+    # ------------------------------------------------------
+    # 통계
+    # ------------------------------------------------------
+    @property
+    def queue_depth(self) -> int:
+        return self._tasks.qsize()
+
+    def stats(self) -> dict:
+        with self._stats_lock:
+            write_ms = list(self._write_ms)
+            latencies = list(self._latencies_ms)
+            counters = {
+                "max_depth": self.max_depth,
+                "submitted": self.submitted,
+                "written": self.written,
+                "failed": self.failed,
+                "dropped": self.dropped,
+                "blocked": self.blocked,
+            }
+        return {
+            "queue_depth": self.queue_depth,
+            **counters,
+            "write_ms_p50": percentile(write_ms, 50),
+            "write_ms_p95": percentile(write_ms, 95),
+            "write_ms_max": max(write_ms) if write_ms else 0.0,
+            "latency_ms_p50": percentile(latencies, 50),
+            "latency_ms_p95": percentile(latencies, 95),
+        }
+
+    def format_stats(self) -> str:
+        s = self.stats()
+        return (
+            f"💾 결과 저장: {s['written']}/{s['submitted']} 완료, "
+            f"실패 {s['failed']}, 버림 {s['dropped']}, 대기 {s['blocked']}회, "
+            f"큐 {s['queue_depth']} (최대 {s['max_depth']}), "
+            f"쓰기 p50={s['write_ms_p50']:.1f}ms p95={s['write_ms_p95']:.1f}ms, "
+            f"제출→완료 p95={s['latency_ms_p95']:.1f}ms"
+        )
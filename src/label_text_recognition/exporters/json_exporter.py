@@ -25,6 +25,18 @@
 #       → bbox 데이터를 텍스트 JSON 내부에 통합하여
 #         하나의 JSON 파일로 저장합니다.
 #
+#   - JSON 직렬화는 serializers.py 를 통해 처리합니다.
+#       → export_options.serializer: auto 이면 orjson 이 있을 때 orjson 사용
+#       → export_options.profile: compact 이면 들여쓰기 없이 + 좌표/신뢰도 반올림
+#
+#   - export_options.mode: "jsonl" 이면
+#       → 캡처마다 파일을 만들지 않고, 텍스트 + bbox 를 한 레코드로 묶어
+#         회전되는 세션 JSONL 파일에 한 줄씩 이어 씁니다. (jsonl_exporter.py)
+#
+#   - export_options.sqlite_index.enabled: true 이면
+#       → 위 저장 방식과 별개로, 캡처 결과를 SQLite DB(FTS5)에도 적재합니다.
+#         (sqlite_index.py, 조회는 demos/query_results.py)
+#
 #   - 기존 코드:
 #       from label_text_recognition.exporters.json_exporter import export_to_json
 #     이 그대로 동작하도록 **하위 호환 래퍼 함수(export_to_json)** 를 제공합니다.
@@ -36,12 +48,14 @@
 # ==========================================================
 
 import os
-import json
 from datetime import datetime
 from typing import Any, List, Dict
 
-# 프로젝트 공통 설정 로더
-from label_text_recognition.config.loader import load_ocr_config
+# 프로젝트 공통 설정 (파싱 결과가 캐시되는 불변 설정 객체)
+from label_text_recognition.config.settings import OcrConfig, get_ocr_config
+from label_text_recognition.exporters.jsonl_exporter import append_session_record
+from label_text_recognition.exporters.serializers import OutputProfile, serializer_from_config
+from label_text_recognition.exporters.sqlite_index import get_result_index
 
 
 # ----------------------------------------------------------
@@ -50,7 +64,7 @@ from label_text_recognition.config.loader import load_ocr_config
 def _timestamp() -> str:
     """
     현재 시각을 'YYYYMMDD_HHMMSS' 형식으로 반환합니다.
-    JSON 파일 이름 패턴에서 {ts}를 치환할 때 사용됩니다.
+    호출부가 캡처 ts 를 넘기지 않았을 때 JSON 파일 이름 패턴의 {ts} 대신 사용됩니다.
 
     예:
         filename_pattern: "capture_{ts}.json"
@@ -59,10 +73,48 @@ def _timestamp() -> str:
     return datetime.now().strftime("%Y%m%d_%H%M%S")
 
 
+# ----------------------------------------------------------
+# (도우미) JSON 파일 쓰기 (직렬화 백엔드 / 출력 프로필 반영)
+# ----------------------------------------------------------
+def _write_json_file(output_path: str, data: Any, cfg) -> None:
+    """
+    export_options.serializer / profile 설정에 맞게 직렬화해서 한 번에 씁니다.
+    - 한글은 "????" 나 유니코드 이스케이프가 아니라 실제 한글(UTF-8)로 저장됩니다.
+    """
+    serializer = serializer_from_config(cfg)
+    indent = OutputProfile.from_config(cfg).indent
+    with open(output_path, "wb") as f:
+        f.write(serializer.dumps(data, indent=indent))
+
+
+# ----------------------------------------------------------
+# (도우미) bbox 레코드 구성
+# ----------------------------------------------------------
+def _bbox_records(results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    결과 리스트에서 텍스트 + 좌표만 뽑은 bbox 레코드 리스트를 만듭니다.
+    (bbox 단독 JSON / 텍스트 JSON 병합 / JSONL 레코드가 같은 형식을 사용)
+    """
+    return [
+        {
+            "id": idx,
+            "text": item.get("text", ""),
+            "confidence": item.get("avg_conf", 0.0),
+            "bbox": item.get("box", []),   # [[x1,y1], ...]
+        }
+        for idx, item in enumerate(results)
+    ]
+
+
 # ----------------------------------------------------------
 # (핵심) 텍스트 JSON 저장 함수
 # ----------------------------------------------------------
-def _save_text_json(results: List[Dict[str, Any]], cfg: dict) -> str:
+def _save_text_json(
+    results: List[Dict[str, Any]],
+    cfg: dict,
+    bbox: List[Dict[str, Any]] | None = None,
+    ts: str | None = None,
+) -> str:
     """
     텍스트 JSON을 저장합니다.
 
@@ -73,11 +125,16 @@ def _save_text_json(results: List[Dict[str, Any]], cfg: dict) -> str:
         예: [{"text": "시험일", "avg_conf": 0.94, "box": [[x1,y1], ...]}, ...]
     cfg : dict
         전체 OCR 설정 객체 (ocr_config.yaml 내용)
+    bbox : list | None
+        merge_with_text_json 일 때 함께 저장할 bbox 레코드.
+        주어지면 {"results": [...], "bbox": [...]} 형태로 한 번에 저장합니다.
+    ts : str | None
+        파일 이름 패턴의 {ts} 값 (캡처 타임스탬프). None 이면 현재 시각.
 
     Returns
     -------
     output_path : str
-        저장된 텍스트 JSON의 전체 경로. (merge 시 bbox 병합용)
+        저장된 텍스트 JSON의 전체 경로.
         저장이 비활성화된 경우 빈 문자열("")을 반환합니다.
     """
 
@@ -94,7 +151,9 @@ def _save_text_json(results: List[Dict[str, Any]], cfg: dict) -> str:
         return ""
 
     # 저장 경로/파일명 결정
-    ts = _timestamp()
+    #  - 캡처 ts 를 그대로 써야 이미지(capture_<ts>.jpg)와 짝이 맞고,
+    #    1초에 여러 장을 저장해도(파일 재처리 / 멀티 카메라) 서로 덮어쓰지 않음
+    ts = ts or _timestamp()
     out_dir = text_cfg["path"]  # 예: "assets/json"
     filename_pattern = text_cfg.get("filename_pattern", "capture_{ts}.json")
     filename = filename_pattern.replace("{ts}", ts)
@@ -103,10 +162,11 @@ def _save_text_json(results: List[Dict[str, Any]], cfg: dict) -> str:
     # 폴더 생성 (없으면 자동 생성)
     os.makedirs(out_dir, exist_ok=True)
 
-    # JSON dump
-    # - ensure_ascii=False: 한글이 "????"가 아니라 실제 한글로 저장되도록 함
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(results, f, ensure_ascii=False, indent=4)
+    # merge 모드면 bbox 까지 합친 최종 형태를 메모리에서 만들어 한 번만 씀
+    data = results if bbox is None else {"results": results, "bbox": bbox}
+
+    # JSON dump (직렬화 백엔드 / 프로필은 설정을 따름)
+    _write_json_file(output_path, data, cfg)
 
     print(f"✅ 텍스트 JSON 저장 완료: {output_path}")
     return output_path
@@ -115,7 +175,7 @@ def _save_text_json(results: List[Dict[str, Any]], cfg: dict) -> str:
 # ----------------------------------------------------------
 # (핵심) bbox JSON 저장 함수
 # ----------------------------------------------------------
-def _save_bbox_json(results: List[Dict[str, Any]], cfg: dict) -> str:
+def _save_bbox_json(results: List[Dict[str, Any]], cfg: dict, ts: str | None = None) -> str:
     """
     바운딩 박스 전용 JSON을 저장합니다.
 
@@ -126,6 +186,8 @@ def _save_bbox_json(results: List[Dict[str, Any]], cfg: dict) -> str:
         예: [{"text": "시험일", "avg_conf": 0.94, "box": [[x1,y1], ...]}, ...]
     cfg : dict
         전체 OCR 설정 객체
+    ts : str | None
+        파일 이름 패턴의 {ts} 값 (캡처 타임스탬프). None 이면 현재 시각.
 
     Returns
     -------
@@ -145,29 +207,21 @@ def _save_bbox_json(results: List[Dict[str, Any]], cfg: dict) -> str:
         print("💾 enable_save_output=false → bbox JSON 생성 취소")
         return ""
 
-    # 저장 경로/파일명
-    ts = _timestamp()
+    # 저장 경로/파일명 (텍스트 JSON 과 같은 ts)
+    ts = ts or _timestamp()
     out_dir = bbox_cfg["path"]  # 예: "assets/json_bbox"
     filename_pattern = bbox_cfg.get("filename_pattern", "bbox_{ts}.json")
     filename = filename_pattern.replace("{ts}", ts)
     output_path = os.path.join(out_dir, filename)
 
     # bbox 데이터만 추출해서 별도의 구조로 저장
-    bbox_only = []
-    for idx, item in enumerate(results):
-        bbox_only.append({
-            "id": idx,
-            "text": item.get("text", ""),
-            "confidence": item.get("avg_conf", 0.0),
-            "bbox": item.get("box", []),   # [[x1,y1], ...]
-        })
+    bbox_only = _bbox_records(results)
 
     # 폴더 생성
     os.makedirs(out_dir, exist_ok=True)
 
     # JSON 저장
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(bbox_only, f, ensure_ascii=False, indent=4)
+    _write_json_file(output_path, bbox_only, cfg)
 
     print(f"🟦 바운딩 박스 JSON 저장 완료: {output_path}")
     return output_path
@@ -176,7 +230,12 @@ def _save_bbox_json(results: List[Dict[str, Any]], cfg: dict) -> str:
 # ----------------------------------------------------------
 # (메인 API) export_all_json
 # ----------------------------------------------------------
-def export_all_json(results: List[Dict[str, Any]]) -> Dict[str, str]:
+def export_all_json(
+    results: List[Dict[str, Any]],
+    cfg: OcrConfig | None = None,
+    ts: str | None = None,
+    meta: Dict[str, Any] | None = None,
+) -> Dict[str, str]:
     """
     텍스트 JSON, 바운딩 박스 JSON을 config 기반으로 처리하여 저장합니다.
 
@@ -185,37 +244,76 @@ def export_all_json(results: List[Dict[str, Any]]) -> Dict[str, str]:
     results : list
         OCR 결과 리스트.
         예: [{"text": "...", "avg_conf": 0.92, "box": [[x1,y1], ...]}, ...]
+    cfg : OcrConfig | None
+        호출부에서 들고 있는 설정 객체. None 이면 캐시된 설정을 사용합니다.
+    ts : str | None
+        캡처 타임스탬프. 텍스트 / bbox JSON 파일 이름의 {ts}, jsonl 레코드 /
+        SQLite 인덱스의 "ts" 로 쓰입니다. (None 이면 현재 시각)
+        백그라운드 저장기에서 늦게 실행되어도 캡처 시각의 이름으로 저장됩니다.
+    meta : dict | None
+        jsonl 레코드 / SQLite 인덱스에 함께 남길 부가 정보 (이미지 경로, 선명도 등)
 
     Returns
     -------
     dict
         {
           "text_json": "assets/json/capture_....json",
-          "bbox_json": "assets/json_bbox/bbox_....json"
+          "bbox_json": "assets/json_bbox/bbox_....json",
+          "jsonl": "assets/jsonl/session_....jsonl",     (jsonl 모드일 때)
+          "sqlite": "assets/ocr_index.sqlite3"           (sqlite_index 사용 시)
         }
         (해당 항목이 비활성화된 경우 빈 문자열 반환)
     """
 
-    # ocr_config.yaml 전체 설정 불러오기
-    cfg = load_ocr_config()
+    # ocr_config.yaml 전체 설정 (캐시됨 → 캡처마다 YAML 을 다시 파싱하지 않음)
+    if cfg is None:
+        cfg = get_ocr_config()
 
     # 전역 스위치: enable_save_output=false 이면 모든 JSON 저장을 막음
     if not cfg.get("enable_save_output", True):
         print("💾 enable_save_output=false → 모든 JSON 저장 비활성화")
         return {"text_json": "", "bbox_json": ""}
 
-    text_cfg = cfg["export_options"]["text_json"]
-    bbox_cfg = cfg["export_options"]["bbox_json"]
+    export_cfg = cfg["export_options"]
+    text_cfg = export_cfg["text_json"]
+    bbox_cfg = export_cfg["bbox_json"]
+
+    # compact 프로필이면 좌표/신뢰도를 반올림한 복사본으로 저장 (호출부 results 는 그대로)
+    results = OutputProfile.from_config(cfg).prepare(results)
+    ts = ts or _timestamp()
+
+    # ------------------------------------------------------
+    # (추가 백엔드) SQLite 인덱스: 저장 방식과 관계없이 적재 (배치 커밋)
+    # ------------------------------------------------------
+    index_paths = {}
+    if (export_cfg.get("sqlite_index", {}) or {}).get("enabled", False):
+        index = get_result_index(cfg)
+        index.add(ts, results, meta)
+        index_paths["sqlite"] = index.db_path
+
+    # ------------------------------------------------------
+    # 0) jsonl 모드: 텍스트 + bbox 를 세션 파일에 한 줄로 추가하고 끝
+    # ------------------------------------------------------
+    if export_cfg.get("mode", "files") == "jsonl":
+        bbox = _bbox_records(results) if bbox_cfg.get("enabled", True) else []
+        jsonl_path = append_session_record(results, bbox, cfg, ts, meta)
+        return {"text_json": "", "bbox_json": "", "jsonl": jsonl_path, **index_paths}
 
     # bbox_json.merge_with_text_json 옵션
     merge = bbox_cfg.get("merge_with_text_json", False)
+    merge_bbox = merge and bbox_cfg.get("enabled", True) and text_cfg.get("enabled", True)
 
     # ------------------------------------------------------
-    # 1) 텍스트 JSON 먼저 저장
+    # 1) 텍스트 JSON 저장
+    #    - merge 모드면 bbox 까지 합쳐서 한 번에 저장 (다시 읽고 덮어쓰지 않음)
     # ------------------------------------------------------
     txt_json_path = ""
     if text_cfg.get("enabled", True):
-        txt_json_path = _save_text_json(results, cfg)
+        if merge_bbox:
+            print("🔗 merge_with_text_json=true → 텍스트 JSON 안에 bbox 데이터 병합")
+            txt_json_path = _save_text_json(results, cfg, bbox=_bbox_records(results), ts=ts)
+        else:
+            txt_json_path = _save_text_json(results, cfg, ts=ts)
 
     # ------------------------------------------------------
     # 2) bbox JSON (단독 저장 또는 텍스트 JSON과 merge)
@@ -224,38 +322,9 @@ def export_all_json(results: List[Dict[str, Any]]) -> Dict[str, str]:
 
     if bbox_cfg.get("enabled", True):
 
-        if merge and txt_json_path:
-            # --------------------------------------------------
-            # 🔗 merge_with_text_json = true
-            # → 텍스트 JSON 내부에 bbox 데이터만 append
-            # --------------------------------------------------
-            print("🔗 merge_with_text_json=true → 텍스트 JSON 안에 bbox 데이터 병합")
-
-            # bbox_only 구성 (텍스트 + 좌표만 깔끔하게)
-            bbox_only = []
-            for idx, item in enumerate(results):
-                bbox_only.append({
-                    "id": idx,
-                    "text": item.get("text", ""),
-                    "confidence": item.get("avg_conf", 0.0),
-                    "bbox": item.get("box", []),
-                })
-
-            # 텍스트 JSON 읽기 → 병합 → 다시 저장
-            with open(txt_json_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            # 기존 결과 형태가 list일 수도 있어서 감싸주는 형태로 구성
-            # 예전 버전: [ {...}, {...}, ... ]
-            # 새 버전: { "results": [...], "bbox": [...] }
-            if isinstance(data, list):
-                data = {"results": data}
-
-            data["bbox"] = bbox_only
-
-            with open(txt_json_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=4)
-
+        if merge_bbox and txt_json_path:
+            # 🔗 merge_with_text_json = true → 이미 텍스트 JSON 안에 포함됨
+            # 형태: { "results": [...], "bbox": [...] }
             bbox_json_path = txt_json_path  # 하나의 파일로 통합
             print(f"🔗 bbox 데이터가 텍스트 JSON에 병합되었습니다 → {txt_json_path}")
 
@@ -263,18 +332,25 @@ def export_all_json(results: List[Dict[str, Any]]) -> Dict[str, str]:
             # --------------------------------------------------
             # 별도 파일로 bbox JSON 저장
             # --------------------------------------------------
-            bbox_json_path = _save_bbox_json(results, cfg)
+            bbox_json_path = _save_bbox_json(results, cfg, ts=ts)
 
     return {
         "text_json": txt_json_path,
-        "bbox_json": bbox_json_path
+        "bbox_json": bbox_json_path,
+        **index_paths,
     }
 
 
 # ----------------------------------------------------------
 # (하위 호환용) export_to_json
 # ----------------------------------------------------------
-def export_to_json(results: List[Dict[str, Any]], output_path: str) -> None:
+def export_to_json(
+    results: List[Dict[str, Any]],
+    output_path: str,
+    cfg: OcrConfig | None = None,
+    ts: str | None = None,
+    meta: Dict[str, Any] | None = None,
+) -> None:
     """
     [하위 호환 래퍼]
 
@@ -294,6 +370,8 @@ def export_to_json(results: List[Dict[str, Any]], output_path: str) -> None:
     output_path : str
         예전 인터페이스에서 사용하던 JSON 저장 경로.
         현재 구현에서는 사용하지 않습니다.
+    cfg, ts, meta :
+        export_all_json 으로 그대로 전달됩니다.
     """
 
     print(
@@ -302,4 +380,4 @@ def export_to_json(results: List[Dict[str, Any]], output_path: str) -> None:
     )
 
     # 새 config 기반 시스템으로 실제 저장 처리
-    export_all_json(results)
\ No newline at end of file
+    export_all_json(results, cfg, ts=ts, meta=meta)
\ No newline at end of file
@@ -0,0 +1,245 @@
+# ==========================================================
+# jsonl_exporter.py
+# ----------------------------------------------------------
+# 캡처 1건 = 한 줄(compact JSON) 로 "세션 로그 파일"에 이어 쓰는
+# JSONL Exporter 입니다.
+#
+# 배경
+# ----------------------------------------------------------
+# - 기존 json_exporter 는 캡처마다 indent=4 JSON 파일을 1~2개씩 만들고,
+#   merge_with_text_json=true 이면 방금 쓴 파일을 다시 읽어서 덮어썼습니다.
+# - 장시간 운영하면 작은 파일이 수백만 개 쌓이고, 파일 생성/메타데이터 I/O 가
+#   실제 데이터보다 더 큰 비용이 됩니다.
+#
+# 동작 방식
+# ----------------------------------------------------------
+# ✅ 텍스트 결과 + bbox 를 한 레코드에 담아 한 줄로 append (다시 읽지 않음)
+# ✅ 파일 크기(rotate_max_mb) / 경과 시간(rotate_interval_min) 기준으로 새 세그먼트로 교체
+# ✅ 닫힌 세그먼트는 선택적으로 gzip 압축 (백그라운드 스레드)
+# ✅ 여러 쓰기 스레드(async_writer)에서 동시에 호출해도 안전 (lock)
+#
+# 레코드 예시 (한 줄)
+# ----------------------------------------------------------
+# {"ts":"20251119_143501","written_at":"2025-11-19T14:35:01.123",
+#  "meta":{"image":"assets/pictures/capture_....jpg", ...},
+#  "results":[{...}, ...],
+#  "bbox":[{"id":0,"text":"시험일","confidence":0.94,"bbox":[[x1,y1],...]}, ...]}
+# ==========================================================
+
+import atexit
+import gzip
+import os
+import shutil
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, List
+
+from label_text_recognition.exporters.serializers import get_serializer, serializer_from_config
+
+
+class JsonlSessionWriter:
+    """
+    회전(rotation)되는 JSONL 세션 로그 파일에 레코드를 이어 씁니다.
+
+    Parameters
+    ----------
+    out_dir : str
+        세션 파일 저장 폴더
+    filename_pattern : str
+        세그먼트 파일 이름 패턴 ({ts} → 세그먼트 시작 시각)
+    rotate_max_bytes : int
+        세그먼트 최대 크기(byte). 0 이하이면 크기 기준 회전 안 함
+    rotate_interval_sec : float
+        세그먼트 최대 유지 시간(초). 0 이하이면 시간 기준 회전 안 함
+    gzip_closed : bool
+        True 면 닫힌 세그먼트를 .gz 로 압축하고 원본은 삭제
+    serializer :
+        serializers.get_serializer() 가 돌려준 직렬화 객체 (None 이면 auto)
+    """
+
+    def __init__(
+        self,
+        out_dir: str,
+        filename_pattern: str = "session_{ts}.jsonl",
+        rotate_max_bytes: int = 64 * 1024 * 1024,
+        rotate_interval_sec: float = 3600.0,
+        gzip_closed: bool = False,
+        serializer=None,
+    ):
+        self.out_dir = out_dir
+        self.filename_pattern = filename_pattern
+        self.rotate_max_bytes = int(rotate_max_bytes)
+        self.rotate_interval_sec = float(rotate_interval_sec)
+        self.gzip_closed = gzip_closed
+        self.serializer = serializer or get_serializer("auto")
+
+        self._lock = threading.Lock()
+        self._file = None
+        self._path = ""
+        self._size = 0
+        self._opened_at = 0.0
+        self._gzip_threads: list[threading.Thread] = []
+
+        self.records = 0
+        self.segments = 0
+
+    @classmethod
+    def from_config(cls, cfg) -> "JsonlSessionWriter":
+        jsonl_cfg = (cfg.get("export_options", {}) or {}).get("jsonl_log", {}) or {}
+        return cls(
+            out_dir=jsonl_cfg.get("path", "assets/jsonl"),
+            filename_pattern=jsonl_cfg.get("filename_pattern", "session_{ts}.jsonl"),
+            rotate_max_bytes=int(float(jsonl_cfg.get("rotate_max_mb", 64)) * 1024 * 1024),
+            rotate_interval_sec=float(jsonl_cfg.get("rotate_interval_min", 60)) * 60.0,
+            gzip_closed=jsonl_cfg.get("gzip_closed", False),
+            serializer=serializer_from_config(cfg),
+        )
+
+    @property
+    def current_path(self) -> str:
+        return self._path
+
+    # ------------------------------------------------------
+    # 세그먼트 열기 / 닫기 / 회전
+    # ------------------------------------------------------
+    def _new_segment_path(self) -> str:
+        ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+        path = os.path.join(self.out_dir, self.filename_pattern.replace("{ts}", ts))
+        # 같은 초에 회전되면 이름이 겹치므로 번호를 붙임
+        base, ext = os.path.splitext(path)
+        n = 1
+        while os.path.exists(path) or os.path.exists(path + ".gz"):
+            path = f"{base}_{n}{ext}"
+            n += 1
+        return path
+
+    def _open(self) -> None:
+        os.makedirs(self.out_dir, exist_ok=True)
+        self._path = self._new_segment_path()
+        self._file = open(self._path, "ab")
+        self._size = 0
+        self._opened_at = time.monotonic()
+        self.segments += 1
+
+    def _close_segment(self) -> None:
+        if self._file is None:
+            return
+        self._file.close()
+        closed_path = self._path
+        self._file = None
+        self._path = ""
+
+        if self.gzip_closed and self._size > 0:
+            t = threading.Thread(target=_gzip_file, args=(closed_path,),
+                                 name="jsonl-gzip", daemon=True)
+            t.start()
+            self._gzip_threads = [g for g in self._gzip_threads if g.is_alive()] + [t]
+
+    def _needs_rotation(self, incoming: int) -> bool:
+        if self._file is None:
+            return False
+        if self.rotate_max_bytes > 0 and self._size > 0 and \
+                self._size + incoming > self.rotate_max_bytes:
+            return True
+        if self.rotate_interval_sec > 0 and \
+                time.monotonic() - self._opened_at >= self.rotate_interval_sec:
+            return True
+        return False
+
+    # ------------------------------------------------------
+    # 메인 API
+    # ------------------------------------------------------
+    def append(self, record: Dict[str, Any]) -> str:
+        """
+        레코드 1건을 한 줄로 추가하고, 기록된 세그먼트 경로를 돌려줍니다.
+        """
+        line = self.serializer.dumps(record, indent=None) + b"\n"
+        nbytes = len(line)
+
+        with self._lock:
+            if self._needs_rotation(nbytes):
+                self._close_segment()
+            if self._file is None:
+                self._open()
+            self._file.write(line)
+            # 프로세스가 비정상 종료되어도 이미 쓴 레코드는 남도록 매번 flush
+            self._file.flush()
+            self._size += nbytes
+            self.records += 1
+            return self._path
+
+    def rotate(self) -> None:
+        """현재 세그먼트를 강제로 닫습니다. (다음 append 에서 새 세그먼트 시작)"""
+        with self._lock:
+            self._close_segment()
+
+    def close(self) -> None:
+        """세그먼트를 닫고 진행 중인 gzip 압축이 끝날 때까지 기다립니다."""
+        with self._lock:
+            self._close_segment()
+            threads, self._gzip_threads = self._gzip_threads, []
+        for t in threads:
+            t.join()
+
+
+def _gzip_file(path: str) -> None:
+    try:
+        with open(path, "rb") as src, gzip.open(path + ".gz", "wb") as dst:
+            shutil.copyfileobj(src, dst)
+        os.remove(path)
+    except OSError as e:
+        print(f"⚠️ JSONL 세그먼트 압축 실패: {path} ({e})")
+
+
+# ----------------------------------------------------------
+# (메인 API) 설정 기반 세션 writer 공유
+# ----------------------------------------------------------
+# export_all_json 은 함수형 API 라서, 설정(경로/패턴/회전 조건)별로
+# 세션 writer 를 하나씩 만들어 프로세스 안에서 공유합니다.
+_writers: Dict[tuple, JsonlSessionWriter] = {}
+_writers_lock = threading.Lock()
+
+
+def get_session_writer(cfg) -> JsonlSessionWriter:
+    jsonl_cfg = (cfg.get("export_options", {}) or {}).get("jsonl_log", {}) or {}
+    key = tuple(sorted((k, str(v)) for k, v in dict(jsonl_cfg).items()))
+    with _writers_lock:
+        writer = _writers.get(key)
+        if writer is None:
+            writer = JsonlSessionWriter.from_config(cfg)
+            _writers[key] = writer
+        return writer
+
+
+def close_session_writers() -> None:
+    """열려 있는 모든 세션 파일을 닫습니다. (프로세스 종료 시 자동 호출)"""
+    with _writers_lock:
+        writers = list(_writers.values())
+        _writers.clear()
+    for writer in writers:
+        writer.close()
+
+
+atexit.register(close_session_writers)
+
+
+def append_session_record(
+    results: List[Dict[str, Any]],
+    bbox: List[Dict[str, Any]],
+    cfg,
+    ts: str,
+    meta: Dict[str, Any] | None = None,
+) -> str:
+    """
+    캡처 1건(텍스트 결과 + bbox)을 세션 JSONL 에 한 줄로 추가합니다.
+    기록된 세그먼트 경로를 돌려줍니다.
+    """
+    record = {
+        "ts": ts,
+        "written_at": datetime.now().isoformat(timespec="milliseconds"),
+        "meta": meta or {},
+        "results": results,
+        "bbox": bbox,
+    }
+    return get_session_writer(cfg).append(record)
@@ -0,0 +1,189 @@
+# ==========================================================
+# serializers.py
+# ----------------------------------------------------------
+# Exporter 들이 같이 쓰는 JSON 직렬화 모듈입니다.
+#
+# 제공 기능
+# ----------------------------------------------------------
+# ✅ 직렬화 백엔드 선택
+#     - "auto"   : orjson 이 설치되어 있으면 orjson, 없으면 표준 json
+#     - "orjson" : orjson (설치 안 되어 있으면 경고 후 표준 json)
+#     - "json"   : 표준 라이브러리 json
+# ✅ 출력 프로필 (export_options.profile)
+#     - "pretty"  : 기존과 같은 들여쓰기 JSON (사람이 읽기 좋음)
+#     - "compact" : 들여쓰기 없음 + 좌표/신뢰도 반올림 (파일 크기·쓰기 시간 ↓)
+#
+# 주의
+# ----------------------------------------------------------
+# - orjson 은 들여쓰기를 2칸만 지원합니다.
+#     * serializer: auto   → 4칸 들여쓰기(pretty)는 표준 json 으로 저장 (기존 파일과 동일)
+#                            들여쓰기 없는 출력(compact / jsonl)만 orjson 사용
+#     * serializer: orjson → pretty 도 orjson 으로, 4칸 대신 2칸으로 저장 (값은 동일)
+# - 두 백엔드 모두 한글은 \uXXXX 가 아닌 UTF-8 그대로 저장합니다.
+#
+# 사용 예시
+# ----------------------------------------------------------
+# serializer = get_serializer("auto")
+# data = serializer.dumps(results, indent=None)      # → bytes
+# ==========================================================
+
+import json
+from functools import lru_cache
+from typing import Any
+
+import numpy as np
+
+SUPPORTED_BACKENDS = ("auto", "orjson", "json")
+SUPPORTED_PROFILES = ("pretty", "compact")
+
+# 결과 dict 안에서 반올림 대상이 되는 키
+_CONF_KEYS = ("avg_conf", "confidence")
+_COORD_KEYS = ("box", "bbox", "word_boxes")
+
+
+class StdlibJsonSerializer:
+    """표준 라이브러리 json 백엔드"""
+
+    name = "json"
+
+    def dumps(self, obj: Any, indent: int | None = None) -> bytes:
+        if indent is None:
+            text = json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+        else:
+            text = json.dumps(obj, ensure_ascii=False, indent=indent)
+        return text.encode("utf-8")
+
+
+class OrjsonSerializer:
+    """
+    orjson 백엔드 (numpy 배열/스칼라도 그대로 직렬화)
+
+    exact_indent=True 이면 orjson 이 지원하지 않는 들여쓰기(2칸 이외)는
+    표준 json 으로 처리해서 요청한 형식을 그대로 지킵니다.
+    """
+
+    name = "orjson"
+
+    def __init__(self, exact_indent: bool = False):
+        import orjson
+
+        self._orjson = orjson
+        self._base_opts = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        self._fallback = StdlibJsonSerializer() if exact_indent else None
+
+    def dumps(self, obj: Any, indent: int | None = None) -> bytes:
+        if indent and indent != 2 and self._fallback is not None:
+            return self._fallback.dumps(obj, indent=indent)
+        opts = self._base_opts
+        if indent:
+            opts |= self._orjson.OPT_INDENT_2
+        return self._orjson.dumps(obj, option=opts)
+
+
+@lru_cache(maxsize=None)
+def get_serializer(backend: str = "auto"):
+    """
+    이름에 맞는 직렬화 객체를 돌려줍니다. (백엔드별로 하나만 만들어 재사용)
+    """
+    if backend not in SUPPORTED_BACKENDS:
+        print(f"⚠️ 지원하지 않는 serializer: {backend} → auto 사용")
+        backend = "auto"
+
+    if backend in ("auto", "orjson"):
+        try:
+            return OrjsonSerializer(exact_indent=(backend == "auto"))
+        except ImportError:
+            if backend == "orjson":
+                print("⚠️ orjson 이 설치되어 있지 않습니다. 표준 json 을 사용합니다. (pip install orjson)")
+    return StdlibJsonSerializer()
+
+
+def serializer_from_config(cfg):
+    """export_options.serializer 설정에 맞는 직렬화 객체"""
+    export_cfg = cfg.get("export_options", {}) or {}
+    return get_serializer(export_cfg.get("serializer", "auto"))
+
+
+# ----------------------------------------------------------
+# 출력 프로필
+# ----------------------------------------------------------
+def _round_coords(value, digits: int):
+    """
+    좌표(중첩 리스트)를 반올림합니다.
+    (N,4,2) 처럼 모양이 고른 배열은 NumPy 로 한 번에, 아니면 재귀로 처리합니다.
+    """
+    if isinstance(value, (list, tuple)) and value:
+        try:
+            arr = np.asarray(value, dtype=np.float64)
+        except (ValueError, TypeError):
+            arr = None
+        if arr is not None and arr.dtype != object:
+            if digits <= 0:
+                return np.rint(arr).astype(np.int64).tolist()
+            return np.round(arr, digits).tolist()
+        return [_round_coords(v, digits) for v in value]
+    if isinstance(value, (int, float)):
+        return int(round(value)) if digits <= 0 else round(float(value), digits)
+    return value
+
+
+def compact_records(records: list, conf_digits: int = 4, coord_digits: int = 0) -> list:
+    """
+    결과/bbox 레코드 리스트의 신뢰도와 좌표를 반올림한 새 리스트를 만듭니다.
+    (원본 리스트는 수정하지 않음)
+    """
+    out = []
+    for item in records:
+        if not isinstance(item, dict):
+            out.append(item)
+            continue
+        item = dict(item)
+        for key in _CONF_KEYS:
+            if isinstance(item.get(key), (int, float)):
+                item[key] = round(float(item[key]), conf_digits)
+        for key in _COORD_KEYS:
+            if key in item:
+                item[key] = _round_coords(item[key], coord_digits)
+        out.append(item)
+    return out
+
+
+class OutputProfile:
+    """
+    export_options.profile / compact 설정을 담는 객체.
+
+    indent        : 파일 저장 시 들여쓰기 (compact 이면 None)
+    round_values  : 좌표/신뢰도 반올림 여부
+    """
+
+    def __init__(self, name: str = "pretty", conf_digits: int = 4, coord_digits: int = 0):
+        if name not in SUPPORTED_PROFILES:
+            print(f"⚠️ 지원하지 않는 export profile: {name} → pretty 사용")
+            name = "pretty"
+        self.name = name
+        self.conf_digits = int(conf_digits)
+        self.coord_digits = int(coord_digits)
+
+    @classmethod
+    def from_config(cls, cfg) -> "OutputProfile":
+        export_cfg = cfg.get("export_options", {}) or {}
+        compact_cfg = export_cfg.get("compact", {}) or {}
+        return cls(
+            name=export_cfg.get("profile", "pretty"),
+            conf_digits=compact_cfg.get("conf_digits", 4),
+            coord_digits=compact_cfg.get("coord_digits", 0),
+        )
+
+    @property
+    def indent(self) -> int | None:
+        return None if self.name == "compact" else 4
+
+    @property
+    def round_values(self) -> bool:
+        return self.name == "compact"
+
+    def prepare(self, records: list) -> list:
+        """compact 프로필이면 반올림한 복사본, 아니면 그대로 돌려줍니다."""
+        if not self.round_values:
+            return records
+        return compact_records(records, self.conf_digits, self.coord_digits)
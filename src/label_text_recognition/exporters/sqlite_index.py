@@ -0,0 +1,371 @@
+# ==========================================================
+# sqlite_index.py
+# ----------------------------------------------------------
+# 캡처 결과(줄 텍스트 / 신뢰도 / 박스 / 이미지 경로)를 로컬 SQLite DB 에
+# 적재하고, 인식된 텍스트로 바로 찾을 수 있게 해주는 인덱스 Exporter 입니다.
+#
+# 배경
+# ----------------------------------------------------------
+# - 결과는 assets/json, assets/json_bbox 아래 초 단위 타임스탬프 파일로만 남아서
+#   "로트 번호 X 가 찍힌 캡처 전부"를 찾으려면 파일을 모두 열어봐야 했습니다.
+#
+# 동작 방식
+# ----------------------------------------------------------
+# ✅ WAL 모드 + synchronous=NORMAL → 쓰는 동안에도 조회 가능, fsync 최소화
+# ✅ 캡처를 메모리에 모았다가 batch_size 건 / flush_interval_sec 초마다 한 트랜잭션으로 커밋
+#     - 시간 기준 커밋은 백그라운드 flush 스레드가 처리 → 캡처가 끊겨도 flush_interval_sec 안에
+#       다른 프로세스(demos/query_results.py)에서 보이고, 프로세스가 죽어도 그 이전 분은 남음
+# ✅ FTS5 전문 검색 인덱스 (기본 trigram 토크나이저 → 부분 문자열 검색 가능)
+#     - trigram 미지원 SQLite → unicode61 토크나이저
+#     - FTS5 자체가 없는 SQLite → LIKE 검색으로 대체
+# ✅ 여러 쓰기 스레드(async_writer)에서 동시에 호출해도 안전 (lock)
+#
+# 테이블
+# ----------------------------------------------------------
+# captures(id, ts, written_at, image, image_origin, definition, n_lines, avg_conf)
+# lines(id, capture_id, line_index, text, avg_conf, box)   ← box 는 JSON 문자열
+# lines_fts(text)                                          ← lines.id 와 같은 rowid
+#
+# 사용 예시
+# ----------------------------------------------------------
+# index = SqliteResultIndex("assets/ocr_index.sqlite3")
+# index.add(ts, results, meta={"image": img_path})
+# rows = index.search("LOT-2025", limit=20)
+# index.close()
+# ==========================================================
+
+import atexit
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, List
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS captures (
+    id           INTEGER PRIMARY KEY,
+    ts           TEXT NOT NULL,
+    written_at   TEXT NOT NULL,
+    image        TEXT,
+    image_origin TEXT,
+    definition   REAL,
+    n_lines      INTEGER NOT NULL,
+    avg_conf     REAL
+);
+CREATE INDEX IF NOT EXISTS idx_captures_ts ON captures(ts);
+
+CREATE TABLE IF NOT EXISTS lines (
+    id          INTEGER PRIMARY KEY,
+    capture_id  INTEGER NOT NULL REFERENCES captures(id),
+    line_index  INTEGER,
+    text        TEXT NOT NULL,
+    avg_conf    REAL,
+    box         TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_lines_capture ON lines(capture_id);
+"""
+
+
+class SqliteResultIndex:
+    """
+    캡처 결과를 SQLite 에 배치로 적재하고 텍스트로 검색합니다.
+
+    Parameters
+    ----------
+    db_path : str
+        DB 파일 경로
+    batch_size : int
+        이 건수만큼 캡처가 모이면 한 트랜잭션으로 커밋
+    flush_interval_sec : float
+        커밋되지 않은 캡처가 있으면 마지막 커밋 후 이 시간 안에 batch_size 전이라도 커밋
+        (다음 add() 를 기다리지 않고 백그라운드 flush 스레드가 커밋, 0 이하면 add() 마다 커밋)
+    fts_tokenizer : str
+        "trigram" (부분 문자열 검색) 또는 "unicode61" (단어 단위 검색)
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        batch_size: int = 20,
+        flush_interval_sec: float = 2.0,
+        fts_tokenizer: str = "trigram",
+    ):
+        self.db_path = db_path
+        self.batch_size = max(1, int(batch_size))
+        self.flush_interval_sec = float(flush_interval_sec)
+
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        # isolation_level=None → 트랜잭션은 BEGIN/COMMIT 으로 직접 관리 (배치 커밋)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self.fts_mode = self._init_fts(fts_tokenizer)
+
+        self._lock = threading.Lock()
+        self._pending: list[tuple] = []
+        self._last_flush = time.monotonic()
+        self.captures_written = 0
+        self._warned_closed = False
+
+        # 시간 기준 커밋용 flush 스레드 (처음 add() 할 때 시작, 조회 전용이면 만들지 않음)
+        self._stop = threading.Event()
+        self._flusher: threading.Thread | None = None
+
+    @classmethod
+    def from_config(cls, cfg) -> "SqliteResultIndex":
+        index_cfg = (cfg.get("export_options", {}) or {}).get("sqlite_index", {}) or {}
+        return cls(
+            db_path=index_cfg.get("path", "assets/ocr_index.sqlite3"),
+            batch_size=index_cfg.get("batch_size", 20),
+            flush_interval_sec=index_cfg.get("flush_interval_sec", 2.0),
+            fts_tokenizer=index_cfg.get("fts_tokenizer", "trigram"),
+        )
+
+    def _init_fts(self, tokenizer: str) -> str:
+        """
+        FTS5 테이블을 준비하고 실제로 사용하는 검색 방식을 돌려줍니다.
+        ("trigram" / "unicode61" / "like")
+        """
+        row = self._conn.execute(
+            "SELECT sql FROM sqlite_master WHERE name = 'lines_fts'"
+        ).fetchone()
+        if row is not None:
+            # 이미 만들어진 DB 는 만들 때의 토크나이저를 그대로 사용
+            return "trigram" if "trigram" in (row[0] or "") else "unicode61"
+
+        for tok in dict.fromkeys([tokenizer, "unicode61"]):
+            try:
+                self._conn.execute(
+                    "CREATE VIRTUAL TABLE lines_fts USING fts5("
+                    f"text, content='lines', content_rowid='id', tokenize='{tok}')"
+                )
+                return tok
+            except sqlite3.OperationalError:
+                continue
+        print("⚠️ 이 SQLite 는 FTS5 를 지원하지 않습니다. LIKE 검색으로 대체합니다.")
+        return "like"
+
+    # ------------------------------------------------------
+    # 적재
+    # ------------------------------------------------------
+    def add(self, ts: str, results: List[Dict[str, Any]], meta: Dict[str, Any] | None = None) -> None:
+        """
+        캡처 1건을 대기 목록에 넣고, 조건(batch_size / flush_interval_sec)이 되면 커밋합니다.
+        """
+        meta = meta or {}
+        confs = [float(r.get("avg_conf", 0.0)) for r in results]
+        capture = (
+            ts,
+            datetime.now().isoformat(timespec="milliseconds"),
+            meta.get("image"),
+            meta.get("image_origin"),
+            meta.get("definition"),
+            len(results),
+            (sum(confs) / len(confs)) if confs else None,
+        )
+        lines = [
+            (
+                r.get("line_index", idx + 1),
+                r.get("text", ""),
+                r.get("avg_conf"),
+                json.dumps(r.get("box", []), separators=(",", ":")),
+            )
+            for idx, r in enumerate(results)
+        ]
+
+        with self._lock:
+            if self._conn is None:
+                if not self._warned_closed:
+                    self._warned_closed = True
+                    print(f"⚠️ 닫힌 SQLite 인덱스에 저장하려고 했습니다. (무시됨: {self.db_path})")
+                return
+            if not self._pending:
+                # 대기분이 없던 상태에서 들어온 캡처 → 여기서부터 flush_interval_sec 를 셈
+                self._last_flush = time.monotonic()
+            self._pending.append((capture, lines))
+            if len(self._pending) >= self.batch_size or self.flush_interval_sec <= 0:
+                self._flush_locked()
+            elif self._flusher is None:
+                self._flusher = threading.Thread(target=self._flush_loop, name="sqlite-index-flush", daemon=True)
+                self._flusher.start()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_loop(self) -> None:
+        """대기분이 flush_interval_sec 이상 머물지 않도록 주기적으로 커밋합니다."""
+        timeout = self.flush_interval_sec
+        while not self._stop.wait(timeout):
+            with self._lock:
+                if self._conn is None:
+                    return
+                waited = time.monotonic() - self._last_flush
+                if self._pending and waited >= self.flush_interval_sec:
+                    self._flush_locked()
+                    timeout = self.flush_interval_sec
+                else:
+                    # 대기분이 있으면 남은 시간만큼, 없으면 한 주기 쉬고 다시 확인
+                    timeout = max(0.01, self.flush_interval_sec - waited) if self._pending \
+                        else self.flush_interval_sec
+
+    def _flush_locked(self) -> None:
+        self._last_flush = time.monotonic()
+        if not self._pending or self._conn is None:
+            return
+        pending, self._pending = self._pending, []
+
+        cur = self._conn.cursor()
+        try:
+            cur.execute("BEGIN")
+            for capture, lines in pending:
+                cur.execute(
+                    "INSERT INTO captures (ts, written_at, image, image_origin, definition, n_lines, avg_conf)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    capture,
+                )
+                capture_id = cur.lastrowid
+                for line in lines:
+                    cur.execute(
+                        "INSERT INTO lines (capture_id, line_index, text, avg_conf, box) VALUES (?, ?, ?, ?, ?)",
+                        (capture_id, *line),
+                    )
+                    if self.fts_mode != "like":
+                        cur.execute(
+                            "INSERT INTO lines_fts (rowid, text) VALUES (?, ?)",
+                            (cur.lastrowid, line[1]),
+                        )
+            cur.execute("COMMIT")
+            self.captures_written += len(pending)
+        except sqlite3.Error as e:
+            cur.execute("ROLLBACK")
+            print(f"⚠️ SQLite 인덱스 저장 실패 ({len(pending)}건): {e}")
+
+    def close(self) -> None:
+        self._stop.set()
+        if self._flusher is not None and self._flusher is not threading.current_thread():
+            self._flusher.join(timeout=2.0)
+        with self._lock:
+            if self._conn is None:
+                return
+            self._flush_locked()
+            self._conn.close()
+            self._conn = None
+
+    # ------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------
+    def search(
+        self,
+        query: str,
+        limit: int = 50,
+        since: str | None = None,
+        until: str | None = None,
+        use_like: bool = False,
+    ) -> list[dict]:
+        """
+        인식된 텍스트로 줄을 찾습니다. 최신 캡처부터 돌려줍니다.
+
+        Parameters
+        ----------
+        query : str
+            찾을 문자열. trigram 인덱스면 부분 문자열(3글자 이상)로 검색됩니다.
+        since / until : str | None
+            캡처 ts 범위 (예: "20251101", "20251130_235959")
+        use_like : bool
+            True 면 FTS 대신 LIKE '%query%' 로 검색 (정확하지만 전체 스캔)
+        """
+        self.flush()
+
+        where = []
+        params: list = []
+        # trigram 은 3글자 미만 질의를 인덱스로 찾지 못하므로 LIKE 로 처리
+        like = use_like or self.fts_mode == "like" or (self.fts_mode == "trigram" and len(query) < 3)
+        if like:
+            where.append("l.text LIKE ?")
+            params.append(f"%{query}%")
+            source = "lines l"
+        else:
+            source = "lines_fts f JOIN lines l ON l.id = f.rowid"
+            where.append("lines_fts MATCH ?")
+            # 특수문자(-, : 등)가 FTS 문법으로 해석되지 않도록 구문(phrase)으로 감쌈
+            params.append('"' + query.replace('"', '""') + '"')
+        if since:
+            where.append("c.ts >= ?")
+            params.append(since)
+        if until:
+            where.append("c.ts <= ?")
+            params.append(until)
+        params.append(int(limit))
+
+        sql = (
+            "SELECT c.ts, c.image, c.image_origin, l.line_index, l.text, l.avg_conf, l.box "
+            f"FROM {source} JOIN captures c ON c.id = l.capture_id "
+            f"WHERE {' AND '.join(where)} "
+            "ORDER BY c.ts DESC, l.line_index LIMIT ?"
+        )
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [
+            {
+                "ts": ts,
+                "image": image,
+                "image_origin": image_origin,
+                "line_index": line_index,
+                "text": text,
+                "avg_conf": avg_conf,
+                "box": json.loads(box) if box else [],
+            }
+            for ts, image, image_origin, line_index, text, avg_conf, box in rows
+        ]
+
+    def stats(self) -> dict:
+        self.flush()
+        with self._lock:
+            n_captures, first_ts, last_ts = self._conn.execute(
+                "SELECT COUNT(*), MIN(ts), MAX(ts) FROM captures"
+            ).fetchone()
+            n_lines = self._conn.execute("SELECT COUNT(*) FROM lines").fetchone()[0]
+        return {
+            "db_path": self.db_path,
+            "captures": n_captures,
+            "lines": n_lines,
+            "first_ts": first_ts,
+            "last_ts": last_ts,
+            "fts_mode": self.fts_mode,
+            "db_bytes": os.path.getsize(self.db_path) if os.path.exists(self.db_path) else 0,
+        }
+
+
+# ----------------------------------------------------------
+# (메인 API) 설정 기반 인덱스 공유
+# ----------------------------------------------------------
+_indexes: Dict[str, SqliteResultIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_result_index(cfg) -> SqliteResultIndex:
+    """export_options.sqlite_index.path 별로 인덱스를 하나만 열어서 공유합니다."""
+    index_cfg = (cfg.get("export_options", {}) or {}).get("sqlite_index", {}) or {}
+    path = os.path.abspath(index_cfg.get("path", "assets/ocr_index.sqlite3"))
+    with _indexes_lock:
+        index = _indexes.get(path)
+        if index is None:
+            index = SqliteResultIndex.from_config(cfg)
+            _indexes[path] = index
+        return index
+
+
+def close_result_indexes() -> None:
+    """열려 있는 인덱스의 대기분을 커밋하고 닫습니다. (프로세스 종료 시 자동 호출)"""
+    with _indexes_lock:
+        indexes = list(_indexes.values())
+        _indexes.clear()
+    for index in indexes:
+        index.close()
+
+
+atexit.register(close_result_indexes)
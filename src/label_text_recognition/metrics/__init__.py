@@ -0,0 +1,31 @@
+# ==========================================================
+# 단계별 소요 시간 계측 관련 모듈을 묶는 패키지입니다.
+# 히스토그램 수집(stage_metrics), /metrics HTTP · 텍스트 파일 노출(endpoint)을 포함합니다.
+# ==========================================================
+
+from .stage_metrics import (
+    MetricsRegistry,
+    configure_metrics,
+    disable_metrics,
+    enable_metrics,
+    get_registry,
+    observe,
+    percentile,
+    timed,
+)
+from .endpoint import MetricsHttpServer, MetricsTextfileWriter, start_metrics, stop_metrics
+
+__all__ = [
+    "MetricsRegistry",
+    "configure_metrics",
+    "enable_metrics",
+    "disable_metrics",
+    "get_registry",
+    "timed",
+    "observe",
+    "percentile",
+    "MetricsHttpServer",
+    "MetricsTextfileWriter",
+    "start_metrics",
+    "stop_metrics",
+]
@@ -0,0 +1,155 @@
+# ==========================================================
+# endpoint.py
+# ----------------------------------------------------------
+# stage_metrics 로 모은 히스토그램을 밖에서 볼 수 있게 내보내는 모듈입니다.
+#
+#   - HTTP   : http://127.0.0.1:9464/metrics  (Prometheus 가 그대로 수집 가능)
+#   - 텍스트 : interval_sec 마다 .prom 파일로 저장 (node_exporter textfile collector 등)
+#
+# 둘 다 데몬 스레드에서 동작하며, 메인 루프/OCR 워커를 막지 않습니다.
+#
+# 사용 예시
+# ----------------------------------------------------------
+# exporters = start_metrics(cfg)      # metrics.enabled: false 면 빈 리스트
+# ...
+# stop_metrics(exporters)             # 텍스트 파일은 종료 시 한 번 더 기록
+# ==========================================================
+
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from .stage_metrics import MetricsRegistry, configure_metrics
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class MetricsHttpServer:
+    """GET /metrics 에 Prometheus 텍스트를 돌려주는 로컬 HTTP 서버"""
+
+    def __init__(self, registry: MetricsRegistry, host: str = "127.0.0.1", port: int = 9464):
+        self.registry = registry
+        self.host = host
+        self.port = int(port)
+        self._server: ThreadingHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> "MetricsHttpServer":
+        registry = self.registry
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?", 1)[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = registry.render_prometheus().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                # 요청마다 콘솔에 접근 로그를 남기지 않음
+                pass
+
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._server.daemon_threads = True
+        # port=0 이면 OS 가 고른 포트를 사용
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name="metrics-http", daemon=True)
+        self._thread.start()
+        return self
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}/metrics"
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+class MetricsTextfileWriter:
+    """interval_sec 마다 Prometheus 텍스트를 파일로 저장 (임시 파일 → rename 으로 원자적 교체)"""
+
+    def __init__(self, registry: MetricsRegistry, path: str, interval_sec: float = 10.0):
+        self.registry = registry
+        self.path = path
+        self.interval_sec = max(0.5, float(interval_sec))
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> "MetricsTextfileWriter":
+        out_dir = os.path.dirname(self.path)
+        if out_dir:
+            os.makedirs(out_dir, exist_ok=True)
+        self._thread = threading.Thread(target=self._loop, name="metrics-textfile", daemon=True)
+        self._thread.start()
+        return self
+
+    def write_now(self) -> None:
+        tmp_path = self.path + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(self.registry.render_prometheus())
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"⚠️ 메트릭 파일 저장 실패: {self.path} ({e})")
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self.interval_sec):
+            self.write_now()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.write_now()
+
+
+def start_metrics(cfg) -> list:
+    """
+    metrics 섹션에 맞춰 수집을 켜고 HTTP 서버 / 텍스트 파일 저장을 시작합니다.
+    시작한 exporter 목록을 돌려줍니다. (비활성화면 빈 리스트)
+
+    metrics:
+      enabled: false
+      http:     {enabled: true,  host: "127.0.0.1", port: 9464}
+      textfile: {enabled: false, path: "assets/metrics/ocr.prom", interval_sec: 10}
+    """
+    registry = configure_metrics(cfg)
+    if registry is None:
+        return []
+
+    metrics_cfg = cfg.get("metrics", {}) or {}
+    http_cfg = metrics_cfg.get("http", {}) or {}
+    text_cfg = metrics_cfg.get("textfile", {}) or {}
+
+    exporters = []
+    if http_cfg.get("enabled", True):
+        try:
+            server = MetricsHttpServer(
+                registry, http_cfg.get("host", "127.0.0.1"), http_cfg.get("port", 9464)
+            ).start()
+            exporters.append(server)
+            print(f"📊 메트릭 엔드포인트: {server.url}")
+        except OSError as e:
+            print(f"⚠️ 메트릭 HTTP 서버를 시작할 수 없습니다 ({e}). 수집은 계속합니다.")
+    if text_cfg.get("enabled", False):
+        writer = MetricsTextfileWriter(
+            registry,
+            text_cfg.get("path", "assets/metrics/ocr.prom"),
+            text_cfg.get("interval_sec", 10),
+        ).start()
+        exporters.append(writer)
+        print(f"📊 메트릭 파일: {writer.path} ({writer.interval_sec:g}s 마다)")
+    return exporters
+
+
+def stop_metrics(exporters: list) -> None:
+    for exporter in exporters:
+        exporter.stop()
@@ -0,0 +1,239 @@
+# ==========================================================
+# stage_metrics.py
+# ----------------------------------------------------------
+# 캡처 → 선명도 → OCR(검출/인식) → 줄 병합 → 렌더링 → 파일 저장 까지
+# 단계별 소요 시간을 히스토그램으로 모으는 계측 모듈입니다.
+#
+# 배경
+# ----------------------------------------------------------
+# - 캡처가 느릴 때 어느 단계 때문인지 알 수 있는 정보가
+#   "OK | MODE: ..." 문자열밖에 없었습니다.
+#
+# 동작 방식
+# ----------------------------------------------------------
+# ✅ with timed("detect"): ...  → "detect" 단계 히스토그램에 소요 시간(초) 기록
+# ✅ 비활성화(기본) 상태에서는 timed() 가 미리 만들어 둔 빈 컨텍스트를 돌려줌
+#     → 전역 변수 1번 확인 + 빈 __enter__/__exit__ 호출이 전부 (측정: benchmarks/bench_metrics.py)
+# ✅ Prometheus 텍스트 형식으로 출력 (endpoint.py 의 /metrics, 텍스트 파일)
+#
+# 사용 예시
+# ----------------------------------------------------------
+# configure_metrics(cfg)              # metrics.enabled: true 일 때만 수집 시작
+# with timed("merge_words"):
+#     merged = group_words(filtered)
+# print(get_registry().format_summary())
+# ==========================================================
+
+import math
+import threading
+import time
+from bisect import bisect_left
+from typing import Sequence
+
+METRIC_NAME = "ocr_stage_duration_seconds"
+
+# 기본 버킷 (ms). 카메라 캡처(수 ms) ~ OCR 엔진(수 초)까지 커버
+DEFAULT_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+
+class Histogram:
+    """누적(cumulative) 버킷 히스토그램. 값 단위는 초."""
+
+    def __init__(self, buckets_sec: Sequence[float]):
+        self.buckets = tuple(sorted(float(b) for b in buckets_sec))
+        self._counts = [0] * (len(self.buckets) + 1)  # 마지막 칸 = +Inf
+        self._sum = 0.0
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float) -> None:
+        idx = bisect_left(self.buckets, seconds)
+        with self._lock:
+            self._counts[idx] += 1
+            self._sum += seconds
+            self._count += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            counts = list(self._counts)
+            total, count = self._sum, self._count
+        cumulative, running = [], 0
+        for c in counts:
+            running += c
+            cumulative.append(running)
+        return {"buckets": self.buckets, "cumulative": cumulative, "sum": total, "count": count}
+
+    def quantile(self, q: float) -> float:
+        """
+        버킷 경계 사이를 선형 보간한 근사 백분위(초). (Prometheus histogram_quantile 과 같은 방식)
+        """
+        snap = self.snapshot()
+        count = snap["count"]
+        if count == 0:
+            return 0.0
+        rank = q / 100.0 * count
+        lower_bound, lower_count = 0.0, 0
+        for bound, cum in zip(self.buckets, snap["cumulative"]):
+            if cum >= rank:
+                in_bucket = cum - lower_count
+                frac = (rank - lower_count) / in_bucket if in_bucket else 0.0
+                return lower_bound + (bound - lower_bound) * frac
+            lower_bound, lower_count = bound, cum
+        return self.buckets[-1] if self.buckets else 0.0
+
+
+class MetricsRegistry:
+    """단계 이름 → Histogram. 처음 기록될 때 히스토그램이 만들어집니다."""
+
+    def __init__(self, buckets_ms: Sequence[float] = DEFAULT_BUCKETS_MS):
+        self.buckets_sec = tuple(float(b) / 1000.0 for b in buckets_ms)
+        self._histograms: dict[str, Histogram] = {}
+        self._lock = threading.Lock()
+        self.started_at = time.time()
+
+    def histogram(self, stage: str) -> Histogram:
+        hist = self._histograms.get(stage)
+        if hist is None:
+            with self._lock:
+                hist = self._histograms.setdefault(stage, Histogram(self.buckets_sec))
+        return hist
+
+    def observe(self, stage: str, seconds: float) -> None:
+        self.histogram(stage).observe(seconds)
+
+    def stages(self) -> list[str]:
+        with self._lock:
+            return sorted(self._histograms)
+
+    # ------------------------------------------------------
+    # 출력
+    # ------------------------------------------------------
+    def render_prometheus(self) -> str:
+        """Prometheus 텍스트 노출 형식(0.0.4)으로 변환합니다."""
+        lines = [
+            f"# HELP {METRIC_NAME} Duration of each label OCR pipeline stage.",
+            f"# TYPE {METRIC_NAME} histogram",
+        ]
+        for stage in self.stages():
+            snap = self._histograms[stage].snapshot()
+            for bound, cum in zip(snap["buckets"], snap["cumulative"]):
+                lines.append(f'{METRIC_NAME}_bucket{{stage="{stage}",le="{bound:g}"}} {cum}')
+            lines.append(f'{METRIC_NAME}_bucket{{stage="{stage}",le="+Inf"}} {snap["count"]}')
+            lines.append(f'{METRIC_NAME}_sum{{stage="{stage}"}} {snap["sum"]:.6f}')
+            lines.append(f'{METRIC_NAME}_count{{stage="{stage}"}} {snap["count"]}')
+        return "\n".join(lines) + "\n"
+
+    def format_summary(self) -> str:
+        """종료 시 콘솔에 보여줄 단계별 요약 (횟수 / 평균 / 근사 p50·p90)"""
+        rows = ["⏱ 단계별 소요 시간 (근사 백분위)"]
+        for stage in self.stages():
+            hist = self._histograms[stage]
+            snap = hist.snapshot()
+            if not snap["count"]:
+                continue
+            mean_ms = snap["sum"] / snap["count"] * 1000.0
+            rows.append(
+                f"   - {stage:<16s} n={snap['count']:<6d} mean={mean_ms:8.1f}ms  "
+                f"p50≈{hist.quantile(50) * 1000.0:8.1f}ms  p90≈{hist.quantile(90) * 1000.0:8.1f}ms"
+            )
+        return "\n".join(rows)
+
+
+# ----------------------------------------------------------
+# 전역 계측 API
+# ----------------------------------------------------------
+class _NullTimer:
+    """비활성화 상태에서 timed() 가 돌려주는 빈 컨텍스트 (하나만 만들어 재사용)"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+class _StageTimer:
+    __slots__ = ("_hist", "_t0")
+
+    def __init__(self, hist: Histogram):
+        self._hist = hist
+        self._t0 = 0.0
+
+    def __enter__(self):
+        self._t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._hist.observe(time.perf_counter() - self._t0)
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+_registry: MetricsRegistry | None = None
+
+
+def configure_metrics(cfg) -> MetricsRegistry | None:
+    """
+    metrics.enabled 가 true 면 전역 레지스트리를 만들고(이미 있으면 재사용) 돌려줍니다.
+    false 면 수집을 끄고 None 을 돌려줍니다.
+    """
+    global _registry
+    metrics_cfg = cfg.get("metrics", {}) or {}
+    if not metrics_cfg.get("enabled", False):
+        _registry = None
+        return None
+    if _registry is None:
+        _registry = MetricsRegistry(metrics_cfg.get("buckets_ms") or DEFAULT_BUCKETS_MS)
+    return _registry
+
+
+def enable_metrics(buckets_ms: Sequence[float] = DEFAULT_BUCKETS_MS) -> MetricsRegistry:
+    """설정 파일 없이 수집을 켭니다. (벤치마크/스크립트용)"""
+    global _registry
+    _registry = MetricsRegistry(buckets_ms)
+    return _registry
+
+
+def disable_metrics() -> None:
+    global _registry
+    _registry = None
+
+
+def get_registry() -> MetricsRegistry | None:
+    return _registry
+
+
+def timed(stage: str):
+    """
+    with timed("stage"): ... 블록의 소요 시간을 기록합니다.
+    수집이 꺼져 있으면 아무것도 하지 않는 컨텍스트를 돌려줍니다.
+    """
+    registry = _registry
+    if registry is None:
+        return _NULL_TIMER
+    return _StageTimer(registry.histogram(stage))
+
+
+def observe(stage: str, seconds: float) -> None:
+    """이미 잰 소요 시간(초)을 기록합니다. (수집이 꺼져 있으면 무시)"""
+    registry = _registry
+    if registry is not None:
+        registry.observe(stage, seconds)
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """
+    선형 보간 방식의 백분위 계산 (numpy.percentile 기본 동작과 동일).
+    값이 없으면 0.0 을 반환합니다. (배치 지연시간 / 결과 저장기 통계 등에서 공용)
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    pos = (len(ordered) - 1) * (q / 100.0)
+    lo = math.floor(pos)
+    hi = math.ceil(pos)
+    if lo == hi:
+        return float(ordered[lo])
+    return float(ordered[lo] + (ordered[hi] - ordered[lo]) * (pos - lo))
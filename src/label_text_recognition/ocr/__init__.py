@@ -1,9 +1,22 @@
 # ==========================================================
 # OCR 관련 모듈을 묶는 패키지입니다.
-# 엔진 초기화(ocr_engine), 실행(ocr_runner), 후처리(ocr_utils)를 포함합니다.
+# 추론 백엔드(backends), 엔진 초기화(ocr_engine, engine_registry),
+# 실행(ocr_runner), 후처리(ocr_utils)를 포함합니다.
 # ==========================================================
 
+from .backends import OcrBackend, create_backend
 from .ocr_engine import build_ocr_engines
+from .engine_registry import OcrEngineRegistry, build_engine_registry
 from .ocr_runner import run_ocr_on_image
+from .ocr_utils import group_words, render_ocr_overlay
 
-__all__ = ["build_ocr_engines", "run_ocr_on_image"]
+__all__ = [
+    "OcrBackend",
+    "create_backend",
+    "build_ocr_engines",
+    "OcrEngineRegistry",
+    "build_engine_registry",
+    "run_ocr_on_image",
+    "group_words",
+    "render_ocr_overlay",
+]
@@ -0,0 +1,77 @@
+# ==========================================================
+# OCR 추론 백엔드를 묶는 패키지입니다.
+# ocr_config.yaml 의 ocr_backend 값으로 사용할 구현을 고릅니다.
+#   - "paddle" : PaddleOCR (기본값, 기존 동작과 동일)
+#   - "onnx"   : ONNX Runtime 으로 PP-OCR ONNX 모델 실행 (CPU 전용 장비용)
+#
+# 사용 예시
+# ----------------------------------------------------------
+# factory = backend_factory_from_config(cfg)
+# registry = OcrEngineRegistry(cfg.get("ocr_langs"), factory=factory)
+# engine = registry.get()          # → OcrBackend
+# ==========================================================
+
+from typing import Any, Callable
+
+from .base import BaseOcrBackend, OcrBackend, crop_text_region, sort_boxes
+
+SUPPORTED_BACKENDS = ("paddle", "onnx")
+
+
+def create_backend(name: str, lang: str, **options) -> OcrBackend:
+    """
+    이름에 맞는 백엔드를 만듭니다. (각 백엔드의 무거운 import 는 여기서 처음 일어남)
+    """
+    if name == "paddle":
+        from .paddle_backend import PaddleBackend
+
+        return PaddleBackend(lang, **options)
+    if name == "onnx":
+        from .onnx_backend import OnnxBackend
+
+        return OnnxBackend.from_settings(lang, **options)
+    raise ValueError(f"지원하지 않는 ocr_backend: {name} (사용 가능: {', '.join(SUPPORTED_BACKENDS)})")
+
+
+def backend_options(cfg, name: str) -> dict:
+    """백엔드별 설정 섹션 (paddle_backend / onnx_backend) 을 일반 dict 로 꺼냅니다."""
+    section = cfg.get(f"{name}_backend", {}) or {}
+    return _thaw(section)
+
+
+def _thaw(value: Any) -> Any:
+    # OcrConfig 의 읽기 전용 매핑/튜플을 생성자에 넘길 수 있는 dict/list 로 변환
+    if hasattr(value, "items"):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(v) for v in value]
+    return value
+
+
+def backend_factory_from_config(cfg) -> Callable[..., OcrBackend]:
+    """
+    OcrEngineRegistry 에 넘길 factory(lang, **kwargs) 를 만듭니다.
+    ocr_backend 가 없으면 "paddle" 을 사용합니다.
+    """
+    name = cfg.get("ocr_backend", "paddle") or "paddle"
+    if name not in SUPPORTED_BACKENDS:
+        raise ValueError(f"지원하지 않는 ocr_backend: {name} (사용 가능: {', '.join(SUPPORTED_BACKENDS)})")
+    options = backend_options(cfg, name)
+
+    def factory(lang: str, **kwargs) -> OcrBackend:
+        return create_backend(name, lang, **{**options, **kwargs})
+
+    factory.backend_name = name
+    return factory
+
+
+__all__ = [
+    "OcrBackend",
+    "BaseOcrBackend",
+    "SUPPORTED_BACKENDS",
+    "create_backend",
+    "backend_options",
+    "backend_factory_from_config",
+    "crop_text_region",
+    "sort_boxes",
+]
@@ -0,0 +1,175 @@
+# ==========================================================
+# base.py
+# ----------------------------------------------------------
+# OCR 백엔드가 구현해야 하는 인터페이스(프로토콜)와
+# 단계별 구현(detect / classify / recognize)을 하나의 ocr() 로 묶어주는
+# 공통 베이스 클래스입니다.
+#
+# 배경
+# ----------------------------------------------------------
+# - run_ocr_on_image 는 PaddleOCR.ocr(img, cls=...) 와 그 결과 모양
+#   [[ [box, (text, conf)], ... ]] 에 직접 묶여 있었습니다.
+# - CPU 전용 장비에서는 PaddlePaddle 의 설치 용량/기동 시간이 커서,
+#   같은 PP-OCR 모델을 ONNX Runtime 으로 돌리는 선택지가 필요합니다.
+#
+# 인터페이스
+# ----------------------------------------------------------
+#   detect(image)          → 글자 영역 4점 박스 목록 (위→아래, 왼→오른 순서)
+#   classify(crops)        → 잘라낸 글자 이미지별 (각도 라벨, 점수)
+#   recognize(crops)       → 잘라낸 글자 이미지별 (텍스트, 신뢰도)  ※ 배치 처리
+#   ocr(image, cls=True)   → PaddleOCR 과 같은 모양의 결과 (기존 코드 호환)
+#   ocr_batch(images, cls) → 여러 장을 한 번에 (ocr() 결과의 리스트)
+#
+# BaseOcrBackend 는 recognize_boxes(images, boxes, cls) 도 제공합니다.
+#   → 검출을 건너뛰고 주어진 박스만 인식 (downscale.py 에서 사용)
+# ==========================================================
+
+from typing import Any, Protocol, Sequence, runtime_checkable
+
+import numpy as np
+
+from label_text_recognition.metrics.stage_metrics import timed
+
+Box = list  # [[x1, y1], [x2, y2], [x3, y3], [x4, y4]] (시계 방향, 왼쪽 위부터)
+
+
+@runtime_checkable
+class OcrBackend(Protocol):
+    """run_ocr_on_image 등 OCR 실행부가 기대하는 백엔드 인터페이스"""
+
+    name: str
+    lang: str
+
+    def detect(self, image_bgr: np.ndarray) -> list[Box]:
+        ...
+
+    def classify(self, crops: Sequence[np.ndarray]) -> list[tuple[str, float]]:
+        ...
+
+    def recognize(self, crops: Sequence[np.ndarray]) -> list[tuple[str, float]]:
+        ...
+
+    def ocr(self, image_bgr: np.ndarray, cls: bool = True) -> list:
+        ...
+
+    def ocr_batch(self, images: Sequence[np.ndarray], cls: bool = True) -> list[list]:
+        ...
+
+
+# ----------------------------------------------------------
+# 공통 유틸
+# ----------------------------------------------------------
+def sort_boxes(boxes: Sequence[Any], y_tolerance: float = 10.0) -> list[np.ndarray]:
+    """
+    박스를 위→아래, 같은 줄(y 차이 y_tolerance 이하)이면 왼→오른 순서로 정렬합니다.
+    (PaddleOCR 의 sorted_boxes 와 같은 규칙)
+    """
+    boxes = sorted((np.asarray(b, dtype=np.float32) for b in boxes),
+                   key=lambda b: (b[0][1], b[0][0]))
+    for i in range(len(boxes) - 1):
+        for j in range(i, -1, -1):
+            if abs(boxes[j + 1][0][1] - boxes[j][0][1]) < y_tolerance and \
+                    boxes[j + 1][0][0] < boxes[j][0][0]:
+                boxes[j], boxes[j + 1] = boxes[j + 1], boxes[j]
+            else:
+                break
+    return boxes
+
+
+def crop_text_region(image_bgr: np.ndarray, box: Any) -> np.ndarray:
+    """
+    4점 박스 영역을 원근 변환으로 똑바로 펴서 잘라냅니다.
+    세로로 긴 영역(높이 ≥ 가로 1.5배)은 90도 돌려서 가로 글줄로 만듭니다.
+    """
+    import cv2
+
+    pts = np.asarray(box, dtype=np.float32)
+    width = int(max(np.linalg.norm(pts[0] - pts[1]), np.linalg.norm(pts[2] - pts[3])))
+    height = int(max(np.linalg.norm(pts[0] - pts[3]), np.linalg.norm(pts[1] - pts[2])))
+    width, height = max(width, 1), max(height, 1)
+
+    dst = np.array([[0, 0], [width, 0], [width, height], [0, height]], dtype=np.float32)
+    matrix = cv2.getPerspectiveTransform(pts, dst)
+    crop = cv2.warpPerspective(
+        image_bgr, matrix, (width, height),
+        borderMode=cv2.BORDER_REPLICATE, flags=cv2.INTER_CUBIC,
+    )
+    if height / width >= 1.5:
+        crop = np.rot90(crop)
+    return crop
+
+
+class BaseOcrBackend:
+    """
+    detect / classify / recognize 를 구현하면
+    ocr() / ocr_batch() 는 이 클래스가 PaddleOCR 과 같은 모양으로 조립해 줍니다.
+
+    cls_thresh : 각도 분류 점수가 이 값 이상이고 "180" 이면 잘라낸 이미지를 뒤집어서 인식
+    """
+
+    name = "base"
+    # 같은 객체를 여러 스레드에서 동시에 호출해도 되는지 (tiling 의 병렬 처리에서 확인)
+    thread_safe = False
+
+    def __init__(self, lang: str, cls_thresh: float = 0.9):
+        self.lang = lang
+        self.cls_thresh = float(cls_thresh)
+
+    def detect(self, image_bgr: np.ndarray) -> list[Box]:
+        raise NotImplementedError
+
+    def classify(self, crops: Sequence[np.ndarray]) -> list[tuple[str, float]]:
+        # 각도 분류 모델이 없는 백엔드는 모두 정방향으로 간주
+        return [("0", 1.0) for _ in crops]
+
+    def recognize(self, crops: Sequence[np.ndarray]) -> list[tuple[str, float]]:
+        raise NotImplementedError
+
+    def ocr(self, image_bgr: np.ndarray, cls: bool = True) -> list:
+        return self.ocr_batch([image_bgr], cls=cls)[0]
+
+    def ocr_batch(self, images: Sequence[np.ndarray], cls: bool = True) -> list[list]:
+        """
+        여러 장을 검출한 뒤, 모든 글자 영역을 모아서 분류/인식을 한 번에 배치로 돌립니다.
+        결과가 없는 이미지는 PaddleOCR 과 같이 [None] 으로 돌려줍니다.
+        """
+        with timed("detect"):
+            boxes_per_image = [self.detect(img) for img in images]
+        return self.recognize_boxes(images, boxes_per_image, cls=cls)
+
+    def recognize_boxes(
+        self, images: Sequence[np.ndarray], boxes_per_image: Sequence[Sequence[Box]], cls: bool = True
+    ) -> list[list]:
+        """
+        이미 알고 있는 박스(이미지 좌표)로 잘라내서 분류/인식만 배치로 돌립니다.
+        (축소 이미지에서 검출한 박스를 원본 해상도에서 인식할 때 등)
+        """
+        crops = [
+            crop_text_region(img, box)
+            for img, boxes in zip(images, boxes_per_image)
+            for box in boxes
+        ]
+        if not crops:
+            return [[None] for _ in images]
+
+        if cls:
+            with timed("classify"):
+                cls_res = self.classify(crops)
+            for i, (label, score) in enumerate(cls_res):
+                if "180" in label and score >= self.cls_thresh:
+                    crops[i] = np.ascontiguousarray(crops[i][::-1, ::-1])
+        with timed("recognize"):
+            texts = self.recognize(crops)
+
+        outputs, pos = [], 0
+        for boxes in boxes_per_image:
+            page = [
+                [np.asarray(box).tolist(), (text, float(conf))]
+                for box, (text, conf) in zip(boxes, texts[pos:pos + len(boxes)])
+            ]
+            pos += len(boxes)
+            outputs.append([page] if page else [None])
+        return outputs
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} lang={self.lang}>"
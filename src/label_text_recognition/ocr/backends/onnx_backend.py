@@ -0,0 +1,284 @@
+# ==========================================================
+# onnx_backend.py
+# ----------------------------------------------------------
+# ONNX Runtime(CPU) 으로 PP-OCR 모델을 실행하는 백엔드입니다. (ocr_backend: "onnx")
+#
+# 배경
+# ----------------------------------------------------------
+# - CPU 전용 장비에서는 PaddlePaddle 설치 용량과 기동 시간이 부담이 됩니다.
+# - paddle2onnx 로 내보낸 PP-OCR det / cls / rec 모델을 onnxruntime 으로 돌리면
+#   같은 모델을 훨씬 가벼운 런타임으로 사용할 수 있습니다.
+#
+# 모델 준비 (예: PP-OCRv4 한국어)
+# ----------------------------------------------------------
+#   paddle2onnx --model_dir ch_PP-OCRv4_det_infer --model_filename inference.pdmodel \
+#       --params_filename inference.pdiparams --save_file models/det.onnx
+#   (cls / rec 모델도 같은 방식, rec 사전 파일은 korean_dict.txt 등 그대로 사용)
+#
+# 전/후처리는 PaddleOCR 기본값과 같게 맞췄습니다.
+#   det : 긴 변 det_limit_side_len 이하로 축소, 32 배수, ImageNet 정규화 → DB 후처리
+#   cls : 3x48x192, ("0", "180")
+#   rec : 높이 48, 배치 안에서 가장 긴 비율에 맞춰 가로 패딩 → CTC greedy 디코딩
+# ==========================================================
+
+import math
+import os
+from typing import Sequence
+
+import cv2
+import numpy as np
+
+from .base import BaseOcrBackend, sort_boxes
+
+_DET_MEAN = np.array([0.485, 0.456, 0.406], dtype=np.float32)
+_DET_STD = np.array([0.229, 0.224, 0.225], dtype=np.float32)
+
+
+def _load_session(path: str, providers: Sequence[str], intra_op_threads: int):
+    import onnxruntime as ort
+
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"ONNX 모델 파일이 없습니다: {path}")
+    opts = ort.SessionOptions()
+    opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    if intra_op_threads > 0:
+        opts.intra_op_num_threads = int(intra_op_threads)
+    return ort.InferenceSession(path, sess_options=opts, providers=list(providers))
+
+
+def _load_charset(dict_path: str, use_space_char: bool) -> list[str]:
+    with open(dict_path, "r", encoding="utf-8") as f:
+        chars = [line.rstrip("\r\n") for line in f]
+    if use_space_char:
+        chars.append(" ")
+    # CTC blank 는 0번
+    return ["blank"] + chars
+
+
+# ----------------------------------------------------------
+# DB 후처리 (PaddleOCR DBPostProcess 의 fast 모드와 같은 규칙)
+# ----------------------------------------------------------
+def _mini_box(contour) -> tuple[np.ndarray, float]:
+    rect = cv2.minAreaRect(contour)
+    pts = sorted(cv2.boxPoints(rect).tolist(), key=lambda p: p[0])
+    left = sorted(pts[:2], key=lambda p: p[1])
+    right = sorted(pts[2:], key=lambda p: p[1])
+    # 왼쪽 위 → 오른쪽 위 → 오른쪽 아래 → 왼쪽 아래
+    box = np.array([left[0], right[0], right[1], left[1]], dtype=np.float32)
+    return box, min(rect[1])
+
+
+def _box_score(prob: np.ndarray, box: np.ndarray) -> float:
+    h, w = prob.shape
+    xmin = int(np.clip(np.floor(box[:, 0].min()), 0, w - 1))
+    xmax = int(np.clip(np.ceil(box[:, 0].max()), 0, w - 1))
+    ymin = int(np.clip(np.floor(box[:, 1].min()), 0, h - 1))
+    ymax = int(np.clip(np.ceil(box[:, 1].max()), 0, h - 1))
+    mask = np.zeros((ymax - ymin + 1, xmax - xmin + 1), dtype=np.uint8)
+    shifted = box.copy()
+    shifted[:, 0] -= xmin
+    shifted[:, 1] -= ymin
+    cv2.fillPoly(mask, shifted.reshape(1, -1, 2).astype(np.int32), 1)
+    return float(cv2.mean(prob[ymin:ymax + 1, xmin:xmax + 1], mask)[0])
+
+
+def _unclip(box: np.ndarray, ratio: float) -> np.ndarray:
+    """
+    박스를 area * ratio / perimeter 만큼 바깥으로 넓힙니다.
+    pyclipper 가 있으면 PaddleOCR 과 같은 다각형 offset, 없으면 회전 사각형을 같은 거리만큼 확장.
+    """
+    area = cv2.contourArea(box)
+    length = cv2.arcLength(box, True)
+    distance = area * ratio / max(length, 1e-6)
+    try:
+        import pyclipper
+
+        offset = pyclipper.PyclipperOffset()
+        offset.AddPath(box.astype(np.int64).tolist(), pyclipper.JT_ROUND, pyclipper.ET_CLOSEDPOLYGON)
+        expanded = offset.Execute(distance)
+        if expanded:
+            return np.array(expanded[0], dtype=np.float32)
+    except ImportError:
+        pass
+    (cx, cy), (w, h), angle = cv2.minAreaRect(box)
+    return cv2.boxPoints(((cx, cy), (w + 2 * distance, h + 2 * distance), angle)).astype(np.float32)
+
+
+class OnnxBackend(BaseOcrBackend):
+    """
+    PP-OCR ONNX 모델(det / cls / rec)을 onnxruntime 으로 실행하는 백엔드.
+
+    Parameters
+    ----------
+    lang : str
+        언어 코드 (결과 표시/레지스트리 키 용도)
+    det_model / rec_model : str
+        검출 / 인식 ONNX 모델 경로
+    rec_dict : str
+        인식 모델의 문자 사전 파일 (한 줄에 한 글자)
+    cls_model : str | None
+        각도 분류 ONNX 모델 경로. None 이면 분류 단계를 건너뜀
+    providers : Sequence[str]
+        onnxruntime 실행 provider (기본 CPUExecutionProvider)
+    intra_op_threads : int
+        세션당 연산 스레드 수 (0 → onnxruntime 기본값)
+    rec_batch_size : int
+        인식 단계에서 한 번에 추론할 글자 영역 수
+    """
+
+    name = "onnx"
+    # InferenceSession.run 은 스레드 안전하고, 추론 중에 바뀌는 멤버 상태가 없음
+    thread_safe = True
+
+    def __init__(
+        self,
+        lang: str,
+        det_model: str,
+        rec_model: str,
+        rec_dict: str,
+        cls_model: str | None = None,
+        providers: Sequence[str] = ("CPUExecutionProvider",),
+        intra_op_threads: int = 0,
+        rec_batch_size: int = 6,
+        rec_image_shape: Sequence[int] = (3, 48, 320),
+        det_limit_side_len: int = 960,
+        det_db_thresh: float = 0.3,
+        det_db_box_thresh: float = 0.6,
+        det_db_unclip_ratio: float = 1.5,
+        use_space_char: bool = True,
+        cls_thresh: float = 0.9,
+    ):
+        super().__init__(lang, cls_thresh=cls_thresh)
+        self.det_session = _load_session(det_model, providers, intra_op_threads)
+        self.rec_session = _load_session(rec_model, providers, intra_op_threads)
+        self.cls_session = _load_session(cls_model, providers, intra_op_threads) if cls_model else None
+        self.charset = _load_charset(rec_dict, use_space_char)
+
+        self.rec_batch_size = max(1, int(rec_batch_size))
+        self.rec_image_shape = tuple(int(v) for v in rec_image_shape)
+        self.det_limit_side_len = int(det_limit_side_len)
+        self.det_db_thresh = float(det_db_thresh)
+        self.det_db_box_thresh = float(det_db_box_thresh)
+        self.det_db_unclip_ratio = float(det_db_unclip_ratio)
+
+    @classmethod
+    def from_settings(cls, lang: str, models: dict | None = None, **settings) -> "OnnxBackend":
+        """
+        ocr_config.yaml 의 onnx_backend 섹션으로 백엔드를 만듭니다.
+        models[lang] 이 없으면 models["default"] 를 사용합니다.
+        model_dir 가 있으면 상대 경로 모델 파일은 그 아래에서 찾습니다.
+        """
+        models = dict(models or {})
+        lang_models = models.get(lang) or models.get("default")
+        if not lang_models:
+            raise ValueError(f"onnx_backend.models 에 '{lang}' (또는 default) 모델 설정이 없습니다.")
+
+        model_dir = settings.pop("model_dir", "") or ""
+
+        def resolve(path):
+            if not path:
+                return None
+            return path if os.path.isabs(path) or not model_dir else os.path.join(model_dir, path)
+
+        return cls(
+            lang,
+            det_model=resolve(lang_models.get("det")),
+            rec_model=resolve(lang_models.get("rec")),
+            rec_dict=resolve(lang_models.get("dict")),
+            cls_model=resolve(lang_models.get("cls")),
+            **settings,
+        )
+
+    # ------------------------------------------------------
+    # 검출
+    # ------------------------------------------------------
+    def _det_resize(self, image_bgr: np.ndarray) -> tuple[np.ndarray, float, float]:
+        h, w = image_bgr.shape[:2]
+        ratio = min(1.0, self.det_limit_side_len / max(h, w))
+        resize_h = max(32, int(round(h * ratio / 32)) * 32)
+        resize_w = max(32, int(round(w * ratio / 32)) * 32)
+        resized = cv2.resize(image_bgr, (resize_w, resize_h))
+        return resized, resize_h / h, resize_w / w
+
+    def detect(self, image_bgr: np.ndarray) -> list:
+        src_h, src_w = image_bgr.shape[:2]
+        resized, ratio_h, ratio_w = self._det_resize(image_bgr)
+
+        x = (resized.astype(np.float32) / 255.0 - _DET_MEAN) / _DET_STD
+        x = x.transpose(2, 0, 1)[np.newaxis]
+        input_name = self.det_session.get_inputs()[0].name
+        prob = self.det_session.run(None, {input_name: x})[0][0, 0]
+
+        bitmap = (prob > self.det_db_thresh).astype(np.uint8)
+        contours, _ = cv2.findContours(bitmap, cv2.RETR_LIST, cv2.CHAIN_APPROX_SIMPLE)
+
+        boxes = []
+        for contour in contours[:1000]:
+            box, short_side = _mini_box(contour)
+            if short_side < 3:
+                continue
+            if _box_score(prob, box) < self.det_db_box_thresh:
+                continue
+            box, short_side = _mini_box(_unclip(box, self.det_db_unclip_ratio).reshape(-1, 1, 2))
+            if short_side < 5:
+                continue
+            box[:, 0] = np.clip(box[:, 0] / ratio_w, 0, src_w - 1)
+            box[:, 1] = np.clip(box[:, 1] / ratio_h, 0, src_h - 1)
+            if np.linalg.norm(box[0] - box[1]) <= 3 or np.linalg.norm(box[0] - box[3]) <= 3:
+                continue
+            boxes.append(box)
+        return sort_boxes(boxes)
+
+    # ------------------------------------------------------
+    # 각도 분류
+    # ------------------------------------------------------
+    @staticmethod
+    def _resize_norm(crop: np.ndarray, height: int, width: int) -> np.ndarray:
+        """높이 height 로 비율 유지 축소 → [-1, 1] 정규화 → 가로 width 까지 0 패딩 (CHW)"""
+        h, w = crop.shape[:2]
+        resized_w = min(width, max(1, int(math.ceil(height * w / max(h, 1)))))
+        resized = cv2.resize(crop, (resized_w, height)).astype(np.float32)
+        out = np.zeros((3, height, width), dtype=np.float32)
+        out[:, :, :resized_w] = ((resized / 255.0 - 0.5) / 0.5).transpose(2, 0, 1)
+        return out
+
+    def classify(self, crops: Sequence[np.ndarray]) -> list[tuple[str, float]]:
+        if self.cls_session is None:
+            return super().classify(crops)
+        input_name = self.cls_session.get_inputs()[0].name
+        results = []
+        for start in range(0, len(crops), self.rec_batch_size):
+            batch = np.stack([self._resize_norm(c, 48, 192) for c in crops[start:start + self.rec_batch_size]])
+            probs = self.cls_session.run(None, {input_name: batch})[0]
+            for p in probs:
+                idx = int(np.argmax(p))
+                results.append((("0", "180")[idx], float(p[idx])))
+        return results
+
+    # ------------------------------------------------------
+    # 인식 (가로세로 비율이 비슷한 것끼리 묶어서 패딩 낭비를 줄임)
+    # ------------------------------------------------------
+    def _ctc_decode(self, probs: np.ndarray) -> tuple[str, float]:
+        idx = probs.argmax(axis=1)
+        conf = probs.max(axis=1)
+        keep = idx != 0
+        keep[1:] &= idx[1:] != idx[:-1]
+        chars = [self.charset[i] for i in idx[keep] if i < len(self.charset)]
+        return "".join(chars), float(conf[keep].mean()) if keep.any() else 0.0
+
+    def recognize(self, crops: Sequence[np.ndarray]) -> list[tuple[str, float]]:
+        _, img_h, img_w = self.rec_image_shape
+        input_name = self.rec_session.get_inputs()[0].name
+        ratios = [c.shape[1] / max(c.shape[0], 1) for c in crops]
+        order = np.argsort(ratios)
+
+        results: list[tuple[str, float]] = [("", 0.0)] * len(crops)
+        for start in range(0, len(crops), self.rec_batch_size):
+            batch_idx = order[start:start + self.rec_batch_size]
+            max_ratio = max([img_w / img_h] + [ratios[i] for i in batch_idx])
+            width = int(math.ceil(img_h * max_ratio))
+            batch = np.stack([self._resize_norm(crops[i], img_h, width) for i in batch_idx])
+            probs = self.rec_session.run(None, {input_name: batch})[0]
+            for i, p in zip(batch_idx, probs):
+                results[i] = self._ctc_decode(p)
+        return results
@@ -0,0 +1,70 @@
+# ==========================================================
+# paddle_backend.py
+# ----------------------------------------------------------
+# PaddleOCR(PaddlePaddle 추론) 백엔드입니다. (ocr_backend: "paddle", 기본값)
+#
+# - ocr() 는 PaddleOCR.ocr() 를 그대로 호출하므로 결과는 기존과 완전히 같습니다.
+# - detect / classify / recognize 는 PaddleOCR 내부의 단계별 predictor
+#   (text_detector / text_classifier / text_recognizer) 를 직접 사용합니다.
+#   → 여러 장을 한 번에 처리하는 ocr_batch() 에서 인식 단계를 배치로 묶을 수 있습니다.
+# ==========================================================
+
+from typing import Sequence
+
+import numpy as np
+
+from .base import BaseOcrBackend, sort_boxes
+
+
+def _strip_elapse(out):
+    # PaddleOCR 2.x predictor 들은 (결과, 소요시간) 튜플을 돌려줌
+    return out[0] if isinstance(out, tuple) else out
+
+
+class PaddleBackend(BaseOcrBackend):
+    """
+    PaddleOCR 인스턴스를 감싸는 백엔드.
+
+    Parameters
+    ----------
+    lang : str
+        PaddleOCR 언어 코드 ("korean", "en", ...)
+    **kwargs :
+        PaddleOCR(...) 생성자에 그대로 전달할 옵션
+    """
+
+    name = "paddle"
+
+    def __init__(self, lang: str, cls_thresh: float = 0.9, **kwargs):
+        super().__init__(lang, cls_thresh=cls_thresh)
+        # paddleocr import 자체도 무겁기 때문에 실제로 엔진을 만들 때만 import
+        from paddleocr import PaddleOCR
+
+        self.engine = PaddleOCR(lang=lang, **kwargs)
+
+    # ------------------------------------------------------
+    # 단계별 API
+    # ------------------------------------------------------
+    def detect(self, image_bgr: np.ndarray) -> list:
+        boxes = _strip_elapse(self.engine.text_detector(image_bgr))
+        if boxes is None or len(boxes) == 0:
+            return []
+        return sort_boxes(boxes)
+
+    def classify(self, crops: Sequence[np.ndarray]) -> list[tuple[str, float]]:
+        classifier = getattr(self.engine, "text_classifier", None)
+        if classifier is None:
+            # use_angle_cls=False 로 만든 엔진에는 분류기가 없음
+            return super().classify(crops)
+        _, cls_res, _ = classifier([c.copy() for c in crops])
+        return [(str(label), float(score)) for label, score in cls_res]
+
+    def recognize(self, crops: Sequence[np.ndarray]) -> list[tuple[str, float]]:
+        rec_res = _strip_elapse(self.engine.text_recognizer(list(crops)))
+        return [(text, float(conf)) for text, conf in rec_res]
+
+    # ------------------------------------------------------
+    # 한 장 처리는 PaddleOCR 전체 파이프라인을 그대로 사용 (기존 결과와 동일)
+    # ------------------------------------------------------
+    def ocr(self, image_bgr: np.ndarray, cls: bool = True) -> list:
+        return self.engine.ocr(image_bgr, cls=cls)
@@ -0,0 +1,280 @@
+# ==========================================================
+# batch_runner.py
+# ----------------------------------------------------------
+# 디렉터리 / glob 으로 지정한 대량의 이미지를
+# "워커 프로세스 풀"로 병렬 OCR 하는 배치 실행 모듈입니다.
+#
+# 특징
+# ----------------------------------------------------------
+# ✅ 워커 프로세스마다 PaddleOCR 엔진을 딱 한 번만 생성 (initializer)
+#    → 이미지마다 엔진을 새로 만드는 비용이 없음
+# ✅ 결과는 입력 순서 그대로 스트리밍 (Pool.imap)
+# ✅ 종료 시 처리량(images/s)과 이미지당 지연시간 백분위(p50/p90/p99) 보고
+#
+# 사용 예시
+# ----------------------------------------------------------
+# from label_text_recognition.ocr.batch_runner import collect_image_paths, iter_batch_ocr
+# paths = collect_image_paths(["assets/pictures_origin", "archive/**/*.jpg"])
+# for item in iter_batch_ocr(paths, lang="korean", workers=4):
+#     print(item.path, item.message)
+# ==========================================================
+
+import glob
+import multiprocessing as mp
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator
+
+from label_text_recognition.metrics.stage_metrics import percentile
+
+# 배치 모드에서 기본으로 수집하는 이미지 확장자
+DEFAULT_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp", ".tif", ".tiff", ".webp")
+
+
+@dataclass
+class BatchItemResult:
+    """
+    이미지 1장에 대한 배치 처리 결과.
+
+    path       : 입력 이미지 경로
+    results    : run_ocr_on_image 가 돌려준 merged_results
+    message    : 상태 메시지 ("OK | ...", "EMPTY: ...", "ERROR: ...")
+    latency_ms : 워커 안에서 측정한 이미지 읽기 + OCR 소요 시간(ms)
+    """
+
+    path: str
+    results: list[dict] = field(default_factory=list)
+    message: str = ""
+    latency_ms: float = 0.0
+
+
+@dataclass
+class BatchSummary:
+    """
+    배치 실행 전체에 대한 요약 통계.
+    """
+
+    total: int = 0
+    ok: int = 0
+    empty: int = 0
+    errors: int = 0
+    elapsed_sec: float = 0.0
+    latencies_ms: list[float] = field(default_factory=list)
+
+    @property
+    def images_per_sec(self) -> float:
+        if self.elapsed_sec <= 0:
+            return 0.0
+        return self.total / self.elapsed_sec
+
+    def add(self, item: BatchItemResult) -> None:
+        """결과 1건을 집계에 반영합니다. (결과 리스트를 따로 쌓아둘 필요 없음)"""
+        self.total += 1
+        self.latencies_ms.append(item.latency_ms)
+        if item.message.startswith("OK"):
+            self.ok += 1
+        elif item.message.startswith("ERROR"):
+            self.errors += 1
+        else:
+            self.empty += 1
+
+    def percentile(self, q: float) -> float:
+        return percentile(self.latencies_ms, q)
+
+    def format_report(self) -> str:
+        """
+        콘솔에 그대로 출력할 수 있는 요약 문자열을 만듭니다.
+        """
+        lines = [
+            "📊 배치 OCR 요약",
+            f"   - 이미지 수 : {self.total} (OK {self.ok} / EMPTY {self.empty} / ERROR {self.errors})",
+            f"   - 총 소요    : {self.elapsed_sec:.2f}s",
+            f"   - 처리량     : {self.images_per_sec:.2f} images/s",
+        ]
+        if self.latencies_ms:
+            lines.append(
+                "   - 지연시간   : "
+                f"p50={self.percentile(50):.1f}ms, "
+                f"p90={self.percentile(90):.1f}ms, "
+                f"p99={self.percentile(99):.1f}ms, "
+                f"max={max(self.latencies_ms):.1f}ms"
+            )
+        return "\n".join(lines)
+
+
+# ----------------------------------------------------------
+# 1️⃣ 입력 경로 수집
+# ----------------------------------------------------------
+def collect_image_paths(
+    inputs: Iterable[str],
+    extensions: Iterable[str] = DEFAULT_EXTENSIONS,
+    recursive: bool = True,
+) -> list[str]:
+    """
+    파일 / 디렉터리 / glob 패턴이 섞인 입력을 이미지 경로 리스트로 펼칩니다.
+
+    - 파일        → 그대로 사용
+    - 디렉터리    → 확장자가 맞는 파일만 수집 (recursive=True 면 하위 폴더 포함)
+    - glob 패턴   → glob.glob(..., recursive=True) 로 확장
+
+    결과는 중복을 제거하고, 입력 순서 → 경로 이름 순으로 정렬해서 돌려줍니다.
+    """
+    exts = tuple(e.lower() for e in extensions)
+    seen: set[str] = set()
+    paths: list[str] = []
+
+    def _add(p: str) -> None:
+        if p.lower().endswith(exts) and p not in seen:
+            seen.add(p)
+            paths.append(p)
+
+    for item in inputs:
+        if os.path.isdir(item):
+            found = []
+            if recursive:
+                for root, _, files in os.walk(item):
+                    found.extend(os.path.join(root, name) for name in files)
+            else:
+                found = [
+                    os.path.join(item, name)
+                    for name in os.listdir(item)
+                    if os.path.isfile(os.path.join(item, name))
+                ]
+            for p in sorted(found):
+                _add(p)
+        elif os.path.isfile(item):
+            _add(item)
+        else:
+            for p in sorted(glob.glob(item, recursive=True)):
+                if os.path.isfile(p):
+                    _add(p)
+
+    return paths
+
+
+# ----------------------------------------------------------
+# 2️⃣ 워커 프로세스 쪽 코드
+# ----------------------------------------------------------
+# 워커 프로세스마다 한 번만 채워지는 전역 상태
+_WORKER_ENGINE = None
+_WORKER_OPTIONS: dict = {}
+
+
+def _init_worker(
+    lang: str,
+    conf_threshold: float,
+    cls_enable: bool,
+    warmup: bool,
+    backend: str = "paddle",
+    backend_options: dict | None = None,
+    preprocess_cfg: dict | None = None,
+) -> None:
+    """
+    Pool initializer: 워커 프로세스가 뜰 때 한 번만 호출되어 엔진을 생성합니다.
+    warmup=True 면 첫 이미지가 콜드 스타트 지연을 떠안지 않도록 미리 1회 추론합니다.
+    preprocess_cfg 는 전처리 섹션만 담은 dict 입니다. (예: {"downscale": {...}, "tiling": {...}})
+    """
+    global _WORKER_ENGINE, _WORKER_OPTIONS
+
+    from label_text_recognition.ocr.backends import create_backend
+    from label_text_recognition.ocr.downscale import AdaptiveDownscaler
+    from label_text_recognition.ocr.tiling import TiledOcr
+    from label_text_recognition.ocr.engine_registry import OcrEngineRegistry
+
+    def factory(lang_: str, **kwargs):
+        return create_backend(backend, lang_, **{**(backend_options or {}), **kwargs})
+
+    registry = OcrEngineRegistry([lang], factory=factory, warmup=warmup, warmup_cls=cls_enable)
+    _WORKER_ENGINE = registry.get()
+    _WORKER_OPTIONS = {
+        "conf_threshold": conf_threshold,
+        "cls_enable": cls_enable,
+        "downscale": AdaptiveDownscaler.from_config(preprocess_cfg or {}),
+        "tiling": TiledOcr.from_config(preprocess_cfg or {}, engine_factory=registry.create_engine),
+    }
+
+
+def _process_one(path: str) -> BatchItemResult:
+    """
+    워커 프로세스에서 이미지 1장을 읽어서 OCR 합니다.
+    시각화 이미지는 프로세스 간 전송 비용이 크므로 만들지도, 돌려주지도 않습니다. (render=False)
+    """
+    import cv2
+
+    from label_text_recognition.ocr.ocr_runner import run_ocr_on_image
+
+    t0 = time.perf_counter()
+    img = cv2.imread(path)
+    if img is None:
+        latency = (time.perf_counter() - t0) * 1000.0
+        return BatchItemResult(path, [], "ERROR: 이미지 파일을 읽을 수 없습니다", latency)
+
+    results, _, message = run_ocr_on_image(
+        img,
+        _WORKER_ENGINE,
+        _WORKER_OPTIONS["conf_threshold"],
+        _WORKER_OPTIONS["cls_enable"],
+        render=False,
+        downscale=_WORKER_OPTIONS["downscale"],
+        tiling=_WORKER_OPTIONS["tiling"],
+    )
+    latency = (time.perf_counter() - t0) * 1000.0
+    return BatchItemResult(path, results, message, latency)
+
+
+# ----------------------------------------------------------
+# 3️⃣ 메인 프로세스 쪽 API
+# ----------------------------------------------------------
+def iter_batch_ocr(
+    paths: list[str],
+    lang: str,
+    workers: int = 2,
+    conf_threshold: float = 0.5,
+    cls_enable: bool = True,
+    chunksize: int = 1,
+    start_method: str = "spawn",
+    warmup: bool = True,
+    backend: str = "paddle",
+    backend_options: dict | None = None,
+    preprocess_cfg: dict | None = None,
+) -> Iterator[BatchItemResult]:
+    """
+    워커 프로세스 풀로 OCR 을 돌리고, 결과를 입력 순서대로 하나씩 yield 합니다.
+
+    Parameters
+    ----------
+    paths : list[str]
+        처리할 이미지 경로 (collect_image_paths 결과)
+    lang : str
+        사용할 PaddleOCR 언어 (보통 ocr_langs[0])
+    workers : int
+        워커 프로세스 개수. 각 워커가 엔진을 하나씩 상주시킵니다.
+    chunksize : int
+        Pool.imap 에 넘기는 chunk 크기. 이미지가 아주 많으면 4~16 정도가 유리합니다.
+    start_method : str
+        multiprocessing 시작 방식. PaddlePaddle 은 fork 후 재사용이 불안정해서
+        기본값은 "spawn" 입니다.
+    warmup : bool
+        워커 엔진 생성 직후 합성 이미지로 1회 추론해서
+        첫 이미지 지연시간이 백분위 통계를 왜곡하지 않게 합니다.
+    backend / backend_options : str / dict | None
+        워커가 만들 OCR 백엔드 ("paddle" / "onnx") 와 생성 옵션
+        (ocr_config.yaml 의 ocr_backend / <backend>_backend 섹션)
+    preprocess_cfg : dict | None
+        워커에서 사용할 전처리 설정 (ocr_config.yaml 의 downscale / tiling 섹션)
+        프로세스 간 전달을 위해 필요한 섹션만 담은 dict 를 넘깁니다.
+    """
+    if not paths:
+        return
+
+    ctx = mp.get_context(start_method)
+    workers = max(1, min(workers, len(paths)))
+    with ctx.Pool(
+        processes=workers,
+        initializer=_init_worker,
+        initargs=(lang, conf_threshold, cls_enable, warmup, backend, backend_options, preprocess_cfg),
+    ) as pool:
+        # imap 은 완료 순서와 상관없이 "입력 순서"대로 결과를 돌려줍니다.
+        for item in pool.imap(_process_one, paths, chunksize=max(1, chunksize)):
+            yield item
@@ -0,0 +1,197 @@
+# ==========================================================
+# cascade.py
+# ----------------------------------------------------------
+# 신뢰도가 낮은 글자 영역만 보조 언어 엔진으로 "다시 인식"하는
+# 다국어 캐스케이드 모듈입니다.
+#
+# 배경
+# ----------------------------------------------------------
+# - ocr_langs 에 korean / en 을 모두 적어도 실제로는 첫 번째 엔진만 실행됩니다.
+# - 그런데 부품 번호처럼 영문/숫자 위주의 줄은 en 엔진이 더 잘 읽는 경우가 있습니다.
+# - 모든 엔진으로 프레임 전체를 돌리면 검출(det)까지 언어 수만큼 반복되어 너무 느립니다.
+#
+# 동작 방식
+# ----------------------------------------------------------
+# ✅ 메인 엔진으로 한 번 OCR (검출 + 인식)
+# ✅ confidence < conf_threshold 인 영역만 잘라서 보조 엔진의 recognize() 로 재인식
+#     (검출 없음, 잘라낸 영역을 한 번에 배치로 처리)
+# ✅ 보조 엔진 결과가 min_gain 이상 높을 때만 교체 (더 나은 읽기 유지)
+# ✅ 보조 엔진은 처음 필요할 때 생성 (또는 preload 로 미리 백그라운드 로딩)
+# ✅ 여러 스레드(예: 멀티 카메라 engine_workers)가 하나의 캐스케이드를 같이 써도 됨
+#    - 보조 엔진이 스레드 안전하지 않으면(thread_safe=False, 예: paddle) 언어별 잠금으로 호출을 직렬화
+#    - 스레드 안전한 백엔드(예: onnx)는 잠금 없이 동시에 호출
+#
+# 사용 예시
+# ----------------------------------------------------------
+# registry = build_engine_registry(cfg)
+# cascade = CascadeRecognizer.from_config(cfg, registry)   # 비활성화면 None
+# results, vis, msg = run_ocr_on_image(frame, registry.get(), cascade=cascade)
+# print(cascade.format_stats())
+# ==========================================================
+
+import threading
+from typing import Any, Iterable
+
+from label_text_recognition.metrics.stage_metrics import timed
+from label_text_recognition.ocr.backends.base import crop_text_region
+
+
+class CascadeRecognizer:
+    """
+    메인 엔진 결과 중 신뢰도가 낮은 영역을 보조 언어 엔진으로 재인식합니다.
+
+    Parameters
+    ----------
+    registry : OcrEngineRegistry
+        보조 언어 엔진을 꺼내 올 레지스트리 (registry.get(lang))
+    langs : Iterable[str]
+        재인식에 사용할 보조 언어 (앞에서부터 순서대로 시도)
+    conf_threshold : float
+        이 값보다 낮은 영역만 재인식
+    min_gain : float
+        보조 엔진의 신뢰도가 기존보다 이만큼 이상 높아야 교체
+    """
+
+    def __init__(
+        self,
+        registry,
+        langs: Iterable[str],
+        conf_threshold: float = 0.8,
+        min_gain: float = 0.05,
+    ):
+        self.registry = registry
+        self.langs = [lang for lang in langs if lang != registry.main_lang]
+        self.conf_threshold = float(conf_threshold)
+        self.min_gain = float(min_gain)
+
+        self._stats_lock = threading.Lock()
+        self.frames = 0
+        self.regions_checked = 0
+        self.regions_retried = 0
+        self.regions_replaced = 0
+        self._unsupported: set[str] = set()
+        # 스레드 안전하지 않은 보조 엔진의 호출을 직렬화하는 언어별 잠금
+        self._engine_locks: dict[str, threading.Lock] = {}
+
+    @classmethod
+    def from_config(cls, cfg, registry) -> "CascadeRecognizer | None":
+        """
+        cascade.enabled 가 true 이고 보조 언어가 있을 때만 객체를 만듭니다.
+
+        cascade:
+          enabled: false
+          langs: null            # null → ocr_langs[1:]
+          conf_threshold: 0.8
+          min_gain: 0.05
+          preload: true          # true → 보조 엔진을 백그라운드에서 미리 로딩
+        """
+        cascade_cfg = cfg.get("cascade", {}) or {}
+        if not cascade_cfg.get("enabled", False):
+            return None
+
+        langs = cascade_cfg.get("langs") or list(registry.langs[1:])
+        cascade = cls(
+            registry,
+            langs,
+            conf_threshold=cascade_cfg.get("conf_threshold", 0.8),
+            min_gain=cascade_cfg.get("min_gain", 0.05),
+        )
+        if not cascade.langs:
+            print("⚠️ cascade.enabled=true 이지만 보조 언어가 없습니다. (ocr_langs / cascade.langs 확인)")
+            return None
+
+        if cascade_cfg.get("preload", True):
+            registry.preload(cascade.langs, background=True)
+        return cascade
+
+    # ------------------------------------------------------
+    # 재인식
+    # ------------------------------------------------------
+    def _recognize(self, lang: str, crops: list) -> list[tuple[str, float]] | None:
+        engine = self.registry.get(lang)
+        recognize = getattr(engine, "recognize", None)
+        if recognize is None:
+            # recognize() 가 없는 엔진(예: PaddleOCR 원본 객체)은 캐스케이드에 쓸 수 없음
+            with self._stats_lock:
+                first = lang not in self._unsupported
+                self._unsupported.add(lang)
+            if first:
+                print(f"⚠️ '{lang}' 엔진이 recognize() 를 지원하지 않아 캐스케이드에서 제외합니다.")
+            return None
+        if getattr(engine, "thread_safe", False):
+            return recognize(crops)
+        with self._stats_lock:
+            lock = self._engine_locks.setdefault(lang, threading.Lock())
+        with lock:
+            return recognize(crops)
+
+    def refine(self, image_bgr, ocr_result: list) -> list:
+        """
+        ocr() 결과([[ [box, (text, conf)], ... ]])에서 신뢰도가 낮은 영역을
+        보조 엔진으로 재인식한 새 결과를 돌려줍니다. (원본 리스트는 수정하지 않음)
+        """
+        if not ocr_result or not ocr_result[0] or not self.langs:
+            return ocr_result
+
+        page = [[box, (text, conf)] for box, (text, conf) in ocr_result[0]]
+        low = [i for i, (_, (_, conf)) in enumerate(page) if _to_float(conf) < self.conf_threshold]
+
+        retried = replaced = 0
+        if low:
+            with timed("cascade"):
+                crops = [crop_text_region(image_bgr, page[i][0]) for i in low]
+                for lang in self.langs:
+                    if lang in self._unsupported or not low:
+                        continue
+                    readings = self._recognize(lang, crops)
+                    if readings is None:
+                        continue
+                    retried += len(low)
+
+                    still_low, still_crops = [], []
+                    for i, crop, (text, conf) in zip(low, crops, readings):
+                        old_conf = _to_float(page[i][1][1])
+                        if text and float(conf) >= old_conf + self.min_gain:
+                            page[i] = [page[i][0], (text, float(conf))]
+                            replaced += 1
+                        if _to_float(page[i][1][1]) < self.conf_threshold:
+                            still_low.append(i)
+                            still_crops.append(crop)
+                    # 다음 보조 언어는 여전히 낮은 영역만 시도
+                    low, crops = still_low, still_crops
+
+        with self._stats_lock:
+            self.frames += 1
+            self.regions_checked += len(page)
+            self.regions_retried += retried
+            self.regions_replaced += replaced
+        return [page] + list(ocr_result[1:])
+
+    # ------------------------------------------------------
+    # 통계
+    # ------------------------------------------------------
+    def stats(self) -> dict[str, Any]:
+        with self._stats_lock:
+            return {
+                "langs": list(self.langs),
+                "frames": self.frames,
+                "regions_checked": self.regions_checked,
+                "regions_retried": self.regions_retried,
+                "regions_replaced": self.regions_replaced,
+            }
+
+    def format_stats(self) -> str:
+        s = self.stats()
+        retry_rate = s["regions_retried"] / s["regions_checked"] * 100 if s["regions_checked"] else 0.0
+        return (
+            f"🔁 다국어 캐스케이드 ({', '.join(s['langs'])}): "
+            f"frames={s['frames']}, 재인식 {s['regions_retried']}/{s['regions_checked']} 영역 "
+            f"({retry_rate:.1f}%), 교체 {s['regions_replaced']}"
+        )
+
+
+def _to_float(value) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
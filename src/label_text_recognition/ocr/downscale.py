@@ -0,0 +1,235 @@
+# ==========================================================
+# downscale.py
+# ----------------------------------------------------------
+# 검출(det)은 축소한 이미지에서, 인식(rec)은 원본 해상도에서 하는
+# 적응형 축소 전처리 모듈입니다.
+#
+# 배경
+# ----------------------------------------------------------
+# - run_ocr_on_image 는 글자 크기와 상관없이 프레임 전체 해상도를 엔진에 넘깁니다.
+# - 라벨 글자는 큰 편이라 1280x720 (보관 스캔은 12MP) 해상도의 검출은
+#   연산 대부분이 낭비됩니다.
+# - 그렇다고 이미지 전체를 줄여서 OCR 하면 작은 글자의 인식 정확도가 떨어집니다.
+#
+# 동작 방식
+# ----------------------------------------------------------
+# ✅ 긴 변이 target_long_side 가 되도록 축소 (이미 작으면 그대로)
+# ✅ target_text_height 를 지정하면, 직전 결과들의 글자 높이(중앙값, 지수 평균)를 보고
+#    글자 높이가 target_text_height px 정도가 되도록 배율을 다시 고름
+#    (단, 긴 변이 min_long_side 보다 작아지지는 않음)
+# ✅ 글자 높이 기준으로 줄였는데 아무것도 검출되지 않으면 (큰 글자 라벨 다음에 작은 글자 라벨)
+#    추정값을 버리고 target_long_side 기준으로 한 번 더 시도
+#    → 추정값이 너무 커서 계속 아무것도 못 찾고 그대로 굳어 버리는 일이 없음
+# ✅ 검출 박스를 원본 좌표로 되돌린 뒤, 원본 해상도에서 잘라서 분류/인식
+#    (recognize_boxes 를 지원하는 백엔드: backends.PaddleBackend / OnnxBackend)
+# ✅ recognize_boxes 가 없는 엔진(PaddleOCR 원본 객체 등)은 축소 이미지 전체를
+#    ocr() 하고 박스만 원본 좌표로 되돌림 (인식도 축소 해상도)
+#
+# 사용 예시
+# ----------------------------------------------------------
+# downscale = AdaptiveDownscaler.from_config(cfg)        # 비활성화면 None
+# ocr_result = downscale.ocr(engine, frame, cls=True)     # engine.ocr(frame) 과 같은 모양
+# results, vis, msg = run_ocr_on_image(frame, engine, downscale=downscale)
+# ==========================================================
+
+import threading
+
+import cv2
+import numpy as np
+
+from label_text_recognition.metrics.stage_metrics import timed
+
+
+class AdaptiveDownscaler:
+    """
+    검출 입력을 줄이고, 결과 박스를 원본 좌표로 되돌립니다.
+
+    Parameters
+    ----------
+    target_long_side : int
+        글자 높이 정보가 없을 때 검출 입력의 긴 변 길이(px)
+    target_text_height : float | None
+        축소 후 글자 높이 목표(px). None 이면 target_long_side 만 사용
+    min_long_side : int
+        target_text_height 기준으로 줄일 때도 긴 변은 이보다 작아지지 않음
+    ema : float
+        관측한 글자 높이의 지수 평균 가중치 (0~1, 클수록 최근 값 반영이 빠름)
+    """
+
+    def __init__(
+        self,
+        target_long_side: int = 960,
+        target_text_height: float | None = None,
+        min_long_side: int = 320,
+        ema: float = 0.3,
+    ):
+        self.target_long_side = max(32, int(target_long_side))
+        self.target_text_height = float(target_text_height) if target_text_height else None
+        self.min_long_side = max(32, int(min_long_side))
+        self.ema = min(1.0, max(0.0, float(ema)))
+
+        self._lock = threading.Lock()
+        self._text_height: float | None = None  # 원본 좌표 기준 글자 높이 추정값
+        self._no_stage_api: set[str] = set()
+
+    @classmethod
+    def from_config(cls, cfg) -> "AdaptiveDownscaler | None":
+        """
+        downscale.enabled 가 true 일 때만 객체를 만듭니다.
+
+        downscale:
+          enabled: false
+          target_long_side: 960
+          target_text_height: null
+          min_long_side: 320
+          ema: 0.3
+        """
+        ds_cfg = cfg.get("downscale", {}) or {}
+        if not ds_cfg.get("enabled", False):
+            return None
+        return cls(
+            target_long_side=ds_cfg.get("target_long_side", 960),
+            target_text_height=ds_cfg.get("target_text_height"),
+            min_long_side=ds_cfg.get("min_long_side", 320),
+            ema=ds_cfg.get("ema", 0.3),
+        )
+
+    @property
+    def key(self) -> tuple:
+        """결과 캐시 파라미터로 쓰는 값 (설정이 같으면 같은 키)"""
+        return (self.target_long_side, self.target_text_height, self.min_long_side)
+
+    @property
+    def text_height(self) -> float | None:
+        return self._text_height
+
+    # ------------------------------------------------------
+    # 배율 결정
+    # ------------------------------------------------------
+    def scale_for(self, frame_w: int, frame_h: int) -> float:
+        """원본 → 검출 입력 배율 (1.0 이하, 1.0 이면 축소하지 않음)"""
+        long_side = max(frame_w, frame_h, 1)
+        text_height = self._text_height
+        if self.target_text_height and text_height:
+            scale = self.target_text_height / text_height
+            scale = max(scale, self.min_long_side / long_side)
+        else:
+            scale = self.target_long_side / long_side
+        return min(1.0, scale)
+
+    def default_scale_for(self, frame_w: int, frame_h: int) -> float:
+        """글자 높이 추정값 없이 target_long_side 만 기준으로 한 배율"""
+        return min(1.0, self.target_long_side / max(frame_w, frame_h, 1))
+
+    def reset(self) -> None:
+        """글자 높이 추정값을 버림 (다음 프레임은 target_long_side 기준)"""
+        with self._lock:
+            self._text_height = None
+
+    def _observe(self, page) -> None:
+        heights = [_box_height(box) for box, _ in page]
+        heights = [h for h in heights if h > 0]
+        if not heights:
+            return
+        median = float(np.median(heights))
+        with self._lock:
+            if self._text_height is None:
+                self._text_height = median
+            else:
+                self._text_height += self.ema * (median - self._text_height)
+
+    # ------------------------------------------------------
+    # OCR
+    # ------------------------------------------------------
+    def bind(self, engine) -> "DownscaledEngine":
+        """engine.ocr() 대신 쓸 수 있는 래퍼 (roi.RoiSet 처럼 ocr() 만 부르는 곳에 넘길 때)"""
+        return DownscaledEngine(self, engine)
+
+    def ocr(self, engine, image_bgr: np.ndarray, cls: bool = True) -> list:
+        """
+        축소 이미지에서 검출 → 원본 해상도에서 인식한
+        [[ [box, (text, conf)], ... ]] 를 돌려줍니다. (box 는 원본 좌표)
+        """
+        frame_h, frame_w = image_bgr.shape[:2]
+        scale = self.scale_for(frame_w, frame_h)
+        result = self._ocr_at(engine, image_bgr, scale, cls)
+
+        if result and result[0]:
+            self._observe(result[0])
+        elif self._text_height is not None:
+            # 글자 높이 추정값 때문에 너무 줄여서 못 찾았을 수 있음
+            # → 추정값을 버리고(다음 프레임도 기본 배율) 기본 배율이 더 크면 한 번 더 시도
+            self.reset()
+            default_scale = self.default_scale_for(frame_w, frame_h)
+            if default_scale > scale:
+                result = self._ocr_at(engine, image_bgr, default_scale, cls)
+                if result and result[0]:
+                    self._observe(result[0])
+        return result
+
+    def _ocr_at(self, engine, image_bgr: np.ndarray, scale: float, cls: bool) -> list:
+        """scale 배율로 검출하고 원본 해상도에서 인식 (box 는 원본 좌표)"""
+        frame_h, frame_w = image_bgr.shape[:2]
+        if scale >= 1.0:
+            result = engine.ocr(image_bgr, cls=cls)
+        else:
+            with timed("downscale"):
+                small = cv2.resize(
+                    image_bgr,
+                    (max(1, round(frame_w * scale)), max(1, round(frame_h * scale))),
+                    interpolation=cv2.INTER_AREA,
+                )
+            # 실제 배율 (반올림된 크기 기준)
+            sx = frame_w / small.shape[1]
+            sy = frame_h / small.shape[0]
+
+            detect = getattr(engine, "detect", None)
+            recognize_boxes = getattr(engine, "recognize_boxes", None)
+            if detect is not None and recognize_boxes is not None:
+                with timed("detect"):
+                    boxes = detect(small)
+                full_boxes = [_rescale_box(box, sx, sy, frame_w, frame_h) for box in boxes]
+                result = recognize_boxes([image_bgr], [full_boxes], cls=cls)[0]
+            else:
+                name = type(engine).__name__
+                if name not in self._no_stage_api:
+                    self._no_stage_api.add(name)
+                    print(f"⚠️ {name} 는 recognize_boxes() 를 지원하지 않아 축소 이미지에서 인식까지 수행합니다.")
+                result = engine.ocr(small, cls=cls)
+                if result and result[0]:
+                    result = [[
+                        [_rescale_box(box, sx, sy, frame_w, frame_h), rec]
+                        for box, rec in result[0]
+                    ]] + list(result[1:])
+        return result
+
+
+class DownscaledEngine:
+    """ocr(image, cls=...) 호출을 AdaptiveDownscaler.ocr 로 넘기는 얇은 래퍼"""
+
+    __slots__ = ("downscaler", "engine")
+
+    def __init__(self, downscaler: AdaptiveDownscaler, engine):
+        self.downscaler = downscaler
+        self.engine = engine
+
+    @property
+    def thread_safe(self) -> bool:
+        return getattr(self.engine, "thread_safe", False)
+
+    def ocr(self, image_bgr: np.ndarray, cls: bool = True) -> list:
+        return self.downscaler.ocr(self.engine, image_bgr, cls=cls)
+
+
+def _rescale_box(box, sx: float, sy: float, frame_w: int, frame_h: int) -> list:
+    return [
+        [min(max(float(p[0]) * sx, 0.0), frame_w - 1.0), min(max(float(p[1]) * sy, 0.0), frame_h - 1.0)]
+        for p in box
+    ]
+
+
+def _box_height(box) -> float:
+    pts = np.asarray(box, dtype=np.float32)
+    if pts.shape[0] < 4:
+        return 0.0
+    return float(min(np.linalg.norm(pts[0] - pts[3]), np.linalg.norm(pts[1] - pts[2])))
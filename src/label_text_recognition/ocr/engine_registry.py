@@ -0,0 +1,275 @@
+# ==========================================================
+# engine_registry.py
+# ----------------------------------------------------------
+# 언어별 OCR 엔진을 "필요할 때" 만들어서 보관하는 레지스트리입니다.
+#
+# 배경
+# ----------------------------------------------------------
+# - build_ocr_engines() 는 ocr_langs 의 모든 언어 엔진을 시작 시점에
+#   순서대로 생성합니다.
+# - 그런데 카메라 루프 / 이미지 데모는 ocr_langs[0] 만 사용하므로
+#   나머지 엔진의 로딩 시간과 상주 메모리는 그대로 낭비됩니다.
+#
+# 동작 방식
+# ----------------------------------------------------------
+# ✅ lazy  : registry.get(lang) 가 처음 불릴 때 그 언어 엔진만 생성
+# ✅ preload: registry.preload(...) 로 여러 언어를 백그라운드 스레드에서
+#            병렬로 미리 생성 (카메라 열기 등 다른 초기화와 겹쳐서 진행)
+# ✅ warmup: 생성 직후 작은 합성 이미지로 추론을 1회 돌려서
+#            첫 실제 캡처의 콜드 스타트 지연을 미리 소모
+#
+# 사용 예시
+# ----------------------------------------------------------
+# from label_text_recognition.ocr.engine_registry import build_engine_registry
+# registry = build_engine_registry(cfg)
+# registry.preload(background=True)   # (선택) 백그라운드 로딩 시작
+# main_engine = registry.get()        # 메인 언어(ocr_langs[0]) 엔진
+# ==========================================================
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Iterable
+
+from label_text_recognition.ocr.backends import backend_factory_from_config, create_backend
+
+
+def create_paddle_engine(lang: str, **kwargs) -> Any:
+    """
+    기본 엔진 팩토리: PaddleOCR 백엔드(backends.PaddleBackend)를 생성합니다.
+    paddleocr import 자체도 무겁기 때문에 실제로 필요할 때만 import 합니다.
+    """
+    return create_backend("paddle", lang, **kwargs)
+
+
+def make_warmup_image(width: int = 320, height: int = 64):
+    """
+    워밍업용 합성 이미지(BGR)를 만듭니다.
+    흰 바탕에 검은 글자를 써서 det / cls / rec 단계가 모두 한 번씩 돌도록 합니다.
+    """
+    import cv2
+    import numpy as np
+
+    img = np.full((height, width, 3), 255, dtype=np.uint8)
+    cv2.putText(
+        img,
+        "WARMUP 0123",
+        (8, int(height * 0.7)),
+        cv2.FONT_HERSHEY_SIMPLEX,
+        max(0.5, height / 64.0),
+        (0, 0, 0),
+        2,
+        cv2.LINE_AA,
+    )
+    return img
+
+
+def warmup_engine(engine: Any, cls_enable: bool = True, size: tuple[int, int] = (320, 64)) -> float:
+    """
+    엔진에 합성 이미지를 한 번 통과시키고, 걸린 시간(초)을 돌려줍니다.
+    워밍업 실패는 치명적이지 않으므로 경고만 출력합니다.
+    """
+    t0 = time.perf_counter()
+    try:
+        engine.ocr(make_warmup_image(*size), cls=cls_enable)
+    except Exception as e:
+        print(f"⚠️ OCR 엔진 워밍업 실패 (무시하고 계속 진행): {e}")
+    return time.perf_counter() - t0
+
+
+class OcrEngineRegistry:
+    """
+    언어 코드 → OCR 엔진을 지연 생성/보관하는 레지스트리.
+
+    - get(lang) 은 스레드 안전하며, 같은 언어를 여러 스레드가 동시에 요청해도
+      엔진은 한 번만 만들어집니다.
+    - registry["korean"] / "korean" in registry 처럼
+      build_ocr_engines() 가 돌려주던 dict 와 비슷하게 쓸 수 있습니다.
+    """
+
+    def __init__(
+        self,
+        lang_list: Iterable[str],
+        factory: Callable[..., Any] | None = None,
+        warmup: bool = False,
+        warmup_cls: bool = True,
+        warmup_size: tuple[int, int] = (320, 64),
+        max_parallel: int = 2,
+        engine_kwargs: dict | None = None,
+    ):
+        self.langs: list[str] = list(lang_list)
+        if not self.langs:
+            raise ValueError("OcrEngineRegistry 에는 최소 한 개의 언어가 필요합니다.")
+
+        self._factory = factory or create_paddle_engine
+        self._warmup = warmup
+        self._warmup_cls = warmup_cls
+        self._warmup_size = tuple(warmup_size)
+        self._engine_kwargs = dict(engine_kwargs or {})
+        self._max_parallel = max(1, int(max_parallel))
+
+        self._engines: dict[str, Any] = {}
+        self._lang_locks: dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        self._futures: dict[str, Future] = {}
+
+    # ------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------
+    @property
+    def main_lang(self) -> str:
+        return self.langs[0]
+
+    def get(self, lang: str | None = None) -> Any:
+        """
+        언어 엔진을 돌려줍니다. 아직 없으면 이 자리에서 생성합니다.
+        (preload 중인 언어라면 백그라운드 생성이 끝날 때까지 기다립니다.)
+        """
+        lang = lang or self.main_lang
+
+        engine = self._engines.get(lang)
+        if engine is not None:
+            return engine
+
+        with self._lock:
+            lang_lock = self._lang_locks.setdefault(lang, threading.Lock())
+
+        with lang_lock:
+            engine = self._engines.get(lang)
+            if engine is None:
+                engine = self._build(lang)
+                self._engines[lang] = engine
+        return engine
+
+    def create_engine(self, lang: str | None = None) -> Any:
+        """
+        레지스트리에 등록하지 않는 새 엔진을 하나 더 만듭니다.
+        (스레드마다 엔진이 따로 필요한 경우 — 예: tiling.TiledOcr 의 타일 워커)
+        """
+        return self._build(lang or self.main_lang)
+
+    def is_loaded(self, lang: str) -> bool:
+        return lang in self._engines
+
+    def loaded_langs(self) -> list[str]:
+        return [lang for lang in self.langs if lang in self._engines]
+
+    def __getitem__(self, lang: str) -> Any:
+        return self.get(lang)
+
+    def __contains__(self, lang: object) -> bool:
+        return lang in self.langs
+
+    def keys(self) -> list[str]:
+        return list(self.langs)
+
+    # ------------------------------------------------------
+    # 생성 / 미리 로딩
+    # ------------------------------------------------------
+    def _build(self, lang: str) -> Any:
+        t0 = time.perf_counter()
+        engine = self._factory(lang, **self._engine_kwargs)
+        load_sec = time.perf_counter() - t0
+
+        backend = getattr(engine, "name", "")
+        msg = f"🧠 OCR 엔진 로드 완료: {lang}{f' [{backend}]' if backend else ''} ({load_sec:.2f}s"
+        if self._warmup:
+            warm_sec = warmup_engine(engine, self._warmup_cls, self._warmup_size)
+            msg += f", warmup {warm_sec:.2f}s"
+        print(msg + ")")
+        return engine
+
+    def preload(
+        self,
+        langs: Iterable[str] | None = None,
+        background: bool = True,
+    ) -> list[Future]:
+        """
+        여러 언어 엔진을 스레드 풀에서 병렬로 미리 생성합니다.
+
+        Parameters
+        ----------
+        langs : Iterable[str] | None
+            미리 만들 언어 목록. None 이면 등록된 모든 언어.
+        background : bool
+            True  → 바로 반환 (생성은 백그라운드에서 진행, get() 이 필요 시 대기)
+            False → 모든 엔진 생성이 끝날 때까지 기다린 뒤 반환
+
+        Returns
+        -------
+        list[Future]
+            각 언어 생성 작업의 Future (예외 확인용)
+        """
+        targets = [lang for lang in (langs or self.langs) if lang not in self._engines]
+
+        futures = []
+        with self._lock:
+            if targets and self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_parallel,
+                    thread_name_prefix="ocr-engine-preload",
+                )
+            for lang in targets:
+                fut = self._futures.get(lang)
+                if fut is None:
+                    fut = self._executor.submit(self.get, lang)
+                    self._futures[lang] = fut
+                futures.append(fut)
+
+        if not background:
+            self.wait()
+        return futures
+
+    def wait(self, timeout: float | None = None) -> None:
+        """
+        진행 중인 preload 작업이 모두 끝날 때까지 기다립니다.
+        생성 중 발생한 예외는 경고로만 출력합니다. (해당 언어는 get() 시 재시도)
+        """
+        with self._lock:
+            pending = list(self._futures.items())
+
+        for lang, fut in pending:
+            try:
+                fut.result(timeout=timeout)
+            except Exception as e:
+                print(f"⚠️ OCR 엔진 미리 로딩 실패: {lang} ({e})")
+                with self._lock:
+                    if self._futures.get(lang) is fut:
+                        del self._futures[lang]
+
+    def shutdown(self) -> None:
+        """
+        preload 용 스레드 풀을 정리합니다. (이미 만든 엔진은 그대로 유지)
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+def build_engine_registry(cfg, factory: Callable[..., Any] | None = None) -> OcrEngineRegistry:
+    """
+    ocr_config.yaml 의 ocr_langs / ocr_backend / engine 섹션으로 레지스트리를 구성합니다.
+    factory 를 주지 않으면 ocr_backend ("paddle" / "onnx") 에 맞는 백엔드를 생성합니다.
+
+    engine:
+      preload: false        # true → 모든 ocr_langs 를 백그라운드에서 병렬 로딩
+      max_parallel: 2       # preload 시 동시에 생성할 엔진 수
+      warmup: true          # 생성 직후 합성 이미지로 1회 추론
+      warmup_size: [320, 64]
+    """
+    engine_cfg = cfg.get("engine", {}) or {}
+    registry = OcrEngineRegistry(
+        cfg.get("ocr_langs", ["en"]) or ["en"],
+        factory=factory or backend_factory_from_config(cfg),
+        warmup=engine_cfg.get("warmup", False),
+        warmup_cls=cfg.get("ocr_cls_enable", True),
+        warmup_size=tuple(engine_cfg.get("warmup_size", (320, 64))),
+        max_parallel=engine_cfg.get("max_parallel", 2),
+    )
+
+    if engine_cfg.get("preload", False):
+        registry.preload(background=True)
+
+    return registry
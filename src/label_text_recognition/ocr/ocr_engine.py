@@ -1,19 +1,26 @@
 # ==========================================================
-# 여러 언어를 한 번에 사용할 수 있도록 PaddleOCR 엔진을
+# 여러 언어를 한 번에 사용할 수 있도록 OCR 엔진(백엔드)을
 # 언어별로 초기화해서 dict로 반환하는 모듈입니다.
-# 예) {"en": <PaddleOCR>, "korean": <PaddleOCR>}
+# 예) {"en": <PaddleBackend>, "korean": <PaddleBackend>}
+#
+# 참고: 모든 언어를 시작 시점에 한꺼번에 만들 필요가 없다면
+#       engine_registry.OcrEngineRegistry (지연 생성 / 병렬 preload / warmup) 를 사용합니다.
 # ==========================================================
 
-from paddleocr import PaddleOCR
+from label_text_recognition.ocr.backends import OcrBackend, create_backend
 
 
-def build_ocr_engines(lang_list: list[str]) -> dict[str, PaddleOCR]:
+def build_ocr_engines(lang_list: list[str], backend: str = "paddle", **options) -> "dict[str, OcrBackend]":
     """
-    주어진 언어 목록을 바탕으로 PaddleOCR 엔진을 여러 개 생성합니다.
+    주어진 언어 목록을 바탕으로 OCR 엔진을 여러 개 생성합니다.
     :param lang_list: ["en", "korean"] 이런 식의 언어코드 리스트
+    :param backend: "paddle" (PaddleOCR) 또는 "onnx" (ONNX Runtime)
+    :param options: 백엔드 생성 옵션 (ocr_config.yaml 의 <backend>_backend 섹션)
     :return: {"en": ocr_en, "korean": ocr_kr}
     """
-    engines: dict[str, PaddleOCR] = {}
+    # 각 백엔드의 무거운 import(paddleocr / onnxruntime)는 실제로 엔진을 만들 때만 일어납니다.
+    # (후처리 유틸만 쓰는 코드가 paddleocr 없이도 import 되도록)
+    engines: dict[str, OcrBackend] = {}
     for lang in lang_list:
-        engines[lang] = PaddleOCR(lang=lang)
+        engines[lang] = create_backend(backend, lang, **options)
     return engines
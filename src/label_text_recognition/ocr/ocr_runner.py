@@ -10,15 +10,48 @@
 #      → UI / 로그 쪽에서 현재 세션이 저장 비활성화인지(SAVE_OFF),
 #        콘솔 로그 모드인지(CONSOLE_ON) 등을 한 번에 파악 가능
 #   ✅ 함수 시그니처는 유지 (demos/ 쪽 수정 필요 없음)
+#
+# 추가 개선:
+#   ✅ 매 프레임 YAML 을 다시 파싱하지 않도록 캐시된 OcrConfig 사용
+#      → 호출부가 cfg 를 직접 넘기면 설정 조회 비용이 사실상 0
+#   ✅ mode suffix 문자열도 설정 객체당 한 번만 생성
+#   ✅ result_cache 를 넘기면 썸네일 지문이 거의 같은 이미지는
+#      OCR 엔진을 호출하지 않고 캐시된 결과를 바로 반환
+#   ✅ render=False 면 시각화(이미지 복사 / PIL 변환 / 폰트 / 텍스트 그리기)를
+#      전혀 하지 않고 결과만 돌려줌 (배치 처리, 저장 OFF 헤드리스 환경용)
+#   ✅ cascade 를 넘기면 신뢰도가 낮은 영역만 보조 언어 엔진으로 재인식
+#      (cascade.CascadeRecognizer, 검출은 메인 엔진 1회만)
+#   ✅ roi 를 넘기면 설정된 관심 영역만 잘라서 엔진에 넘기고
+#      박스는 프레임 전체 좌표로 되돌림 (roi.RoiSet, 검출 입력 픽셀 감소)
+#   ✅ downscale 을 넘기면 축소 이미지에서 검출, 원본 해상도에서 인식
+#      (downscale.AdaptiveDownscaler, 박스는 항상 원본 좌표)
+#   ✅ tiling 을 넘기면 아주 큰 스캔은 겹치는 타일로 나눠서 병렬 OCR 후 중복 박스 제거
+#      (tiling.TiledOcr, 줄 병합은 중복 제거가 끝난 뒤에 한 번만)
 # ==========================================================
 
+from functools import lru_cache
 from typing import Any, Tuple
 
-from label_text_recognition.config.loader import load_ocr_config
-from .ocr_utils import merge_words_with_boxes
+from label_text_recognition.config.settings import OcrConfig, get_ocr_config
+from label_text_recognition.metrics.stage_metrics import timed
+from .ocr_utils import group_words, render_ocr_overlay
+from .cascade import CascadeRecognizer
+from .downscale import AdaptiveDownscaler
+from .result_cache import OcrResultCache
+from .roi import RoiSet
+from .tiling import TiledOcr
+
+
+@lru_cache(maxsize=8)
+def _mode_suffix_for(cfg: OcrConfig) -> str:
+    """
+    OcrConfig 는 불변이므로 같은 객체에 대한 suffix 는 한 번만 만들면 됩니다.
+    (YAML 이 수정되면 새 OcrConfig 객체가 생기므로 자연스럽게 갱신됨)
+    """
+    return _build_mode_suffix(cfg)
 
 
-def _build_mode_suffix(cfg: dict) -> str:
+def _build_mode_suffix(cfg) -> str:
     """
     YAML에서 가져온 enable_* 값들을 간단한 문자열로 표현해주는 헬퍼.
     예) "MODE: SAVE_ON, CONSOLE_OFF, REDRAW_ON"
@@ -36,11 +69,87 @@ def _build_mode_suffix(cfg: dict) -> str:
     return "MODE: " + ", ".join(parts)
 
 
+def _run_pipeline(
+    image_bgr,
+    ocr_engine,
+    conf_threshold: float,
+    cls_enable: bool,
+    cascade=None,
+    roi=None,
+    downscale=None,
+    tiling=None,
+):
+    """
+    OCR 실행 → confidence 필터링 → 줄 단위 병합까지 수행합니다. (렌더링 없음)
+    반환하는 status 는 mode suffix 가 붙기 전의 상태 문자열입니다.
+    (예외는 호출부 run_ocr_on_image 에서 처리)
+    """
+    # ----------------------------------------------------------
+    # ① OCR 실행 (roi 가 있으면 관심 영역만 잘라서 실행, 박스는 프레임 좌표)
+    #    tiling 이 있으면 큰 이미지(영역)를 타일로 나눠서 실행
+    #    downscale 이 있으면 (영역/타일별로) 축소 이미지에서 검출 → 원본에서 인식
+    # ----------------------------------------------------------
+    wrap = downscale.bind if downscale is not None else None
+    if tiling is not None:
+        ocr_engine = tiling.bind(ocr_engine, wrap=wrap)
+    elif wrap is not None:
+        ocr_engine = wrap(ocr_engine)
+    with timed("ocr_engine"):
+        if roi is not None:
+            ocr_result = roi.ocr(ocr_engine, image_bgr, cls=cls_enable)
+        else:
+            ocr_result = ocr_engine.ocr(image_bgr, cls=cls_enable)
+
+    if not ocr_result or not ocr_result[0]:
+        # 결과 자체가 비었을 때
+        return [], "EMPTY: OCR 결과 없음 (글자 영역 미검출)"
+
+    # ①-1 다국어 캐스케이드: 신뢰도가 낮은 영역만 보조 엔진으로 재인식 (선택)
+    if cascade is not None:
+        ocr_result = cascade.refine(image_bgr, ocr_result)
+
+    # ----------------------------------------------------------
+    # ② Confidence 필터링
+    # ----------------------------------------------------------
+    filtered = []
+    for box, (text, conf) in ocr_result[0]:
+        try:
+            if float(conf) >= conf_threshold:
+                filtered.append((box, (text, conf)))
+        except (ValueError, TypeError):
+            # confidence가 숫자 변환이 안 되는 경우는 조용히 스킵
+            continue
+
+    if not filtered:
+        return [], f"EMPTY: 모든 결과의 confidence가 threshold({conf_threshold}) 미만"
+
+    # ----------------------------------------------------------
+    # ③ 후처리 및 결과 병합
+    # ----------------------------------------------------------
+    with timed("merge_words"):
+        merged_results = group_words(filtered)
+
+    if not merged_results:
+        return [], "EMPTY: 후처리 병합 결과 없음"
+
+    # ----------------------------------------------------------
+    # ④ 정상 종료
+    # ----------------------------------------------------------
+    return merged_results, "OK"
+
+
 def run_ocr_on_image(
     image_bgr,
     ocr_engine,
     conf_threshold: float = 0.5,
     cls_enable: bool = True,
+    cfg: OcrConfig | None = None,
+    result_cache: OcrResultCache | None = None,
+    render: bool = True,
+    cascade: "CascadeRecognizer | None" = None,
+    roi: "RoiSet | None" = None,
+    downscale: "AdaptiveDownscaler | None" = None,
+    tiling: "TiledOcr | None" = None,
 ) -> Tuple[list[dict], Any, str]:
     """
     단일 이미지에 대해 OCR을 실행하고 후처리된 결과, 시각화 이미지, 상태 메시지를 반환합니다.
@@ -49,68 +158,93 @@ def run_ocr_on_image(
     ----------
     image_bgr : ndarray
         입력 이미지 (BGR)
-    ocr_engine :
-        PaddleOCR 인스턴스
+    ocr_engine : OcrBackend
+        OCR 백엔드 (backends.PaddleBackend / OnnxBackend 또는 PaddleOCR 처럼
+        ocr(image, cls=...) 가 [[ [box, (text, conf)], ... ]] 를 돌려주는 객체)
     conf_threshold : float
         이 값보다 낮은 confidence는 필터링됩니다.
     cls_enable : bool
         True  → 텍스트 방향/기울기 보정까지 수행 (정확도 우선 모드)
         False → 보정 단계 생략 (속도/자원 우선 모드)
+    cfg : OcrConfig | None
+        호출부에서 이미 들고 있는 설정 객체. None 이면 캐시된 설정을 사용합니다.
+    result_cache : OcrResultCache | None
+        썸네일 지문 기반 결과 캐시. 거의 같은 이미지를 다시 받으면
+        엔진 호출 없이 캐시된 merged_results 를 돌려줍니다. (message 에 "CACHE HIT" 표시)
+    render : bool
+        True  → 박스/텍스트를 그린 시각화 이미지를 만들어 반환 (기존 동작)
+        False → 시각화를 건너뛰고 입력 이미지를 그대로 반환 (복사도 하지 않음)
+    cascade : CascadeRecognizer | None
+        신뢰도가 conf_threshold(cascade 설정) 미만인 영역만 보조 언어 엔진으로
+        다시 인식해서 더 높은 신뢰도의 읽기를 사용합니다. None 이면 메인 엔진 결과만 사용.
+    roi : RoiSet | None
+        관심 영역만 잘라서 OCR 합니다. 반환되는 box 는 항상 입력 이미지 전체 기준 좌표입니다.
+        None 이면 이미지 전체를 사용.
+    downscale : AdaptiveDownscaler | None
+        검출은 축소한 이미지에서, 인식은 원본 해상도에서 수행합니다.
+        반환되는 box 는 원본 좌표입니다. None 이면 엔진에 원본을 그대로 넘깁니다.
+    tiling : TiledOcr | None
+        긴 변이 tiling.min_image_side 이상인 이미지를 겹치는 타일로 나눠서 OCR 하고,
+        겹치는 부분의 중복 박스를 제거한 뒤 줄 병합합니다. 반환되는 box 는 원본 좌표입니다.
 
     Returns
     -------
     (merged_results, vis_image, message)
         merged_results : list[dict] - 인식 결과 (텍스트, bbox, avg_conf 등)
-        vis_image      : ndarray    - 시각화된 이미지
+        vis_image      : ndarray    - 시각화된 이미지 (render=False 이면 입력 이미지 그대로)
         message        : str        - 상태나 원인 정보 + 현재 모드 정보
                                       예) "OK | MODE: SAVE_OFF, CONSOLE_ON, REDRAW_ON"
     """
-    # 여기서 한 번 설정을 읽어두면 이 함수만 봐도 현재 세션 모드를 알 수 있음
-    cfg = load_ocr_config()
-    mode_suffix = _build_mode_suffix(cfg)
+    # 설정은 캐시된 불변 객체를 사용 (파일이 바뀌었을 때만 다시 파싱됨)
+    if cfg is None:
+        cfg = get_ocr_config()
+    mode_suffix = _mode_suffix_for(cfg)
 
     try:
         # ----------------------------------------------------------
-        # ① OCR 실행
+        # ⓪ 결과 캐시 조회 (거의 같은 화면이면 OCR 생략)
         # ----------------------------------------------------------
-        ocr_result = ocr_engine.ocr(image_bgr, cls=cls_enable)
-
-        if not ocr_result or not ocr_result[0]:
-            # 결과 자체가 비었을 때
-            return [], image_bgr, f"EMPTY: OCR 결과 없음 (글자 영역 미검출) | {mode_suffix}"
+        image_fp = None
+        cache_params = (
+            conf_threshold,
+            cls_enable,
+            cascade is not None,
+            roi.key if roi is not None else None,
+            downscale.key if downscale is not None else None,
+            tiling.key if tiling is not None else None,
+        )
+        if result_cache is not None:
+            with timed("cache_lookup"):
+                image_fp = result_cache.fingerprint(image_bgr)
+                cached = result_cache.get(image_fp, cache_params)
+            if cached is not None:
+                # get() 은 깊은 복사본을 돌려주므로 호출부가 수정해도 캐시는 그대로
+                results, status = cached
+                vis_img = render_ocr_overlay(image_bgr, results) if render and results else image_bgr
+                return results, vis_img, f"{status} (CACHE HIT) | {mode_suffix}"
+
+        merged_results, status = _run_pipeline(
+            image_bgr, ocr_engine, conf_threshold, cls_enable, cascade, roi, downscale, tiling
+        )
+
+        if result_cache is not None:
+            # 시각화 이미지는 캐시하지 않음 → 필요할 때 현재 프레임 위에 다시 그림
+            # put() 이 깊은 복사본을 저장 (box / word_boxes 등 중첩 리스트도 공유하지 않음)
+            result_cache.put(image_fp, (merged_results, status), cache_params)
 
         # ----------------------------------------------------------
-        # ② Confidence 필터링
+        # ⑤ 시각화 (render=True 이고 결과가 있을 때만)
         # ----------------------------------------------------------
-        filtered = []
-        for box, (text, conf) in ocr_result[0]:
-            try:
-                if float(conf) >= conf_threshold:
-                    filtered.append((box, (text, conf)))
-            except (ValueError, TypeError):
-                # confidence가 숫자 변환이 안 되는 경우는 조용히 스킵
-                continue
-
-        if not filtered:
-            return [], image_bgr, (
-                f"EMPTY: 모든 결과의 confidence가 threshold({conf_threshold}) 미만 | {mode_suffix}"
-            )
+        vis_img = image_bgr
+        if render and merged_results:
+            with timed("render"):
+                vis_img = render_ocr_overlay(image_bgr, merged_results)
 
-        # ----------------------------------------------------------
-        # ③ 후처리 및 결과 병합
-        # ----------------------------------------------------------
-        merged_results, vis_img = merge_words_with_boxes(image_bgr, filtered)
-
-        if not merged_results:
-            return [], vis_img, f"EMPTY: 후처리 병합 결과 없음 | {mode_suffix}"
-
-        # ----------------------------------------------------------
-        # ④ 정상 종료
-        # ----------------------------------------------------------
-        return merged_results, vis_img, f"OK | {mode_suffix}"
+        return merged_results, vis_img, f"{status} | {mode_suffix}"
 
     except Exception as e:
         # 예외가 나더라도 이미지 원본과 상태 메시지를 돌려줍니다.
         # UI에서는 message.startswith("ERROR") 만으로 판단 가능.
+        # (오류 결과는 캐시하지 않으므로 재시도 시 OCR 을 다시 실행합니다.)
         print(f"⚠️ run_ocr_on_image 예외 발생: {e}")
-        return [], image_bgr, f"ERROR: {str(e)} | {mode_suffix}"
\ No newline at end of file
+        return [], image_bgr, f"ERROR: {str(e)} | {mode_suffix}"
@@ -7,37 +7,156 @@
 # 기능 요약
 # ----------------------------------------------------------
 # ✅ paddleocr의 원시 결과(단어 단위)를 한 줄 단위로 병합
+#    (박스 파싱 / 중심·범위 계산 / 줄 그룹화 / 간격 병합은 (N, 4, 2) NumPy 배열 연산)
 # ✅ 각 줄마다 평균 confidence 계산
 # ✅ 이미지 위에 사각형 박스 및 텍스트를 시각화
 # ✅ OpenCV + Pillow 혼합 사용 → 한글 텍스트도 깨짐 없이 표시
+# ✅ 그룹화(group_words)와 렌더링(render_ocr_overlay)을 분리
+#    → 화면/이미지 저장이 필요 없는 헤드리스 환경에서는 렌더링 비용 0
 #
 # 사용 예시
 # ----------------------------------------------------------
-# from label_text_recognition.ocr.ocr_utils import merge_words_with_boxes
+# from label_text_recognition.ocr.ocr_utils import group_words, render_ocr_overlay
+# merged_results = group_words(ocr_result)                  # 렌더링 없음
+# vis_image = render_ocr_overlay(frame, merged_results)     # 필요할 때만
+#
+# # 기존 방식 (그룹화 + 렌더링 한 번에)
 # merged_results, vis_image = merge_words_with_boxes(frame, ocr_result)
 #
 # 결과 예시:
 # merged_results = [
-#   {"line_index": 1, "text": "시험일 2025.11.11", "avg_conf": 0.93},
-#   {"line_index": 2, "text": "성명 홍길동", "avg_conf": 0.95}
+#   {"line_index": 1, "text": "시험일 2025.11.11", "avg_conf": 0.93,
+#    "box": [[x1,y1],[x2,y1],[x2,y2],[x1,y2]], "word_boxes": [[[x,y],...], ...]},
+#   {"line_index": 2, "text": "성명 홍길동", "avg_conf": 0.95, ...}
 # ]
 # ==========================================================
 
-from typing import Any
 import numpy as np
-import cv2
-from PIL import Image, ImageDraw, ImageFont
 
+from label_text_recognition.render.overlay import OverlayCompositor
 
-def merge_words_with_boxes(image, ocr_result, y_thresh=20, x_gap_thresh=30):
+
+# ----------------------------------------------------------
+# (내부) OCR 결과 → NumPy 배열
+# ----------------------------------------------------------
+def _parse_ocr_result(ocr_result):
     """
-    OCR 결과(box, text, conf)를 받아서 같은 줄의 단어를 묶고,
-    이미지 위에 한글이 포함된 텍스트까지 정상적으로 시각화합니다.
+    paddleocr 결과 [(box, (text, conf)), ...] 를 배열로 바꿉니다.
+
+    Returns
+    -------
+    boxes : np.ndarray  (N, 4, 2) float64 — 4점 박스가 아니면 (N,) object 배열
+    texts : list[str]   strip() 된 텍스트
+    confs : np.ndarray  (N,) float64
+    """
+    raw_boxes = []
+    texts = []
+    confs = []
+    for box, (text, conf) in ocr_result:
+        raw_boxes.append(box)
+        texts.append(text.strip())
+        confs.append(float(conf))
+
+    try:
+        boxes = np.asarray(raw_boxes, dtype=np.float64)
+        if boxes.ndim != 3 or boxes.shape[1:] != (4, 2):
+            raise ValueError("not an (N, 4, 2) layout")
+    except ValueError:
+        # 점 개수가 제각각인 박스 → 박스별 배열로 보관 (느린 경로)
+        boxes = np.empty(len(raw_boxes), dtype=object)
+        for i, box in enumerate(raw_boxes):
+            boxes[i] = np.asarray(box, dtype=np.float64).reshape(-1, 2)
+
+    return boxes, texts, np.asarray(confs, dtype=np.float64)
+
+
+def _box_extents(boxes):
+    """
+    박스별 중심(cx, cy)과 가로 범위(x_min, x_max)를 한 번에 계산합니다.
+    """
+    if boxes.dtype != object:
+        xs = boxes[:, :, 0]
+        ys = boxes[:, :, 1]
+        return xs.mean(axis=1), ys.mean(axis=1), xs.min(axis=1), xs.max(axis=1)
+
+    cx = np.array([b[:, 0].mean() for b in boxes])
+    cy = np.array([b[:, 1].mean() for b in boxes])
+    x_min = np.array([b[:, 0].min() for b in boxes])
+    x_max = np.array([b[:, 0].max() for b in boxes])
+    return cx, cy, x_min, x_max
+
+
+def _group_lines(ocr_result, y_thresh=20, x_gap_thresh=30):
+    """
+    단어 박스들을 줄 단위로 묶고, 줄마다 텍스트를 합칩니다. (렌더링 없음)
+
+    처리 순서 (기존 파이썬 루프 구현과 결과가 동일)
+    ------------------------------------------------------
+    1) (cy, cx) 기준 안정 정렬
+    2) 정렬된 cy 의 인접 차이가 y_thresh 를 넘는 지점에서 줄 분리
+    3) 줄 안에서 x_min 기준 안정 정렬
+    4) x 간격(gap)이 x_gap_thresh 이상인 곳에서 단어 묶음 분리 후 공백으로 연결
+
+    Returns
+    -------
+    list[dict]
+        줄마다 {"order": 단어 인덱스 배열(x 순), "text": 병합 텍스트,
+                "avg_conf": 평균 신뢰도, "cy": 첫 단어 cy, "x_min": 첫 단어 x_min}
+        와 함께 boxes (N, 4, 2) 배열을 돌려줍니다.
+    """
+    boxes, texts, confs = _parse_ocr_result(ocr_result)
+    n = len(texts)
+    if n == 0:
+        return [], boxes
+
+    cx, cy, x_min, x_max = _box_extents(boxes)
+
+    # 1) (cy, cx) 순 정렬 — lexsort 는 마지막 키가 1순위이며 안정 정렬
+    order = np.lexsort((cx, cy))
+
+    # 2) 줄 분리: 정렬된 cy 의 인접 차이 > y_thresh 인 곳에서 새 줄 시작
+    cy_sorted = cy[order]
+    line_id = np.zeros(n, dtype=np.int64)
+    line_id[1:] = np.cumsum(np.diff(cy_sorted) > y_thresh)
+
+    # 3) 줄 번호 → x_min 순으로 다시 정렬 (같은 값은 1)의 순서 유지)
+    within = np.lexsort((x_min[order], line_id))
+    order = order[within]
+    line_id = line_id[within]
+
+    # 줄 경계 (start, end) 계산
+    starts = np.flatnonzero(np.r_[True, line_id[1:] != line_id[:-1]])
+    ends = np.r_[starts[1:], n]
+
+    # 4) 단어 묶음 경계: 같은 줄에서 이전 박스와의 x 간격이 x_gap_thresh 이상
+    gaps = x_min[order][1:] - x_max[order][:-1]
+    word_break = np.r_[True, (gaps >= x_gap_thresh) | (line_id[1:] != line_id[:-1])]
+
+    lines = []
+    for start, end in zip(starts, ends):
+        idx = order[start:end]
+        segments = np.split(idx, np.flatnonzero(word_break[start + 1:end]) + 1)
+        words = [" ".join(texts[i] for i in seg) for seg in segments]
+
+        first = idx[0]
+        lines.append({
+            "order": idx,
+            "text": " ".join(words),
+            "avg_conf": float(np.mean(confs[idx])),
+            "cy": cy[first],
+            "x_min": x_min[first],
+        })
+
+    return lines, boxes
+
+
+def group_words(ocr_result, y_thresh=20, x_gap_thresh=30) -> list[dict]:
+    """
+    OCR 결과(box, text, conf)를 줄 단위로 묶어서 결과 리스트만 돌려줍니다.
+    이미지 복사 / 색 변환 / 폰트 로딩 같은 시각화 작업은 전혀 하지 않습니다.
 
     Parameters
     ----------
-    image : np.ndarray
-        원본 이미지 (BGR 형식)
     ocr_result : list
         paddleocr.ocr(...) 호출 결과 중 하나의 프레임 데이터
     y_thresh : int
@@ -48,121 +167,109 @@ def merge_words_with_boxes(image, ocr_result, y_thresh=20, x_gap_thresh=30):
     Returns
     -------
     merged_results : list[dict]
-        {"line_index": 1, "text": "...", "avg_conf": 0.91, ...} 형태의 결과 리스트
-    vis_image : np.ndarray
-        박스와 텍스트가 표시된 BGR 이미지
+        line_index  : 1부터 시작하는 줄 번호
+        text        : 줄 텍스트
+        avg_conf    : 줄 평균 신뢰도
+        box         : 줄 전체를 감싸는 4점 박스 [[x1,y1],[x2,y1],[x2,y2],[x1,y2]] (정수)
+        word_boxes  : 줄에 속한 단어 박스들 (x 순서, 정수 좌표)
     """
-    # ------------------------------------------------------
-    # 1️⃣ OCR 결과를 (텍스트 + 위치 + 신뢰도) 구조로 정리
-    # ------------------------------------------------------
-    lines = []
-    for box_info in ocr_result:
-        box, (text, conf) = box_info
-        x_coords = [p[0] for p in box]
-        y_coords = [p[1] for p in box]
-        cx, cy = np.mean(x_coords), np.mean(y_coords)
-        lines.append({
-            "text": text.strip(),
-            "conf": float(conf),
-            "cx": cx,
-            "cy": cy,
-            "x_min": min(x_coords),
-            "x_max": max(x_coords),
-            "box": np.array(box).astype(int).tolist()
-        })
-
-    if not lines:
-        return [], image
+    grouped_lines, boxes = _group_lines(ocr_result, y_thresh, x_gap_thresh)
+    if not grouped_lines:
+        return []
 
-    # ------------------------------------------------------
-    # 2️⃣ Y좌표를 기준으로 정렬 후 같은 줄끼리 그룹화
-    # ------------------------------------------------------
-    lines.sort(key=lambda t: (t["cy"], t["cx"]))
-
-    grouped_lines = []
-    current_line = [lines[0]]
-    for i in range(1, len(lines)):
-        if abs(lines[i]["cy"] - current_line[-1]["cy"]) <= y_thresh:
-            current_line.append(lines[i])
-        else:
-            grouped_lines.append(current_line)
-            current_line = [lines[i]]
-    grouped_lines.append(current_line)
-
-    # ------------------------------------------------------
-    # 3️⃣ 시각화 설정
-    # ------------------------------------------------------
-    vis_img = image.copy()
-    colors = [
-        (0, 255, 0),
-        (255, 255, 0),
-        (0, 255, 255),
-        (255, 128, 0),
-        (255, 0, 255),
-        (0, 128, 255),
-    ]
-
-    # PIL로 텍스트 렌더링 (OpenCV는 한글 깨짐)
-    pil_img = Image.fromarray(cv2.cvtColor(vis_img, cv2.COLOR_BGR2RGB))
-    draw = ImageDraw.Draw(pil_img)
-    font_path = "/usr/share/fonts/truetype/noto/NotoSansCJK-Regular.ttc"
-    try:
-        font = ImageFont.truetype(font_path, 20)
-    except OSError:
-        print("⚠️ 한글 폰트를 찾을 수 없습니다. 기본 폰트를 사용합니다.")
-        font = ImageFont.load_default()
+    # 단어 박스 정수 좌표 (기존 np.array(box).astype(int) 와 동일한 절삭)
+    if boxes.dtype != object:
+        int_boxes = boxes.astype(np.int64)
+    else:
+        int_boxes = [b.astype(np.int64) for b in boxes]
 
     merged_results = []
-
-    # ------------------------------------------------------
-    # 4️⃣ 각 줄(line)에 대해 단어 병합 및 시각화
-    # ------------------------------------------------------
     for line_idx, line in enumerate(grouped_lines, start=1):
-        # 줄 내 단어를 x_min 순으로 정렬
-        line.sort(key=lambda t: t["x_min"])
-        merged_line_words = []
-        current_word = line[0]["text"]
-
-        for j in range(1, len(line)):
-            gap = line[j]["x_min"] - line[j - 1]["x_max"]
-            if gap < x_gap_thresh:
-                current_word += " " + line[j]["text"]
-            else:
-                merged_line_words.append(current_word)
-                current_word = line[j]["text"]
-        merged_line_words.append(current_word)
-
-        merged_text = " ".join(merged_line_words)
-
-        # 각 단어별 박스(OpenCV)
-        for word in line:
-            pts = np.array(word["box"], np.int32)
-            cv2.polylines(
-                vis_img,
-                [pts],
-                isClosed=True,
-                color=colors[line_idx % len(colors)],
-                thickness=2,
-            )
-
-        # 텍스트(PIL, 한글 지원)
-        y_pos = int(line[0]["cy"]) - 25
-        x_pos = int(line[0]["x_min"])
-        draw.text(
-            (x_pos, y_pos),
-            f"{line_idx}. {merged_text}",
-            font=font,
-            fill=(255, 0, 0),
-        )
+        word_boxes = [int_boxes[i] for i in line["order"]]
+        pts = np.concatenate(word_boxes, axis=0)
+        x1, y1 = pts.min(axis=0).tolist()
+        x2, y2 = pts.max(axis=0).tolist()
 
         merged_results.append({
             "line_index": line_idx,
-            "text": merged_text,
-            "avg_conf": float(np.mean([w["conf"] for w in line])),
+            "text": line["text"],
+            "avg_conf": line["avg_conf"],
+            "box": [[x1, y1], [x2, y1], [x2, y2], [x1, y2]],
+            "word_boxes": [wb.tolist() for wb in word_boxes],
         })
 
-    # ------------------------------------------------------
-    # 5️⃣ PIL 이미지를 다시 OpenCV BGR로 변환 후 반환
-    # ------------------------------------------------------
-    vis_img = cv2.cvtColor(np.array(pil_img), cv2.COLOR_RGB2BGR)
-    return merged_results, vis_img
\ No newline at end of file
+    return merged_results
+
+
+# 줄 번호별 박스 색상 (BGR)
+LINE_COLORS = [
+    (0, 255, 0),
+    (255, 255, 0),
+    (0, 255, 255),
+    (255, 128, 0),
+    (255, 0, 255),
+    (0, 128, 255),
+]
+
+
+def render_ocr_overlay(image, merged_results):
+    """
+    group_words() 결과를 이미지 위에 그립니다. (원본은 건드리지 않고 복사본에 그림)
+
+    - 단어 박스: 줄 번호별 색상의 폴리라인 (OpenCV)
+    - 줄 텍스트: "번호. 텍스트" 를 첫 단어 위쪽에 표시 (PIL, 한글 지원)
+    - 렌더링은 OverlayCompositor 로 한 번에 합성 (색 변환은 텍스트 영역 왕복 1회)
+
+    JSON 에서 다시 읽은 결과처럼 word_boxes 가 없는 항목은 줄 박스(box)를 대신 그립니다.
+    """
+    if not merged_results:
+        return image.copy()
+
+    # 박스(OpenCV)와 텍스트(PIL, 한글 지원)를 모아서 compose() 에서 한 번에 그림
+    overlay = OverlayCompositor(image)
+    for item in merged_results:
+        line_idx = item.get("line_index", 0)
+        word_boxes = item.get("word_boxes") or ([item["box"]] if item.get("box") else [])
+        if not word_boxes:
+            continue
+
+        color = LINE_COLORS[line_idx % len(LINE_COLORS)]
+        for wb in word_boxes:
+            overlay.add_polyline(wb, color=color, thickness=2)
+
+        first = np.asarray(word_boxes[0], dtype=np.float64)
+        x_pos = int(first[:, 0].min())
+        y_pos = int(first[:, 1].mean()) - 25
+        overlay.add_text(f"{line_idx}. {item.get('text', '')}", x_pos, y_pos, color=(255, 0, 0))
+
+    return overlay.compose()
+
+
+def merge_words_with_boxes(image, ocr_result, y_thresh=20, x_gap_thresh=30):
+    """
+    OCR 결과(box, text, conf)를 받아서 같은 줄의 단어를 묶고,
+    이미지 위에 한글이 포함된 텍스트까지 정상적으로 시각화합니다.
+    (group_words + render_ocr_overlay 를 한 번에 호출하는 하위 호환 함수)
+
+    Parameters
+    ----------
+    image : np.ndarray
+        원본 이미지 (BGR 형식)
+    ocr_result : list
+        paddleocr.ocr(...) 호출 결과 중 하나의 프레임 데이터
+    y_thresh : int
+        두 단어의 y좌표 차이가 이 값 이하이면 같은 줄로 판단
+    x_gap_thresh : int
+        단어 간의 x 간격이 이 값 이하이면 같은 문장으로 이어붙임
+
+    Returns
+    -------
+    merged_results : list[dict]
+        {"line_index": 1, "text": "...", "avg_conf": 0.91, "box": ..., ...} 형태의 결과 리스트
+    vis_image : np.ndarray
+        박스와 텍스트가 표시된 BGR 이미지
+    """
+    merged_results = group_words(ocr_result, y_thresh, x_gap_thresh)
+    if not merged_results:
+        return [], image
+    return merged_results, render_ocr_overlay(image, merged_results)
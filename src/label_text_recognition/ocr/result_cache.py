@@ -0,0 +1,241 @@
+# ==========================================================
+# result_cache.py
+# ----------------------------------------------------------
+# "거의 같은 화면"에 대해 OCR 을 다시 돌리지 않도록
+# 축소 썸네일 지문(fingerprint) 기반으로 결과를 캐시하는 모듈입니다.
+#
+# 배경
+# ----------------------------------------------------------
+# - 같은 라벨이 카메라 아래에 몇 초씩 머무는 경우가 많고,
+#   트리거될 때마다 det + cls + rec 전체가 다시 실행됩니다.
+# - 처음에는 프레임 전체의 dHash(17x16) 를 키로 썼는데, 레이아웃이 같고
+#   로트 번호만 다른 두 라벨이 1비트 차이로 나와서 "다른 라벨인데 HIT"
+#   (앞 라벨의 글자를 그대로 돌려줌) 가 생겼습니다.
+#   반대로 같은 라벨도 센서 노이즈만으로 수십 비트가 달라져 HIT 가 잘 나지 않았습니다.
+#
+# 동작 방식
+# ----------------------------------------------------------
+# ✅ 이미지 → 흑백 → 가로 fingerprint_width(기본 320)px 로 축소(INTER_AREA, 노이즈 평균화)
+#    → 밝기 평균을 뺀 썸네일을 지문(fingerprint)으로 저장
+# ✅ 두 지문의 픽셀 차이를 cell_size x cell_size 칸마다 평균 내고,
+#    "가장 많이 달라진 칸"이 max_cell_diff 이하일 때만 같은 화면으로 판단
+#    → 글자 한 개가 바뀌어도 그 칸의 차이가 커서 MISS, 화면 전체 노이즈는 평균되어 HIT
+# ✅ 조회는 칸을 4x4 로 묶은 거친 지문으로 먼저 걸러낸 뒤(거친 차이 ≤ 세밀한 차이이므로
+#    걸러낸 항목 중에 HIT 가 될 수 있는 항목은 없음) 남은 항목만 세밀하게 비교
+# ✅ LRU(최근 사용 순) + TTL(유효 시간)로 크기/신선도를 제한
+# ✅ 저장/반환 시 결과를 깊은 복사 → 호출부가 box / word_boxes 를 고쳐도 캐시는 그대로
+# ✅ hit / miss / eviction / expiration 카운터 제공
+#
+# 사용 예시
+# ----------------------------------------------------------
+# cache = OcrResultCache.from_config(cfg)   # 비활성화면 None
+# results, vis, msg = run_ocr_on_image(frame, engine, result_cache=cache)
+# print(cache.stats())
+# ==========================================================
+
+import copy
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Hashable
+
+import cv2
+import numpy as np
+
+# 거친 지문 1칸 = 세밀한 칸 COARSE_FACTOR x COARSE_FACTOR 개
+COARSE_FACTOR = 4
+
+
+@dataclass(frozen=True)
+class Fingerprint:
+    """
+    화면 비교용 지문.
+
+    fine   : 밝기 평균을 뺀 흑백 썸네일 (float32)
+    coarse : fine 을 (cell_size * COARSE_FACTOR) 칸 단위로 평균 낸 것 (빠른 1차 필터용)
+    """
+
+    fine: np.ndarray
+    coarse: np.ndarray
+
+
+def fingerprint(image, width: int = 320, cell_size: int = 4) -> Fingerprint:
+    """
+    이미지의 지문을 만듭니다.
+    썸네일 크기는 cell_size * COARSE_FACTOR 의 배수로 맞춰서 칸이 정확히 나눠지게 합니다.
+    """
+    if image.ndim == 3:
+        image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    block = cell_size * COARSE_FACTOR
+    h, w = image.shape[:2]
+    thumb_w = max(block, (width // block) * block)
+    thumb_h = max(block, int(round(h * thumb_w / max(w, 1) / block)) * block)
+    fine = cv2.resize(image, (thumb_w, thumb_h), interpolation=cv2.INTER_AREA).astype(np.float32)
+    fine -= fine.mean()
+    return Fingerprint(fine, _cell_mean(fine, block))
+
+
+def _cell_mean(values: np.ndarray, cell: int) -> np.ndarray:
+    h, w = values.shape
+    return values.reshape(h // cell, cell, w // cell, cell).mean(axis=(1, 3))
+
+
+def fingerprint_distance(a: Fingerprint, b: Fingerprint, cell_size: int = 4) -> float:
+    """
+    cell_size 칸별 평균 절대 차이 중 최댓값 (밝기 단위, 0~255).
+    크기가 다른 이미지의 지문끼리는 비교하지 않고 inf.
+    """
+    if a.fine.shape != b.fine.shape:
+        return float("inf")
+    return float(_cell_mean(np.abs(a.fine - b.fine), cell_size).max())
+
+
+@dataclass
+class _Entry:
+    params: Hashable
+    fp: Fingerprint
+    value: Any
+    stored_at: float
+
+
+class OcrResultCache:
+    """
+    화면 지문을 키로 하는 LRU + TTL 캐시.
+
+    Parameters
+    ----------
+    max_size : int
+        최대 항목 수. 넘치면 가장 오래 안 쓰인 항목부터 제거(eviction)합니다.
+    ttl_sec : float
+        항목 유효 시간(초). 0 이하이면 만료 없음.
+    max_cell_diff : float
+        칸별 평균 밝기 차이의 최댓값이 이 값 이하이면 "같은 화면"으로 간주합니다.
+    fingerprint_width : int
+        지문 썸네일의 가로 크기(px). 클수록 작은 글자 차이까지 구분하지만 조금 느려집니다.
+    cell_size : int
+        차이를 평균 내는 칸 크기(썸네일 px). 작을수록 글자 한 개 차이에 민감합니다.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 32,
+        ttl_sec: float = 5.0,
+        max_cell_diff: float = 3.0,
+        fingerprint_width: int = 320,
+        cell_size: int = 4,
+    ):
+        self.max_size = max(1, int(max_size))
+        self.ttl_sec = float(ttl_sec)
+        self.max_cell_diff = max(0.0, float(max_cell_diff))
+        self.cell_size = max(1, int(cell_size))
+        self.fingerprint_width = max(self.cell_size * COARSE_FACTOR, int(fingerprint_width))
+
+        # id → _Entry (최근 사용 순)
+        self._entries: "OrderedDict[int, _Entry]" = OrderedDict()
+        self._ids = itertools.count()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @classmethod
+    def from_config(cls, cfg) -> "OcrResultCache | None":
+        """
+        ocr_config.yaml 의 result_cache 섹션으로 캐시를 만듭니다.
+        enabled=false 면 None 을 돌려줍니다.
+        """
+        cache_cfg = cfg.get("result_cache", {}) or {}
+        if not cache_cfg.get("enabled", False):
+            return None
+        return cls(
+            max_size=cache_cfg.get("max_size", 32),
+            ttl_sec=cache_cfg.get("ttl_sec", 5.0),
+            max_cell_diff=cache_cfg.get("max_cell_diff", 3.0),
+            fingerprint_width=cache_cfg.get("fingerprint_width", 320),
+            cell_size=cache_cfg.get("cell_size", 4),
+        )
+
+    # ------------------------------------------------------
+    # 조회 / 저장
+    # ------------------------------------------------------
+    def fingerprint(self, image) -> Fingerprint:
+        return fingerprint(image, self.fingerprint_width, self.cell_size)
+
+    def get(self, fp: Fingerprint, params: Hashable = None, now: float | None = None) -> Any:
+        """
+        max_cell_diff 안의 가장 가까운 항목을 찾아서 값의 복사본을 돌려줍니다. 없으면 None.
+        params 가 다른 항목(예: conf_threshold 가 달랐던 결과)은 사용하지 않습니다.
+        """
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            self._expire(now)
+
+            best_key = None
+            best_dist = self.max_cell_diff
+            for key, entry in self._entries.items():
+                if entry.params != params or entry.fp.coarse.shape != fp.coarse.shape:
+                    continue
+                # 1차: 거친 칸 차이가 이미 허용치를 넘으면 세밀한 비교 생략
+                if float(np.abs(entry.fp.coarse - fp.coarse).max()) > best_dist:
+                    continue
+                dist = fingerprint_distance(entry.fp, fp, self.cell_size)
+                if dist <= best_dist:
+                    best_key, best_dist = key, dist
+
+            if best_key is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(best_key)
+            self.hits += 1
+            return copy.deepcopy(self._entries[best_key].value)
+
+    def put(self, fp: Fingerprint, value: Any, params: Hashable = None, now: float | None = None) -> None:
+        """값의 복사본을 저장합니다. (이후 호출부가 value 를 고쳐도 캐시는 바뀌지 않음)"""
+        now = time.monotonic() if now is None else now
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._entries[next(self._ids)] = _Entry(params, fp, value, now)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def _expire(self, now: float) -> None:
+        if self.ttl_sec <= 0:
+            return
+        # OrderedDict 는 최근 사용 순이므로 저장 시각 기준으로 전체를 훑어서 제거
+        expired = [k for k, entry in self._entries.items() if now - entry.stored_at > self.ttl_sec]
+        for k in expired:
+            del self._entries[k]
+        self.expirations += len(expired)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    # ------------------------------------------------------
+    # 통계
+    # ------------------------------------------------------
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "hit_rate": (self.hits / total) if total else 0.0,
+            }
+
+    def format_stats(self) -> str:
+        s = self.stats()
+        return (
+            f"♻️ OCR 캐시: hit {s['hits']} / miss {s['misses']} "
+            f"(hit rate {s['hit_rate'] * 100:.1f}%), "
+            f"evict {s['evictions']}, expire {s['expirations']}, size {s['size']}"
+        )
@@ -0,0 +1,173 @@
+# ==========================================================
+# roi.py
+# ----------------------------------------------------------
+# 프레임 전체 대신 "라벨이 나오는 영역(ROI)"만 OCR 엔진에 넘기는 모듈입니다.
+#
+# 배경
+# ----------------------------------------------------------
+# - 라벨은 항상 1280x720 프레임의 정해진 위치에 놓이는데,
+#   run_ocr_on_image 는 매번 프레임 전체에 대해 검출(det)을 돌립니다.
+# - 검출 입력 픽셀 수가 줄면 캡처당 지연이 그대로 줄어듭니다.
+#
+# 동작 방식
+# ----------------------------------------------------------
+# ✅ ocr_config.yaml 의 roi.regions (여러 개 가능, 카메라별 per_camera 지정 가능)
+# ✅ 각 ROI 를 잘라서 엔진에 넘기고, 결과 박스는 프레임 전체 좌표로 되돌림
+#     → 오버레이 / bbox_json / redraw_from_json 은 그대로 동작
+# ✅ ROI 가 겹치면 같은 글자가 두 번 나올 수 있으므로,
+#    박스 중심이 "먼저 적힌 ROI" 에 속하는 결과만 남김
+# ✅ units: ratio 로 적으면 프레임 크기에 대한 비율(0~1)로 해석
+#
+# 사용 예시
+# ----------------------------------------------------------
+# roi = RoiSet.from_config(cfg)                 # 비활성화면 None
+# ocr_result = roi.ocr(engine, frame, cls=True) # engine.ocr(frame) 과 같은 모양
+# ==========================================================
+
+from dataclasses import dataclass
+from typing import Any, Iterable
+
+import numpy as np
+
+from label_text_recognition.metrics.stage_metrics import timed
+
+
+@dataclass(frozen=True)
+class Roi:
+    """관심 영역 1개. units="ratio" 이면 x, y, w, h 는 프레임 크기 대비 비율"""
+
+    x: float
+    y: float
+    w: float
+    h: float
+    name: str = ""
+
+    def to_pixels(self, frame_w: int, frame_h: int, units: str = "px", padding: int = 0) -> tuple[int, int, int, int]:
+        """프레임 안으로 잘라낸 (x1, y1, x2, y2) 픽셀 좌표"""
+        if units == "ratio":
+            x, y, w, h = self.x * frame_w, self.y * frame_h, self.w * frame_w, self.h * frame_h
+        else:
+            x, y, w, h = self.x, self.y, self.w, self.h
+        x1 = int(max(0, round(x) - padding))
+        y1 = int(max(0, round(y) - padding))
+        x2 = int(min(frame_w, round(x + w) + padding))
+        y2 = int(min(frame_h, round(y + h) + padding))
+        return x1, y1, x2, y2
+
+
+class RoiSet:
+    """
+    여러 ROI 를 순서대로 잘라서 OCR 하고, 결과를 프레임 전체 좌표로 합칩니다.
+
+    Parameters
+    ----------
+    rois : Iterable[Roi]
+        관심 영역 목록 (앞에 적힌 영역이 겹치는 부분의 결과를 가져감)
+    units : str
+        "px" (픽셀) 또는 "ratio" (프레임 크기 대비 0~1 비율)
+    padding : int
+        잘라낼 때 ROI 바깥으로 더 포함할 여백(px). 가장자리 글자가 잘리는 것을 방지
+    """
+
+    def __init__(self, rois: Iterable[Roi], units: str = "px", padding: int = 0):
+        self.rois = list(rois)
+        if not self.rois:
+            raise ValueError("RoiSet 에는 최소 한 개의 영역이 필요합니다.")
+        if units not in ("px", "ratio"):
+            print(f"⚠️ 지원하지 않는 roi.units: {units} → px 사용")
+            units = "px"
+        self.units = units
+        self.padding = max(0, int(padding))
+
+    @classmethod
+    def from_config(cls, cfg, camera_index: Any = None) -> "RoiSet | None":
+        """
+        roi.enabled 가 true 일 때만 객체를 만듭니다.
+        per_camera 에 camera_index 항목이 있으면 regions 대신 그 목록을 사용합니다.
+        camera_index 는 실제로 연 장치 번호입니다. ("auto" 가 아니라 CameraSource.camera_index)
+
+        roi:
+          enabled: false
+          units: "px"
+          padding: 8
+          regions:
+            - {name: "label", x: 320, y: 160, w: 640, h: 400}
+          per_camera:
+            1:
+              - {name: "label", x: 0, y: 0, w: 1280, h: 360}
+        """
+        roi_cfg = cfg.get("roi", {}) or {}
+        if not roi_cfg.get("enabled", False):
+            return None
+
+        regions = roi_cfg.get("regions") or []
+        # YAML 키는 정수/문자열 어느 쪽으로 적어도 찾을 수 있게 문자열로 통일
+        per_camera = {str(k): v for k, v in (roi_cfg.get("per_camera", {}) or {}).items()}
+        if camera_index is not None:
+            regions = per_camera.get(str(camera_index)) or regions
+
+        rois = [
+            Roi(float(r["x"]), float(r["y"]), float(r["w"]), float(r["h"]), str(r.get("name", "")))
+            for r in regions
+        ]
+        if not rois:
+            print("⚠️ roi.enabled=true 이지만 regions 가 비어 있습니다. 프레임 전체를 사용합니다.")
+            return None
+        return cls(rois, units=roi_cfg.get("units", "px"), padding=roi_cfg.get("padding", 0))
+
+    @property
+    def key(self) -> tuple:
+        """결과 캐시 파라미터로 쓰는 값 (영역 설정이 같으면 같은 키)"""
+        return (tuple(self.rois), self.units, self.padding)
+
+    def pixel_rects(self, frame_w: int, frame_h: int, padding: bool = True) -> list[tuple[int, int, int, int]]:
+        pad = self.padding if padding else 0
+        return [roi.to_pixels(frame_w, frame_h, self.units, pad) for roi in self.rois]
+
+    def coverage(self, frame_w: int, frame_h: int) -> float:
+        """엔진에 넘기는 픽셀 수 / 프레임 전체 픽셀 수 (겹치는 부분은 중복 계산)"""
+        area = sum((x2 - x1) * (y2 - y1) for x1, y1, x2, y2 in self.pixel_rects(frame_w, frame_h))
+        return area / float(max(1, frame_w * frame_h))
+
+    # ------------------------------------------------------
+    # OCR
+    # ------------------------------------------------------
+    def ocr(self, engine, image_bgr: np.ndarray, cls: bool = True) -> list:
+        """
+        ROI 별로 engine.ocr() 를 호출하고, 박스를 프레임 좌표로 옮긴
+        [[ [box, (text, conf)], ... ]] 를 돌려줍니다. (엔진 ocr() 와 같은 모양)
+        """
+        frame_h, frame_w = image_bgr.shape[:2]
+        padded = self.pixel_rects(frame_w, frame_h, padding=True)
+        owners = self.pixel_rects(frame_w, frame_h, padding=False)
+
+        page = []
+        with timed("roi"):
+            for k, (x1, y1, x2, y2) in enumerate(padded):
+                if x2 - x1 < 2 or y2 - y1 < 2:
+                    continue
+                crop = np.ascontiguousarray(image_bgr[y1:y2, x1:x2])
+                result = engine.ocr(crop, cls=cls)
+                if not result or not result[0]:
+                    continue
+
+                for box, (text, conf) in result[0]:
+                    full_box = [[float(p[0]) + x1, float(p[1]) + y1] for p in box]
+                    if _owner_of(full_box, owners) == k:
+                        page.append([full_box, (text, conf)])
+
+        return [page] if page else [None]
+
+
+def _owner_of(box, rects) -> int:
+    """박스 중심을 포함하는 첫 번째 ROI 번호 (패딩 여백에만 걸친 박스는 가장 가까운 ROI)"""
+    cx = sum(p[0] for p in box) / len(box)
+    cy = sum(p[1] for p in box) / len(box)
+    best, best_dist = -1, float("inf")
+    for k, (x1, y1, x2, y2) in enumerate(rects):
+        if x1 <= cx < x2 and y1 <= cy < y2:
+            return k
+        dist = max(x1 - cx, 0, cx - x2) + max(y1 - cy, 0, cy - y2)
+        if dist < best_dist:
+            best, best_dist = k, dist
+    return best
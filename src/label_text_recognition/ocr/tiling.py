@@ -0,0 +1,414 @@
+# ==========================================================
+# tiling.py
+# ----------------------------------------------------------
+# 아주 큰 스캔 이미지를 겹치는 타일로 나눠서 OCR 하고,
+# 겹치는 부분에서 두 번 나온 글자 박스를 걸러서 하나의 결과로 합치는 모듈입니다.
+#
+# 배경
+# ----------------------------------------------------------
+# - 보관용 팔레트 시트 스캔은 6000x8000 px 입니다.
+# - 통째로 run_ocr_on_image 에 넘기면 메모리가 폭증하거나,
+#   엔진 내부에서 검출 입력이 줄어들어 작은 글자를 읽지 못합니다.
+#
+# 동작 방식
+# ----------------------------------------------------------
+# ✅ 긴 변이 min_image_side 이상인 이미지만 타일로 나눔 (카메라 프레임은 그대로)
+# ✅ tile_size x tile_size 타일, 이웃 타일과 overlap px 씩 겹치게 배치
+#    → 가로 길이가 overlap 이하인 글자 줄(그리고 높이가 overlap 이하인 줄)은
+#      어느 한 타일에는 온전히 들어감
+#    → 그보다 긴 줄은 세로 경계에서 잘려 양쪽 타일에 조각으로 나오므로 아래에서 이어 붙임
+# ✅ 타일은 스레드 풀(workers)에서 병렬 처리
+#    - 스레드 안전한 백엔드(thread_safe=True, 예: onnx)는 엔진 하나를 공유
+#    - 그렇지 않으면 engine_factory 로 스레드마다 엔진을 따로 만들고,
+#      engine_factory 가 없으면 순서대로 처리
+#    - 한 번에 잘라내는 타일은 workers 개뿐이라, 엔진이 보는 입력 크기는 타일 크기로 제한됨
+# ✅ 박스를 원본 좌표로 옮긴 뒤 중복 제거
+#    - IoU ≥ iou_threshold 이거나,
+#      작은 박스의 대부분(≥ contain_threshold)이 겹치고 텍스트가 같거나 포함 관계면 중복
+#    - 타일 안쪽 경계에 닿아 잘렸을 수 있는 박스보다 온전한 박스를 우선
+#    - 잘린 조각이 온전한 박스 안에 대부분 들어가면 텍스트가 달라도 중복 (잘린 쪽 텍스트는 깨져 있음)
+# ✅ 세로 경계 양쪽에서 잘린 같은 줄의 조각(왼쪽 타일의 오른쪽 끝 + 오른쪽 타일의 왼쪽 끝)은
+#    박스를 합치고, 겹침 영역에서 두 번 읽힌 글자는 한 번만 남겨 텍스트를 이어 붙임
+# ✅ 결과는 엔진 ocr() 와 같은 모양 → 이후 group_words 로 줄 병합
+#
+# 사용 예시
+# ----------------------------------------------------------
+# tiling = TiledOcr.from_config(cfg, engine_factory=registry.create_engine)  # 비활성화면 None
+# results, vis, msg = run_ocr_on_image(scan, engine, tiling=tiling)
+# ==========================================================
+
+import atexit
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+import numpy as np
+
+from label_text_recognition.metrics.stage_metrics import timed
+
+
+class TiledOcr:
+    """
+    큰 이미지를 겹치는 타일로 나눠서 OCR 하고 중복 박스를 제거합니다.
+
+    Parameters
+    ----------
+    tile_size : int
+        타일 한 변의 길이(px). 엔진의 검출 입력 제한(det_limit_side_len)과 비슷하게 맞추면
+        타일 안에서는 축소가 일어나지 않습니다.
+    overlap : int
+        이웃 타일과 겹치는 길이(px). 글자 줄(박스)의 가로 길이가 이 값 이하여야
+        어느 한 타일에 온전히 들어갑니다. (높이도 이 값 이하)
+        더 긴 줄은 경계 양쪽 조각을 이어 붙여서 복원합니다.
+    min_image_side : int
+        긴 변이 이 값 미만인 이미지는 타일로 나누지 않고 그대로 엔진에 넘김
+    workers : int
+        타일을 동시에 처리할 스레드 수
+    iou_threshold / contain_threshold : float
+        중복 판정 기준 (클래스 설명의 "중복 제거" 참고)
+    engine_factory : Callable[[], Any] | None
+        스레드 안전하지 않은 엔진일 때 워커 스레드마다 새 엔진을 만드는 함수
+    """
+
+    def __init__(
+        self,
+        tile_size: int = 1280,
+        overlap: int = 480,
+        min_image_side: int = 2500,
+        workers: int = 2,
+        iou_threshold: float = 0.5,
+        contain_threshold: float = 0.7,
+        engine_factory: Callable[[], Any] | None = None,
+    ):
+        self.tile_size = max(64, int(tile_size))
+        self.overlap = min(max(0, int(overlap)), self.tile_size // 2)
+        self.min_image_side = max(1, int(min_image_side))
+        self.workers = max(1, int(workers))
+        self.iou_threshold = float(iou_threshold)
+        self.contain_threshold = float(contain_threshold)
+        self.engine_factory = engine_factory
+
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._warned_serial = False
+
+    @classmethod
+    def from_config(cls, cfg, engine_factory: Callable[[], Any] | None = None) -> "TiledOcr | None":
+        """
+        tiling.enabled 가 true 일 때만 객체를 만듭니다.
+
+        tiling:
+          enabled: false
+          tile_size: 1280
+          overlap: 480
+          min_image_side: 2500
+          workers: 2
+          iou_threshold: 0.5
+          contain_threshold: 0.7
+        """
+        tiling_cfg = cfg.get("tiling", {}) or {}
+        if not tiling_cfg.get("enabled", False):
+            return None
+        return cls(
+            tile_size=tiling_cfg.get("tile_size", 1280),
+            overlap=tiling_cfg.get("overlap", 480),
+            min_image_side=tiling_cfg.get("min_image_side", 2500),
+            workers=tiling_cfg.get("workers", 2),
+            iou_threshold=tiling_cfg.get("iou_threshold", 0.5),
+            contain_threshold=tiling_cfg.get("contain_threshold", 0.7),
+            engine_factory=engine_factory,
+        )
+
+    @property
+    def key(self) -> tuple:
+        """결과 캐시 파라미터로 쓰는 값 (설정이 같으면 같은 키)"""
+        return (self.tile_size, self.overlap, self.min_image_side, self.iou_threshold, self.contain_threshold)
+
+    # ------------------------------------------------------
+    # 타일 배치
+    # ------------------------------------------------------
+    def _starts(self, length: int) -> list[int]:
+        if length <= self.tile_size:
+            return [0]
+        stride = self.tile_size - self.overlap
+        starts = list(range(0, length - self.tile_size, stride))
+        # 마지막 타일은 이미지 끝에 맞춤 (가장자리 타일이 작아지지 않도록)
+        starts.append(length - self.tile_size)
+        return starts
+
+    def tiles(self, frame_w: int, frame_h: int) -> list[tuple[int, int, int, int]]:
+        """(x1, y1, x2, y2) 타일 목록 (위→아래, 왼→오른)"""
+        return [
+            (x, y, min(frame_w, x + self.tile_size), min(frame_h, y + self.tile_size))
+            for y in self._starts(frame_h)
+            for x in self._starts(frame_w)
+        ]
+
+    def should_tile(self, frame_w: int, frame_h: int) -> bool:
+        return max(frame_w, frame_h) >= self.min_image_side
+
+    # ------------------------------------------------------
+    # 엔진 / 스레드
+    # ------------------------------------------------------
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="ocr-tile")
+                atexit.register(self.shutdown)
+            return self._executor
+
+    def _thread_engine(self, wrap):
+        """워커 스레드 전용 엔진 (engine_factory 로 스레드당 한 번만 생성)"""
+        engine = getattr(self._local, "engine", None)
+        if engine is None:
+            engine = self.engine_factory()
+            self._local.engine = engine
+        return wrap(engine) if wrap is not None else engine
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+            atexit.unregister(self.shutdown)
+
+    # ------------------------------------------------------
+    # OCR
+    # ------------------------------------------------------
+    def bind(self, engine, wrap: Callable[[Any], Any] | None = None) -> "TiledEngine":
+        """
+        engine.ocr() 대신 쓸 수 있는 래퍼를 돌려줍니다.
+        wrap 은 타일마다 쓰는 엔진에 덧씌울 함수입니다. (예: downscale.bind)
+        """
+        return TiledEngine(self, engine, wrap)
+
+    def ocr(self, engine, image_bgr: np.ndarray, cls: bool = True, wrap: Callable[[Any], Any] | None = None) -> list:
+        """
+        타일별 OCR 결과를 원본 좌표로 합친 [[ [box, (text, conf)], ... ]] 를 돌려줍니다.
+        이미지가 min_image_side 보다 작으면 engine.ocr() 를 그대로 호출합니다.
+        """
+        main = wrap(engine) if wrap is not None else engine
+        frame_h, frame_w = image_bgr.shape[:2]
+        if not self.should_tile(frame_w, frame_h):
+            return main.ocr(image_bgr, cls=cls)
+
+        rects = self.tiles(frame_w, frame_h)
+
+        def run_tile(rect, tile_engine):
+            x1, y1, x2, y2 = rect
+            # 타일은 처리할 때 잘라내므로 동시에 메모리에 올라가는 타일은 workers 개뿐
+            tile = np.ascontiguousarray(image_bgr[y1:y2, x1:x2])
+            return tile_engine.ocr(tile, cls=cls)
+
+        shared = getattr(engine, "thread_safe", False)
+        if self.workers > 1 and len(rects) > 1 and (shared or self.engine_factory is not None):
+            executor = self._get_executor()
+            if shared:
+                futures = [executor.submit(run_tile, rect, main) for rect in rects]
+            else:
+                futures = [
+                    executor.submit(lambda r: run_tile(r, self._thread_engine(wrap)), rect)
+                    for rect in rects
+                ]
+            tile_results = [f.result() for f in futures]
+        else:
+            if self.workers > 1 and not self._warned_serial:
+                self._warned_serial = True
+                print(f"⚠️ {type(engine).__name__} 는 스레드 안전하지 않고 engine_factory 가 없어 "
+                      f"타일을 순서대로 처리합니다.")
+            tile_results = [run_tile(rect, main) for rect in rects]
+
+        with timed("tile_merge"):
+            page = self._merge(rects, tile_results, frame_w, frame_h)
+        return [page] if page else [None]
+
+    # ------------------------------------------------------
+    # 중복 제거 + 경계 조각 이어 붙이기
+    # ------------------------------------------------------
+    def _merge(self, rects, tile_results, frame_w: int, frame_h: int) -> list:
+        candidates = []
+        for (x1, y1, x2, y2), result in zip(rects, tile_results):
+            if not result or not result[0]:
+                continue
+            for box, (text, conf) in result[0]:
+                full_box = [[float(p[0]) + x1, float(p[1]) + y1] for p in box]
+                aabb = _aabb(full_box)
+                cut = _cut_sides(aabb, (x1, y1, x2, y2), frame_w, frame_h)
+                candidates.append((full_box, text, conf, aabb, cut))
+
+        # 온전한 박스 → 신뢰도 높은 박스 → 큰 박스 순으로 남김
+        candidates.sort(key=lambda c: (bool(c[4]), -_to_float(c[2]), -_area(c[3])))
+
+        kept = []
+        for cand in candidates:
+            if not any(self._is_duplicate(cand, other) for other in kept):
+                kept.append(cand)
+
+        kept = self._stitch(kept)
+        kept.sort(key=lambda c: (c[3][1], c[3][0]))
+        return [[box, (text, conf)] for box, text, conf, _, _ in kept]
+
+    def _is_duplicate(self, a, b) -> bool:
+        inter = _intersection(a[3], b[3])
+        if inter <= 0:
+            return False
+        # 같은 줄이 세로 경계 양쪽에서 잘린 조각끼리는 중복이 아님 → _stitch 에서 이어 붙임
+        if _is_seam_pair(a, b) or _is_seam_pair(b, a):
+            return False
+        area_a, area_b = _area(a[3]), _area(b[3])
+        union = area_a + area_b - inter
+        if union > 0 and inter / union >= self.iou_threshold:
+            return True
+        smaller = min(area_a, area_b)
+        if smaller > 0 and inter / smaller >= self.contain_threshold:
+            # 잘린 조각이 온전한 박스 안에 들어가면 같은 글자를 덜 본 것 (텍스트는 깨져 있을 수 있음)
+            part = a if area_a <= area_b else b
+            whole = b if part is a else a
+            if part[4] and not whole[4]:
+                return True
+            text_a, text_b = _norm_text(a[1]), _norm_text(b[1])
+            return text_a in text_b or text_b in text_a
+        return False
+
+    def _stitch(self, kept: list) -> list:
+        """세로 경계에서 잘린 같은 줄의 조각을 왼쪽부터 이어 붙임 (3개 이상 타일에 걸친 줄도 반복해서 합침)"""
+        merged = True
+        while merged:
+            merged = False
+            kept.sort(key=lambda c: c[3][0])
+            for i, left in enumerate(kept):
+                if "r" not in left[4]:
+                    continue
+                # 가장 가까운(왼쪽 끝이 가장 왼쪽인) 오른쪽 조각과 합침
+                for j in range(i + 1, len(kept)):
+                    right = kept[j]
+                    if _is_seam_pair(left, right):
+                        kept[i] = _join_pieces(left, right)
+                        del kept[j]
+                        merged = True
+                        break
+                if merged:
+                    break
+        return kept
+
+
+class TiledEngine:
+    """ocr(image, cls=...) 호출을 TiledOcr.ocr 로 넘기는 얇은 래퍼"""
+
+    __slots__ = ("tiling", "engine", "wrap")
+
+    def __init__(self, tiling: TiledOcr, engine, wrap=None):
+        self.tiling = tiling
+        self.engine = engine
+        self.wrap = wrap
+
+    def ocr(self, image_bgr: np.ndarray, cls: bool = True) -> list:
+        return self.tiling.ocr(self.engine, image_bgr, cls=cls, wrap=self.wrap)
+
+
+# ----------------------------------------------------------
+# 박스 유틸 (축 정렬 사각형 x1, y1, x2, y2)
+# ----------------------------------------------------------
+def _aabb(box) -> tuple[float, float, float, float]:
+    xs = [p[0] for p in box]
+    ys = [p[1] for p in box]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def _area(r) -> float:
+    return max(0.0, r[2] - r[0]) * max(0.0, r[3] - r[1])
+
+
+def _intersection(a, b) -> float:
+    w = min(a[2], b[2]) - max(a[0], b[0])
+    h = min(a[3], b[3]) - max(a[1], b[1])
+    return w * h if w > 0 and h > 0 else 0.0
+
+
+def _cut_sides(aabb, tile, frame_w: int, frame_h: int, margin: float = 2.0) -> frozenset:
+    """
+    박스가 닿은 타일 안쪽 경계 (이미지 가장자리가 아닌 쪽, 글자가 잘렸을 수 있음).
+    "l" / "r" / "t" / "b" 의 집합, 온전한 박스는 빈 집합.
+    """
+    x1, y1, x2, y2 = tile
+    sides = []
+    if x1 > 0 and aabb[0] <= x1 + margin:
+        sides.append("l")
+    if y1 > 0 and aabb[1] <= y1 + margin:
+        sides.append("t")
+    if x2 < frame_w and aabb[2] >= x2 - margin:
+        sides.append("r")
+    if y2 < frame_h and aabb[3] >= y2 - margin:
+        sides.append("b")
+    return frozenset(sides)
+
+
+def _is_seam_pair(left, right, min_v_overlap: float = 0.6) -> bool:
+    """
+    left 의 오른쪽이 잘렸고 right 의 왼쪽이 잘렸으며,
+    같은 줄(세로 범위가 충분히 겹침)에서 가로로 겹치거나 맞닿아 있으면 True.
+    """
+    if "r" not in left[4] or "l" not in right[4]:
+        return False
+    la, ra = left[3], right[3]
+    # right 가 left 보다 오른쪽으로 더 뻗어 있어야 함 (같은 조각 / 포함 관계 제외)
+    if not (ra[0] > la[0] and ra[2] > la[2]):
+        return False
+    h_l, h_r = la[3] - la[1], ra[3] - ra[1]
+    min_h = min(h_l, h_r)
+    if min_h <= 0 or min_h / max(h_l, h_r) < min_v_overlap:
+        return False
+    v_overlap = min(la[3], ra[3]) - max(la[1], ra[1])
+    if v_overlap < min_v_overlap * min_h:
+        return False
+    # 가로: 겹치거나 글자 반 칸(높이의 절반) 이내로 떨어져 있어야 같은 줄의 조각
+    return ra[0] <= la[2] + 0.5 * min_h
+
+
+def _join_pieces(left, right):
+    """두 조각의 박스를 합치고, 겹침 영역에서 두 번 읽힌 글자를 한 번만 남겨 텍스트를 이음"""
+    la, ra = left[3], right[3]
+    aabb = (min(la[0], ra[0]), min(la[1], ra[1]), max(la[2], ra[2]), max(la[3], ra[3]))
+    box = [[aabb[0], aabb[1]], [aabb[2], aabb[1]], [aabb[2], aabb[3]], [aabb[0], aabb[3]]]
+
+    text_l, text_r = str(left[1]), str(right[1])
+    # 겹친 폭만큼 right 앞쪽 글자 수 추정 → 그 근처에서 left 끝과 right 앞이 일치하는 길이를 찾음
+    overlap_w = max(0.0, la[2] - ra[0])
+    width_r = max(ra[2] - ra[0], 1e-6)
+    expected = min(len(text_r), max(0, round(len(text_r) * overlap_w / width_r)))
+    k = _overlap_length(text_l, text_r, expected)
+    text = text_l + text_r[k:]
+
+    # 신뢰도는 글자 수로 가중 평균
+    n_l, n_r = max(len(text_l), 1), max(len(text_r) - k, 0)
+    conf = (_to_float(left[2]) * n_l + _to_float(right[2]) * n_r) / (n_l + n_r)
+    cut = (left[4] - {"r"}) | (right[4] - {"l"})
+    return (box, text, conf, aabb, cut)
+
+
+def _overlap_length(text_l: str, text_r: str, expected: int, tolerance: int = 2) -> int:
+    """
+    text_l 의 끝과 text_r 의 앞이 같은 길이 k (겹침 영역에서 두 번 읽힌 글자 수).
+    expected ± tolerance 안에서 일치하는 k 중 expected 에 가장 가까운 값,
+    일치하는 k 가 없으면 expected (겹친 폭으로 추정한 글자 수) 를 씀.
+    """
+    limit = min(len(text_l), len(text_r))
+    matches = [
+        k for k in range(1, limit + 1)
+        if abs(k - expected) <= tolerance and text_l[-k:] == text_r[:k]
+    ]
+    if matches:
+        return min(matches, key=lambda k: (abs(k - expected), -k))
+    return min(expected, limit)
+
+
+def _norm_text(text) -> str:
+    return "".join(str(text).split()).lower()
+
+
+def _to_float(value) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
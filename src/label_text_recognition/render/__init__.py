@@ -0,0 +1,15 @@
+# ==========================================================
+# 결과 시각화(텍스트/박스 렌더링) 관련 모듈을 묶는 패키지입니다.
+# 폰트 로딩(fonts), 박스/텍스트 일괄 합성(overlay)을 포함합니다.
+# ==========================================================
+
+from .fonts import clear_font_cache, configure_fonts, font_cache_info, get_font
+from .overlay import OverlayCompositor
+
+__all__ = [
+    "configure_fonts",
+    "get_font",
+    "font_cache_info",
+    "clear_font_cache",
+    "OverlayCompositor",
+]
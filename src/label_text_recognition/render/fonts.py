@@ -0,0 +1,155 @@
+# ==========================================================
+# fonts.py
+# ----------------------------------------------------------
+# 한글 텍스트 렌더링에 쓰는 PIL 폰트를 "프로세스 전체에서 한 번만"
+# 로드해서 공유하는 폰트 레지스트리입니다.
+#
+# 배경
+# ----------------------------------------------------------
+# - 예전에는 ocr_utils / camera_loop.draw_korean_text / redraw_from_json 이
+#   호출될 때마다 ImageFont.truetype(NotoSansCJK-Regular.ttc, 20) 을 새로 불렀습니다.
+# - CJK .ttc 파일은 수십 MB 라서 캡처 1건(결과 줄 수만큼 호출)마다
+#   디스크 I/O + 폰트 파싱이 반복되었습니다.
+#
+# 동작 방식
+# ----------------------------------------------------------
+# ✅ (path, size) 를 키로 로드된 폰트를 보관 → 같은 조합은 두 번 로드하지 않음
+# ✅ 기본 폰트 경로는 후보 목록(fonts.candidates) 중 "존재하는 첫 번째 파일"로
+#    처음 한 번만 결정 (configure_fonts 또는 첫 get_font 호출 시)
+# ✅ 어떤 후보도 없으면 경고를 한 번만 출력하고 PIL 기본 폰트를 사용
+#
+# 사용 예시
+# ----------------------------------------------------------
+# from label_text_recognition.render.fonts import configure_fonts, get_font
+# configure_fonts(cfg)          # 시작 시 1회 (생략하면 기본 후보 목록 사용)
+# font = get_font(20)           # 기본 한글 폰트, 20px
+# ==========================================================
+
+import os
+import threading
+
+from PIL import ImageFont
+
+# 기본 폰트 후보 (앞에서부터 존재하는 파일을 사용)
+DEFAULT_FONT_CANDIDATES = (
+    "/usr/share/fonts/truetype/noto/NotoSansCJK-Regular.ttc",
+    "/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc",
+    "/usr/share/fonts/noto-cjk/NotoSansCJK-Regular.ttc",
+    "/usr/share/fonts/truetype/nanum/NanumGothic.ttf",
+    "C:/Windows/Fonts/malgun.ttf",
+    "/System/Library/Fonts/AppleSDGothicNeo.ttc",
+)
+
+DEFAULT_FONT_SIZE = 20
+
+_lock = threading.Lock()
+_fonts: dict = {}                 # (path, size) → FreeTypeFont
+_failed_paths: set = set()        # 로드에 실패한 경로 (경고는 한 번만)
+_candidates = DEFAULT_FONT_CANDIDATES
+_default_path: str | None = None
+_resolved = False
+_loads = 0
+_hits = 0
+
+
+def _resolve_default_path(candidates) -> str | None:
+    for path in candidates:
+        if path and os.path.isfile(path):
+            return path
+    return None
+
+
+def configure_fonts(cfg=None, candidates=None) -> str | None:
+    """
+    기본 폰트 경로를 결정합니다. (시작 시 한 번 호출)
+
+    Parameters
+    ----------
+    cfg : dict | OcrConfig | None
+        fonts.candidates 목록을 읽을 설정 객체
+    candidates : list[str] | None
+        직접 넘기는 후보 목록 (cfg 보다 우선)
+
+    Returns
+    -------
+    str | None
+        선택된 폰트 경로. 후보가 모두 없으면 None (→ PIL 기본 폰트 사용)
+    """
+    global _candidates, _default_path, _resolved
+
+    if candidates is None and cfg is not None:
+        font_cfg = cfg.get("fonts", {}) or {}
+        candidates = font_cfg.get("candidates")
+    if not candidates:
+        candidates = DEFAULT_FONT_CANDIDATES
+
+    with _lock:
+        _candidates = tuple(candidates)
+        _default_path = _resolve_default_path(_candidates)
+        _resolved = True
+
+    if _default_path is None:
+        print("⚠️ 한글 폰트를 찾을 수 없습니다. 기본 폰트를 사용합니다. (fonts.candidates 확인)")
+    return _default_path
+
+
+def default_font_path() -> str | None:
+    """결정된 기본 폰트 경로. 아직 결정되지 않았으면 지금 한 번 결정합니다."""
+    if not _resolved:
+        configure_fonts()
+    return _default_path
+
+
+def get_font(size: int = DEFAULT_FONT_SIZE, path: str | None = None):
+    """
+    (path, size) 에 해당하는 폰트를 돌려줍니다. 처음 요청될 때만 디스크에서 로드합니다.
+    path 가 None 이면 기본 폰트 경로를 사용합니다.
+    """
+    global _loads, _hits
+
+    if path is None:
+        path = default_font_path()
+    key = (path, int(size))
+
+    font = _fonts.get(key)
+    if font is not None:
+        _hits += 1
+        return font
+
+    with _lock:
+        font = _fonts.get(key)
+        if font is not None:
+            _hits += 1
+            return font
+
+        if path is None:
+            font = ImageFont.load_default()
+        else:
+            try:
+                font = ImageFont.truetype(path, int(size))
+            except OSError:
+                if path not in _failed_paths:
+                    print(f"⚠️ 폰트를 로드할 수 없습니다: {path} → 기본 폰트 사용")
+                    _failed_paths.add(path)
+                font = ImageFont.load_default()
+
+        _fonts[key] = font
+        _loads += 1
+        return font
+
+
+def font_cache_info() -> dict:
+    """로드 횟수 / 재사용 횟수 / 보관 중인 폰트 수"""
+    return {"loads": _loads, "hits": _hits, "size": len(_fonts), "default_path": _default_path}
+
+
+def clear_font_cache() -> None:
+    """로드된 폰트와 기본 경로 결정을 모두 초기화합니다. (폰트 파일 교체/테스트용)"""
+    global _default_path, _resolved, _loads, _hits
+    with _lock:
+        _fonts.clear()
+        _failed_paths.clear()
+        _default_path = None
+        _resolved = False
+        _loads = 0
+        _hits = 0
@@ -0,0 +1,146 @@
+# ==========================================================
+# overlay.py
+# ----------------------------------------------------------
+# 캡처 결과(박스 + 한글 라벨)를 "한 번에" 그리는 오버레이 합성기입니다.
+#
+# 배경
+# ----------------------------------------------------------
+# - 예전 process_capture 는 결과 줄마다 draw_korean_text 를 호출했고,
+#   호출마다 전체 프레임을 BGR→RGB→PIL→NumPy→BGR 로 변환했습니다.
+#   → 40줄 라벨이면 캡처 1건에 전체 프레임 색 변환이 80번
+#
+# 동작 방식
+# ----------------------------------------------------------
+# ✅ add_rect / add_polyline / add_text 로 그릴 항목을 모으기만 하고
+# ✅ compose() 에서
+#     1) 박스는 OpenCV 로 BGR 이미지에 바로 그림 (색 변환 없음)
+#     2) 모든 텍스트가 차지하는 영역(합집합)만 잘라서 PIL 레이어 1장으로 만들고
+#     3) 그 레이어에 텍스트를 한 번에 그린 뒤 원래 위치에 한 번만 합성
+#   → 색 변환은 텍스트 영역에 대해 왕복 1회
+#
+# 색상 규칙 (기존 코드와 동일)
+# ----------------------------------------------------------
+# - 박스 color : OpenCV 와 같은 BGR
+# - 텍스트 color: PIL 과 같은 RGB  (draw_korean_text 의 color 와 같은 의미)
+#
+# 사용 예시
+# ----------------------------------------------------------
+# overlay = OverlayCompositor(frame)
+# for r in results:
+#     overlay.add_rect((x1, y1), (x2, y2), (0, 255, 255))
+#     overlay.add_text(r["text"], x1, y1 - 22, color=(255, 0, 0))
+# vis_img = overlay.compose()
+# ==========================================================
+
+from dataclasses import dataclass
+
+import cv2
+import numpy as np
+from PIL import Image, ImageDraw
+
+from label_text_recognition.render.fonts import DEFAULT_FONT_SIZE, get_font
+
+
+@dataclass(frozen=True)
+class _TextItem:
+    text: str
+    x: int
+    y: int
+    color: tuple
+    font: object
+
+
+class OverlayCompositor:
+    """
+    박스/텍스트 그리기 요청을 모아서 compose() 에서 한 번에 그립니다.
+
+    Parameters
+    ----------
+    image_bgr : np.ndarray
+        바탕 이미지 (BGR)
+    copy : bool
+        True  → 복사본에 그림 (원본 유지, 기본값)
+        False → image_bgr 에 직접 그림 (호출부가 이미 복사본을 들고 있을 때)
+    """
+
+    def __init__(self, image_bgr, copy: bool = True):
+        self._image = image_bgr.copy() if copy else image_bgr
+        self._rects: list = []
+        self._polylines: list = []
+        self._texts: list[_TextItem] = []
+
+    def __len__(self) -> int:
+        return len(self._rects) + len(self._polylines) + len(self._texts)
+
+    # ------------------------------------------------------
+    # 그릴 항목 추가
+    # ------------------------------------------------------
+    def add_rect(self, pt1, pt2, color=(0, 255, 255), thickness: int = 2) -> None:
+        """축 정렬 사각형 (color: BGR)"""
+        p1 = (int(pt1[0]), int(pt1[1]))
+        p2 = (int(pt2[0]), int(pt2[1]))
+        self._rects.append((p1, p2, tuple(color), int(thickness)))
+
+    def add_polyline(self, points, color=(0, 255, 0), thickness: int = 2, closed: bool = True) -> None:
+        """다각형 박스 (points: [[x, y], ...], color: BGR)"""
+        pts = np.asarray(points, dtype=np.int32).reshape((-1, 1, 2))
+        self._polylines.append((pts, tuple(color), int(thickness), closed))
+
+    def add_text(self, text, x, y, color=(255, 0, 0), font_size: int = DEFAULT_FONT_SIZE,
+                 font_path: str | None = None) -> None:
+        """한글 텍스트 (color: RGB, 폰트는 render.fonts 레지스트리에서 공유)"""
+        if not text:
+            return
+        font = get_font(font_size, font_path)
+        self._texts.append(_TextItem(str(text), int(x), int(y), tuple(color), font))
+
+    # ------------------------------------------------------
+    # 합성
+    # ------------------------------------------------------
+    def _text_region(self):
+        """모든 텍스트를 감싸는 영역 (이미지 범위로 자른 x0, y0, x1, y1). 없으면 None."""
+        h, w = self._image.shape[:2]
+        x0 = y0 = None
+        x1 = y1 = None
+        for item in self._texts:
+            left, top, right, bottom = item.font.getbbox(item.text)
+            bx0, by0 = item.x + left, item.y + top
+            bx1, by1 = item.x + right, item.y + bottom
+            x0 = bx0 if x0 is None else min(x0, bx0)
+            y0 = by0 if y0 is None else min(y0, by0)
+            x1 = bx1 if x1 is None else max(x1, bx1)
+            y1 = by1 if y1 is None else max(y1, by1)
+
+        if x0 is None:
+            return None
+        x0, y0 = max(0, int(x0)), max(0, int(y0))
+        x1, y1 = min(w, int(np.ceil(x1)) + 1), min(h, int(np.ceil(y1)) + 1)
+        if x0 >= x1 or y0 >= y1:
+            return None
+        return x0, y0, x1, y1
+
+    def compose(self):
+        """모아둔 항목을 모두 그린 BGR 이미지를 돌려줍니다."""
+        img = self._image
+
+        # 1) 박스: OpenCV 로 BGR 이미지에 직접
+        for p1, p2, color, thickness in self._rects:
+            cv2.rectangle(img, p1, p2, color, thickness)
+        for pts, color, thickness, closed in self._polylines:
+            cv2.polylines(img, [pts], isClosed=closed, color=color, thickness=thickness)
+
+        # 2) 텍스트: 텍스트 영역만 PIL 레이어로 만들어 한 번에 그리고 한 번에 되돌림
+        region = self._text_region()
+        if region is not None:
+            x0, y0, x1, y1 = region
+            patch = img[y0:y1, x0:x1]
+            layer = Image.fromarray(cv2.cvtColor(patch, cv2.COLOR_BGR2RGB))
+            draw = ImageDraw.Draw(layer)
+            for item in self._texts:
+                draw.text((item.x - x0, item.y - y0), item.text, font=item.font, fill=item.color)
+            img[y0:y1, x0:x1] = cv2.cvtColor(np.asarray(layer), cv2.COLOR_RGB2BGR)
+
+        self._rects.clear()
+        self._polylines.clear()
+        self._texts.clear()
+        return img
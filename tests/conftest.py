@@ -0,0 +1,14 @@
+# ==========================================================
+# tests/conftest.py
+# ----------------------------------------------------------
+# src/ 경로를 sys.path 에 추가합니다. (demos/ , benchmarks/ 와 같은 방식)
+# 실행: python -m pytest -q tests
+# ==========================================================
+
+import os
+import sys
+
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+SRC_PATH = os.path.join(os.path.dirname(CURRENT_DIR), "src")
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
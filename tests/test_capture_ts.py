@@ -0,0 +1,61 @@
+# ==========================================================
+# tests/test_capture_ts.py
+# ----------------------------------------------------------
+# 파일 소스 / 카메라에서 같은 초에 캡처한 프레임들이
+# 이미지와 JSON 모두 서로 다른 이름으로 저장되는지 확인합니다.
+# ==========================================================
+
+import os
+
+from label_text_recognition.camera.camera_loop import _capture_ts
+from label_text_recognition.camera.frame_source import FrameSource
+from label_text_recognition.config.settings import OcrConfig
+from label_text_recognition.exporters.json_exporter import export_to_json
+
+
+class _VideoSource(FrameSource):
+    name = "line3"
+
+
+class _LiveSource(FrameSource):
+    name = "camera"
+    is_live = True
+
+
+def _cfg(tmp_path) -> OcrConfig:
+    return OcrConfig.from_mapping({
+        "enable_save_output": True,
+        "export_options": {
+            "text_json": {"enabled": True, "path": str(tmp_path / "json"),
+                          "filename_pattern": "capture_{ts}.json"},
+            "bbox_json": {"enabled": False},
+        },
+    })
+
+
+def test_file_source_frames_get_distinct_json_names(tmp_path):
+    cfg = _cfg(tmp_path)
+    source = _VideoSource()
+    results = [{"text": "LOT 240117", "avg_conf": 0.9, "box": [[0, 0], [40, 0], [40, 12], [0, 12]]}]
+
+    stamps = [_capture_ts(source, seq) for seq in range(4)]
+    for ts in stamps:
+        export_to_json(results, f"capture_{ts}.json", cfg=cfg, ts=ts)
+
+    assert len(set(stamps)) == 4
+    assert sorted(os.listdir(tmp_path / "json")) == sorted(f"capture_{ts}.json" for ts in stamps)
+
+
+def test_live_captures_in_the_same_second_get_distinct_names(tmp_path):
+    # ocr_queue_size 만큼 같은 초에 캡처가 대기열에 들어가도 서로 덮어쓰지 않아야 함
+    cfg = _cfg(tmp_path)
+    source = _LiveSource()
+    results = [{"text": "LOT 240117", "avg_conf": 0.9, "box": [[0, 0], [40, 0], [40, 12], [0, 12]]}]
+
+    stamps = [_capture_ts(source, seq) for seq in (41, 42)]
+    for ts in stamps:
+        export_to_json(results, f"capture_{ts}.json", cfg=cfg, ts=ts)
+
+    assert stamps[0] != stamps[1]
+    assert all(ts.endswith(f"_{seq:06d}") for ts, seq in zip(stamps, (41, 42)))
+    assert len(os.listdir(tmp_path / "json")) == 2
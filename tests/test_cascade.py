@@ -0,0 +1,81 @@
+# ==========================================================
+# tests/test_cascade.py
+# ----------------------------------------------------------
+# 여러 워커 스레드가 CascadeRecognizer 하나를 같이 쓸 때
+# 스레드 안전하지 않은 보조 엔진이 동시에 호출되지 않는지 확인합니다.
+# ==========================================================
+
+import threading
+import time
+
+import numpy as np
+
+from label_text_recognition.ocr.cascade import CascadeRecognizer
+
+
+class _SecondaryEngine:
+    """recognize() 가 겹쳐서 호출되면 그 횟수를 세는 가짜 보조 엔진."""
+
+    def __init__(self, thread_safe: bool):
+        self.thread_safe = thread_safe
+        self.active = 0
+        self.max_active = 0
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def recognize(self, crops):
+        with self._lock:
+            self.active += 1
+            self.calls += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(0.01)
+        with self._lock:
+            self.active -= 1
+        return [("PART-7", 0.95) for _ in crops]
+
+
+class _Registry:
+    main_lang = "korean"
+    langs = ["korean", "en"]
+
+    def __init__(self, engine):
+        self.engine = engine
+
+    def get(self, lang=None):
+        return self.engine
+
+
+def _refine_from_threads(cascade, n_threads=6):
+    image = np.zeros((60, 200, 3), dtype=np.uint8)
+    result = [[[[[10, 10], [120, 10], [120, 40], [10, 40]], ("PAR7-7", 0.4)]]]
+    outputs = []
+
+    def worker():
+        outputs.append(cascade.refine(image, result))
+
+    threads = [threading.Thread(target=worker) for _ in range(n_threads)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return outputs
+
+
+def test_non_thread_safe_secondary_engine_is_serialized():
+    engine = _SecondaryEngine(thread_safe=False)
+    cascade = CascadeRecognizer(_Registry(engine), ["en"])
+    outputs = _refine_from_threads(cascade)
+
+    assert engine.calls == 6
+    assert engine.max_active == 1
+    assert all(out[0][0][1] == ("PART-7", 0.95) for out in outputs)
+    assert cascade.stats()["regions_replaced"] == 6
+
+
+def test_thread_safe_secondary_engine_runs_concurrently():
+    engine = _SecondaryEngine(thread_safe=True)
+    cascade = CascadeRecognizer(_Registry(engine), ["en"])
+    _refine_from_threads(cascade)
+
+    assert engine.calls == 6
+    assert engine.max_active > 1
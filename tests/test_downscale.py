@@ -0,0 +1,77 @@
+# ==========================================================
+# tests/test_downscale.py
+# ----------------------------------------------------------
+# AdaptiveDownscaler 의 target_text_height 모드가
+# "큰 글자 프레임 → 작은 글자 프레임" 전환 뒤에도 다시 검출하는지 확인합니다.
+# ==========================================================
+
+import numpy as np
+
+from label_text_recognition.ocr.downscale import AdaptiveDownscaler
+
+
+class _FakeEngine:
+    """
+    원본 좌표 글자 높이가 text_height 인 박스 하나를 돌려주는 가짜 엔진.
+    축소 후 글자 높이가 min_detect_px 미만이면 검출하지 못함.
+    """
+
+    def __init__(self):
+        self.text_height = 200.0
+        self.min_detect_px = 8.0
+        self.detect_sizes = []
+
+    def detect(self, small):
+        frame_w = self.frame_w
+        scale = small.shape[1] / frame_w
+        self.detect_sizes.append(small.shape[1])
+        h = self.text_height * scale
+        if h < self.min_detect_px:
+            return []
+        return [[[10, 10], [10 + 4 * h, 10], [10 + 4 * h, 10 + h], [10, 10 + h]]]
+
+    def recognize_boxes(self, images, boxes_per_image, cls=True):
+        # 이미지마다 engine.ocr() 과 같은 [[ [box, (text, conf)], ... ]] 모양
+        return [[[[box, ("TEXT", 0.9)] for box in boxes]] for boxes in boxes_per_image]
+
+    def ocr(self, image, cls=True):
+        raise AssertionError("detect/recognize_boxes 경로를 써야 함")
+
+
+def _run(downscaler, engine, text_height):
+    engine.text_height = text_height
+    frame = np.zeros((3000, 4000, 3), np.uint8)
+    engine.frame_w = frame.shape[1]
+    return downscaler.ocr(engine, frame)
+
+
+def test_recovers_after_large_text_frame():
+    downscaler = AdaptiveDownscaler(target_long_side=1000, target_text_height=16, min_long_side=100)
+    engine = _FakeEngine()
+
+    # 큰 글자(200px) → 추정값 200 → 다음 배율은 16/200 = 0.08
+    assert _run(downscaler, engine, 200.0)[0]
+    assert downscaler.scale_for(4000, 3000) < 0.1
+
+    # 작은 글자(40px): 0.08 배율이면 3.2px → 검출 실패 → 기본 배율(0.25, 10px)로 재시도해서 찾음
+    result = _run(downscaler, engine, 40.0)
+    assert result[0], "기본 배율 재시도에서 검출되어야 함"
+    assert engine.detect_sizes[-2:] == [320, 1000]
+
+    # 추정값이 작은 글자 기준으로 바뀌어서 다음 프레임은 재시도 없이 검출
+    engine.detect_sizes.clear()
+    assert _run(downscaler, engine, 40.0)[0]
+    assert len(engine.detect_sizes) == 1
+
+
+def test_empty_frame_resets_estimate():
+    downscaler = AdaptiveDownscaler(target_long_side=1000, target_text_height=16, min_long_side=100)
+    engine = _FakeEngine()
+    _run(downscaler, engine, 200.0)
+    assert downscaler.text_height is not None
+
+    # 글자가 없는 프레임 → 추정값을 버리고 다음 프레임은 기본 배율
+    engine.min_detect_px = 1e9
+    assert not _run(downscaler, engine, 200.0)[0]
+    assert downscaler.text_height is None
+    assert downscaler.scale_for(4000, 3000) == 0.25
@@ -0,0 +1,51 @@
+# ==========================================================
+# tests/test_json_exporter.py
+# ----------------------------------------------------------
+# export_all_json 이 파일 이름의 {ts} 로 호출부가 넘긴 캡처 ts 를 쓰는지 확인합니다.
+# (1초에 여러 장을 저장해도 덮어쓰지 않고, 이미지 capture_<ts>.jpg 와 짝이 맞아야 함)
+# ==========================================================
+
+import json
+import os
+
+from label_text_recognition.config.settings import OcrConfig
+from label_text_recognition.exporters.json_exporter import export_all_json
+
+RESULTS = [{"text": "LOT 240117", "avg_conf": 0.93, "box": [[0, 0], [40, 0], [40, 12], [0, 12]]}]
+
+
+def _cfg(tmp_path, merge: bool = False) -> OcrConfig:
+    return OcrConfig.from_mapping({
+        "enable_save_output": True,
+        "export_options": {
+            "text_json": {"enabled": True, "path": str(tmp_path / "json"),
+                          "filename_pattern": "capture_{ts}.json"},
+            "bbox_json": {"enabled": True, "path": str(tmp_path / "bbox"),
+                          "filename_pattern": "bbox_{ts}.json", "merge_with_text_json": merge},
+        },
+    })
+
+
+def test_each_capture_ts_gets_its_own_files(tmp_path):
+    cfg = _cfg(tmp_path)
+    for i in range(5):
+        paths = export_all_json(RESULTS, cfg, ts=f"20260101_120000_vid_{i:06d}")
+        assert paths["text_json"].endswith(f"capture_20260101_120000_vid_{i:06d}.json")
+        assert paths["bbox_json"].endswith(f"bbox_20260101_120000_vid_{i:06d}.json")
+
+    assert len(os.listdir(tmp_path / "json")) == 5
+    assert len(os.listdir(tmp_path / "bbox")) == 5
+
+
+def test_merged_bbox_uses_capture_ts(tmp_path):
+    paths = export_all_json(RESULTS, _cfg(tmp_path, merge=True), ts="20260101_120000_cam2")
+    assert os.path.basename(paths["text_json"]) == "capture_20260101_120000_cam2.json"
+    with open(paths["text_json"], encoding="utf-8") as f:
+        assert set(json.load(f)) == {"results", "bbox"}
+
+
+def test_missing_ts_falls_back_to_current_time(tmp_path):
+    paths = export_all_json(RESULTS, _cfg(tmp_path))
+    name = os.path.basename(paths["text_json"])
+    # capture_YYYYMMDD_HHMMSS.json
+    assert name.startswith("capture_") and len(name) == len("capture_20260101_120000.json")
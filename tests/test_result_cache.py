@@ -0,0 +1,140 @@
+# ==========================================================
+# tests/test_result_cache.py
+# ----------------------------------------------------------
+# OcrResultCache 의 HIT / MISS / TTL / LRU 동작과
+# "레이아웃이 같고 로트 번호만 다른 라벨"을 구분하는지 확인합니다.
+# ==========================================================
+
+import cv2
+import numpy as np
+import pytest
+
+from label_text_recognition.ocr.result_cache import OcrResultCache
+
+
+def _label(lot: str, font_scale: float = 1.2) -> np.ndarray:
+    img = np.full((720, 1280, 3), 235, np.uint8)
+    cv2.rectangle(img, (100, 80), (1180, 640), (30, 30, 30), 3)
+    lines = ["ACME PARTS CO.", "PART NO: AB-1234-XY", f"LOT: {lot}", "QTY: 500 PCS", "EXP: 2027-03-01"]
+    for i, text in enumerate(lines):
+        cv2.putText(img, text, (150, 170 + i * 100), cv2.FONT_HERSHEY_SIMPLEX,
+                    font_scale, (20, 20, 20), 2, cv2.LINE_AA)
+    return img
+
+
+def _noisy(img: np.ndarray, sigma: float, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return np.clip(img + rng.normal(0, sigma, img.shape), 0, 255).astype(np.uint8)
+
+
+def _results(text: str) -> list[dict]:
+    return [{"text": text, "avg_conf": 0.9, "box": [[0, 0], [10, 0], [10, 10], [0, 10]],
+             "word_boxes": [[[0, 0], [10, 0], [10, 10], [0, 10]]]}]
+
+
+@pytest.fixture
+def cache() -> OcrResultCache:
+    return OcrResultCache(max_size=4, ttl_sec=5.0)
+
+
+def test_same_label_with_sensor_noise_hits(cache):
+    base = _label("240117-03")
+    cache.put(cache.fingerprint(base), _results("A"), params="p", now=0.0)
+
+    for sigma in (3.0, 8.0):
+        hit = cache.get(cache.fingerprint(_noisy(base, sigma)), params="p", now=1.0)
+        assert hit is not None and hit[0]["text"] == "A"
+    assert cache.hits == 2 and cache.misses == 0
+
+
+@pytest.mark.parametrize("other_lot", ["240117-08", "240117-06", "240117-05"])
+def test_label_differing_only_in_lot_number_misses(cache, other_lot):
+    cache.put(cache.fingerprint(_label("240117-03")), _results("A"), params="p", now=0.0)
+
+    assert cache.get(cache.fingerprint(_label(other_lot)), params="p", now=1.0) is None
+    assert cache.misses == 1
+
+
+def test_small_text_difference_misses(cache):
+    def small(lot):
+        img = np.full((720, 1280, 3), 235, np.uint8)
+        cv2.putText(img, f"LOT: {lot}", (150, 300), cv2.FONT_HERSHEY_SIMPLEX, 0.4, (20, 20, 20), 1, cv2.LINE_AA)
+        return img
+
+    cache.put(cache.fingerprint(small("240117-03")), _results("A"), now=0.0)
+    assert cache.get(cache.fingerprint(small("240117-01")), now=1.0) is None
+    assert cache.get(cache.fingerprint(_noisy(small("240117-03"), 3.0)), now=1.0) is not None
+
+
+def test_params_must_match(cache):
+    fp = cache.fingerprint(_label("240117-03"))
+    cache.put(fp, _results("A"), params=(0.5, True), now=0.0)
+
+    assert cache.get(fp, params=(0.6, True), now=1.0) is None
+    assert cache.get(fp, params=(0.5, True), now=1.0) is not None
+
+
+def test_different_image_size_never_hits(cache):
+    img = _label("240117-03")
+    cache.put(cache.fingerprint(img), _results("A"), now=0.0)
+    assert cache.get(cache.fingerprint(cv2.resize(img, (640, 640))), now=1.0) is None
+
+
+def test_ttl_expires_entries():
+    cache = OcrResultCache(max_size=4, ttl_sec=2.0)
+    fp = cache.fingerprint(_label("240117-03"))
+    cache.put(fp, _results("A"), now=0.0)
+
+    assert cache.get(fp, now=1.5) is not None
+    assert cache.get(fp, now=2.5) is None
+    assert cache.expirations == 1
+    assert cache.stats()["size"] == 0
+
+
+def test_ttl_zero_never_expires():
+    cache = OcrResultCache(max_size=4, ttl_sec=0)
+    fp = cache.fingerprint(_label("240117-03"))
+    cache.put(fp, _results("A"), now=0.0)
+    assert cache.get(fp, now=1e6) is not None
+
+
+def test_lru_evicts_least_recently_used():
+    cache = OcrResultCache(max_size=2, ttl_sec=0)
+    fps = {lot: cache.fingerprint(_label(lot)) for lot in ("111111-11", "222222-22", "333333-33")}
+    cache.put(fps["111111-11"], _results("1"), now=0.0)
+    cache.put(fps["222222-22"], _results("2"), now=0.0)
+
+    # 1 을 조회해서 최근 사용으로 만든 뒤 3 을 넣으면 2 가 밀려남
+    assert cache.get(fps["111111-11"], now=0.0)[0]["text"] == "1"
+    cache.put(fps["333333-33"], _results("3"), now=0.0)
+
+    assert cache.evictions == 1
+    assert cache.get(fps["222222-22"], now=0.0) is None
+    assert cache.get(fps["111111-11"], now=0.0)[0]["text"] == "1"
+    assert cache.get(fps["333333-33"], now=0.0)[0]["text"] == "3"
+
+
+def test_values_are_deep_copied(cache):
+    fp = cache.fingerprint(_label("240117-03"))
+    stored = _results("A")
+    cache.put(fp, stored, now=0.0)
+
+    # 저장 후 호출부가 원본을 고쳐도 캐시는 그대로
+    stored[0]["box"][0][0] = 999
+    stored[0]["word_boxes"].clear()
+
+    first = cache.get(fp, now=0.0)
+    assert first[0]["box"][0][0] == 0 and len(first[0]["word_boxes"]) == 1
+
+    # 받은 결과를 고쳐도 다음 HIT 결과는 그대로
+    first[0]["box"][0][0] = 555
+    first[0]["text"] = "changed"
+    second = cache.get(fp, now=0.0)
+    assert second[0]["box"][0][0] == 0 and second[0]["text"] == "A"
+
+
+def test_from_config_disabled_by_default():
+    assert OcrResultCache.from_config({}) is None
+    assert OcrResultCache.from_config({"result_cache": {"enabled": False}}) is None
+    cache = OcrResultCache.from_config({"result_cache": {"enabled": True, "max_cell_diff": 2.5}})
+    assert cache is not None and cache.max_cell_diff == 2.5
@@ -0,0 +1,42 @@
+# ==========================================================
+# tests/test_roi.py
+# ----------------------------------------------------------
+# camera_index: "auto" 로 연 카메라에도 roi.per_camera.<실제 장치 번호> 가 적용되는지 확인합니다.
+# ==========================================================
+
+from label_text_recognition.camera import camera_initializer
+from label_text_recognition.camera.frame_source import open_frame_source
+from label_text_recognition.config.settings import OcrConfig
+from label_text_recognition.ocr.roi import RoiSet
+
+ROI_CFG = {
+    "enabled": True,
+    "units": "px",
+    "regions": [{"name": "default", "x": 0, "y": 0, "w": 100, "h": 100}],
+    "per_camera": {2: [{"name": "cam2", "x": 10, "y": 20, "w": 300, "h": 40}]},
+}
+
+
+class _FakeCap:
+    def isOpened(self):
+        return True
+
+    def release(self):
+        pass
+
+
+def test_per_camera_uses_device_index():
+    cfg = OcrConfig.from_mapping({"roi": ROI_CFG})
+    assert RoiSet.from_config(cfg, camera_index=2).rois[0].name == "cam2"
+    assert RoiSet.from_config(cfg, camera_index=0).rois[0].name == "default"
+    assert RoiSet.from_config(cfg, camera_index=None).rois[0].name == "default"
+
+
+def test_auto_camera_source_reports_resolved_index(monkeypatch):
+    # auto 탐색이 2번 장치를 열었다고 가정
+    monkeypatch.setattr(camera_initializer, "init_camera_with_index", lambda cfg: (_FakeCap(), 2))
+    cfg = OcrConfig.from_mapping({"camera_index": "auto", "roi": ROI_CFG})
+
+    source = open_frame_source(cfg)
+    assert source.camera_index == 2
+    assert RoiSet.from_config(cfg, camera_index=source.camera_index).rois[0].name == "cam2"
@@ -0,0 +1,59 @@
+# ==========================================================
+# tests/test_sqlite_index.py
+# ----------------------------------------------------------
+# SqliteResultIndex 가 다음 캡처를 기다리지 않고 flush_interval_sec 안에 커밋해서
+# 다른 연결(조회 프로세스)에서 바로 보이는지, close() 뒤 호출이 안전한지 확인합니다.
+# ==========================================================
+
+import sqlite3
+import time
+
+from label_text_recognition.exporters.sqlite_index import SqliteResultIndex
+
+RESULTS = [{"text": "LOT-240117", "avg_conf": 0.93, "box": [[0, 0], [40, 0], [40, 12], [0, 12]]}]
+
+
+def _count_from_other_connection(db_path) -> int:
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute("SELECT COUNT(*) FROM captures").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def test_idle_capture_is_committed_after_interval(tmp_path):
+    db_path = str(tmp_path / "index.sqlite3")
+    index = SqliteResultIndex(db_path, batch_size=20, flush_interval_sec=0.2)
+    try:
+        index.add("20260101_120000_000001", RESULTS)
+        assert _count_from_other_connection(db_path) == 0
+
+        deadline = time.monotonic() + 2.0
+        while _count_from_other_connection(db_path) == 0 and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert _count_from_other_connection(db_path) == 1
+    finally:
+        index.close()
+
+
+def test_batch_size_commits_immediately(tmp_path):
+    db_path = str(tmp_path / "index.sqlite3")
+    index = SqliteResultIndex(db_path, batch_size=2, flush_interval_sec=60.0)
+    try:
+        index.add("20260101_120000_000001", RESULTS)
+        index.add("20260101_120000_000002", RESULTS)
+        assert _count_from_other_connection(db_path) == 2
+    finally:
+        index.close()
+
+
+def test_add_and_flush_after_close_are_ignored(tmp_path):
+    db_path = str(tmp_path / "index.sqlite3")
+    index = SqliteResultIndex(db_path, flush_interval_sec=60.0)
+    index.add("20260101_120000_000001", RESULTS)
+    index.close()
+
+    index.add("20260101_120001_000002", RESULTS)
+    index.flush()
+    index.close()
+    assert _count_from_other_connection(db_path) == 1
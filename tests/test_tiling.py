@@ -0,0 +1,203 @@
+# ==========================================================
+# tests/test_tiling.py
+# ----------------------------------------------------------
+# TiledOcr 의 타일 배치(_starts), 중복 판정(_is_duplicate),
+# 결과 합치기(_merge) 와 경계에서 잘린 줄 조각 이어 붙이기를 확인합니다.
+# ==========================================================
+
+import random
+
+import numpy as np
+
+from label_text_recognition.ocr.tiling import TiledOcr
+
+
+def _box(x1, y1, x2, y2):
+    return [[x1, y1], [x2, y1], [x2, y2], [x1, y2]]
+
+
+def _cand(x1, y1, x2, y2, text, conf=0.9, cut=()):
+    return (_box(x1, y1, x2, y2), text, conf, (x1, y1, x2, y2), frozenset(cut))
+
+
+# ----------------------------------------------------------
+# _starts
+# ----------------------------------------------------------
+def test_starts_cover_image_with_overlap():
+    tiling = TiledOcr(tile_size=1280, overlap=480)
+    for length in (1281, 2500, 6000, 8000):
+        starts = tiling._starts(length)
+        assert starts[0] == 0
+        assert starts[-1] == length - 1280
+        for a, b in zip(starts, starts[1:]):
+            # 이웃 타일은 최소 overlap 만큼 겹치고, 빈틈이 없어야 함
+            assert 0 < b - a <= 1280 - 480
+
+
+def test_starts_small_image_is_single_tile():
+    tiling = TiledOcr(tile_size=1280, overlap=480)
+    assert tiling._starts(1280) == [0]
+    assert tiling._starts(900) == [0]
+
+
+def test_overlap_is_clamped_to_half_tile():
+    assert TiledOcr(tile_size=1000, overlap=900).overlap == 500
+
+
+# ----------------------------------------------------------
+# _is_duplicate
+# ----------------------------------------------------------
+def test_is_duplicate_by_iou():
+    tiling = TiledOcr()
+    assert tiling._is_duplicate(_cand(0, 0, 100, 20, "LOT"), _cand(2, 0, 102, 20, "LOT"))
+    assert not tiling._is_duplicate(_cand(0, 0, 100, 20, "LOT"), _cand(200, 0, 300, 20, "LOT"))
+
+
+def test_is_duplicate_contained_needs_matching_text():
+    tiling = TiledOcr()
+    whole = _cand(0, 0, 300, 20, "LOT 12345")
+    assert tiling._is_duplicate(_cand(100, 0, 200, 20, "123"), whole)
+    assert not tiling._is_duplicate(_cand(100, 0, 200, 20, "XYZ"), whole)
+
+
+def test_is_duplicate_cut_fragment_inside_whole_box():
+    tiling = TiledOcr()
+    whole = _cand(0, 100, 300, 120, "LOT 12345")
+    # 가로 경계에서 위쪽만 보인 조각 → 텍스트가 깨져 있어도 중복
+    fragment = _cand(0, 100, 300, 112, "10T I2", cut="b")
+    assert tiling._is_duplicate(fragment, whole)
+
+
+def test_seam_fragments_are_not_duplicates():
+    tiling = TiledOcr()
+    left = _cand(500, 0, 800, 20, "ABCDEFGHIJ", cut="r")
+    right = _cand(520, 0, 820, 20, "BCDEFGHIJK", cut="l")
+    # IoU 가 높아도 세로 경계 양쪽에서 잘린 조각끼리는 이어 붙일 대상
+    assert not tiling._is_duplicate(left, right)
+    assert not tiling._is_duplicate(right, left)
+
+
+# ----------------------------------------------------------
+# _merge
+# ----------------------------------------------------------
+RECTS = [(0, 0, 1280, 1280), (800, 0, 2080, 1280)]
+
+
+def _texts(page):
+    return [text for _, (text, _) in page]
+
+
+def test_merge_drops_duplicate_from_overlap():
+    tiling = TiledOcr(tile_size=1280, overlap=480)
+    # x=900~1100 의 단어는 두 타일 모두에 온전히 들어감
+    results = [
+        [[[_box(900, 50, 1100, 80), ("PALLET", 0.95)]]],
+        [[[_box(100, 50, 300, 80), ("PALLET", 0.90)]]],
+    ]
+    page = tiling._merge(RECTS, results, 2080, 1280)
+    assert _texts(page) == ["PALLET"]
+    assert page[0][1][1] == 0.95
+
+
+def test_merge_prefers_whole_box_over_cut_fragment():
+    tiling = TiledOcr(tile_size=1280, overlap=480)
+    # 왼쪽 타일에서는 잘린 조각, 오른쪽 타일에서는 온전한 박스 (조각의 신뢰도가 더 높아도)
+    results = [
+        [[[_box(1100, 50, 1280, 80), ("SHIP", 0.99)]]],
+        [[[_box(300, 50, 600, 80), ("SHIPMENT", 0.80)]]],
+    ]
+    page = tiling._merge(RECTS, results, 2080, 1280)
+    assert _texts(page) == ["SHIPMENT"]
+    assert page[0][0][0] == [1100.0, 50.0]
+
+
+def test_merge_stitches_line_cut_by_vertical_seam():
+    tiling = TiledOcr(tile_size=1280, overlap=480)
+    # 한 글자 40px, x=600~1400 의 20글자 줄 → 어느 타일에도 온전히 들어가지 않음
+    line = "ABCDEFGHIJKLMNOPQRST"
+    results = [
+        [[[_box(600, 50, 1280, 90), (line[:17], 0.9)]]],   # 600~1280 : A..Q
+        [[[_box(0, 50, 600, 90), (line[5:], 0.8)]]],       # 800~1400 : F..T
+    ]
+    page = tiling._merge(RECTS, results, 2080, 1280)
+    assert len(page) == 1
+    box, (text, conf) = page[0]
+    assert text == line
+    assert box[0] == [600.0, 50.0] and box[2] == [1400.0, 90.0]
+    assert 0.8 <= conf <= 0.9
+
+
+def test_merge_keeps_repeated_characters_at_seam():
+    tiling = TiledOcr(tile_size=1280, overlap=480)
+    # 겹침 영역(800~1280) 안의 글자가 반복 문자라도 겹친 폭 기준으로 한 번만 제거
+    line = "1111122222333334444455555"          # 25글자, 한 글자 40px, x=500~1500
+    results = [
+        [[[_box(500, 50, 1280, 90), (line[:19], 0.9)]]],   # 500~1280 : 19글자
+        [[[_box(0, 50, 700, 90), (line[7:], 0.9)]]],       # 800~1500 : 18글자
+    ]
+    page = tiling._merge(RECTS, results, 2080, 1280)
+    assert _texts(page) == [line]
+
+
+# ----------------------------------------------------------
+# 합성 스캔: 타일보다 긴 줄까지 원래 줄 그대로 복원되는지
+# ----------------------------------------------------------
+CHAR_W = 25
+LINE_H = 40
+
+
+class _CoordEngine:
+    """
+    이미지 픽셀에 원본 좌표가 들어 있는 합성 스캔용 가짜 엔진.
+    타일 왼쪽 위 픽셀로 타일 위치를 알아내고, 타일 안에 보이는 줄만 돌려줌.
+    - 중심이 타일 안에 있는 글자만 읽힘 (잘린 줄은 조각 텍스트)
+    - 세로로 잘린 줄은 깨진 텍스트로 읽힘
+    """
+
+    def __init__(self, lines):
+        self.lines = lines
+
+    def ocr(self, tile, cls=True):
+        px = tile[0, 0].astype(int)
+        tx1, ty1 = px[0] * 256 + px[1], px[2] * 256 + px[3]
+        tx2, ty2 = tx1 + tile.shape[1], ty1 + tile.shape[0]
+        page = []
+        for x1, y1, text in self.lines:
+            x2, y2 = x1 + CHAR_W * len(text), y1 + LINE_H
+            bx1, by1, bx2, by2 = max(x1, tx1), max(y1, ty1), min(x2, tx2), min(y2, ty2)
+            if bx2 - bx1 < CHAR_W or by2 - by1 < LINE_H / 2:
+                continue
+            visible = "".join(
+                ch for i, ch in enumerate(text)
+                if tx1 <= x1 + CHAR_W * (i + 0.5) < tx2
+            )
+            if (by1, by2) != (y1, y2):
+                visible = "#" * len(visible)
+            box = _box(bx1 - tx1, by1 - ty1, bx2 - tx1, by2 - ty1)
+            page.append([box, (visible, 0.9)])
+        return [page] if page else [None]
+
+
+def _coord_image(width, height):
+    ys, xs = np.indices((height, width))
+    return np.stack([xs // 256, xs % 256, ys // 256, ys % 256], axis=-1).astype(np.uint8)
+
+
+def test_synthetic_scan_recovers_long_lines():
+    rng = random.Random(0)
+    width, height = 4000, 3000
+    lines = []
+    y = 30
+    while y + LINE_H < height:
+        # 한 줄 폭 250~1500px, 일부는 타일 하나(1280)보다 김
+        n_chars = rng.randint(10, 60)
+        x = rng.randint(0, width - CHAR_W * n_chars)
+        text = "".join(rng.choice("0123456789ABC-") for _ in range(n_chars))
+        lines.append((x, y, text))
+        y += LINE_H + rng.randint(15, 60)
+
+    tiling = TiledOcr(tile_size=1280, overlap=480, min_image_side=2500, workers=1)
+    result = tiling.ocr(_CoordEngine(lines), _coord_image(width, height))
+
+    got = sorted((round(box[0][0]), round(box[0][1]), text) for box, (text, _) in result[0])
+    assert got == sorted(lines)